@@ -1,6 +1,7 @@
 """Ford Controller Validator Class
 """
-from pyrox.models.network import Ipv4Address
+from typing import Optional
+from controlrox.interfaces import ModuleControlsType
 from controlrox.models.plc.rockwell import (
     RaController,
     RaDatatype,
@@ -9,14 +10,19 @@ from controlrox.models.plc.rockwell import (
 )
 from pyrox.services.logging import log
 from pyrox.services.logic import function_list_or_chain
-from controlrox.applications.validator import BaseControllerValidator
+from controlrox.applications.validator import (
+    BaseControllerValidator,
+    debug_success,
+    fail,
+    warning,
+)
+from controlrox.models.plc.rockwell.meta import L5X_ASSET_PROGRAMS, L5X_ASSET_TAGS
+from controlrox.models.tasks.findings import rule_scope
+from controlrox.services.plc.network import NO_ADDRESS
 from .ford import FordController
 
-
-# def success(message: str) -> bool: return BaseControllerValidator.success(message)
-# def fail(message: str) -> bool: return BaseControllerValidator.fail(message)
-# def warning(message: str) -> bool: return BaseControllerValidator.warning(message)
-# def debug_success(message: str) -> bool: return BaseControllerValidator.debug_success(message)
+# Rockwell controls types by value, to map the (wider) introspective module controls types
+_RA_CONTROLS_TYPES: dict[str, RaModuleControlsType] = {x.value: x for x in RaModuleControlsType}
 
 
 class FordControllerValidator(BaseControllerValidator):
@@ -27,8 +33,41 @@ class FordControllerValidator(BaseControllerValidator):
     drive_module_rpi = 30.0  # 30ms RPI for drives
     sfty_module_input_rpi = 20.0  # 20ms RPI for safety input modules
     sfty_module_output_rpi = 50.0  # 50ms RPI for safety output modules
+    network_prefix = (136 << 8) | 129  # 136.129.x.x
+    subnet_by_controls_type = {
+        ModuleControlsType.INPUT_BLOCK: 1,
+        ModuleControlsType.OUTPUT_BLOCK: 1,
+        ModuleControlsType.INPUT_OUTPUT_BLOCK: 1,
+        ModuleControlsType.BLOCK: 1,
+        ModuleControlsType.SAFETY_BLOCK: 4,
+        ModuleControlsType.SAFETY_INPUT_BLOCK: 4,
+        ModuleControlsType.SAFETY_OUTPUT_BLOCK: 4,
+        ModuleControlsType.SAFETY_INPUT_OUTPUT_BLOCK: 4,
+        ModuleControlsType.DRIVE: 6,
+        ModuleControlsType.ENCODER: 6,
+    }
 
     @classmethod
+    def _get_module_controls_type(
+        cls,
+        module: RaModule
+    ) -> Optional[RaModuleControlsType]:
+        """Get the controls type of a module from its (cached) introspective module.
+
+        Args:
+            module: The module to get the controls type of.
+
+        Returns:
+            The controls type (UNKOWN for types with no Rockwell counterpart, like safety scanners),
+            or None if the module matches no known introspective module.
+        """
+        imodule = module.introspective_module
+        if not imodule:
+            return None
+        return _RA_CONTROLS_TYPES.get(imodule.module_controls_type.value, RaModuleControlsType.UNKOWN)
+
+    @classmethod
+    @rule_scope(reads=(L5X_ASSET_PROGRAMS, L5X_ASSET_TAGS))
     def _check_module_has_logic_tag(
         cls,
         controller: RaController,
@@ -58,6 +97,7 @@ class FordControllerValidator(BaseControllerValidator):
         return debug_success(f'{module_object.__class__.__name__} {module_object.name} has logic tag.')
 
     @classmethod
+    @rule_scope()
     def _check_module_has_valid_network_address(
         cls,
         controller: RaController,
@@ -71,48 +111,28 @@ class FordControllerValidator(BaseControllerValidator):
         Returns:
             True if the common PLC object has a valid network address, False otherwise.
         """
-        address = Ipv4Address(module_object.address)
-        if address.octects[0] != 136:
-            return warning(f'{module_object.__class__.__name__} {module_object.name} has invalid network address {address}!'
-                           'Must start with 136.129.x.x')
-        if address.octects[1] != 129:
+        table = cls.get_network_table(controller, module_object)
+        row = table.get_row(module_object)
+        if table.addresses[row] == NO_ADDRESS:
+            return warning(f'{module_object.__class__.__name__} {module_object.name} has no network address!')
+
+        address = module_object.ip_address
+        if (table.addresses[row] >> 16) != cls.network_prefix:
             return warning(f'{module_object.__class__.__name__} {module_object.name} has invalid network address {address}!'
                            'Must start with 136.129.x.x')
-        if 1 > address.octects[2] > 16:
+        subnet = table.get_octet(row, 2)
+        if not 1 <= subnet <= 16:
             return warning(f'{module_object.__class__.__name__} {module_object.name} has invalid network address {address}!'
                            'Third octet must be between 1 and 16.')
 
-        match module_object.introspective_module.controls_type:
-            case (
-                RaModuleControlsType.INPUT_BLOCK |
-                RaModuleControlsType.OUTPUT_BLOCK |
-                RaModuleControlsType.INPUT_OUTPUT_BLOCK |
-                RaModuleControlsType.BLOCK
-            ):
-                if address.octects[2] != 1:
-                    return warning(f'{module_object.__class__.__name__} {module_object.name} has invalid network address {address}!'
-                                   'IO blocks must be in the 136.129.1.x subnet.')
-
-            case (
-                RaModuleControlsType.SAFETY_BLOCK |
-                RaModuleControlsType.SAFETY_INPUT_BLOCK |
-                RaModuleControlsType.SAFETY_OUTPUT_BLOCK |
-                RaModuleControlsType.SAFETY_INPUT_OUTPUT_BLOCK
-            ):
-                if address.octects[2] != 4:
-                    return warning(f'{module_object.__class__.__name__} {module_object.name} has invalid network address {address}!'
-                                   'Safety blocks must be in the 136.129.4.x subnet.')
-
-            case (
-                RaModuleControlsType.DRIVE |
-                RaModuleControlsType.ENCODER
-            ):
-                if address.octects[2] != 6:
-                    return warning(f'{module_object.__class__.__name__} {module_object.name} has invalid network address {address}!'
-                                   'Drives and Encoders must be in the 136.129.6.x subnet.')
+        expected_subnet = cls.subnet_by_controls_type.get(table.controls_types[row])
+        if expected_subnet is not None and subnet != expected_subnet:
+            return warning(f'{module_object.__class__.__name__} {module_object.name} has invalid network address {address}!'
+                           f'{table.controls_types[row].value} modules must be in the 136.129.{expected_subnet}.x subnet.')
         return debug_success(f'{module_object.__class__.__name__} {module_object.name} has valid network address.')
 
     @classmethod
+    @rule_scope(reads=(L5X_ASSET_PROGRAMS,))
     def _check_module_location_in_program(
         cls,
         controller: RaController,
@@ -201,13 +221,14 @@ class FordControllerValidator(BaseControllerValidator):
         controller,
         module,
     ) -> bool:
-        if module.introspective_module.controls_type is RaModuleControlsType.INPUT_BLOCK:
+        type_ = cls._get_module_controls_type(module)
+        if type_ is RaModuleControlsType.INPUT_BLOCK:
             return cls._validate_standard_input_block(controller, module)
-        elif module.introspective_module.controls_type is RaModuleControlsType.OUTPUT_BLOCK:
+        elif type_ is RaModuleControlsType.OUTPUT_BLOCK:
             return cls._validate_standard_output_block(controller, module)
-        elif module.introspective_module.controls_type is RaModuleControlsType.INPUT_OUTPUT_BLOCK:
+        elif type_ is RaModuleControlsType.INPUT_OUTPUT_BLOCK:
             return cls._validate_standard_io_block(controller, module)
-        elif module.introspective_module.controls_type in [
+        elif type_ in [
             RaModuleControlsType.SAFETY_BLOCK,
             RaModuleControlsType.SAFETY_INPUT_BLOCK,
             RaModuleControlsType.SAFETY_OUTPUT_BLOCK,
@@ -216,7 +237,7 @@ class FordControllerValidator(BaseControllerValidator):
             return cls._validate_safety_io_block(controller, module)
         else:
             log(cls).warning(
-                f'No specific IO block validation implemented for module type: {module.introspective_module.controls_type}'
+                f'No specific IO block validation implemented for module type: {type_}'
             )
             return False
 
@@ -230,14 +251,14 @@ class FordControllerValidator(BaseControllerValidator):
         return True  # TODO: Implement PLC module validation if needed
 
     @classmethod
+    @rule_scope(reads=(lambda controller, module: f'{L5X_ASSET_TAGS}/{module.name}',))
     def _check_module_tag_exists(
         cls,
         controller,
         module
     ) -> bool:
         if module.name not in controller.tags:
-            log(cls).error(f'Module {module.name} does not have a corresponding tag in the controller.')
-            return False
+            return fail(f'Module {module.name} does not have a corresponding tag in the controller.')
         return True
 
     @classmethod
@@ -314,7 +335,7 @@ class FordControllerValidator(BaseControllerValidator):
         controller,
         module
     ) -> bool:
-        type_ = module.introspective_module.controls_type
+        type_ = cls._get_module_controls_type(module)
 
         if type_ is RaModuleControlsType.PLC:
             return cls._validate_module_plc(controller, module)
@@ -329,4 +350,4 @@ class FordControllerValidator(BaseControllerValidator):
         elif type_ is RaModuleControlsType.DRIVE:
             return cls._validate_module_drive(controller, module)
         else:
-            return warning(f'No validation implemented for module type: {module.introspective_module.controls_type}')
+            return warning(f'No validation implemented for module type: {type_}')
@@ -1,9 +1,12 @@
 """General motors implimentation specific plc types
     """
+from array import array
 from enum import Enum
 import fnmatch
+import functools
 import re
-from typing import Generic, Optional, TypeVar, Union
+import string
+from typing import Generic, NamedTuple, Optional, TypeVar, Union
 
 from controlrox.interfaces import META
 from controlrox.interfaces import (
@@ -31,6 +34,8 @@ USER_CHAR = 'u'
 USER_SAFE_CHAR = 's_u'
 ALARM_PATTERN:   str = '*<Alarm[[]*[]]:*>'
 PROMPT_PATTERN:  str = '*<Prompt[[]*[]]:*>'
+PARAM_RTN_PATTERN:   str = 'B*_Parameters'
+PARAM_MATCH_PATTERN: str = 'MOV(*,HMI.Diag.Pgm.MsgOffset);'
 
 DIAG_RE_PATTERN:    str = r"(<.+\[\d*\].*>)"
 TL_RE_PATTERN:      str = r"(?:.*)(<.*\[\d*\]:.*>)(?:.*)"
@@ -39,6 +44,79 @@ DIAG_NUM_RE_PATTERN: str = r"(?:<.*\[)(\d*)(?:\].*>)"
 COLUMN_RE_PATTERN:   str = r"(?:<.*\[\d+\]:)(@[a-zA-Z]+\d+)(?:.*)"
 DIAG_NAME_RE_PATTER: str = r"(?!MOV\(\d*,HMI\.Diag\.Pgm\.Name\.LEN\))(MOV\(.*?,HMI\.Diag\.Pgm\.Name\.DATA\[\d*?\])"
 
+_ALARM_RE = re.compile(fnmatch.translate(ALARM_PATTERN))
+_PROMPT_RE = re.compile(fnmatch.translate(PROMPT_PATTERN))
+_PARAM_RTN_RE = re.compile(fnmatch.translate(PARAM_RTN_PATTERN))
+_PARAM_MATCH_RE = re.compile(fnmatch.translate(PARAM_MATCH_PATTERN))
+_DIAG_RE = re.compile(DIAG_RE_PATTERN)
+_TL_RE = re.compile(TL_RE_PATTERN)
+_TL_ID_RE = re.compile(TL_ID_PATTERN)
+_DIAG_NUM_RE = re.compile(DIAG_NUM_RE_PATTERN)
+_COLUMN_RE = re.compile(COLUMN_RE_PATTERN)
+_DIAG_NAME_RE = re.compile(DIAG_NAME_RE_PATTER)
+_DIAG_NAME_LEN_RE = re.compile(r'MOV\((\d+),HMI\.Diag\.Pgm\.Name\.LEN\)')
+_DIAG_NAME_DATA_RE = re.compile(r'MOV\((kAscii\.\w+),HMI\.Diag\.Pgm\.Name\.DATA\[(\d+)\]\)')
+
+# kAscii constant names mapped to the characters they hold
+KASCII_MAP: dict[str, str] = {
+    **{f'kAscii.{x}': x for x in string.ascii_letters},
+    **{f'kAscii.n{x}': x for x in string.digits},
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def decode_diag_name(rung_text: str) -> Optional[str]:
+    """Decode the diag program name written by a parameter routine rung.
+
+    Results are cached per rung text.
+
+    Args:
+        rung_text: The rung text.
+
+    Returns:
+        Optional[str]: The decoded name, or None if the rung does not write the diag program name.
+
+    Raises:
+        ValueError: If the rung writes the name without a length or without characters.
+    """
+    if not _DIAG_NAME_RE.search(rung_text):
+        return None
+
+    # Extract the length of the string
+    length_match = _DIAG_NAME_LEN_RE.search(rung_text)
+    if length_match:
+        string_length = int(length_match.group(1))
+    else:
+        raise ValueError("String length not found in the PLC code")
+
+    # Extract the ASCII characters and their positions
+    data_matches = _DIAG_NAME_DATA_RE.findall(rung_text)
+    if not data_matches:
+        raise ValueError("No ASCII characters found in the PLC code")
+
+    string_chars = [''] * string_length
+    for char, pos in data_matches:
+        string_chars[int(pos)] = KASCII_MAP.get(char, '?')
+
+    return ''.join(string_chars)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_parameter_offset(rung_text: str) -> Optional[int]:
+    """Parse the diag message offset written by a parameter routine rung.
+
+    Results are cached per rung text.
+
+    Args:
+        rung_text: The rung text.
+
+    Returns:
+        Optional[int]: The message offset, or None if the rung does not write the message offset.
+    """
+    if not _PARAM_MATCH_RE.match(rung_text):
+        return None
+    return int(rung_text.replace("MOV(", '').replace(',HMI.Diag.Pgm.MsgOffset);', ''))
+
 
 class TextListElement:
     """General Motors Text List Generic Element
@@ -90,14 +168,14 @@ class TextListElement:
         return self._text_list_id
 
     def _get_diag_number(self):
-        match = re.search(DIAG_NUM_RE_PATTERN, self._text)
+        match = _DIAG_NUM_RE.search(self._text)
         if match:
             return int(match.groups()[0])
 
         raise ValueError('Could not find diag number in diag string! -> %s' % self._text)
 
     def _get_diag_text(self, text: str):
-        match = re.search(DIAG_RE_PATTERN, text)
+        match = _DIAG_RE.search(text)
         if match:
             return match.groups()[0]
 
@@ -107,7 +185,7 @@ class TextListElement:
         if not self.text:
             return ''
 
-        match = re.search(TL_ID_PATTERN, self.text)
+        match = _TL_ID_RE.search(self.text)
         if match:
             return match.groups()[0].strip()
         else:
@@ -121,6 +199,46 @@ class KDiagType(Enum):
     VALUE = 3
 
 
+class CommentRecord(NamedTuple):
+    """Text list element and k-diagnostic found on one rung comment line.
+
+    Attributes:
+        line: The comment line.
+        text_list_text: The text list element text, or '' if the line holds none.
+        diag_type: The k-diagnostic type of the line, NA if the line is not a k-diagnostic.
+    """
+    line: str
+    text_list_text: str
+    diag_type: KDiagType
+
+
+@functools.lru_cache(maxsize=65536)
+def scan_comment(comment: str) -> tuple[CommentRecord, ...]:
+    """Scan a rung comment for text list elements and k-diagnostics.
+
+    Results are cached per comment, so unchanged rungs are never re-scanned.
+
+    Args:
+        comment: The rung comment.
+
+    Returns:
+        tuple[CommentRecord, ...]: One record per line holding a text list element or k-diagnostic.
+    """
+    records = []
+    for line in comment.splitlines():
+        if _ALARM_RE.match(line):
+            diag_type = KDiagType.ALARM
+        elif _PROMPT_RE.match(line):
+            diag_type = KDiagType.PROMPT
+        else:
+            diag_type = KDiagType.NA
+
+        match = _TL_RE.match(line)
+        if match or diag_type is not KDiagType.NA:
+            records.append(CommentRecord(line, match.groups()[0] if match else '', diag_type))
+    return tuple(records)
+
+
 class KDiagProgramType(Enum):
     NA = 0
     MCP = 1
@@ -192,7 +310,7 @@ class KDiag(TextListElement):
 
     def _get_col_location(self) -> None:
         self._col_location = ''
-        col_match = re.search(COLUMN_RE_PATTERN, self.text)
+        col_match = _COLUMN_RE.search(self.text)
         if col_match:
             self._col_location = col_match.groups()[0]
             return
@@ -267,6 +385,8 @@ class GmRung(
     ) -> None:
         super().__init__(meta_data, name, description, **kwargs)
         self._kdiags: list[KDiag] = []
+        self._text_list_items: list[TextListElement] = []
+        self._text_list_comment: str = ''
 
     @property
     def has_kdiag(self) -> bool:
@@ -283,26 +403,34 @@ class GmRung(
 
     @property
     def text_list_items(self) -> list[TextListElement]:
-        if not self.comment:
+        comment = self.comment
+        if not comment:
             return []
 
-        comment_lines = self.comment.splitlines()
-        ret_list = []
+        if comment != self._text_list_comment:
+            self._text_list_items = [
+                TextListElement(x.text_list_text, self)
+                for x in scan_comment(comment) if x.text_list_text
+            ]
+            self._text_list_comment = comment
 
-        for line in comment_lines:
-            match = re.match(TL_RE_PATTERN, line)
-            if match:
-                ret_list.append(TextListElement(match.groups()[0], self))
+        return list(self._text_list_items)
 
-        return ret_list
+    def get_kdiags(
+        self,
+        parent_offset: Optional[int] = None
+    ) -> None:
+        """Extract the k-diagnostics of this rung's comment.
 
-    def get_kdiags(self) -> None:
+        Args:
+            parent_offset: The message offset of the rung's program. Looked up from the program if not given.
+        """
         self._kdiags.clear()
 
         if not self.comment:
             return
 
-        comment_lines = self.comment.splitlines()
+        records = [x for x in scan_comment(self.comment) if x.diag_type is not KDiagType.NA]
 
         if not self.routine:
             raise ValueError("Routine is None")
@@ -314,26 +442,18 @@ class GmRung(
         if not isinstance(container, GmProgram):
             return
 
-        for line in comment_lines:
-            if fnmatch.fnmatch(line, ALARM_PATTERN):
-                self._kdiags.append(
-                    KDiag(
-                        KDiagType.ALARM,
-                        line,
-                        container.parameter_offset,
-                        self
-                    )
-                )
+        if records and parent_offset is None:
+            parent_offset = container.parameter_offset
 
-            elif fnmatch.fnmatch(line, PROMPT_PATTERN):
-                self._kdiags.append(
-                    KDiag(
-                        KDiagType.PROMPT,
-                        line,
-                        container.parameter_offset,
-                        self
-                    )
+        for record in records:
+            self._kdiags.append(
+                KDiag(
+                    record.diag_type,
+                    record.line,
+                    parent_offset,
+                    self
                 )
+            )
 
 
 class GmRoutine(
@@ -393,9 +513,9 @@ class GmProgram(
 ):
     """General Motors Program
     """
-    PARAM_RTN_STR = 'B*_Parameters'
+    PARAM_RTN_STR = PARAM_RTN_PATTERN
 
-    PARAM_MATCH_STR = "MOV(*,HMI.Diag.Pgm.MsgOffset);"
+    PARAM_MATCH_STR = PARAM_MATCH_PATTERN
 
     PGM_NAME_STR = "MOV(*,HMI.Diag.Pgm.Name.LEN)*"
 
@@ -422,115 +542,15 @@ class GmProgram(
         if not self.parameter_routine:
             return ''
 
-        diag_rung = None
         for rung in self.parameter_routine.rungs:
-            match = re.search(DIAG_NAME_RE_PATTER, rung.text)
-            if match:
-                diag_rung = rung
-                break
-        if not diag_rung:
-            return ''
-
-        # Extract the length of the string
-        length_match = re.search(r'MOV\((\d+),HMI\.Diag\.Pgm\.Name\.LEN\)', diag_rung.text)
-        if length_match:
-            string_length = int(length_match.group(1))
-        else:
-            raise ValueError("String length not found in the PLC code")
-
-        # Extract the ASCII characters and their positions
-        data_matches = re.findall(r'MOV\((kAscii\.\w+),HMI\.Diag\.Pgm\.Name\.DATA\[(\d+)\]\)', diag_rung.text)
-        if not data_matches:
-            raise ValueError("No ASCII characters found in the PLC code")
-
-        # Create a dictionary to map ASCII positions to characters
-        ascii_map = {
-            'kAscii.A': 'A',
-            'kAscii.B': 'B',
-            'kAscii.C': 'C',
-            'kAscii.D': 'D',
-            'kAscii.E': 'E',
-            'kAscii.F': 'F',
-            'kAscii.G': 'G',
-            'kAscii.H': 'H',
-            'kAscii.I': 'I',
-            'kAscii.J': 'J',
-            'kAscii.K': 'K',
-            'kAscii.L': 'L',
-            'kAscii.M': 'M',
-            'kAscii.N': 'N',
-            'kAscii.O': 'O',
-            'kAscii.P': 'P',
-            'kAscii.Q': 'Q',
-            'kAscii.R': 'R',
-            'kAscii.S': 'S',
-            'kAscii.T': 'T',
-            'kAscii.U': 'U',
-            'kAscii.V': 'V',
-            'kAscii.W': 'W',
-            'kAscii.X': 'X',
-            'kAscii.Y': 'Y',
-            'kAscii.Z': 'Z',
-            'kAscii.a': 'a',
-            'kAscii.b': 'b',
-            'kAscii.c': 'c',
-            'kAscii.d': 'd',
-            'kAscii.e': 'e',
-            'kAscii.f': 'f',
-            'kAscii.g': 'g',
-            'kAscii.h': 'h',
-            'kAscii.i': 'i',
-            'kAscii.j': 'j',
-            'kAscii.k': 'k',
-            'kAscii.l': 'l',
-            'kAscii.m': 'm',
-            'kAscii.n': 'n',
-            'kAscii.o': 'o',
-            'kAscii.p': 'p',
-            'kAscii.q': 'q',
-            'kAscii.r': 'r',
-            'kAscii.s': 's',
-            'kAscii.t': 't',
-            'kAscii.u': 'u',
-            'kAscii.v': 'v',
-            'kAscii.w': 'w',
-            'kAscii.x': 'x',
-            'kAscii.y': 'y',
-            'kAscii.z': 'z',
-            'kAscii.n0': '0',
-            'kAscii.n1': '1',
-            'kAscii.n2': '2',
-            'kAscii.n3': '3',
-            'kAscii.n4': '4',
-            'kAscii.n5': '5',
-            'kAscii.n6': '6',
-            'kAscii.n7': '7',
-            'kAscii.n8': '8',
-            'kAscii.n9': '9',
-        }
-
-        # Initialize the string with placeholders
-        string_chars = [''] * string_length
-
-        # Fill the string with the extracted characters
-        for char, pos in data_matches:
-            string_chars[int(pos)] = ascii_map.get(char, '?')
-
-        # Join the characters to form the final string
-        final_string = ''.join(string_chars)
-
-        return final_string
+            diag_name = decode_diag_name(rung.text)
+            if diag_name is not None:
+                return diag_name
+        return ''
 
     @property
     def diag_setup(self) -> dict:
-        return {
-            'program_name': self.name,
-            'diag_name': self.diag_name,
-            'msg_offset': self.parameter_offset,
-            'hmi_tag': 'TBD',
-            'program_type': self.program_type,
-            'tag_alias_refs': 'TBD'
-        }
+        return self.get_diag_setup()
 
     @property
     def kdiags(self) -> list[KDiag]:
@@ -544,14 +564,15 @@ class GmProgram(
             return 0
 
         for rung in self.parameter_routine.rungs:
-            if fnmatch.fnmatch(rung.text, self.PARAM_MATCH_STR):
-                return int(rung.text.replace("MOV(", '').replace(',HMI.Diag.Pgm.MsgOffset);', ''))
+            offset = parse_parameter_offset(rung.text)
+            if offset is not None:
+                return offset
         return 0
 
     @property
     def parameter_routine(self) -> Optional[GmRoutine]:
         for routine in self.routines:
-            if fnmatch.fnmatch(routine.name, self.PARAM_RTN_STR):
+            if _PARAM_RTN_RE.match(routine.name):
                 return routine
         return None
 
@@ -578,6 +599,29 @@ class GmProgram(
     def user_routines(self) -> list[GmRoutine]:
         return [x for x in self.routines if x.is_user_owned]
 
+    def get_diag_setup(self) -> dict:
+        """Get the diag setup of this program, decoding the diag name and message offset
+        in a single pass over the parameter routine.
+        """
+        diag_name, msg_offset = None, None
+        parameter_routine = self.parameter_routine
+        for rung in parameter_routine.rungs if parameter_routine else []:
+            if msg_offset is None:
+                msg_offset = parse_parameter_offset(rung.text)
+            if diag_name is None:
+                diag_name = decode_diag_name(rung.text)
+            if diag_name is not None and msg_offset is not None:
+                break
+
+        return {
+            'program_name': self.name,
+            'diag_name': diag_name or '',
+            'msg_offset': msg_offset or 0,
+            'hmi_tag': 'TBD',
+            'program_type': self.program_type,
+            'tag_alias_refs': 'TBD'
+        }
+
     def compile_kdiags(self):
         """get all kdiags within program
         """
@@ -592,6 +636,117 @@ class GmProgram(
         return super().invalidate()
 
 
+class GmTextListTable:
+    """Text list elements and k-diagnostics of a whole controller, stored as columns.
+
+    Built in a single pass over every rung comment of the controller. Rows are text list elements;
+    the diag type and global number of a row are set when its comment line is also a k-diagnostic.
+
+    Attributes:
+        elements: The text list elements.
+        text_list_ids: Text list id of each element.
+        numbers: Number of each element within its text list.
+        global_numbers: Number of each element plus its program's message offset for k-diagnostics.
+        diag_types: K-diagnostic type of each element (NA for plain text list elements).
+        programs: Name of the program holding each element.
+        kdiags: Every k-diagnostic of the controller.
+
+    Args:
+        controller: The controller to build the table for.
+    """
+
+    def __init__(
+        self,
+        controller: 'GmController'
+    ) -> None:
+        self.elements: list[TextListElement] = []
+        self.text_list_ids: list[str] = []
+        self.numbers: array = array('q')
+        self.global_numbers: array = array('q')
+        self.diag_types: list[KDiagType] = []
+        self.programs: list[str] = []
+        self.kdiags: list[KDiag] = []
+        self._by_text_list_id: dict[str, list[int]] = {}
+        self._by_number: dict[int, list[int]] = {}
+        self._comments: list[tuple[GmRung, str]] = []
+
+        for program in controller.programs:
+            is_gm_program = isinstance(program, GmProgram)
+            offset = program.parameter_offset if is_gm_program else 0
+            for routine in program.routines:
+                for rung in routine.rungs:
+                    comment = rung.comment
+                    if not comment:
+                        continue
+                    self._comments.append((rung, comment))
+                    records = [x for x in scan_comment(comment) if x.text_list_text]
+                    for record, element in zip(records, rung.text_list_items):
+                        self._add_row(element, record.diag_type, offset if is_gm_program else 0, program.name)
+                    if is_gm_program:
+                        rung.get_kdiags(offset)
+                        self.kdiags.extend(rung.kdiags)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def _add_row(
+        self,
+        element: TextListElement,
+        diag_type: KDiagType,
+        offset: int,
+        program_name: str
+    ) -> None:
+        row = len(self.elements)
+        self.elements.append(element)
+        self.text_list_ids.append(element.text_list_id)
+        self.numbers.append(element.number)
+        self.global_numbers.append(element.number + (offset if diag_type is not KDiagType.NA else 0))
+        self.diag_types.append(diag_type)
+        self.programs.append(program_name)
+        self._by_text_list_id.setdefault(element.text_list_id, []).append(row)
+        self._by_number.setdefault(element.number, []).append(row)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether a rung comment changed since the table was built."""
+        return any(rung.comment != comment for rung, comment in self._comments)
+
+    def get_duplicates(self) -> dict[tuple[str, int], list[TextListElement]]:
+        """Get the text list elements sharing a text list id and global number.
+
+        Returns:
+            dict[tuple[str, int], list[TextListElement]]: (text list id, global number) mapped to the duplicate elements.
+        """
+        groups: dict[tuple[str, int], list[int]] = {}
+        for row, key in enumerate(zip(self.text_list_ids, self.global_numbers)):
+            groups.setdefault(key, []).append(row)
+        return {
+            key: [self.elements[row] for row in rows]
+            for key, rows in groups.items() if len(rows) > 1
+        }
+
+    def get_elements_by_text_list_id(self) -> dict[str, list[TextListElement]]:
+        """Get the text list elements grouped by text list id."""
+        return {
+            text_list_id: [self.elements[row] for row in rows]
+            for text_list_id, rows in self._by_text_list_id.items()
+        }
+
+    def get_rows_by_number(
+        self,
+        number: int
+    ) -> list[int]:
+        """Get the rows of the elements with a number (within their text list)."""
+        return list(self._by_number.get(number, []))
+
+    def get_rows_by_text_list_id(
+        self,
+        text_list_id: str
+    ) -> list[int]:
+        """Get the rows of the elements of a text list."""
+        return list(self._by_text_list_id.get(text_list_id, []))
+
+
 class GmController(
     GmPlcObject[dict],
     RaController
@@ -604,6 +759,7 @@ class GmController(
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._kdiags = []
+        self._text_list_table: Optional[GmTextListTable] = None
 
     @property
     def kdiags(self) -> list[KDiag]:
@@ -623,10 +779,7 @@ class GmController(
 
     @property
     def text_list_items(self) -> list[TextListElement]:
-        x = []
-        for program in self.programs:
-            x.extend(program.text_list_items)
-        return x
+        return list(self.get_text_list_table().elements)
 
     @property
     def gm_programs(self) -> list[GmProgram]:
@@ -648,31 +801,39 @@ class GmController(
             self._kdiags.extend(program.kdiags)
 
     def extract_messages(self):
-        tl_items = self.text_list_items
-        filtered = {}
-
-        for item in tl_items:
-            if item.text_list_id not in filtered:
-                filtered[item.text_list_id] = []
-            filtered[item.text_list_id].append(item)
+        table = self.get_text_list_table()
 
         return {
-            'text_lists': tl_items,
-            'filtered': filtered,
-            'duplicates': 'Fix This Method',
-            'programs': [x.diag_setup for x in self.programs]
+            'text_lists': list(table.elements),
+            'filtered': table.get_elements_by_text_list_id(),
+            'duplicates': table.get_duplicates(),
+            'programs': self.get_diag_setups()
         }
 
+    def get_diag_setups(self) -> list[dict]:
+        """Get the diag setup (diag name, message offset, program type) of every program in a single sweep.
+        """
+        return [x.get_diag_setup() for x in self.programs]
+
+    def get_text_list_table(self) -> GmTextListTable:
+        """Get the text list table of this controller, rebuilding it if a rung comment changed.
+        """
+        if self._text_list_table is None or self._text_list_table.is_stale:
+            self._text_list_table = GmTextListTable(self)
+        return self._text_list_table
+
     def invalidate(self) -> None:
         self._kdiags.clear()
+        self._text_list_table = None
         return super().invalidate()
 
-    def validate_text_lists(self):
+    def validate_text_lists(self) -> dict[tuple[str, int], list[TextListElement]]:
         """validate all text lists within controller
-        """
-        duplicate_diags = 'Fix This Method'
 
-        return duplicate_diags
+        Returns:
+            dict[tuple[str, int], list[TextListElement]]: Duplicate diags, keyed by (text list id, global number).
+        """
+        return self.get_text_list_table().get_duplicates()
 
 
 GmPlcObject.supporting_class = GmController
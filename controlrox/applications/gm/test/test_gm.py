@@ -20,6 +20,9 @@ from controlrox.applications.gm.gm import (
     TextListElement,
     KDiag,
     KDiagType,
+    decode_diag_name,
+    parse_parameter_offset,
+    scan_comment,
 )
 from controlrox.models.plc.rockwell import (
     RaController,
@@ -734,6 +737,33 @@ class TestGmRoutineProperties(unittest.TestCase):
         self.assertIsInstance(text_items, list)
 
 
+class TestDiagNameDecoder(unittest.TestCase):
+    """Test the cached diag name and message offset decoders."""
+
+    NAME_RUNG = (
+        'MOV(3,HMI.Diag.Pgm.Name.LEN)MOV(kAscii.S,HMI.Diag.Pgm.Name.DATA[0])'
+        'MOV(kAscii.t,HMI.Diag.Pgm.Name.DATA[1])MOV(kAscii.n1,HMI.Diag.Pgm.Name.DATA[2]);'
+    )
+
+    def test_decode_diag_name(self):
+        """Test the diag name is decoded from the kAscii moves."""
+        self.assertEqual(decode_diag_name(self.NAME_RUNG), 'St1')
+
+    def test_decode_diag_name_other_rung(self):
+        """Test rungs not writing the diag name decode to None."""
+        self.assertIsNone(decode_diag_name('MOV(100,HMI.Diag.Pgm.MsgOffset);'))
+
+    def test_decode_diag_name_missing_length(self):
+        """Test a name rung without a length raises ValueError."""
+        with self.assertRaises(ValueError):
+            decode_diag_name('MOV(kAscii.S,HMI.Diag.Pgm.Name.DATA[0]);')
+
+    def test_parse_parameter_offset(self):
+        """Test the message offset is parsed from the offset rung only."""
+        self.assertEqual(parse_parameter_offset('MOV(100,HMI.Diag.Pgm.MsgOffset);'), 100)
+        self.assertIsNone(parse_parameter_offset(self.NAME_RUNG))
+
+
 class TestGmProgramProperties(unittest.TestCase):
     """Test GmProgram properties and parameter extraction."""
 
@@ -766,6 +796,10 @@ class TestGmProgramProperties(unittest.TestCase):
                                                     {
                                                         '@Number': '0',
                                                         'Text': 'MOV(100,HMI.Diag.Pgm.MsgOffset);'
+                                                    },
+                                                    {
+                                                        '@Number': '1',
+                                                        'Text': TestDiagNameDecoder.NAME_RUNG
                                                     }
                                                 ]
                                             }
@@ -815,6 +849,27 @@ class TestGmProgramProperties(unittest.TestCase):
         offset = program.parameter_offset
         self.assertEqual(offset, 100)
 
+    @patch('controlrox.models.tasks.app.ControllerInstanceManager.get_controller')
+    def test_diag_name_extraction(self, mock_get_controller):
+        """Test diag_name decodes the name from parameter routine."""
+        mock_get_controller.return_value = GmController.from_meta_data(self.test_meta_data)
+        controller = GmController.from_meta_data(self.test_meta_data)
+        program = controller.programs[0]
+
+        self.assertEqual(program.diag_name, 'St1')
+
+    @patch('controlrox.models.tasks.app.ControllerInstanceManager.get_controller')
+    def test_diag_setups_batch(self, mock_get_controller):
+        """Test get_diag_setups decodes every program's diag setup."""
+        mock_get_controller.return_value = GmController.from_meta_data(self.test_meta_data)
+        controller = GmController.from_meta_data(self.test_meta_data)
+
+        setups = controller.get_diag_setups()
+        self.assertEqual(len(setups), 1)
+        self.assertEqual(setups[0]['diag_name'], 'St1')
+        self.assertEqual(setups[0]['msg_offset'], 100)
+        self.assertEqual(setups[0], controller.programs[0].diag_setup)
+
     @patch('controlrox.models.tasks.app.ControllerInstanceManager.get_controller')
     def test_gm_routines_filters_gm_owned(self, mock_get_controller):
         """Test gm_routines returns only GM-owned routines."""
@@ -970,6 +1025,128 @@ class TestGmControllerGeneratorType(unittest.TestCase):
         self.assertEqual(controller.generator_type, 'GmEmulationGenerator')
 
 
+class TestScanComment(unittest.TestCase):
+    """Test the cached rung comment scanner."""
+
+    def test_scan_comment_records(self):
+        """Test alarms, prompts and plain text list lines are found."""
+        records = scan_comment('<@DIAG>\n<Alarm[10]: Alarm>\n<Prompt[20]: Prompt>\n<TestList[5]: Text>\nPlain')
+        self.assertEqual(
+            [x.diag_type for x in records],
+            [KDiagType.ALARM, KDiagType.PROMPT, KDiagType.NA]
+        )
+        self.assertEqual(records[2].text_list_text, '<TestList[5]: Text>')
+
+    def test_scan_comment_is_cached(self):
+        """Test identical comments are only scanned once."""
+        comment = '<Alarm[1]: Cached alarm>'
+        self.assertIs(scan_comment(comment), scan_comment(comment))
+
+
+class TestGmTextListTable(unittest.TestCase):
+    """Test GmTextListTable indexing and duplicate detection."""
+
+    def setUp(self):
+        """Set up test metadata with a duplicate text list element."""
+        self.test_meta_data = {
+            'RSLogix5000Content': {
+                '@SchemaRevision': '1.0',
+                'Controller': {
+                    '@Name': 'TestController',
+                    '@ProcessorType': 'CompactLogix',
+                    '@MajorRev': '32',
+                    '@MinorRev': '0',
+                    'AddOnInstructionDefinitions': {'AddOnInstructionDefinition': []},
+                    'DataTypes': {'DataType': []},
+                    'Modules': {'Module': []},
+                    'Programs': {
+                        'Program': [
+                            {
+                                '@Name': 'MCP',
+                                '@Class': 'Standard',
+                                'Tags': {'Tag': []},
+                                'Routines': {
+                                    'Routine': [
+                                        {
+                                            '@Name': 'B1_Parameters',
+                                            '@Type': 'RLL',
+                                            'RLLContent': {
+                                                'Rung': [
+                                                    {
+                                                        '@Number': '0',
+                                                        'Text': 'MOV(100,HMI.Diag.Pgm.MsgOffset);'
+                                                    }
+                                                ]
+                                            }
+                                        },
+                                        {
+                                            '@Name': 'zz_Routine1',
+                                            '@Type': 'RLL',
+                                            'RLLContent': {
+                                                'Rung': [
+                                                    {
+                                                        '@Number': '0',
+                                                        'Comment': '<@DIAG>\n<Alarm[10]: Alarm 1>\n<TestList[5]: One>',
+                                                        'Text': 'NOP();'
+                                                    },
+                                                    {
+                                                        '@Number': '1',
+                                                        'Comment': '<TestList[5]: Two>',
+                                                        'Text': 'NOP();'
+                                                    }
+                                                ]
+                                            }
+                                        }
+                                    ]
+                                }
+                            }
+                        ]
+                    },
+                    'Tags': {'Tag': []},
+                    'SafetyInfo': None
+                }
+            }
+        }
+
+    @patch('controlrox.models.tasks.app.ControllerInstanceManager.get_controller')
+    def test_table_columns_and_indexes(self, mock_get_controller):
+        """Test the table holds every element with its global number."""
+        controller = GmController.from_meta_data(self.test_meta_data)
+        mock_get_controller.return_value = controller
+
+        table = controller.get_text_list_table()
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.get_rows_by_text_list_id('TestList'), [1, 2])
+        self.assertEqual(table.get_rows_by_number(10), [0])
+        self.assertEqual(table.global_numbers[0], 110)
+        self.assertEqual(len(table.kdiags), 1)
+        self.assertEqual(table.kdiags[0].global_number, 110)
+        self.assertIs(controller.get_text_list_table(), table)
+
+    @patch('controlrox.models.tasks.app.ControllerInstanceManager.get_controller')
+    def test_validate_text_lists_finds_duplicates(self, mock_get_controller):
+        """Test duplicate text list elements are grouped by text list id and number."""
+        controller = GmController.from_meta_data(self.test_meta_data)
+        mock_get_controller.return_value = controller
+
+        duplicates = controller.validate_text_lists()
+        self.assertEqual(list(duplicates.keys()), [('TestList', 5)])
+        self.assertEqual([x.text for x in duplicates[('TestList', 5)]], ['<TestList[5]: One>', '<TestList[5]: Two>'])
+
+    @patch('controlrox.models.tasks.app.ControllerInstanceManager.get_controller')
+    def test_table_rebuilt_after_comment_edit(self, mock_get_controller):
+        """Test editing a rung comment rebuilds the table."""
+        controller = GmController.from_meta_data(self.test_meta_data)
+        mock_get_controller.return_value = controller
+
+        table = controller.get_text_list_table()
+        rung = controller.programs[0].routines[1].rungs[1]
+        rung.meta_data['Comment'] = '<TestList[6]: Two>'
+
+        self.assertIsNot(controller.get_text_list_table(), table)
+        self.assertEqual(controller.validate_text_lists(), {})
+
+
 class TestGmControllerIntegration(unittest.TestCase):
     """Integration tests verifying complete GM controller hierarchy."""
 
@@ -1 +1,36 @@
-from .generated import *  # noqa: F401, F403
+"""Configured introspective modules.
+
+Module classes are created on demand from the JSON configurations in ``config`` by the module registry,
+which is installed as a module class provider of the introspective module warehouses on import.
+The module classes are also exported by their configured class name (e.g. ``AB_1734_IB8S``), created on first access.
+"""
+from .registry import (
+    ModuleRungSpec,
+    ModuleSpec,
+    ModuleSpecRegistry,
+    ModuleTagSpec,
+    get_module_registry,
+)
+
+get_module_registry().install()
+
+
+def __getattr__(name: str) -> type:
+    """Get a configured module class by its class name."""
+    spec = None if name.startswith('_') else get_module_registry().get_spec_by_class_name(name)
+    if spec is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return get_module_registry().get_module_class(spec)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *(x.class_name for x in get_module_registry().specs)})
+
+
+__all__ = (
+    'ModuleRungSpec',
+    'ModuleSpec',
+    'ModuleSpecRegistry',
+    'ModuleTagSpec',
+    'get_module_registry',
+)
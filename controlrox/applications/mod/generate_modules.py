@@ -4,6 +4,7 @@ This script reads JSON configuration files and generates Python class files
 for introspective PLC modules.
 """
 import json
+import sys
 from pathlib import Path
 from typing import Any
 from datetime import datetime
@@ -252,12 +253,7 @@ class ModuleGenerator:
             lines.append('        rungs = []')
 
             for rung in config['rungs']['safety']:
-                lines.append('        rungs.append(self.controller.create_rung(')
-                text_template = rung['text_template']
-                text_code = self._generate_template_code(text_template)
-                lines.append(f'            rung_text={text_code},')
-                lines.append(f"            comment='{rung['comment']}'")
-                lines.append('        ))')
+                lines.extend(self._generate_rung_code(rung))
 
             lines.append('        return rungs')
 
@@ -269,12 +265,7 @@ class ModuleGenerator:
             lines.append('        rungs = []')
 
             for rung in config['rungs']['standard']:
-                lines.append('        rungs.append(self.controller.create_rung(')
-                text_template = rung['text_template']
-                text_code = self._generate_template_code(text_template)
-                lines.append(f'            rung_text={text_code},')
-                lines.append(f"            comment='{rung['comment']}'")
-                lines.append('        ))')
+                lines.extend(self._generate_rung_code(rung))
 
             lines.append('        return rungs')
 
@@ -295,6 +286,25 @@ class ModuleGenerator:
         lines.append('')
         return '\n'.join(lines)
 
+    def _generate_rung_code(self, rung: dict[str, Any]) -> list[str]:
+        """Generate Python code appending a rung created from a rung template.
+
+        The rung text is kept as a template (not an f-string), so it is tokenized once
+        and only the operands are substituted for each module.
+
+        Args:
+            rung: Rung configuration with text_template and comment
+
+        Returns:
+            Lines of Python code
+        """
+        return [
+            '        rungs.append(self.create_rung_from_template(',
+            f"            {rung['text_template']!r},",
+            f"            comment='{rung['comment']}'",
+            '        ))',
+        ]
+
     def _generate_template_code(self, template: str) -> str:
         """Generate Python code for a template string with placeholders.
 
@@ -351,11 +361,15 @@ class ModuleGenerator:
 
 
 def main():
-    """Main entry point for the generator."""
+    """Main entry point for the generator.
+
+    The classes are written to the directory given as first argument (default: ``generated`` in the working
+    directory). The package itself loads the configurations through the module registry, not generated code.
+    """
     # Determine paths
     script_dir = Path(__file__).parent
     config_dir = script_dir / 'config'
-    output_dir = script_dir / 'generated'
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd() / 'generated'
 
     print(f"Config directory: {config_dir}")
     print(f"Output directory: {output_dir}")
@@ -1,50 +0,0 @@
-"""Auto-generated module exports."""
-# This file is auto-generated. Do not edit directly.
-
-from .ab_1732es_ib812obv2 import AB_1732Es_IB812OBV2
-from .ab_1732es_ib16 import AB_1732Es_IB16
-from .ab_1732es_ib8xobv4 import AB_1732Es_IB8XOBV4
-from .ab_1734_8cfg import AB_1734_8CFG
-from .ab_1734_aent import AB_1734_AENT
-from .ab_1734_aentr import AB_1734_AENTR
-from .ab_1734_ib8 import AB_1734_IB8
-from .ab_1734_ib8s import AB_1734_IB8S
-from .ab_1734_ob8 import AB_1734_OB8
-from .ab_1736_ent import AB_1736_ENT
-from .ab_1756_l8 import AB_1756_L8
-from .ab_1791es import AB_1791ES
-from .keyence_sz_v_scanner import Keyence_SZ_V_Scanner
-from .ntron_enet_switch import NTron_ENET_Switch
-from .pf_eip_encoder import PF_EIP_Encoder
-from .pf_eip_rope_encoder import PF_EIP_Rope_Encoder
-from .sew_movisafe import SEW_MoviSafe
-from .siemens_g115d import Siemens_G115D
-from .turck_tben_16cfg import Turck_TBEN_16CFG
-from .turck_tben_16in import Turck_TBEN_16In
-from .turck_tben_8i8o import Turck_TBEN_8I8O
-from .turck_tben_l4_8iol import Turck_TBEN_L4_8IOL
-
-__all__ = [
-    'AB_1732Es_IB812OBV2',
-    'AB_1732Es_IB16',
-    'AB_1732Es_IB8XOBV4',
-    'AB_1734_8CFG',
-    'AB_1734_AENT',
-    'AB_1734_AENTR',
-    'AB_1734_IB8',
-    'AB_1734_IB8S',
-    'AB_1734_OB8',
-    'AB_1736_ENT',
-    'AB_1756_L8',
-    'AB_1791ES',
-    'Keyence_SZ_V_Scanner',
-    'NTron_ENET_Switch',
-    'PF_EIP_Encoder',
-    'PF_EIP_Rope_Encoder',
-    'SEW_MoviSafe',
-    'Siemens_G115D',
-    'Turck_TBEN_16CFG',
-    'Turck_TBEN_16In',
-    'Turck_TBEN_8I8O',
-    'Turck_TBEN_L4_8IOL',
-]
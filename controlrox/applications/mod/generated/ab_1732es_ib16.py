@@ -1,79 +0,0 @@
-"""Auto-generated module class from JSON configuration.
-
-Allen Bradley 1732ES-IB16 Safety Block Module
-
-DO NOT EDIT THIS FILE DIRECTLY.
-Edit the corresponding JSON config file and regenerate.
-Generated: 2025-12-09 09:45:21
-"""
-from controlrox.interfaces import ModuleControlsType
-from controlrox.applications.mod.meta import GeneratedModule
-
-
-class AB_1732Es_IB16(GeneratedModule):
-    """Allen Bradley 1732ES-IB16 Safety Block Module"""
-
-    def get_catalog_number(self) -> str:
-        """The catalog number of the module."""
-        return '1732ES-IB16'
-
-    def get_module_controls_type(self) -> ModuleControlsType:
-        """The controls type of the module."""
-        return ModuleControlsType.SAFETY_BLOCK
-
-    def get_required_imports(self) -> list[tuple[str, list[str]]]:
-        """Get the required datatype imports for the module."""
-        return [
-            (r'docs\\controls\\emu\\Demo3D_WDint_DataType.L5X', ['DataTypes']),
-            (r'docs\\controls\\emu\\Demo3D_CommOK_SBK_DataType.L5X', ['DataTypes']),
-        ]
-
-    def get_required_tags(self, **__) -> list[dict]:
-        """Get the required tags for the module."""
-        if not self.controller:
-            raise ValueError("Controller not set for this module")
-
-        tags = []
-        tags.append({
-            'tag_name': f'zz_Demo3D_Comm_{self.controller.process_name}SBK',
-            'datatype': 'Demo3D_CommOK_SBK',
-            'tag_class': 'Standard',
-            'description': 'Communication status tag for SBK module array.',
-        })
-        tags.append({
-            'tag_name': self.get_standard_input_tag_name(),
-            'datatype': 'Demo3D_WDint',
-            'tag_class': 'Standard',
-            'description': 'Standard input tag.',
-        })
-        tags.append({
-            'tag_name': self.get_safety_input_tag_name(),
-            'datatype': 'Demo3D_WDint',
-            'tag_class': 'Safety',
-            'description': 'Safety input tag.',
-        })
-        tags.append({
-            'tag_name': self.get_standard_output_tag_name(),
-            'datatype': 'DINT',
-            'tag_class': 'Standard',
-            'description': 'Standard output tag.',
-        })
-        return tags
-
-    def get_required_safety_rungs(self, **__):
-        """Get the required safety rungs for the module."""
-        rungs = []
-        rungs.append(self.controller.create_rung(
-            rung_text=f'COP(sz_Demo3D_{self.base_module.name}_I,{self.base_module.name}:I,1);',
-            comment='Copy the input data from the emulation tag to the safety block.'
-        ))
-        return rungs
-
-    def get_required_standard_rungs(self, **__):
-        """Get the required standard rungs for the module."""
-        rungs = []
-        rungs.append(self.controller.create_rung(
-            rung_text=f'COP({self.base_module.name}:O,zz_Demo3D_{self.base_module.name}_O,1);',
-            comment='Copy the output data from the safety block to the emulation tag.'
-        ))
-        return rungs
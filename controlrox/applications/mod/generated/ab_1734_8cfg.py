@@ -1,22 +0,0 @@
-"""Auto-generated module class from JSON configuration.
-
-Allen Bradley 1734-8CFG Configurable Chassis Module
-
-DO NOT EDIT THIS FILE DIRECTLY.
-Edit the corresponding JSON config file and regenerate.
-Generated: 2025-12-09 09:45:21
-"""
-from controlrox.interfaces import ModuleControlsType
-from controlrox.applications.mod.meta import GeneratedModule
-
-
-class AB_1734_8CFG(GeneratedModule):
-    """Allen Bradley 1734-8CFG Configurable Chassis Module"""
-
-    def get_catalog_number(self) -> str:
-        """The catalog number of the module."""
-        return '1734-8CFG'
-
-    def get_module_controls_type(self) -> ModuleControlsType:
-        """The controls type of the module."""
-        return ModuleControlsType.POINT_IO
@@ -1,81 +0,0 @@
-"""Auto-generated module class from JSON configuration.
-
-Keyence SZ-V Scanner Module
-
-DO NOT EDIT THIS FILE DIRECTLY.
-Edit the corresponding JSON config file and regenerate.
-Generated: 2025-12-09 09:45:21
-"""
-from controlrox.interfaces import ModuleControlsType
-from controlrox.applications.mod.meta import GeneratedModule
-
-
-class Keyence_SZ_V_Scanner(GeneratedModule):
-    """Keyence SZ-V Scanner Module"""
-
-    def get_catalog_number(self) -> str:
-        """The catalog number of the module."""
-        return 'ETHERNET-SAFETYMODULE'
-
-    def get_module_controls_type(self) -> ModuleControlsType:
-        """The controls type of the module."""
-        return ModuleControlsType.SAFETY_SCANNER
-
-    def get_input_connection_point(self) -> int:
-        """Get the input connection point for the module."""
-        return 130
-
-    def get_output_connection_point(self) -> int:
-        """Get the output connection point for the module."""
-        return 1278
-
-    def get_config_connection_point(self) -> int:
-        """Get the configuration connection point for the module."""
-        return 0
-
-    def get_input_connection_size(self) -> int:
-        """Get the input connection size for the module."""
-        return 16
-
-    def get_output_connection_size(self) -> int:
-        """Get the output connection size for the module."""
-        return 0
-
-    def get_config_connection_size(self) -> int:
-        """Get the configuration connection size for the module."""
-        return 0
-
-    def get_safety_input_tag_name(self) -> str:
-        """Get the safety input tag name."""
-        return f'sz_Demo3D_{self.base_module.parent_module}_I'
-
-    def get_standard_input_tag_name(self) -> str:
-        """Get the standard input tag name."""
-        return f'zz_Demo3D_{self.base_module.parent_module}_I'
-
-    def get_standard_output_tag_name(self) -> str:
-        """Get the standard output tag name."""
-        return f'zz_Demo3D_{self.base_module.parent_module}_O'
-
-    def get_required_tags(self, **__) -> list[dict]:
-        """Get the required tags for the module."""
-        tags = []
-        tags.append({
-            'tag_name': self.get_standard_input_tag_name(),
-            'datatype': 'Demo3D_HMI_IN',
-            'tag_class': 'Standard',
-            'description': 'Standard input tag for the Keyence SZ-V Scanner module.',
-        })
-        tags.append({
-            'tag_name': self.get_safety_input_tag_name(),
-            'datatype': 'Demo3D_HMI_IN',
-            'tag_class': 'Safety',
-            'description': 'Safety input tag for the Keyence SZ-V Scanner module.',
-        })
-        tags.append({
-            'tag_name': self.get_standard_output_tag_name(),
-            'datatype': 'Demo3D_HMI_OUT',
-            'tag_class': 'Standard',
-            'description': 'Standard output tag for the Keyence SZ-V Scanner module.',
-        })
-        return tags
@@ -1,66 +0,0 @@
-"""Auto-generated module class from JSON configuration.
-
-Pepperl+Fuchs Ethernet IP Encoder Module
-
-DO NOT EDIT THIS FILE DIRECTLY.
-Edit the corresponding JSON config file and regenerate.
-Generated: 2025-12-09 09:45:21
-"""
-from controlrox.interfaces import ModuleControlsType
-from controlrox.applications.mod.meta import GeneratedModule
-
-
-class PF_EIP_Encoder(GeneratedModule):
-    """Pepperl+Fuchs Ethernet IP Encoder Module"""
-
-    def get_catalog_number(self) -> str:
-        """The catalog number of the module."""
-        return 'ETHERNET-MODULE'
-
-    def get_module_controls_type(self) -> ModuleControlsType:
-        """The controls type of the module."""
-        return ModuleControlsType.ENCODER
-
-    def get_input_connection_point(self) -> int:
-        """Get the input connection point for the module."""
-        return 101
-
-    def get_output_connection_point(self) -> int:
-        """Get the output connection point for the module."""
-        return 193
-
-    def get_config_connection_point(self) -> int:
-        """Get the configuration connection point for the module."""
-        return 0
-
-    def get_input_connection_size(self) -> int:
-        """Get the input connection size for the module."""
-        return 22
-
-    def get_output_connection_size(self) -> int:
-        """Get the output connection size for the module."""
-        return 0
-
-    def get_config_connection_size(self) -> int:
-        """Get the configuration connection size for the module."""
-        return 0
-
-    def get_required_tags(self, **__) -> list[dict]:
-        """Get the required tags for the module."""
-        tags = []
-        tags.append({
-            'tag_name': self.get_standard_input_tag_name(),
-            'datatype': 'DINT',
-            'tag_class': 'Standard',
-            'description': 'Standard input tag.',
-        })
-        return tags
-
-    def get_required_standard_rungs(self, **__):
-        """Get the required standard rungs for the module."""
-        rungs = []
-        rungs.append(self.controller.create_rung(
-            rung_text=f'XIC(zz_Demo3D_TestBit)NOP();',
-            comment='Integration TBD.'
-        ))
-        return rungs
@@ -1,57 +0,0 @@
-"""Auto-generated module class from JSON configuration.
-
-Pepperl+Fuchs Ethernet IP Rope Encoder Module ECA30PL-02C1A-B25AZ:OE
-
-DO NOT EDIT THIS FILE DIRECTLY.
-Edit the corresponding JSON config file and regenerate.
-Generated: 2025-12-09 09:45:21
-"""
-from controlrox.interfaces import ModuleControlsType
-from controlrox.applications.mod.meta import GeneratedModule
-
-
-class PF_EIP_Rope_Encoder(GeneratedModule):
-    """Pepperl+Fuchs Ethernet IP Rope Encoder Module ECA30PL-02C1A-B25AZ:OE"""
-
-    def get_catalog_number(self) -> str:
-        """The catalog number of the module."""
-        return 'ETHERNET-MODULE'
-
-    def get_module_controls_type(self) -> ModuleControlsType:
-        """The controls type of the module."""
-        return ModuleControlsType.ENCODER
-
-    def get_input_connection_point(self) -> int:
-        """Get the input connection point for the module."""
-        return 3
-
-    def get_output_connection_point(self) -> int:
-        """Get the output connection point for the module."""
-        return 105
-
-    def get_config_connection_point(self) -> int:
-        """Get the configuration connection point for the module."""
-        return 0
-
-    def get_input_connection_size(self) -> int:
-        """Get the input connection size for the module."""
-        return 8
-
-    def get_output_connection_size(self) -> int:
-        """Get the output connection size for the module."""
-        return 0
-
-    def get_config_connection_size(self) -> int:
-        """Get the configuration connection size for the module."""
-        return 12
-
-    def get_required_tags(self, **__) -> list[dict]:
-        """Get the required tags for the module."""
-        tags = []
-        tags.append({
-            'tag_name': self.get_standard_input_tag_name(),
-            'datatype': 'DINT',
-            'tag_class': 'Standard',
-            'description': 'Standard input tag.',
-        })
-        return tags
@@ -1,87 +0,0 @@
-"""Auto-generated module class from JSON configuration.
-
-SEW MoviSafe Drive Module
-
-DO NOT EDIT THIS FILE DIRECTLY.
-Edit the corresponding JSON config file and regenerate.
-Generated: 2025-12-09 09:45:21
-"""
-from controlrox.interfaces import ModuleControlsType
-from controlrox.applications.mod.meta import GeneratedModule
-
-
-class SEW_MoviSafe(GeneratedModule):
-    """SEW MoviSafe Drive Module"""
-
-    def get_catalog_number(self) -> str:
-        """The catalog number of the module."""
-        return 'ETHERNET-SAFETY-STANDARD-MODULE'
-
-    def get_module_controls_type(self) -> ModuleControlsType:
-        """The controls type of the module."""
-        return ModuleControlsType.DRIVE
-
-    def get_input_connection_point(self) -> int:
-        """Get the input connection point for the module."""
-        return 130
-
-    def get_output_connection_point(self) -> int:
-        """Get the output connection point for the module."""
-        return 120
-
-    def get_config_connection_point(self) -> int:
-        """Get the configuration connection point for the module."""
-        return 100
-
-    def get_input_connection_size(self) -> int:
-        """Get the input connection size for the module."""
-        return 16
-
-    def get_output_connection_size(self) -> int:
-        """Get the output connection size for the module."""
-        return 16
-
-    def get_config_connection_size(self) -> int:
-        """Get the configuration connection size for the module."""
-        return 0
-
-    def get_required_imports(self) -> list[tuple[str, list[str]]]:
-        """Get the required datatype imports for the module."""
-        return [
-            (r'docs\\controls\\emu\\Demo3D_MoviMotAdv_DataType.L5X', ['DataTypes']),
-        ]
-
-    def get_required_tags(self, **__) -> list[dict]:
-        """Get the required tags for the module."""
-        tags = []
-        tags.append({
-            'tag_name': self.get_standard_input_tag_name(),
-            'datatype': 'Demo3D_WDint',
-            'tag_class': 'Standard',
-            'description': 'Standard input tag.',
-        })
-        tags.append({
-            'tag_name': self.get_safety_input_tag_name(),
-            'datatype': 'Demo3D_WDint',
-            'tag_class': 'Safety',
-            'description': 'Safety input tag.',
-        })
-        return tags
-
-    def get_required_safety_rungs(self, **__):
-        """Get the required safety rungs for the module."""
-        rungs = []
-        rungs.append(self.controller.create_rung(
-            rung_text=f'COP(sz_Demo3D_{self.base_module.name}_I,{self.base_module.name}:SI,1);',
-            comment='Copy the input data from the emulation tag to the safety block.'
-        ))
-        return rungs
-
-    def get_required_standard_rungs(self, **__):
-        """Get the required standard rungs for the module."""
-        rungs = []
-        rungs.append(self.controller.create_rung(
-            rung_text=f'COP(zz_Demo3D_{self.base_module.name}.I,{self.base_module.name}:I,1)COP({self.base_module.name}:O,zz_Demo3D_{self.base_module.name}.O,1);',
-            comment='Standard Emulation Logic for SEW Safe MoviDrive.'
-        ))
-        return rungs
@@ -1,75 +0,0 @@
-"""Auto-generated module class from JSON configuration.
-
-Siemens G115D Drive Module
-
-DO NOT EDIT THIS FILE DIRECTLY.
-Edit the corresponding JSON config file and regenerate.
-Generated: 2025-12-09 09:45:21
-"""
-from controlrox.interfaces import ModuleControlsType
-from controlrox.applications.mod.meta import GeneratedModule
-
-
-class Siemens_G115D(GeneratedModule):
-    """Siemens G115D Drive Module"""
-
-    def get_catalog_number(self) -> str:
-        """The catalog number of the module."""
-        return 'ETHERNET-MODULE'
-
-    def get_module_controls_type(self) -> ModuleControlsType:
-        """The controls type of the module."""
-        return ModuleControlsType.DRIVE
-
-    def get_input_connection_point(self) -> int:
-        """Get the input connection point for the module."""
-        return 101
-
-    def get_output_connection_point(self) -> int:
-        """Get the output connection point for the module."""
-        return 102
-
-    def get_config_connection_point(self) -> int:
-        """Get the configuration connection point for the module."""
-        return 0
-
-    def get_input_connection_size(self) -> int:
-        """Get the input connection size for the module."""
-        return 26
-
-    def get_output_connection_size(self) -> int:
-        """Get the output connection size for the module."""
-        return 4
-
-    def get_config_connection_size(self) -> int:
-        """Get the configuration connection size for the module."""
-        return 0
-
-    def get_required_imports(self) -> list[tuple[str, list[str]]]:
-        """Get the required datatype imports for the module."""
-        return [
-            (r'docs\\controls\\emu\\Demo3D_G115D_Drive_DataType.L5X', ['DataTypes']),
-        ]
-
-    def get_required_tags(self, **__) -> list[dict]:
-        """Get the required tags for the module."""
-        if not self.controller:
-            raise ValueError("Controller not set for this module")
-
-        tags = []
-        tags.append({
-            'tag_name': f'zz_Demo3D_{self.controller.process_name}_Siemens_Drives',
-            'datatype': 'Demo3D_WDint',
-            'tag_class': 'Standard',
-            'description': 'Standard input tag for the drive array.',
-        })
-        return tags
-
-    def get_required_standard_rungs(self, **__):
-        """Get the required standard rungs for the module."""
-        rungs = []
-        rungs.append(self.controller.create_rung(
-            rung_text=f'COP(zz_Demo3D_{self.base_module.name}.I,{self.base_module.name}:I,1)COP({self.base_module.name}:O,zz_Demo3D_{self.base_module.name}.O,1);',
-            comment='Standard Emulation Logic for G115D Siemens Drives.'
-        ))
-        return rungs
@@ -1,46 +0,0 @@
-"""Auto-generated module class from JSON configuration.
-
-Turck TBEN-16In Input Module
-
-DO NOT EDIT THIS FILE DIRECTLY.
-Edit the corresponding JSON config file and regenerate.
-Generated: 2025-12-09 09:45:21
-"""
-from controlrox.interfaces import ModuleControlsType
-from controlrox.applications.mod.meta import GeneratedModule
-
-
-class Turck_TBEN_16In(GeneratedModule):
-    """Turck TBEN-16In Input Module"""
-
-    def get_catalog_number(self) -> str:
-        """The catalog number of the module."""
-        return 'ETHERNET-MODULE'
-
-    def get_module_controls_type(self) -> ModuleControlsType:
-        """The controls type of the module."""
-        return ModuleControlsType.INPUT_BLOCK
-
-    def get_input_connection_point(self) -> int:
-        """Get the input connection point for the module."""
-        return 103
-
-    def get_output_connection_point(self) -> int:
-        """Get the output connection point for the module."""
-        return 104
-
-    def get_config_connection_point(self) -> int:
-        """Get the configuration connection point for the module."""
-        return 0
-
-    def get_input_connection_size(self) -> int:
-        """Get the input connection size for the module."""
-        return 8
-
-    def get_output_connection_size(self) -> int:
-        """Get the output connection size for the module."""
-        return 2
-
-    def get_config_connection_size(self) -> int:
-        """Get the configuration connection size for the module."""
-        return 16
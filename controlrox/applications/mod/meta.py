@@ -1,13 +1,16 @@
 """Generic Generated Module Class.
 This is the base class for all auto-generated module classes.
 """
+from typing import Any
+
 from pyrox.models.factory import FactoryTypeMeta
+from controlrox.interfaces import IRung
 from controlrox.models import (
     Controller,
     IntrospectiveModule,
 )
-from controlrox.services import ControllerInstanceManager
-from controlrox.services.plc.introspective import IntrospectiveModuleWarehouse
+from controlrox.services import ControllerInstanceManager, get_rung_template
+from controlrox.services.plc.introspective import IntrospectiveModuleWarehouse, IntrospectiveModuleWarehouseFactory
 
 
 class GeneratedModule(
@@ -23,7 +26,8 @@ class GeneratedModule(
 
     def __init_subclass__(cls, **kwargs):
         cls.supports_registering = True
-        return super().__init_subclass__(**kwargs)
+        super().__init_subclass__(**kwargs)
+        IntrospectiveModuleWarehouseFactory.register_module_class(cls)
 
     @classmethod
     def get_factory(cls):
@@ -48,3 +52,53 @@ class GeneratedModule(
 
     def get_standard_output_tag_name(self):
         return f'zz_Demo3D_{self.base_module.name}_O'
+
+    def get_template_operand(
+        self,
+        field: str
+    ) -> Any:
+        """Get the operand of a rung template placeholder.
+
+        Placeholders are resolved against the base module (``{module.<attribute>}``)
+        and the controller (``{controller.<attribute>}``).
+
+        Args:
+            field: The placeholder name, e.g. 'module.parent_module'.
+
+        Returns:
+            Any: The operand.
+
+        Raises:
+            ValueError: If the placeholder does not start with 'module.' or 'controller.'.
+        """
+        root, _, path = field.partition('.')
+        if root == 'module':
+            value: Any = self.base_module
+        elif root == 'controller':
+            value = self.controller
+        else:
+            raise ValueError(f'Unknown rung template placeholder: {field}')
+        for attribute in path.split('.') if path else ():
+            value = getattr(value, attribute)
+        return value
+
+    def create_rung_from_template(
+        self,
+        text_template: str,
+        comment: str = ''
+    ) -> IRung:
+        """Create a rung from a rung template, bound to this module.
+
+        The template is tokenized and validated once per text, so modules of the same type only substitute
+        their operands into it.
+
+        Args:
+            text_template: The rung text, with placeholders like {module.name}.
+            comment: The rung comment.
+
+        Returns:
+            IRung: The rung.
+        """
+        template = get_rung_template(text_template, comment)
+        operands = {x: self.get_template_operand(x) for x in template.fields}
+        return template.create_rung(self.controller, operands)
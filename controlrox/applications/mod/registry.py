@@ -0,0 +1,678 @@
+"""Runtime registry of module configurations.
+
+Reads the JSON module configurations (validated against ``module_config_schema.json``) into compact, immutable
+module specs indexed by their match key (catalog number, connection points and sizes). A module class is only
+created when a module matching a spec is introspected, so adding a device only needs a new JSON file
+(no generated code, no import at startup).
+
+Parsed specs are cached per file (by modification time and size) in memory and in a JSON file in the user cache
+directory, so reloading the registry only parses the files that changed.
+"""
+import json
+import os
+import sys
+import types
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Optional,
+    Union,
+)
+
+from pyrox.services.logging import log
+from controlrox.interfaces import IModule, IRung, ModuleControlsType
+from controlrox.services.plc import get_rung_template
+from controlrox.services.plc.introspective import (
+    LAZY_MATCH_EXCLUDED_CATALOG,
+    IntrospectiveModuleWarehouseFactory,
+    get_module_match_key,
+)
+from .meta import GeneratedModule
+from .validate_configs import ConfigValidator
+
+__all__ = (
+    'ModuleRungSpec',
+    'ModuleSpec',
+    'ModuleSpecRegistry',
+    'ModuleTagSpec',
+    'get_module_registry',
+    'get_user_cache_dir',
+    'render_template',
+)
+
+DEFAULT_CONFIG_DIR = Path(__file__).parent / 'config'
+SCHEMA_FILE_NAME = 'module_config_schema.json'
+CACHE_FILE_NAME = 'module_specs.json'
+CACHE_VERSION = 2
+
+_TAG_NAME_METHOD_KEYS = ('safety_input', 'safety_output', 'standard_input', 'standard_output')
+
+
+def get_user_cache_dir() -> Path:
+    """Get the controlrox directory of the user cache (LOCALAPPDATA on Windows, XDG_CACHE_HOME or ~/.cache else)."""
+    if sys.platform == 'win32' and os.environ.get('LOCALAPPDATA'):
+        return Path(os.environ['LOCALAPPDATA']) / 'controlrox' / 'cache'
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'controlrox'
+
+
+def render_template(
+    template: str,
+    imodule: Any
+) -> str:
+    """Render a configuration template for an introspective module.
+
+    Supports the same placeholders as the module generator: ``{module.name}``, ``{module.parent_module}``
+    and ``{controller.process_name}``.
+
+    Args:
+        template: The template to render.
+        imodule: The introspective module to render the template for.
+
+    Returns:
+        str: The rendered text.
+    """
+    if '{' not in template:
+        return template
+    text = template
+    if '{module.name}' in text:
+        text = text.replace('{module.name}', str(imodule.base_module.name))
+    if '{module.parent_module}' in text:
+        text = text.replace('{module.parent_module}', str(imodule.base_module.parent_module))
+    if '{controller.process_name}' in text:
+        text = text.replace('{controller.process_name}', str(imodule.controller.process_name))
+    return text
+
+
+@dataclass(frozen=True)
+class ModuleTagSpec:
+    """A tag required by a configured module.
+
+    Attributes:
+        name_template: Template of the tag name (used if no name method is set).
+        name_method: Name of the module method returning the tag name.
+        datatype: Data type of the tag.
+        tag_class: 'Safety' or 'Standard', if set.
+        description: Description of the tag, if set.
+    """
+    name_template: str = ''
+    name_method: str = ''
+    datatype: Optional[str] = None
+    tag_class: Optional[str] = None
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ModuleRungSpec:
+    """A rung required by a configured module.
+
+    Attributes:
+        text_template: Template of the rung text.
+        comment: Comment of the rung.
+    """
+    text_template: str
+    comment: str = ''
+
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    """Compact, immutable form of a module configuration.
+
+    Attributes:
+        catalog_number: Catalog number of the module.
+        class_name: Name of the module class created for the spec.
+        controls_type: Name of the ModuleControlsType of the module.
+        description: Description of the module.
+        connection_points: Input, output and config connection points.
+        connection_sizes: Input, output and config connection sizes.
+        required_imports: L5X file paths and the elements to import from each.
+        tag_name_methods: Tag name method keys (e.g. 'safety_input') and their templates.
+        tags: Tags required by the module.
+        safety_rungs: Safety rungs required by the module.
+        standard_rungs: Standard rungs required by the module.
+        standard_to_safety_mapping: Names of the methods returning the standard and safety tag names to map, if any.
+        source: Name of the configuration file.
+    """
+    catalog_number: str
+    class_name: str
+    controls_type: str
+    description: str = ''
+    connection_points: tuple[int, int, int] = (0, 0, 0)
+    connection_sizes: tuple[int, int, int] = (0, 0, 0)
+    required_imports: tuple[tuple[str, tuple[str, ...]], ...] = ()
+    tag_name_methods: tuple[tuple[str, str], ...] = ()
+    tags: tuple[ModuleTagSpec, ...] = ()
+    safety_rungs: tuple[ModuleRungSpec, ...] = ()
+    standard_rungs: tuple[ModuleRungSpec, ...] = ()
+    standard_to_safety_mapping: Optional[tuple[str, str]] = None
+    source: str = ''
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict,
+        source: str = ''
+    ) -> 'ModuleSpec':
+        """Create a spec from a (validated) module configuration.
+
+        Args:
+            config: The parsed module configuration.
+            source: Name of the configuration file.
+
+        Returns:
+            ModuleSpec: The spec.
+        """
+        points = config.get('connection_points', {})
+        sizes = config.get('connection_sizes', {})
+        rungs = config.get('rungs', {})
+        mapping = config.get('standard_to_safety_mapping')
+        return cls(
+            catalog_number=config['catalog_number'],
+            class_name=config['class_name'],
+            controls_type=config['controls_type'],
+            description=config.get('metadata', {}).get('description', ''),
+            connection_points=(points.get('input', 0), points.get('output', 0), points.get('config', 0)),
+            connection_sizes=(sizes.get('input', 0), sizes.get('output', 0), sizes.get('config', 0)),
+            required_imports=tuple(
+                (x['path'], tuple(x['elements'])) for x in config.get('required_imports', [])
+            ),
+            tag_name_methods=tuple(
+                (k, v) for k, v in config.get('tag_name_methods', {}).items() if k in _TAG_NAME_METHOD_KEYS
+            ),
+            tags=tuple(
+                ModuleTagSpec(
+                    name_template=x.get('name_template', ''),
+                    name_method=x.get('name_method', ''),
+                    datatype=x.get('datatype'),
+                    tag_class=x.get('tag_class'),
+                    description=x.get('description'),
+                ) for x in config.get('tags', [])
+            ),
+            safety_rungs=tuple(ModuleRungSpec(x['text_template'], x['comment']) for x in rungs.get('safety', [])),
+            standard_rungs=tuple(ModuleRungSpec(x['text_template'], x['comment']) for x in rungs.get('standard', [])),
+            standard_to_safety_mapping=(
+                (mapping['standard_name_method'], mapping['safety_name_method']) if mapping else None
+            ),
+            source=source,
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict
+    ) -> 'ModuleSpec':
+        """Create a spec from its dictionary form (see dataclasses.asdict), as read from the cache file.
+
+        Args:
+            data: The spec as a dictionary, with lists in place of tuples.
+
+        Returns:
+            ModuleSpec: The spec.
+        """
+        mapping = data.get('standard_to_safety_mapping')
+        return cls(**{
+            **data,
+            'connection_points': tuple(data['connection_points']),
+            'connection_sizes': tuple(data['connection_sizes']),
+            'required_imports': tuple((path, tuple(elements)) for path, elements in data['required_imports']),
+            'tag_name_methods': tuple((key, template) for key, template in data['tag_name_methods']),
+            'tags': tuple(ModuleTagSpec(**x) for x in data['tags']),
+            'safety_rungs': tuple(ModuleRungSpec(**x) for x in data['safety_rungs']),
+            'standard_rungs': tuple(ModuleRungSpec(**x) for x in data['standard_rungs']),
+            'standard_to_safety_mapping': tuple(mapping) if mapping else None,
+        })
+
+    @property
+    def match_key(self) -> tuple[Any, ...]:
+        """The key modules are matched to this spec by (see get_module_match_key)."""
+        return (self.catalog_number, *self.connection_points, *self.connection_sizes)
+
+    def get_tag_name_template(
+        self,
+        key: str
+    ) -> Optional[str]:
+        """Get the template of a tag name method (e.g. 'safety_input'), or None if the spec does not define it."""
+        for method_key, template in self.tag_name_methods:
+            if method_key == key:
+                return template
+        return None
+
+
+class _ConfiguredModule:
+    """Module behaviour driven by a ModuleSpec. Combined with GeneratedModule into each materialized class."""
+
+    spec: ModuleSpec
+
+    def _get_tag_name(
+        self,
+        key: str,
+        default: str
+    ) -> str:
+        template = self.spec.get_tag_name_template(key)
+        return default if template is None else render_template(template, self)
+
+    def get_catalog_number(self) -> str:
+        """The catalog number of the module."""
+        return self.spec.catalog_number
+
+    def get_module_controls_type(self) -> ModuleControlsType:
+        """The controls type of the module."""
+        return ModuleControlsType[self.spec.controls_type]
+
+    def get_input_connection_point(self) -> int:
+        """Get the input connection point for the module."""
+        return self.spec.connection_points[0]
+
+    def get_output_connection_point(self) -> int:
+        """Get the output connection point for the module."""
+        return self.spec.connection_points[1]
+
+    def get_config_connection_point(self) -> int:
+        """Get the configuration connection point for the module."""
+        return self.spec.connection_points[2]
+
+    def get_input_connection_size(self) -> int:
+        """Get the input connection size for the module."""
+        return self.spec.connection_sizes[0]
+
+    def get_output_connection_size(self) -> int:
+        """Get the output connection size for the module."""
+        return self.spec.connection_sizes[1]
+
+    def get_config_connection_size(self) -> int:
+        """Get the configuration connection size for the module."""
+        return self.spec.connection_sizes[2]
+
+    def get_required_imports(self) -> list[tuple[str, list[str]]]:
+        """Get the required datatype imports for the module."""
+        return [(path, list(elements)) for path, elements in self.spec.required_imports]
+
+    def get_safety_input_tag_name(self) -> str:
+        """Get the safety input tag name."""
+        return self._get_tag_name('safety_input', super().get_safety_input_tag_name())  # type: ignore[misc]
+
+    def get_safety_output_tag_name(self) -> str:
+        """Get the safety output tag name."""
+        return self._get_tag_name('safety_output', super().get_safety_output_tag_name())  # type: ignore[misc]
+
+    def get_standard_input_tag_name(self) -> str:
+        """Get the standard input tag name."""
+        return self._get_tag_name('standard_input', super().get_standard_input_tag_name())  # type: ignore[misc]
+
+    def get_standard_output_tag_name(self) -> str:
+        """Get the standard output tag name."""
+        return self._get_tag_name('standard_output', super().get_standard_output_tag_name())  # type: ignore[misc]
+
+    def get_required_tags(self, **__) -> list[dict]:
+        """Get the required tags for the module."""
+        tags = []
+        for tag in self.spec.tags:
+            if tag.name_method:
+                tag_name = getattr(self, tag.name_method)()
+            else:
+                tag_name = render_template(tag.name_template, self)
+            tag_dict = {'tag_name': tag_name}
+            for key in ('datatype', 'tag_class', 'description'):
+                value = getattr(tag, key)
+                if value is not None:
+                    tag_dict[key] = value
+            tags.append(tag_dict)
+        return tags
+
+    def _create_rungs(
+        self,
+        rungs: tuple[ModuleRungSpec, ...]
+    ) -> list[IRung]:
+        return [
+            self.create_rung_from_template(rung.text_template, rung.comment)  # type: ignore[attr-defined]
+            for rung in rungs
+        ]
+
+    def get_required_safety_rungs(self, **__) -> list[IRung]:
+        """Get the required safety rungs for the module."""
+        return self._create_rungs(self.spec.safety_rungs)
+
+    def get_required_standard_rungs(self, **__) -> list[IRung]:
+        """Get the required standard rungs for the module."""
+        return self._create_rungs(self.spec.standard_rungs)
+
+    def get_required_standard_to_safety_mapping(self, **__) -> tuple[str, str]:
+        """Get mapping from standard tags to safety tags."""
+        if not self.spec.standard_to_safety_mapping:
+            return ('', '')
+        standard_method, safety_method = self.spec.standard_to_safety_mapping
+        return (getattr(self, standard_method)(), getattr(self, safety_method)())
+
+
+class ModuleSpecRegistry:
+    """Registry of module specs read from a directory of JSON module configurations.
+
+    The configurations are read (and validated) on first use. Installing the registry registers it as a module
+    class provider of the introspective module warehouses: when no known module class matches a module, the
+    registry creates the class of the matching spec, which registers itself like any generated module class.
+
+    Args:
+        config_dir: Directory of the JSON configurations. Defaults to the bundled ``config`` directory.
+        cache_path: JSON file caching the parsed specs. Defaults to ``module_specs.json`` in the user cache
+            directory (see get_user_cache_dir).
+        use_cache: Whether to read and write the cache file.
+    """
+
+    def __init__(
+        self,
+        config_dir: Optional[Union[str, Path]] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        use_cache: bool = True,
+    ) -> None:
+        self.config_dir = Path(config_dir) if config_dir else DEFAULT_CONFIG_DIR
+        self.cache_path = Path(cache_path) if cache_path else get_user_cache_dir() / CACHE_FILE_NAME
+        self.use_cache = use_cache
+        self._validator: Optional[ConfigValidator] = None
+        self._schema_stamp: Optional[tuple[int, int]] = None
+        self._entries: Optional[dict[str, tuple[tuple[int, int], Optional[ModuleSpec], tuple[str, ...]]]] = None
+        self._specs: Optional[tuple[ModuleSpec, ...]] = None
+        self._exact: dict[tuple[Any, ...], int] = {}
+        self._by_catalog: dict[str, int] = {}
+        self._by_class_name: dict[str, int] = {}
+        self._classes: dict[str, type[GeneratedModule]] = {}
+
+    def __contains__(self, catalog_number: str) -> bool:
+        self.load()
+        return catalog_number in self._by_catalog
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    @property
+    def specs(self) -> tuple[ModuleSpec, ...]:
+        """The valid specs, ordered by configuration file name."""
+        return self.load()
+
+    @property
+    def errors(self) -> dict[str, list[str]]:
+        """The validation errors of every invalid configuration file."""
+        self.load()
+        return {name: list(entry[2]) for name, entry in (self._entries or {}).items() if entry[2]}
+
+    @staticmethod
+    def _get_stamp(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get_validator(self) -> ConfigValidator:
+        if self._validator is None:
+            self._validator = ConfigValidator(str(self.config_dir / SCHEMA_FILE_NAME))
+        return self._validator
+
+    def _read_cache(self) -> dict:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(cache, dict)
+            or cache.get('version') != CACHE_VERSION
+            or cache.get('config_dir') != str(self.config_dir.resolve())
+            or cache.get('schema') != (list(self._schema_stamp) if self._schema_stamp else None)
+        ):
+            return {}
+        try:
+            return {
+                name: (tuple(stamp), ModuleSpec.from_dict(spec) if spec else None, tuple(errors))
+                for name, (stamp, spec, errors) in cache.get('entries', {}).items()
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            log(self).debug(f'Ignoring invalid module spec cache {self.cache_path}: {e}')
+            return {}
+
+    def _write_cache(self) -> None:
+        cache = {
+            'version': CACHE_VERSION,
+            'config_dir': str(self.config_dir.resolve()),
+            'schema': self._schema_stamp,
+            'entries': {
+                name: (stamp, asdict(spec) if spec else None, errors)
+                for name, (stamp, spec, errors) in (self._entries or {}).items()
+            },
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            log(self).debug(f'Could not write module spec cache {self.cache_path}: {e}')
+
+    def _parse_config(
+        self,
+        path: Path
+    ) -> tuple[Optional[ModuleSpec], tuple[str, ...]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            errors: tuple[str, ...] = (f'JSON parse error: {e}',)
+        else:
+            is_valid, error_list = self._get_validator().validate_data(config)
+            if is_valid:
+                spec = ModuleSpec.from_config(config, path.name)
+                error_list = self._validate_rungs(spec)
+                if not error_list:
+                    return spec, ()
+            errors = tuple(error_list)
+        log(self).warning(f'Invalid module configuration {path.name}: {"; ".join(errors)}')
+        return None, errors
+
+    @staticmethod
+    def _validate_rungs(spec: ModuleSpec) -> list[str]:
+        """Tokenize the rung templates of a spec once, so broken rung text is reported when loading."""
+        errors = []
+        for rung in spec.safety_rungs + spec.standard_rungs:
+            try:
+                get_rung_template(rung.text_template, rung.comment)
+            except ValueError as e:
+                errors.append(str(e))
+        return errors
+
+    def _build_index(self) -> None:
+        specs = []
+        self._exact.clear()
+        self._by_catalog.clear()
+        self._by_class_name.clear()
+        for _, spec, _ in (self._entries or {}).values():
+            if spec is None:
+                continue
+            order = len(specs)
+            specs.append(spec)
+            if spec.match_key in self._exact:
+                log(self).warning(
+                    f'Module configuration {spec.source} has the same match key as '
+                    f'{specs[self._exact[spec.match_key]].source}, it will never be matched exactly.'
+                )
+            self._exact.setdefault(spec.match_key, order)
+            self._by_catalog.setdefault(spec.catalog_number, order)
+            self._by_class_name.setdefault(spec.class_name, order)
+        self._specs = tuple(specs)
+
+    def _unregister_replaced_classes(self) -> None:
+        """Unregister the module classes whose spec changed or was removed, so the current specs are matched."""
+        for class_name, module_class in list(self._classes.items()):
+            if self.get_spec_by_class_name(class_name) != module_class.spec:  # type: ignore[attr-defined]
+                del self._classes[class_name]
+                IntrospectiveModuleWarehouseFactory.unregister_module_class(module_class)
+                log(self).debug(f'Unregistered module class {class_name}, its configuration changed')
+
+    def load(
+        self,
+        force: bool = False
+    ) -> tuple[ModuleSpec, ...]:
+        """Read the configurations, if they have not been read yet.
+
+        Only configuration files that are new or changed since they were last parsed (in this process or,
+        through the cache file, in another one) are parsed and validated again.
+
+        Args:
+            force: Check the configuration directory for changes even if it has been read already.
+
+        Returns:
+            tuple[ModuleSpec, ...]: The valid specs.
+        """
+        if self._specs is not None and not force:
+            return self._specs
+
+        schema_path = self.config_dir / SCHEMA_FILE_NAME
+        schema_stamp = self._get_stamp(schema_path) if schema_path.exists() else None
+        if schema_stamp != self._schema_stamp:
+            self._schema_stamp = schema_stamp
+            self._validator = None
+            self._entries = None
+        if self._entries is None:
+            self._entries = self._read_cache() if self.use_cache else {}
+
+        entries = {}
+        changed = False
+        for path in sorted(self.config_dir.glob('*.json')):
+            if path.name == SCHEMA_FILE_NAME:
+                continue
+            stamp = self._get_stamp(path)
+            entry = self._entries.get(path.name)
+            if entry is None or entry[0] != stamp:
+                entry = (stamp, *self._parse_config(path))
+                changed = True
+            entries[path.name] = entry
+        changed = changed or entries.keys() != self._entries.keys()
+
+        self._entries = entries
+        if changed and self.use_cache:
+            self._write_cache()
+        self._build_index()
+        self._unregister_replaced_classes()
+        log(self).debug(f'Loaded {len(self._specs or ())} module specs from {self.config_dir}')
+        return self._specs or ()
+
+    def reload(self) -> tuple[ModuleSpec, ...]:
+        """Re-read the configurations that changed since they were last read.
+
+        Module classes created from a changed (or removed) configuration are unregistered from the warehouses.
+
+        Returns:
+            tuple[ModuleSpec, ...]: The valid specs.
+        """
+        return self.load(force=True)
+
+    def get_spec(
+        self,
+        catalog_number: str
+    ) -> Optional[ModuleSpec]:
+        """Get the first spec with a catalog number.
+
+        Args:
+            catalog_number: The catalog number.
+
+        Returns:
+            Optional[ModuleSpec]: The spec, or None if no configuration has the catalog number.
+        """
+        specs = self.load()
+        order = self._by_catalog.get(catalog_number)
+        return specs[order] if order is not None else None
+
+    def get_spec_by_class_name(
+        self,
+        class_name: str
+    ) -> Optional[ModuleSpec]:
+        """Get the first spec with a class name.
+
+        Args:
+            class_name: The name of the module class.
+
+        Returns:
+            Optional[ModuleSpec]: The spec, or None if no configuration has the class name.
+        """
+        specs = self.load()
+        order = self._by_class_name.get(class_name)
+        return specs[order] if order is not None else None
+
+    def find_spec(
+        self,
+        module: IModule,
+        lazy_match_catalog: bool = False
+    ) -> Optional[ModuleSpec]:
+        """Find the spec matching a module, with the same rules as the introspective module index.
+
+        Args:
+            module: The module to match.
+            lazy_match_catalog: Also match specs whose catalog number is contained in the module's catalog number.
+
+        Returns:
+            Optional[ModuleSpec]: The matching spec, or None if no spec matches.
+        """
+        specs = self.load()
+        best = self._exact.get(get_module_match_key(module))
+
+        catalog_number = module.catalog_number
+        if lazy_match_catalog and catalog_number and catalog_number != LAZY_MATCH_EXCLUDED_CATALOG:
+            for spec_catalog, order in self._by_catalog.items():
+                if (best is None or order < best) and spec_catalog in catalog_number:
+                    best = order
+
+        return specs[best] if best is not None else None
+
+    def get_module_class(
+        self,
+        spec: ModuleSpec
+    ) -> type[GeneratedModule]:
+        """Get the module class of a spec, creating (and so registering) it on first use.
+
+        Args:
+            spec: The spec.
+
+        Returns:
+            type[GeneratedModule]: The module class.
+        """
+        module_class = self._classes.get(spec.class_name)
+        if module_class is None or module_class.spec != spec:  # type: ignore[attr-defined]
+            def exec_body(namespace: dict) -> None:
+                namespace['__module__'] = __name__
+                namespace['__doc__'] = spec.description or f'Generated module class for {spec.catalog_number}.'
+                namespace['spec'] = spec
+
+            module_class = types.new_class(spec.class_name, (_ConfiguredModule, GeneratedModule), exec_body=exec_body)
+            self._classes[spec.class_name] = module_class
+            log(self).debug(f'Created module class {spec.class_name} from {spec.source}')
+        return module_class
+
+    def match(
+        self,
+        module: IModule,
+        lazy_match_catalog: bool = False
+    ) -> Optional[type[GeneratedModule]]:
+        """Get the module class matching a module. Used as the module class provider of the warehouses.
+
+        Args:
+            module: The module to match.
+            lazy_match_catalog: Also match specs whose catalog number is contained in the module's catalog number.
+
+        Returns:
+            Optional[type[GeneratedModule]]: The module class, or None if no spec matches.
+        """
+        spec = self.find_spec(module, lazy_match_catalog)
+        return self.get_module_class(spec) if spec else None
+
+    def install(self) -> None:
+        """Register the registry as a module class provider of the introspective module warehouses."""
+        IntrospectiveModuleWarehouseFactory.register_module_provider(self.match)
+
+    def uninstall(self) -> None:
+        """Unregister the registry as a module class provider."""
+        IntrospectiveModuleWarehouseFactory.unregister_module_provider(self.match)
+
+
+_module_registry: Optional[ModuleSpecRegistry] = None
+
+
+def get_module_registry() -> ModuleSpecRegistry:
+    """Get the registry of the bundled module configurations."""
+    global _module_registry
+    if _module_registry is None:
+        _module_registry = ModuleSpecRegistry()
+    return _module_registry
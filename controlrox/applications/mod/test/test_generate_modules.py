@@ -306,8 +306,9 @@ class TestModuleGeneratorGenerateClassCode(unittest.TestCase):
         code = self.generator._generate_class_code(config)
 
         self.assertIn('def get_required_safety_rungs(self, **__):', code)
-        self.assertIn('rungs.append(self.controller.create_rung(', code)
-        self.assertIn("rung_text=f'COP({self.base_module.name}:I,Tag,1);',", code)
+        self.assertIn('rungs.append(self.create_rung_from_template(', code)
+        self.assertIn("'COP({module.name}:I,Tag,1);',", code)
+        self.assertNotIn("f'COP(", code)
         self.assertIn("comment='Copy input data'", code)
 
     def test_generate_class_code_with_standard_rungs(self):
@@ -333,9 +334,9 @@ class TestModuleGeneratorGenerateClassCode(unittest.TestCase):
         code = self.generator._generate_class_code(config)
 
         self.assertIn('def get_required_standard_rungs(self, **__):', code)
-        self.assertIn("rung_text=f'MOV(Source,Dest);',", code)
+        self.assertIn("'MOV(Source,Dest);',", code)
         self.assertIn("comment='Move data'", code)
-        self.assertIn("rung_text=f'ADD(A,B,C);',", code)
+        self.assertIn("'ADD(A,B,C);',", code)
         self.assertIn("comment='Add values'", code)
 
     def test_generate_class_code_with_both_safety_and_standard_rungs(self):
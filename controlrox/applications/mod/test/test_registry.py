@@ -0,0 +1,293 @@
+"""Unit tests for the module spec registry.
+
+Tests that JSON module configurations are loaded into specs, matched against modules,
+materialized into module classes on demand and cached between loads.
+"""
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, PropertyMock, patch
+
+from controlrox.interfaces import ModuleControlsType
+from controlrox.applications.mod.meta import GeneratedModule
+from controlrox.applications.mod.registry import (
+    DEFAULT_CONFIG_DIR,
+    SCHEMA_FILE_NAME,
+    ModuleSpec,
+    ModuleSpecRegistry,
+    render_template,
+)
+from controlrox.services.plc.introspective import IntrospectiveModuleWarehouseFactory
+
+
+SAFETY_CONFIG = {
+    'catalog_number': '1734-IB8S',
+    'class_name': 'Test_1734_IB8S',
+    'controls_type': 'SAFETY_INPUT_BLOCK',
+    'required_imports': [
+        {'path': 'docs\\controls\\emu\\Demo3D_HMI_IN_DataType.L5X', 'elements': ['DataTypes']},
+    ],
+    'tag_name_methods': {
+        'safety_input': 'sz_Demo3D_{module.parent_module}_I',
+    },
+    'tags': [
+        {'name_template': 'zz_Demo3D_Comm_{controller.process_name}HMI', 'datatype': 'Demo3D_CommOK_HMI'},
+        {'name_method': 'get_safety_input_tag_name', 'datatype': 'Demo3D_HMI_IN', 'tag_class': 'Safety'},
+    ],
+    'rungs': {
+        'safety': [
+            {'text_template': 'COP(sz_Demo3D_{module.parent_module}_I,{module.name}:I,1);', 'comment': 'Copy'},
+        ],
+    },
+    'standard_to_safety_mapping': {
+        'standard_name_method': 'get_standard_input_tag_name',
+        'safety_name_method': 'get_safety_input_tag_name',
+    },
+    'metadata': {'description': 'Test safety input module'},
+}
+
+DRIVE_CONFIG = {
+    'catalog_number': 'ETHERNET-MODULE',
+    'class_name': 'Test_Drive',
+    'controls_type': 'DRIVE',
+    'connection_points': {'input': 1, 'output': 2},
+    'connection_sizes': {'input': 10, 'output': 20},
+}
+
+
+def _make_module(
+    catalog_number: str,
+    points: tuple = (0, 0, 0),
+    sizes: tuple = (0, 0, 0),
+) -> Mock:
+    module = Mock()
+    module.name = 'Local_IB8S'
+    module.parent_module = 'Local'
+    module.description = ''
+    module.catalog_number = catalog_number
+    module.input_connection_point, module.output_connection_point, module.config_connection_point = points
+    module.input_connection_size, module.output_connection_size, module.config_connection_size = sizes
+    return module
+
+
+class TestModuleSpec(unittest.TestCase):
+    """Test ModuleSpec creation from configurations."""
+
+    def test_from_config(self):
+        spec = ModuleSpec.from_config(SAFETY_CONFIG, 'test.json')
+
+        self.assertEqual(spec.catalog_number, '1734-IB8S')
+        self.assertEqual(spec.description, 'Test safety input module')
+        self.assertEqual(spec.required_imports, (('docs\\controls\\emu\\Demo3D_HMI_IN_DataType.L5X', ('DataTypes',)),))
+        self.assertEqual(spec.get_tag_name_template('safety_input'), 'sz_Demo3D_{module.parent_module}_I')
+        self.assertIsNone(spec.get_tag_name_template('safety_output'))
+        self.assertEqual(len(spec.tags), 2)
+        self.assertEqual(len(spec.safety_rungs), 1)
+        self.assertEqual(spec.standard_rungs, ())
+        self.assertEqual(spec.source, 'test.json')
+
+    def test_match_key(self):
+        spec = ModuleSpec.from_config(DRIVE_CONFIG)
+
+        self.assertEqual(spec.match_key, ('ETHERNET-MODULE', 1, 2, 0, 10, 20, 0))
+
+    def test_render_template(self):
+        imodule = Mock()
+        imodule.base_module = _make_module('1734-IB8S')
+        imodule.controller.process_name = 'Paint'
+
+        self.assertEqual(
+            render_template('{module.name}/{module.parent_module}/{controller.process_name}', imodule),
+            'Local_IB8S/Local/Paint'
+        )
+        self.assertEqual(render_template('NOP();', imodule), 'NOP();')
+
+
+class TestModuleSpecRegistry(unittest.TestCase):
+    """Test ModuleSpecRegistry loading, matching and caching."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_dir = Path(self.temp_dir) / 'config'
+        self.config_dir.mkdir()
+        shutil.copy(DEFAULT_CONFIG_DIR / SCHEMA_FILE_NAME, self.config_dir / SCHEMA_FILE_NAME)
+        self._write('ab_1734_ib8s.json', SAFETY_CONFIG)
+        self._write('drive.json', DRIVE_CONFIG)
+        self.cache_path = Path(self.temp_dir) / 'cache' / 'specs.json'
+        self.registry = ModuleSpecRegistry(self.config_dir, self.cache_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name: str, config: dict) -> None:
+        with open(self.config_dir / name, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+
+    def test_load(self):
+        specs = self.registry.load()
+
+        self.assertEqual([x.class_name for x in specs], ['Test_1734_IB8S', 'Test_Drive'])
+        self.assertIn('1734-IB8S', self.registry)
+        self.assertNotIn('1734-OB8', self.registry)
+        self.assertEqual(self.registry.get_spec('1734-IB8S').source, 'ab_1734_ib8s.json')
+        self.assertIs(self.registry.load(), specs)
+
+    def test_invalid_configs_are_skipped(self):
+        self._write('bad.json', {'catalog_number': 'X', 'class_name': 'bad', 'controls_type': 'NOPE'})
+        (self.config_dir / 'broken.json').write_text('{', encoding='utf-8')
+
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(sorted(self.registry.errors), ['bad.json', 'broken.json'])
+
+    def test_invalid_rung_templates_are_reported(self):
+        config = dict(SAFETY_CONFIG, rungs={'standard': [{'text_template': 'XIC(A)[OTE(B);', 'comment': ''}]})
+        self._write('ab_1734_ib8s.json', config)
+
+        self.assertNotIn('1734-IB8S', self.registry)
+        self.assertIn('unbalanced branches', self.registry.errors['ab_1734_ib8s.json'][0])
+
+    def test_bundled_configs_are_valid(self):
+        registry = ModuleSpecRegistry(use_cache=False)
+
+        self.assertEqual(registry.errors, {})
+        self.assertEqual(len(registry), len(list(DEFAULT_CONFIG_DIR.glob('*.json'))) - 1)
+
+    def test_find_spec(self):
+        exact = _make_module('ETHERNET-MODULE', (1, 2, 0), (10, 20, 0))
+        lazy = _make_module('1734-IB8S/A')
+
+        self.assertEqual(self.registry.find_spec(exact).class_name, 'Test_Drive')
+        self.assertIsNone(self.registry.find_spec(lazy))
+        self.assertEqual(self.registry.find_spec(lazy, True).class_name, 'Test_1734_IB8S')
+        self.assertIsNone(self.registry.find_spec(_make_module('ETHERNET-MODULE'), True))
+
+    def test_cache_skips_unchanged_configs(self):
+        self.registry.load()
+        self.assertTrue(self.cache_path.exists())
+
+        registry = ModuleSpecRegistry(self.config_dir, self.cache_path)
+        with patch.object(ModuleSpecRegistry, '_parse_config') as mock_parse:
+            specs = registry.load()
+
+        mock_parse.assert_not_called()
+        self.assertEqual(specs, self.registry.specs)
+
+    def test_invalid_cache_is_ignored(self):
+        self.cache_path.parent.mkdir()
+        self.cache_path.write_text('{"version": 2, "entries": [', encoding='utf-8')
+
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(len(json.loads(self.cache_path.read_text(encoding='utf-8'))['entries']), 2)
+
+    def test_default_cache_path_is_outside_the_package(self):
+        registry = ModuleSpecRegistry()
+
+        self.assertNotIn(DEFAULT_CONFIG_DIR.parent, registry.cache_path.parents)
+        self.assertEqual(registry.cache_path.suffix, '.json')
+
+    def test_reload_parses_changed_configs_only(self):
+        self.registry.load()
+        self._write('drive.json', dict(DRIVE_CONFIG, catalog_number='1756-EN2T'))
+        self._write('new.json', dict(DRIVE_CONFIG, class_name='Test_New'))
+
+        with patch.object(ModuleSpecRegistry, '_parse_config', wraps=self.registry._parse_config) as mock_parse:
+            self.registry.reload()
+
+        self.assertEqual(sorted(x.args[0].name for x in mock_parse.call_args_list), ['drive.json', 'new.json'])
+        self.assertIn('1756-EN2T', self.registry)
+        self.assertEqual(len(self.registry), 3)
+
+    def test_reload_matches_changed_spec(self):
+        config = dict(DRIVE_CONFIG, catalog_number='TEST-RELOAD', class_name='Test_Reload')
+        self._write('reload.json', config)
+        module = _make_module('TEST-RELOAD', (1, 2, 0), (10, 20, 0))
+
+        self.registry.install()
+        try:
+            old_imodule = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(module)
+            self._write('reload.json', dict(config, metadata={'description': 'Reloaded module'}))
+            self.registry.reload()
+            imodule = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(module)
+        finally:
+            self.registry.uninstall()
+            IntrospectiveModuleWarehouseFactory.invalidate_module_index()
+
+        self.assertEqual(type(old_imodule).spec.description, '')
+        self.assertIsNot(type(imodule), type(old_imodule))
+        self.assertEqual(type(imodule).spec.description, 'Reloaded module')
+        self.assertNotIn(type(old_imodule), IntrospectiveModuleWarehouseFactory.get_all_known_modules())
+
+    def test_get_spec_by_class_name(self):
+        self.assertEqual(self.registry.get_spec_by_class_name('Test_Drive').catalog_number, 'ETHERNET-MODULE')
+        self.assertIsNone(self.registry.get_spec_by_class_name('Test_Missing'))
+
+    def test_get_module_class(self):
+        spec = self.registry.get_spec('1734-IB8S')
+        module_class = self.registry.get_module_class(spec)
+
+        self.assertTrue(issubclass(module_class, GeneratedModule))
+        self.assertEqual(module_class.__name__, 'Test_1734_IB8S')
+        self.assertIs(self.registry.get_module_class(spec), module_class)
+        self.assertIs(self.registry.match(_make_module('1734-IB8S')), module_class)
+        self.assertIsNone(self.registry.match(_make_module('1734-OB8')))
+
+    def test_module_class_behaviour(self):
+        module = _make_module('1734-IB8S')
+        imodule = self.registry.get_module_class(self.registry.get_spec('1734-IB8S'))(module)
+
+        self.assertEqual(imodule.get_catalog_number(), '1734-IB8S')
+        self.assertEqual(imodule.get_module_controls_type(), ModuleControlsType.SAFETY_INPUT_BLOCK)
+        self.assertEqual(imodule.get_input_connection_point(), 0)
+        self.assertEqual(imodule.get_safety_input_tag_name(), 'sz_Demo3D_Local_I')
+        self.assertEqual(imodule.get_standard_input_tag_name(), 'zz_Demo3D_Local_IB8S_I')
+        self.assertEqual(imodule.get_required_imports(), [('docs\\controls\\emu\\Demo3D_HMI_IN_DataType.L5X', ['DataTypes'])])
+        self.assertEqual(
+            imodule.get_required_standard_to_safety_mapping(),
+            ('zz_Demo3D_Local_IB8S_I', 'sz_Demo3D_Local_I')
+        )
+
+        with patch.object(GeneratedModule, 'controller', new_callable=PropertyMock) as mock_controller:
+            mock_controller.return_value.process_name = 'Paint'
+            tags = imodule.get_required_tags()
+            imodule.get_required_safety_rungs()
+
+        self.assertEqual(tags, [
+            {'tag_name': 'zz_Demo3D_Comm_PaintHMI', 'datatype': 'Demo3D_CommOK_HMI'},
+            {'tag_name': 'sz_Demo3D_Local_I', 'datatype': 'Demo3D_HMI_IN', 'tag_class': 'Safety'},
+        ])
+        create_rung = mock_controller.return_value.create_rung
+        create_rung.assert_called_once()
+        self.assertEqual(create_rung.call_args.kwargs['meta_data']['Text'], 'COP(sz_Demo3D_Local_I,Local_IB8S:I,1);')
+        self.assertEqual(create_rung.call_args.kwargs['meta_data']['Comment'], 'Copy')
+        create_rung.return_value.set_sequence.assert_called_once()
+        self.assertEqual(imodule.get_required_standard_rungs(), [])
+
+    def test_install(self):
+        with patch('controlrox.applications.mod.registry.IntrospectiveModuleWarehouseFactory') as mock_factory:
+            self.registry.install()
+            self.registry.uninstall()
+
+        mock_factory.register_module_provider.assert_called_once_with(self.registry.match)
+        mock_factory.unregister_module_provider.assert_called_once_with(self.registry.match)
+
+
+class TestModulePackageExports(unittest.TestCase):
+    """Test the configured module classes are exported by the package."""
+
+    def test_export_by_class_name(self):
+        import controlrox.applications.mod as mod
+
+        module_class = mod.AB_1734_IB8S
+
+        self.assertTrue(issubclass(module_class, GeneratedModule))
+        self.assertEqual(module_class.spec.catalog_number, '1734-IB8S')
+        self.assertIs(mod.AB_1734_IB8S, module_class)
+        self.assertIn('AB_1734_IB8S', dir(mod))
+        with self.assertRaises(AttributeError):
+            mod.Missing_Module
+
+
+if __name__ == '__main__':
+    unittest.main()
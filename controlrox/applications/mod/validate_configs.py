@@ -4,6 +4,19 @@ Validates JSON configuration files against the schema and checks for logical err
 """
 import json
 from pathlib import Path
+from typing import Any
+
+DEFAULT_CONTROLS_TYPES = [
+    "SAFETY_INPUT_OUTPUT_BLOCK",
+    "SAFETY_INPUT_BLOCK",
+    "SAFETY_OUTPUT_BLOCK",
+    "SAFETY_BLOCK",
+    "POINT_IO",
+    "ETHERNET",
+    "RACK_COMM_CARD",
+    "PLC",
+    "DRIVE",
+]
 
 
 class ConfigValidator:
@@ -27,14 +40,28 @@ class ConfigValidator:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
-
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
         except json.JSONDecodeError as e:
             return False, [f"JSON parse error: {e}"]
 
+        return self.validate_data(config)
+
+    def validate_data(self, config: Any) -> tuple[bool, list[str]]:
+        """Validate an already parsed configuration.
+
+        Args:
+            config: The parsed configuration
+
+        Returns:
+            Tuple of (is_valid, error_messages)
+        """
+        if not isinstance(config, dict):
+            return False, ["Configuration must be an object"]
+
+        errors = []
+
         # Check required fields
         required_fields = self.schema.get('required', [])
         for field in required_fields:
@@ -57,18 +84,9 @@ class ConfigValidator:
                 errors.append("class_name must contain only alphanumeric characters and underscores")
 
         # Validate controls_type
-        valid_controls_types = [
-            "SAFETY_INPUT_OUTPUT_BLOCK",
-            "SAFETY_INPUT_BLOCK",
-            "SAFETY_OUTPUT_BLOCK",
-            "SAFETY_BLOCK",
-            "POINT_IO",
-            "ETHERNET",
-            "RACK_COMM_CARD",
-            "PLC",
-            "DRIVE",
-            "HMI"
-        ]
+        valid_controls_types = (
+            self.schema.get('properties', {}).get('controls_type', {}).get('enum') or DEFAULT_CONTROLS_TYPES
+        )
         if 'controls_type' in config:
             if config['controls_type'] not in valid_controls_types:
                 errors.append(f"Invalid controls_type. Must be one of: {', '.join(valid_controls_types)}")
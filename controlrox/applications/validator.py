@@ -1,8 +1,15 @@
 """Base PLC Controller Validator
 """
+from typing import Optional
+from weakref import WeakKeyDictionary
+
 from controlrox.models.plc import rockwell as plc
 from controlrox.models.tasks import validator as plc_validator
+from controlrox.models.tasks.findings import report_result, rule_scope, ValidationSeverity
+from controlrox.models.tasks.profiling import record_cache_lookup
 from controlrox.models.plc.rockwell import module as plc_module
+from controlrox.models.plc.rockwell.meta import L5X_ASSET_MODULES, L5X_ASSET_PROGRAMS
+from controlrox.services.plc.network import ModuleNetworkTable, NO_RPI
 from pyrox.services.factory import reload_factory_module_while_preserving_registered_types
 from pyrox.services.logging import log, LOG_LEVEL_FAILURE, LOG_LEVEL_SUCCESS
 
@@ -20,21 +27,25 @@ __all__ = [
 
 def debug_success(message: str) -> bool:
     log(BaseControllerValidator).debug(message)
+    report_result(ValidationSeverity.DEBUG, message)
     return True
 
 
 def success(message: str) -> bool:
     log(BaseControllerValidator).log(LOG_LEVEL_SUCCESS, message)
+    report_result(ValidationSeverity.SUCCESS, message)
     return True
 
 
 def fail(message: str) -> bool:
     log(BaseControllerValidator).log(LOG_LEVEL_FAILURE, message)
+    report_result(ValidationSeverity.FAILURE, message)
     return False
 
 
 def warning(message: str) -> bool:
     log(BaseControllerValidator).warning(message)
+    report_result(ValidationSeverity.WARNING, message)
     return False
 
 
@@ -42,8 +53,11 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
     """Validator for controllers.
     """
     supporting_class = plc.RaController
+    adapter_packet_budget: Optional[float] = None  # Max packets/s through one adapter, None to skip the check
+    _network_tables: WeakKeyDictionary[plc.RaController, ModuleNetworkTable] = WeakKeyDictionary()
 
     @classmethod
+    @rule_scope()
     def _check_common_has_description(
         cls,
         controller: plc.RaController,
@@ -63,6 +77,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return True
 
     @classmethod
+    @rule_scope()
     def _check_common_has_name(
         cls,
         controller: plc.RaController,
@@ -82,6 +97,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return True
 
     @classmethod
+    @rule_scope()
     def _check_comms_path(
         cls,
         controller: plc.RaController
@@ -104,6 +120,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
             return success(message)
 
     @classmethod
+    @rule_scope()
     def _check_datatype_member_has_valid_datatype(
         cls,
         controller: plc.RaController,
@@ -125,6 +142,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return True
 
     @classmethod
+    @rule_scope(reads=('Modules/Local',))
     def _check_internal_plc_module(
         cls,
         controller: plc.RaController
@@ -147,6 +165,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
             return success(message)
 
     @classmethod
+    @rule_scope()
     def _check_module_has_catalog_number(
         cls,
         controller: plc.RaController,
@@ -167,6 +186,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return True
 
     @classmethod
+    @rule_scope()
     def _check_module_has_electronic_keying(
         cls,
         controller: plc.RaController,
@@ -187,6 +207,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return True
 
     @classmethod
+    @rule_scope(reads=(L5X_ASSET_PROGRAMS,))
     def check_module_has_cop_in_instruction(
         cls,
         controller: plc.RaController,
@@ -206,6 +227,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return debug_success(f'{module_object.name} has COP IN instruction.')
 
     @classmethod
+    @rule_scope(reads=(L5X_ASSET_PROGRAMS,))
     def check_module_has_cop_out_instruction(
         cls,
         controller: plc.RaController,
@@ -225,6 +247,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return debug_success(f'{module_object.name} has COP OUT instruction.')
 
     @classmethod
+    @rule_scope(reads=(L5X_ASSET_PROGRAMS,))
     def check_module_has_logic_gsv(
         cls,
         controller: plc.RaController,
@@ -244,6 +267,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return debug_success(f'{module_object.__class__.__name__} {module_object.name} has GSV logic.')
 
     @classmethod
+    @rule_scope()
     def _check_module_has_network_address(
         cls,
         controller: plc.RaController,
@@ -264,6 +288,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return True
 
     @classmethod
+    @rule_scope()
     def check_module_has_valid_network_rpi(
         cls,
         controller: plc.RaController,
@@ -278,9 +303,10 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         Returns:
             True if the common PLC object has a Network RPI, False otherwise.
         """
-        rpi = float(module_object.rpi)
+        table = cls.get_network_table(controller, module_object)
+        rpi = table.rpis[table.get_row(module_object)]
 
-        if rpi is None:
+        if rpi == NO_RPI:
             return warning(f'{module_object.__class__.__name__} {module_object.name} has no RPI!')
 
         rpi = rpi / 1000.0  # Convert from microseconds to milliseconds
@@ -290,6 +316,54 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return debug_success(f'{module_object.__class__.__name__} {module_object.name} has valid RPI of {rpi}.')
 
     @classmethod
+    @rule_scope(reads=(L5X_ASSET_MODULES,))
+    def _check_module_has_unique_network_address(
+        cls,
+        controller: plc.RaController,
+        module_object: plc_module.RaModule
+    ) -> bool:
+        """Check that no other module of the controller uses the same network address.
+
+        Args:
+            controller: The controller to check.
+            module_object: The module to check.
+        Returns:
+            True if the module's network address is unique (or it has none), False otherwise.
+        """
+        table = cls.get_network_table(controller, module_object)
+        others = table.get_rows_sharing_address(table.get_row(module_object))
+        if others:
+            return warning(f'{module_object.__class__.__name__} {module_object.name} shares network address '
+                           f'{module_object.ip_address} with {", ".join(table.names[x] for x in others)}!')
+        return True
+
+    @classmethod
+    @rule_scope(reads=(L5X_ASSET_MODULES,))
+    def _check_module_rpi_budget(
+        cls,
+        controller: plc.RaController,
+        module_object: plc_module.RaModule
+    ) -> bool:
+        """Check that the connections through an adapter module stay within the adapter packet budget.
+
+        Args:
+            controller: The controller to check.
+            module_object: The adapter module to check.
+        Returns:
+            True if the adapter is within budget (or no budget is configured), False otherwise.
+        """
+        if cls.adapter_packet_budget is None:
+            return True
+        table = cls.get_network_table(controller, module_object)
+        packets_per_second = table.get_rpi_budget_by_parent().get(module_object.name, 0.0)
+        if packets_per_second > cls.adapter_packet_budget:
+            return warning(f'{module_object.__class__.__name__} {module_object.name} carries {packets_per_second:.1f} '
+                           f'packets/s, budget is {cls.adapter_packet_budget:.1f}!')
+        return debug_success(f'{module_object.__class__.__name__} {module_object.name} carries '
+                             f'{packets_per_second:.1f} packets/s.')
+
+    @classmethod
+    @rule_scope()
     def _check_routine_has_jsr(
         cls,
         controller: plc.RaController,
@@ -311,6 +385,53 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         return True
 
     @classmethod
+    @rule_scope()
+    def _check_rung_has_number(
+        cls,
+        controller: plc.RaController,
+        program: plc.RaProgram,
+        routine: plc.RaRoutine,
+        rung: plc.RaRung
+    ) -> bool:
+        """Check if a rung has a number.
+
+        Args:
+            controller: The controller to check.
+            program: The program the routine is in.
+            routine: The routine the rung is in.
+            rung: The rung to check.
+        Returns:
+            True if the rung has a number, False otherwise.
+        """
+        if not rung.number or rung.number == '':
+            return fail(f'Rung in routine {routine.name} in program {program.name} has no number!')
+        return True
+
+    @classmethod
+    @rule_scope()
+    def _check_rung_has_text(
+        cls,
+        controller: plc.RaController,
+        program: plc.RaProgram,
+        routine: plc.RaRoutine,
+        rung: plc.RaRung
+    ) -> bool:
+        """Check if a rung has text.
+
+        Args:
+            controller: The controller to check.
+            program: The program the routine is in.
+            routine: The routine the rung is in.
+            rung: The rung to check.
+        Returns:
+            True if the rung has text, False otherwise.
+        """
+        if not rung.text or rung.text == '':
+            return fail(f'Rung {rung.number} in routine {routine.name} in program {program.name} has no text!')
+        return True
+
+    @classmethod
+    @rule_scope(reads=('Modules/Local',))
     def _check_slot(
         cls,
         controller: plc.RaController
@@ -332,6 +453,63 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         else:
             return success(message)
 
+    @classmethod
+    @rule_scope()
+    def _check_tag_has_datatype(
+        cls,
+        controller: plc.RaController,
+        tag: plc.RaTag
+    ) -> bool:
+        """Check if a tag has a datatype.
+
+        Args:
+            controller: The controller to check.
+            tag: The tag to check.
+        Returns:
+            True if the tag has a datatype, False otherwise.
+        """
+        if not tag.datatype or tag.datatype == '':
+            return fail(f'Tag {tag.name} has no datatype!')
+        return True
+
+    @classmethod
+    def build_network_table(
+        cls,
+        controller: plc.RaController
+    ) -> ModuleNetworkTable:
+        """Build (or rebuild) the network table of a controller's modules.
+
+        Args:
+            controller: The controller to build the table for.
+        Returns:
+            The network table.
+        """
+        table = ModuleNetworkTable(controller.modules)
+        cls._network_tables[controller] = table
+        return table
+
+    @classmethod
+    def get_network_table(
+        cls,
+        controller: plc.RaController,
+        module: Optional[plc_module.RaModule] = None
+    ) -> ModuleNetworkTable:
+        """Get the network table of a controller's modules, building it if needed.
+
+        Args:
+            controller: The controller to get the table for.
+            module: A module that must be in the table. The table is rebuilt if the module was added since, or if the
+                modules of the controller were invalidated and compiled again.
+        Returns:
+            The network table.
+        """
+        table = cls._network_tables.get(controller)
+        hit = table is not None and (module is None or table.has_module(module))
+        record_cache_lookup('module_network_table', hit)
+        if not hit:
+            table = cls.build_network_table(controller)
+        return table
+
     @classmethod
     def validate_all(
         cls,
@@ -432,7 +610,13 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         controller: plc.RaController
     ) -> None:
         log(cls).info('Validating modules...')
+        table = cls.build_network_table(controller)
+        table.log_summary()
+        adapters = set(table.parents)
         for module in controller.modules:
+            cls._check_module_has_unique_network_address(controller, module)
+            if module.name in adapters:
+                cls._check_module_rpi_budget(controller, module)
             if not cls.validate_module(controller, module):
                 log(cls).log(LOG_LEVEL_FAILURE, f'Module validation failed! -> {module.name}')
 
@@ -484,12 +668,8 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
         routine: plc.RaRoutine,
         rung: plc.RaRung
     ) -> None:
-
-        if not rung.number or rung.number == '':
-            log(cls).log(LOG_LEVEL_FAILURE, f'Rung in routine {routine.name} in program {program.name} has no number!')
-
-        if not rung.text or rung.text == '':
-            log(cls).log(LOG_LEVEL_FAILURE, f'Rung {rung.number} in routine {routine.name} in program {program.name} has no text!')
+        cls._check_rung_has_number(controller, program, routine, rung)
+        cls._check_rung_has_text(controller, program, routine, rung)
 
     @classmethod
     def validate_rungs(
@@ -509,9 +689,7 @@ class BaseControllerValidator(plc_validator.ControllerValidator):
     ) -> None:
         cls._check_common_has_name(controller, tag)
         cls._check_common_has_description(controller, tag)
-
-        if not tag.datatype or tag.datatype == '':
-            log(cls).log(LOG_LEVEL_FAILURE, f'Tag {tag.name} has no datatype!')
+        cls._check_tag_has_datatype(controller, tag)
 
     @classmethod
     def validate_tags(
@@ -21,7 +21,8 @@ from .protocols import (
 from .aoi import IAddOnInstruction
 from .datatype import IDatatype
 from .instruction import ILogicInstruction
-from .module import IModule
+from .introspective import IIntrospectiveModule
+from .module import IModule, ModuleControlsType
 from .operand import ILogicOperand
 from .program import IProgram
 from .routine import IRoutine
@@ -356,6 +357,21 @@ class IController(
         """
         raise NotImplementedError("This method should be overridden by subclasses to get the file location.")
 
+    @abstractmethod
+    def get_introspected_modules(
+        self,
+        by_type: Optional[ModuleControlsType] = None
+    ) -> list[IIntrospectiveModule]:
+        """Get the introspective modules of the controller's modules.
+
+        Args:
+            by_type: Only get the introspective modules of this controls type. Defaults to all matched modules.
+
+        Returns:
+            list[IIntrospectiveModule]: The introspective modules, in module order.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses to get the introspected modules.")
+
     @abstractmethod
     def get_modified_date(self) -> str:
         """Get the date when the controller was last modified.
@@ -383,6 +399,15 @@ class IController(
         """
         raise NotImplementedError("This method should be overridden by subclasses to get the slot.")
 
+    @abstractmethod
+    def group_introspected_modules(self) -> dict[ModuleControlsType, list[IIntrospectiveModule]]:
+        """Group the introspective modules of the controller's modules by controls type.
+
+        Returns:
+            dict[ModuleControlsType, list[IIntrospectiveModule]]: The introspective modules per controls type.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses to group the introspected modules.")
+
     @abstractmethod
     def import_assets_from_file(
         self,
@@ -583,6 +608,21 @@ class IControllerSafetyInfo:
         """
         raise NotImplementedError("This method should be overridden by subclasses to get the safety tag map.")
 
+    @abstractmethod
+    def get_safety_tag_mapping(
+        self,
+        tag_name: str
+    ) -> Optional[str]:
+        """Get the safety tag a standard tag is mapped to.
+
+        Args:
+            tag_name (str): The standard tag name
+
+        Returns:
+            Optional[str]: The safety tag name, or None if the standard tag is not mapped.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses to get a safety tag mapping.")
+
     @abstractmethod
     def set_safety_tag_map(
         self,
@@ -320,14 +320,29 @@ class IEmulationGenerator(IPlcObject):
         raise NotImplementedError("Subclasses must implement 'set_emulation_standard_routine_name' method")
 
     @abstractmethod
-    def generate_emulation_logic(self):
+    def generate_emulation_logic(
+        self,
+        dry_run: bool = False
+    ):
         """Main entry point to generate emulation logic.
 
+        Args:
+            dry_run: Only plan the changes, without changing the controller.
+
         Returns:
             The modification schema with all changes.
         """
         raise NotImplementedError("Subclasses must implement 'generate_emulation_logic' method")
 
+    @abstractmethod
+    def plan_emulation_logic(self):
+        """Plan the emulation logic generation without changing the controller.
+
+        Returns:
+            The plan of every change generating the emulation logic would make.
+        """
+        raise NotImplementedError("Subclasses must implement 'plan_emulation_logic' method")
+
     @abstractmethod
     def remove_emulation_logic(self):
         """Remove previously added emulation logic.
@@ -202,12 +202,11 @@ class PlcSceneBridgeDialog(TkinterTaskFrame):
 
     def _update_status(self):
         """Update status bar."""
-        bindings = self.bridge.get_bindings()
-        enabled_count = sum(1 for b in bindings if b.enabled)
+        stats = self.bridge.get_binding_stats()
         active_status = "ACTIVE" if self.bridge._active else "STOPPED"
 
         self.status_var.set(
-            f"{active_status} | {enabled_count}/{len(bindings)} bindings enabled"
+            f"{active_status} | {stats['enabled']}/{stats['total']} bindings enabled"
         )
 
         # Update button states
@@ -253,13 +252,10 @@ class PlcSceneBridgeDialog(TkinterTaskFrame):
         object_id = item['values'][3]
         property_path = item['values'][4]
 
-        # Find binding
-        bindings = [b for b in self.bridge.get_bindings()
-                    if b.tag_name == tag_name and b.object_id == object_id
-                    and b.property_path == property_path]
+        binding = self.bridge.get_binding(tag_name, object_id, property_path)
 
-        if bindings:
-            dialog = EditBindingDialog(self.root, self.bridge, bindings[0])
+        if binding:
+            dialog = EditBindingDialog(self.root, self.bridge, binding)
             self.root.wait_window(dialog)
             self._refresh_bindings()
 
@@ -301,12 +297,10 @@ class PlcSceneBridgeDialog(TkinterTaskFrame):
         property_path = item['values'][4]
 
         # Find and toggle binding
-        for binding in self.bridge.get_bindings():
-            if (binding.tag_name == tag_name and binding.object_id == object_id
-                    and binding.property_path == property_path):
-                binding.enabled = not binding.enabled
-                log(self).info(f"Toggled binding {tag_name}: {'enabled' if binding.enabled else 'disabled'}")
-                break
+        binding = self.bridge.get_binding(tag_name, object_id, property_path)
+        if binding:
+            self.bridge.set_binding_enabled(tag_name, object_id, property_path, not binding.enabled)
+            log(self).info(f"Toggled binding {tag_name}: {'enabled' if binding.enabled else 'disabled'}")
 
         self._refresh_bindings()
 
@@ -518,7 +512,9 @@ class EditBindingDialog(tk.Toplevel):
     def _save(self):
         """Save changes."""
         self.binding.description = self.description_entry.get()
-        self.binding.enabled = self.enabled_var.get()
+        self.bridge.set_binding_enabled(
+            self.binding.tag_name, self.binding.object_id, self.binding.property_path, self.enabled_var.get()
+        )
         messagebox.showinfo("Success", "Binding updated")
         self.destroy()
 
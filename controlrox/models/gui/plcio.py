@@ -1,5 +1,6 @@
+import time
 import tkinter as tk
-from tkinter import ttk, simpledialog, messagebox
+from tkinter import filedialog, ttk, simpledialog, messagebox
 from pylogix.lgx_response import Response
 
 from pyrox.models.gui.tk.frame import TkinterTaskFrame
@@ -9,6 +10,8 @@ from pyrox.services import log, SceneRunnerService
 from controlrox.models.gui.plc_bridge import PlcSceneBridgeDialog
 from controlrox.services.plc.connection import PlcConnectionManager, ConnectionParameters
 from controlrox.services.plc.bridge import PlcSceneBridge
+from controlrox.services.plc.dispatch import CallbackQueue
+from controlrox.services.plc.recorder import PlcRecorder
 
 
 class PlcIoFrame(TkinterTaskFrame):
@@ -104,6 +107,11 @@ class PlcIoFrame(TkinterTaskFrame):
         self._watch_table_dialog = None
         self._bridge_dialog = None
 
+        # Deliver the connection callbacks (ticks, watched tags, write responses) to the Tk main loop
+        self._callbacks = CallbackQueue()
+        PlcConnectionManager.set_dispatcher(self._callbacks.put)
+        self._callbacks.drain_with_tk(self.content_frame)
+
         # Subscribe to connection ticks for status updates
         PlcConnectionManager.subscribe_to_ticks(self._update_connection_status)
 
@@ -318,6 +326,8 @@ class PlcIoFrame(TkinterTaskFrame):
 
         # Unsubscribe from connection ticks
         PlcConnectionManager.unsubscribe_from_ticks(self._update_connection_status)
+        PlcConnectionManager.set_dispatcher(None)
+        self._callbacks.clear()
 
         if self._plc_bridge:
             self._plc_bridge.stop()  # Stop the bridge if it's running
@@ -373,6 +383,22 @@ class WatchTableDialog(tk.Toplevel):
             variable=self.auto_refresh_var
         ).pack(side=tk.LEFT, padx=10)
 
+        # Recording controls
+        self.recorder = None
+        self.record_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            toolbar,
+            text='Record',
+            variable=self.record_var,
+            command=self._toggle_recording
+        ).pack(side=tk.LEFT, padx=2)
+
+        tk.Button(
+            toolbar,
+            text='Trend Selected',
+            command=self._trend_selected_tag
+        ).pack(side=tk.LEFT, padx=2)
+
         # Tree frame with scrollbars
         tree_frame = tk.Frame(self)
         tree_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -567,6 +593,37 @@ class WatchTableDialog(tk.Toplevel):
                 messagebox.showerror("Error", f"Failed to write value: {e}")
                 log(self).error(f"Failed to write value to {tag_name}: {e}")
 
+    def _toggle_recording(self):
+        """Start or stop recording the watched tags."""
+        if not self.record_var.get():
+            if self.recorder:
+                self.recorder.stop()
+                self.status_var.set(f"Stopped recording ({self.recorder.dropped} samples dropped)")
+            return
+
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Save Recording (cancel to record in memory only)",
+            defaultextension=".zip",
+            filetypes=[("Recordings", "*.zip")]
+        )
+        self.recorder = PlcRecorder(path=path or None)
+        self.recorder.start(self.connection_manager)
+        self.status_var.set(f"Recording to {path or 'memory'}")
+
+    def _trend_selected_tag(self):
+        """Show a trend of the recorded samples of the selected tag."""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showinfo("No Selection", "Please select a tag to trend.")
+            return
+        if not self.recorder:
+            messagebox.showinfo("Not Recording", "Enable recording to trend tags.")
+            return
+
+        tag_name = self.tree.item(selection[0])['values'][0]
+        TrendDialog(self, self.recorder, tag_name)
+
     def _schedule_refresh(self):
         """Schedule periodic refresh of the table."""
         if self.auto_refresh_var.get():
@@ -577,4 +634,55 @@ class WatchTableDialog(tk.Toplevel):
 
     def _on_close(self):
         """Handle window close event."""
+        if self.recorder:
+            self.recorder.stop()
         self.destroy()
+
+
+class TrendDialog(tk.Toplevel):
+    """Dialog plotting the recorded samples of a tag over a sliding time window."""
+
+    def __init__(self, parent, recorder: PlcRecorder, tag_name: str, window: float = 60.0):
+        super().__init__(parent)
+        self.recorder = recorder
+        self.tag_name = tag_name
+        self.window = window
+        self.title(f"Trend - {tag_name}")
+        self.geometry("800x400")
+
+        self.canvas = tk.Canvas(self, background='white')
+        self.canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+
+        self.status_var = tk.StringVar(value="No samples")
+        tk.Label(self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W).pack(side=tk.BOTTOM, fill=tk.X)
+
+        self._schedule_redraw()
+
+    def _redraw(self):
+        """Plot the samples of the last window, decimated to the width of the canvas."""
+        self.canvas.delete('all')
+        width = max(self.canvas.winfo_width(), 2)
+        height = max(self.canvas.winfo_height(), 2)
+        end = time.time()
+        times, values = self.recorder.get_decimated(self.tag_name, end - self.window, end, max_points=width)
+        if not times:
+            self.status_var.set("No samples")
+            return
+
+        low, high = min(values), max(values)
+        span = (high - low) or 1.0
+        margin = 10
+        points = []
+        for sample_time, value in zip(times, values):
+            points.append((sample_time - end + self.window) / self.window * width)
+            points.append(height - margin - (value - low) / span * (height - 2 * margin))
+        if len(points) >= 4:
+            self.canvas.create_line(*points, fill='blue')
+        self.status_var.set(f"{len(times)} points - min {low:g} - max {high:g} - last {values[-1]:g}")
+
+    def _schedule_redraw(self):
+        """Schedule periodic redraw of the trend."""
+        if not self.winfo_exists():
+            return
+        self._redraw()
+        self.after(500, self._schedule_redraw)
@@ -0,0 +1,148 @@
+"""Live list of validation findings.
+"""
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional
+
+from pyrox.models.gui.tk.frame import TkinterTaskFrame
+from pyrox.services.file import get_save_file
+from pyrox.services.logging import log
+
+from controlrox.models.tasks.findings import ValidationFindingsStore
+
+
+class ValidationFindingsFrame(TkinterTaskFrame):
+    """Frame showing the findings of a validation run, refreshed as findings are re-evaluated.
+
+    Args:
+        parent: The parent widget.
+        findings: The findings store to display.
+        on_revalidate: Callback to re-evaluate findings affected by edits.
+    """
+
+    refresh_interval_ms: int = 500
+
+    def __init__(
+        self,
+        parent,
+        findings: ValidationFindingsStore,
+        on_revalidate: Optional[Callable[[], None]] = None,
+    ) -> None:
+        super().__init__(
+            name='validation findings',
+            parent=parent,
+        )
+        self.findings = findings
+        self._on_revalidate = on_revalidate
+        self._displayed_version = -1
+
+        toolbar = tk.Frame(self.content_frame)
+        toolbar.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
+
+        tk.Button(
+            toolbar,
+            text='Re-validate Changed',
+            command=self._on_revalidate_clicked
+        ).pack(side=tk.LEFT, padx=2)
+
+        tk.Button(
+            toolbar,
+            text='Export JSON',
+            command=self._on_export_json_clicked
+        ).pack(side=tk.LEFT, padx=2)
+
+        tk.Button(
+            toolbar,
+            text='Export CSV',
+            command=self._on_export_csv_clicked
+        ).pack(side=tk.LEFT, padx=2)
+
+        self.failures_only_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            toolbar,
+            text='Failures only',
+            variable=self.failures_only_var,
+            command=self._refresh_table
+        ).pack(side=tk.LEFT, padx=10)
+
+        tree_frame = tk.Frame(self.content_frame)
+        tree_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.tree = ttk.Treeview(
+            tree_frame,
+            columns=('Severity', 'Rule', 'Object', 'Message'),
+            show='headings',
+            yscrollcommand=vsb.set
+        )
+        vsb.config(command=self.tree.yview)
+
+        self.tree.heading('Severity', text='Severity')
+        self.tree.heading('Rule', text='Rule')
+        self.tree.heading('Object', text='Object')
+        self.tree.heading('Message', text='Message')
+
+        self.tree.column('Severity', width=80)
+        self.tree.column('Rule', width=250)
+        self.tree.column('Object', width=300)
+        self.tree.column('Message', width=500)
+
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.status_var = tk.StringVar(value="Ready")
+        tk.Label(
+            self.content_frame,
+            textvariable=self.status_var,
+            relief=tk.SUNKEN,
+            anchor=tk.W
+        ).pack(side=tk.BOTTOM, fill=tk.X)
+
+        self._schedule_refresh()
+
+    def _on_export_csv_clicked(self) -> None:
+        file_location = get_save_file([('.csv', 'CSV Files')])
+        if not file_location:
+            return
+        self.findings.to_csv(file_location)
+        log(self).info(f'Exported {len(self.findings)} findings to {file_location}')
+
+    def _on_export_json_clicked(self) -> None:
+        file_location = get_save_file([('.json', 'JSON Files')])
+        if not file_location:
+            return
+        self.findings.to_json(file_location)
+        log(self).info(f'Exported {len(self.findings)} findings to {file_location}')
+
+    def _on_revalidate_clicked(self) -> None:
+        if self._on_revalidate:
+            self._on_revalidate()
+        self._refresh_table()
+
+    def _refresh_table(self) -> None:
+        """Rebuild the list from the findings store."""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+
+        findings = self.findings.failures if self.failures_only_var.get() else self.findings.findings
+        for finding in findings:
+            self.tree.insert('', tk.END, values=(
+                finding.severity.value,
+                finding.rule_id,
+                finding.object_path,
+                finding.message,
+            ))
+
+        self._displayed_version = self.findings.version
+        self.status_var.set(
+            f'{len(self.findings.failures)} failing of {len(self.findings)} findings'
+            f' - {len(self.findings.stale_keys)} stale'
+        )
+
+    def _schedule_refresh(self) -> None:
+        """Refresh the list whenever the findings store changed since it was last displayed."""
+        if not self.root.winfo_exists():
+            return
+        if self.findings.version != self._displayed_version:
+            self._refresh_table()
+        self.root.after(self.refresh_interval_ms, self._schedule_refresh)
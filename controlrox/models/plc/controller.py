@@ -1,12 +1,14 @@
 """PLC type module for Pyrox framework."""
 from typing import (
     Any,
+    Iterator,
     List,
     Optional,
     Union,
 )
 
 from pyrox.models import HashList, FactoryTypeMeta, MetaFactory
+from pyrox.services import log
 
 from controlrox.interfaces import (
     IAddOnInstruction,
@@ -16,11 +18,13 @@ from controlrox.interfaces import (
     ILogicInstruction,
     IHasRoutines,
     IHasTags,
+    IIntrospectiveModule,
     IModule,
     ITag,
     IProgram,
     IRoutine,
     IRung,
+    ModuleControlsType,
     PLCDialect,
 )
 
@@ -37,6 +41,7 @@ from controlrox.services import (
     TagFactory,
     InstructionFactory
 )
+from controlrox.services.plc.introspective import IntrospectiveModuleWarehouseFactory
 
 from .protocols import (
     HasAOIs,
@@ -47,6 +52,7 @@ from .protocols import (
 )
 
 from .meta import PlcObject
+from .module import Module
 
 __all__ = (
     'Controller',
@@ -412,6 +418,47 @@ class Controller(
     def get_file_location(self) -> str:
         return self._file_location  # type: ignore
 
+    def _iter_introspected_modules(self) -> Iterator[IIntrospectiveModule]:
+        for module in self.modules:
+            if isinstance(module, Module):
+                imodule = module.get_introspective_module()
+            else:
+                imodule = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(module, True)
+            if not imodule:
+                log(self).warning(f'Module {module.name} has no introspective module, skipping...')
+                continue
+            yield imodule
+
+    def get_introspected_modules(
+        self,
+        by_type: Optional[ModuleControlsType] = None
+    ) -> list[IIntrospectiveModule]:
+        """Get the introspective modules of this controller's modules.
+
+        Each module caches its own match, so repeated calls only re-match modules whose catalog number or
+        connections changed. Modules that do not match a known introspective module are logged and left out.
+
+        Args:
+            by_type: Only get the introspective modules of this controls type. Defaults to all matched modules.
+
+        Returns:
+            list[IIntrospectiveModule]: The introspective modules, in module order.
+        """
+        if by_type is None:
+            return list(self._iter_introspected_modules())
+        return [x for x in self._iter_introspected_modules() if x.module_controls_type == by_type]
+
+    def group_introspected_modules(self) -> dict[ModuleControlsType, list[IIntrospectiveModule]]:
+        """Group the introspective modules of this controller's modules by controls type, in a single pass.
+
+        Returns:
+            dict[ModuleControlsType, list[IIntrospectiveModule]]: The introspective modules per controls type.
+        """
+        grouped: dict[ModuleControlsType, list[IIntrospectiveModule]] = {}
+        for imodule in self._iter_introspected_modules():
+            grouped.setdefault(imodule.module_controls_type, []).append(imodule)
+        return grouped
+
     def get_processor_type(self) -> str:
         return self._processor_type
 
@@ -1,8 +1,13 @@
 """Module model for pyrox Controller applications."""
-from typing import Optional
+from typing import Any, Optional
 from controlrox.interfaces import (
+    IIntrospectiveModule,
     IModule,
 )
+from controlrox.services.plc.introspective import (
+    IntrospectiveModuleWarehouseFactory,
+    get_module_match_key,
+)
 from .meta import PlcObject
 
 
@@ -23,6 +28,13 @@ class Module(
             name=name,
             description=description,
         )
+        self._introspective_module: Optional[IIntrospectiveModule] = None
+        self._introspective_key: Optional[tuple[Any, ...]] = None
+
+    @property
+    def introspective_module(self) -> Optional[IIntrospectiveModule]:
+        """The introspective module matched to this module."""
+        return self.get_introspective_module()
 
     def compile(self):
         return self
@@ -30,6 +42,21 @@ class Module(
     def get_catalog_number(self) -> str:
         raise NotImplementedError("This method should be overridden by subclasses to get the catalog number.")
 
+    def get_introspective_module(self) -> Optional[IIntrospectiveModule]:
+        """Get the introspective module matched to this module.
+
+        The match is cached on the module and only redone when the catalog number or a connection point / size
+        of the module changed since the last match.
+
+        Returns:
+            Optional[IIntrospectiveModule]: The matched introspective module, or None if no known module matches.
+        """
+        key = get_module_match_key(self)
+        if key != self._introspective_key:
+            self._introspective_module = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(self, True)
+            self._introspective_key = key
+        return self._introspective_module
+
     def get_ip_address(self) -> str:
         raise NotImplementedError("This method should be overridden by subclasses to get the IP address.")
 
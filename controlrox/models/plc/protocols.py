@@ -46,8 +46,8 @@ from controlrox.interfaces import (
     RungBranch,
 )
 from controlrox.interfaces.plc.dialect import IHasInstructionsTranslator, IHasOperandsTranslator, IHasRungsTranslator
-from controlrox.services import extract_instruction_strings, ControllerInstanceManager, DialectTranslatorFactory
-from controlrox.services.plc.instruction import InstructionSequenceBuilder
+from controlrox.services import ControllerInstanceManager, DialectTranslatorFactory
+from controlrox.services.plc.instruction import InstructionSequenceBuilder, tokenize_rung_text
 
 
 class HasMetaData(
@@ -719,57 +719,7 @@ class HasRungText(
 
     def tokenize_instruction_meta_data(self) -> list[str]:
         """Tokenize instruction meta_data to identify instructions and branch markers."""
-
-        tokens = []
-        text = self.text
-
-        # First, extract all instructions using the balanced parentheses method
-        instructions = extract_instruction_strings(text)
-        instruction_ranges = []
-
-        # Find the positions of each instruction in the text
-        search_start = 0
-        for instruction in instructions:
-            pos = text.find(instruction, search_start)
-            if pos != -1:
-                instruction_ranges.append((pos, pos + len(instruction)))
-                search_start = pos + len(instruction)
-
-        # Process the text character by character
-        i = 0
-        current_segment = ""
-
-        while i < len(text):
-            char = text[i]
-
-            if char in ['[', ']', ',']:
-                # Check if this symbol is inside any instruction
-                inside_instruction = any(start <= i < end for start, end in instruction_ranges)
-
-                if inside_instruction:
-                    # This bracket is part of an instruction (array reference), keep it
-                    current_segment += char
-                else:
-                    # This is a branch marker or next-branch marker
-                    if current_segment.strip():
-                        # Extract instructions from current segment using our method
-                        segment_instructions = extract_instruction_strings(current_segment)
-                        tokens.extend(segment_instructions)
-                        current_segment = ""
-
-                    # Add the branch marker
-                    tokens.append(char)
-            else:
-                current_segment += char
-
-            i += 1
-
-        # Process any remaining segment
-        if current_segment.strip():
-            segment_instructions = extract_instruction_strings(current_segment)
-            tokens.extend(segment_instructions)
-
-        return tokens
+        return tokenize_rung_text(self.text)
 
     def remove_token(
         self,
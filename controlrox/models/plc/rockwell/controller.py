@@ -41,6 +41,8 @@ __all__ = (
     'ControllerSafetyInfo',
 )
 
+_UNPARSED = object()
+
 
 class ControllerSafetyInfo(
     RaPlcObject,
@@ -51,6 +53,11 @@ class ControllerSafetyInfo(
         meta_data: str,
         **kwargs
     ) -> None:
+        # The safety tag map is parsed once into an ordered dict (standard tag -> safety tag).
+        # Changes are made to the dict, and only serialized back to the meta data string when the meta data is read.
+        self._safety_tag_map_dict: dict[str, str] = {}
+        self._safety_tag_map_source: object = _UNPARSED  # meta data value the dict was parsed from / serialized to
+        self._safety_tag_map_dirty = False
         super().__init__(
             meta_data=meta_data,
             **kwargs
@@ -60,27 +67,67 @@ class ControllerSafetyInfo(
     def safety_tag_map(self) -> str:
         return self.get_safety_tag_map()
 
+    @property
+    def safety_tag_map_dict(self) -> dict[str, str]:
+        """A copy of the safety tag map, as standard tag name -> safety tag name."""
+        return dict(self._get_safety_tag_map_dict())
+
     @property
     def safety_tag_map_dict_list(self) -> list[dict]:
-        if not self.safety_tag_map:
-            return []
+        return [
+            {'@Name': tag_name, 'TagName': tag_name, 'SafetyTagName': safety_tag_name}
+            for tag_name, safety_tag_name in self._get_safety_tag_map_dict().items()
+        ]
 
-        if not isinstance(self.safety_tag_map, str):
+    @staticmethod
+    def _parse_safety_tag_map(safety_tag_map: Optional[str]) -> dict[str, str]:
+        if not safety_tag_map:
+            return {}
+
+        if not isinstance(safety_tag_map, str):
             raise ValueError("Safety tag map must be a string!")
 
-        string_data = self.safety_tag_map.strip().split(',')
-        if len(string_data) == 1 and string_data[0] == '':
-            return []
+        mappings = {}
+        for pair in safety_tag_map.split(','):
+            if not pair.strip():
+                continue
+            tag_name, separator, safety_tag_name = pair.partition('=')
+            if not separator or '=' in safety_tag_name:
+                raise ValueError("Safety tag map must be in the format 'tag_name=safety_tag_name, ...'")
+            mappings[tag_name.strip()] = safety_tag_name.strip()
+        return mappings
+
+    def _get_raw_safety_tag_map(self) -> Optional[str]:
+        return self._meta_data.get('SafetyTagMap') if isinstance(self._meta_data, dict) else None
 
-        dict_list = []
-        for pair in string_data:
-            dict_list.append({
-                '@Name': pair.split('=')[0].strip(),
-                'TagName': pair.split('=')[0].strip(),
-                'SafetyTagName': pair.split('=')[1].strip()
-            })
+    def _get_safety_tag_map_dict(self) -> dict[str, str]:
+        """Get the parsed safety tag map, re-parsing it only if the meta data string was replaced."""
+        raw = self._get_raw_safety_tag_map()
+        if raw is not self._safety_tag_map_source:
+            self._safety_tag_map_dict = self._parse_safety_tag_map(raw)
+            self._safety_tag_map_source = raw
+            self._safety_tag_map_dirty = False
+        return self._safety_tag_map_dict
 
-        return dict_list
+    def _sync_safety_tag_map(self) -> None:
+        """Serialize pending safety tag map changes to the meta data string.
+
+        Raises:
+            ValueError: If there are pending changes and the safety info meta data is not a dictionary.
+        """
+        if not self._safety_tag_map_dirty:
+            return
+        if not isinstance(self._meta_data, dict):
+            log(self).error('Cannot save safety tag map changes, safety info meta data is not a dictionary!')
+            raise ValueError('Safety info meta data must be a dictionary to save safety tag map changes!')
+        raw = ','.join(f'{k}={v}' for k, v in self._safety_tag_map_dict.items()) or None
+        self._meta_data['SafetyTagMap'] = raw
+        self._safety_tag_map_source = raw
+        self._safety_tag_map_dirty = False
+
+    def get_meta_data(self) -> dict:
+        self._sync_safety_tag_map()
+        return super().get_meta_data()
 
     def get_safety_locked(self) -> bool:
         return self['@SafetyLocked'] == 'true'
@@ -119,11 +166,26 @@ class ControllerSafetyInfo(
         self['@SafetyLevel'] = safety_level
 
     def get_safety_tag_map(self) -> str:
+        self._sync_safety_tag_map()
         if self['SafetyTagMap'] is None:
             return ''
 
         return self['SafetyTagMap']
 
+    def get_safety_tag_mapping(
+        self,
+        tag_name: str
+    ) -> Optional[str]:
+        """Get the safety tag a standard tag is mapped to.
+
+        Args:
+            tag_name (str): The standard tag name
+
+        Returns:
+            Optional[str]: The safety tag name, or None if the standard tag is not mapped.
+        """
+        return self._get_safety_tag_map_dict().get(tag_name)
+
     def set_safety_tag_map(self, safety_tag_map: str):
         if not isinstance(safety_tag_map, str):
             raise ValueError("Safety tag map must be a string!")
@@ -160,17 +222,10 @@ class ControllerSafetyInfo(
         if not isinstance(tag_name, str) or not isinstance(safety_tag_name, str):
             raise ValueError("Tag names must be strings!")
 
-        if not self.safety_tag_map:
-            self.set_safety_tag_map(f"{tag_name}={safety_tag_name}")
-            return
-
-        self.set_safety_tag_map(self.safety_tag_map.strip())
-
-        if f',{tag_name}={safety_tag_name}' in self.safety_tag_map:
-            self.set_safety_tag_map(self.safety_tag_map.replace(f",{tag_name}={safety_tag_name}", ''))
-        elif f"{tag_name}={safety_tag_name}," in self.safety_tag_map:
-            self.set_safety_tag_map(self.safety_tag_map.replace(f"{tag_name}={safety_tag_name},", ''))
-        self.set_safety_tag_map(self.safety_tag_map + f",{tag_name}={safety_tag_name}")
+        mappings = self._get_safety_tag_map_dict()
+        mappings.pop(tag_name, None)  # re-adding a mapping moves it to the end
+        mappings[tag_name] = safety_tag_name
+        self._safety_tag_map_dirty = True
 
     def remove_safety_tag_mapping(
         self,
@@ -188,16 +243,12 @@ class ControllerSafetyInfo(
         if not isinstance(tag_name, str) or not isinstance(safety_tag_name, str):
             raise ValueError("Tag names must be strings!")
 
-        if not self.safety_tag_map:
+        mappings = self._get_safety_tag_map_dict()
+        if mappings.get(tag_name) != safety_tag_name:
             return
 
-        self.set_safety_tag_map(self.safety_tag_map.strip())
-        if f",{tag_name}={safety_tag_name}" in self.safety_tag_map:
-            self.set_safety_tag_map(self.safety_tag_map.replace(f",{tag_name}={safety_tag_name}", ''))
-        elif f"{tag_name}={safety_tag_name}," in self.safety_tag_map:
-            self.set_safety_tag_map(self.safety_tag_map.replace(f"{tag_name}={safety_tag_name},", ''))
-        elif f"{tag_name}={safety_tag_name}" in self.safety_tag_map:
-            self.set_safety_tag_map(self.safety_tag_map.replace(f"{tag_name}={safety_tag_name}", ''))
+        del mappings[tag_name]
+        self._safety_tag_map_dirty = True
 
 
 class RaController(
@@ -503,6 +554,22 @@ class RaController(
             raise ValueError('CommPath must be a string!')
         self['@CommPath'] = comms_path
 
+    def get_meta_data(self) -> dict:
+        meta_data = super().get_meta_data()
+        safety_info = getattr(self, '_safety_info', None)
+        if not isinstance(safety_info, ControllerSafetyInfo):
+            return meta_data
+
+        safety_meta_data = safety_info.get_meta_data()  # serializes pending safety tag map changes
+        controller_meta_data = meta_data.get('RSLogix5000Content', {}).get('Controller')
+        if (
+            safety_meta_data
+            and isinstance(controller_meta_data, dict)
+            and controller_meta_data.get('SafetyInfo') is None
+        ):
+            controller_meta_data['SafetyInfo'] = safety_meta_data  # created for a controller without safety info
+        return meta_data
+
     def get_controller_safety_info(self) -> IControllerSafetyInfo:
         """Get the safety info of the controller.
 
@@ -173,7 +173,7 @@ class TestControllerSafetyInfo(unittest.TestCase):
         self.safety_info.set_safety_tag_map(original_map)
         self.safety_info.add_safety_tag_mapping('tag1', 'new_safety1')
         # Should remove old mapping and add new one
-        expected = 'tag1=safety1,tag2=safety2,tag1=new_safety1'
+        expected = 'tag2=safety2,tag1=new_safety1'
         self.assertEqual(self.safety_info.safety_tag_map, expected)
 
         # Test with invalid types
@@ -185,6 +185,35 @@ class TestControllerSafetyInfo(unittest.TestCase):
             self.safety_info.add_safety_tag_mapping('tag', 123)  # type: ignore
         self.assertIn("Tag names must be strings", str(context.exception))
 
+    def test_safety_tag_mapping_serialized_on_read(self):
+        """Test mapping changes are kept in the parsed map until the meta data is read."""
+        for i in range(3, 6):
+            self.safety_info.add_safety_tag_mapping(f'tag{i}', f'safety{i}')
+        self.safety_info.remove_safety_tag_mapping('tag1', 'safety1')
+        self.safety_info.remove_safety_tag_mapping('tag2', 'wrong_safety')
+
+        self.assertEqual(self.test_meta_data['SafetyTagMap'], 'tag1=safety1,tag2=safety2')
+        self.assertEqual(self.safety_info.get_safety_tag_mapping('tag4'), 'safety4')
+        self.assertIsNone(self.safety_info.get_safety_tag_mapping('tag1'))
+        self.assertEqual(list(self.safety_info.safety_tag_map_dict), ['tag2', 'tag3', 'tag4', 'tag5'])
+
+        self.safety_info.get_meta_data()
+        self.assertEqual(self.test_meta_data['SafetyTagMap'], 'tag2=safety2,tag3=safety3,tag4=safety4,tag5=safety5')
+
+    def test_safety_tag_mapping_on_string_meta_data(self):
+        """Test pending mapping changes raise instead of being dropped when the meta data is not a dictionary."""
+        safety_info = ControllerSafetyInfo(meta_data='SafetyInfo')
+        safety_info.add_safety_tag_mapping('tag1', 'safety1')
+
+        with self.assertRaises(ValueError):
+            safety_info.get_meta_data()
+
+    def test_safety_tag_map_reparsed_after_direct_change(self):
+        """Test the parsed map follows direct changes of the meta data."""
+        self.assertEqual(self.safety_info.get_safety_tag_mapping('tag1'), 'safety1')
+        self.test_meta_data['SafetyTagMap'] = 'tag1=other1'
+        self.assertEqual(self.safety_info.get_safety_tag_mapping('tag1'), 'other1')
+
     def test_remove_safety_tag_mapping(self):
         """Test remove_safety_tag_mapping method."""
         # Test removing from existing map
@@ -375,6 +404,27 @@ class TestController(unittest.TestCase):
         controller['@MajorRev'] = '33'
         self.assertEqual(controller.content_meta_data['@SoftwareRevision'], '33.11')
 
+    def test_safety_tag_mapping_without_safety_info(self):
+        """Test safety tag mappings of a controller without safety info create its container."""
+        del self.test_meta_data['RSLogix5000Content']['Controller']['SafetyInfo']
+        controller = RaController(meta_data=self.test_meta_data)
+
+        controller.safety_info.add_safety_tag_mapping('tag1', 'safety1')
+
+        meta_data = controller.get_meta_data()
+        self.assertEqual(
+            meta_data['RSLogix5000Content']['Controller']['SafetyInfo'],
+            {'SafetyTagMap': 'tag1=safety1'}
+        )
+
+    def test_no_safety_info_created_without_mappings(self):
+        """Test a controller without safety info is saved without one if no mapping was added."""
+        del self.test_meta_data['RSLogix5000Content']['Controller']['SafetyInfo']
+        controller = RaController(meta_data=self.test_meta_data)
+
+        meta_data = controller.get_meta_data()
+        self.assertNotIn('SafetyInfo', meta_data['RSLogix5000Content']['Controller'])
+
     @patch('controlrox.models.plc.rockwell.controller.get_save_file')
     def test_file_location_property_with_dialog(self, mock_get_save_file):
         """Test file_location property when not set initially."""
@@ -5,7 +5,9 @@ from unittest.mock import Mock, patch
 from pyrox.models.list import HashList
 from controlrox.interfaces import (
     IDatatype,
-    IProgram
+    IModule,
+    IProgram,
+    ModuleControlsType,
 )
 from controlrox.models.plc.controller import Controller
 
@@ -1096,7 +1098,32 @@ class TestControllerCreateMethods(unittest.TestCase):
         self.assertIn('No constructor or default constructor found', str(context.exception))
         self.assertIn('TestFactory', str(context.exception))
 
-
+    @patch('controlrox.models.plc.controller.IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data')
+    def test_introspected_modules(self, mock_get_imodule):
+        """Test get_introspected_modules and group_introspected_modules skip unmatched modules."""
+        controller = self.ConcreteClass()
+        imodules = {}
+        for name, controls_type in (('Rack', None), ('Block1', ModuleControlsType.INPUT_BLOCK),
+                                    ('Drive1', ModuleControlsType.DRIVE), ('Block2', ModuleControlsType.INPUT_BLOCK)):
+            module = Mock(spec=IModule)
+            module.name = name
+            controller._modules.append(module)
+            if controls_type:
+                imodules[name] = Mock(module_controls_type=controls_type)
+        mock_get_imodule.side_effect = lambda module, lazy: imodules.get(module.name)
+
+        self.assertEqual(
+            controller.get_introspected_modules(),
+            [imodules['Block1'], imodules['Drive1'], imodules['Block2']]
+        )
+        self.assertEqual(
+            controller.get_introspected_modules(by_type=ModuleControlsType.INPUT_BLOCK),
+            [imodules['Block1'], imodules['Block2']]
+        )
+        self.assertEqual(controller.group_introspected_modules(), {
+            ModuleControlsType.INPUT_BLOCK: [imodules['Block1'], imodules['Block2']],
+            ModuleControlsType.DRIVE: [imodules['Drive1']],
+        })
 
 
 if __name__ == '__main__':
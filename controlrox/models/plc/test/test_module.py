@@ -1,6 +1,6 @@
 """Unit tests for controlrox.models.plc.module module."""
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from controlrox.models.plc.module import Module
 
@@ -1110,5 +1110,61 @@ class TestModuleSpecialCases(unittest.TestCase):
         self.assertEqual(module2.name, 'Mod2')
 
 
+class TestModuleIntrospection(unittest.TestCase):
+    """Test the introspective module cached on a module."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        class IntrospectableModule(Module):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self._catalog_number = '1734-AENTR'
+                self._input_connection_point = 101
+
+            def get_catalog_number(self):
+                return self._catalog_number
+
+            def get_input_connection_point(self):
+                return self._input_connection_point
+
+        self.module = IntrospectableModule(name='Adapter')
+
+    @patch('controlrox.models.plc.module.IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data')
+    def test_match_is_cached(self, mock_get_imodule):
+        """Test the module is only matched once while its catalog and connections are unchanged."""
+        imodule = Mock()
+        mock_get_imodule.return_value = imodule
+
+        self.assertIs(self.module.introspective_module, imodule)
+        self.assertIs(self.module.get_introspective_module(), imodule)
+
+        mock_get_imodule.assert_called_once_with(self.module, True)
+
+    @patch('controlrox.models.plc.module.IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data')
+    def test_no_match_is_cached(self, mock_get_imodule):
+        """Test a module without a match is not matched again."""
+        mock_get_imodule.return_value = None
+
+        self.assertIsNone(self.module.introspective_module)
+        self.assertIsNone(self.module.introspective_module)
+
+        mock_get_imodule.assert_called_once()
+
+    @patch('controlrox.models.plc.module.IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data')
+    def test_rematch_on_catalog_or_connection_change(self, mock_get_imodule):
+        """Test the module is matched again after its catalog number or a connection point changed."""
+        mock_get_imodule.side_effect = [Mock(), Mock(), Mock()]
+
+        first = self.module.introspective_module
+        self.module._catalog_number = '1734-AENT'
+        second = self.module.introspective_module
+        self.module._input_connection_point = 102
+        third = self.module.introspective_module
+
+        self.assertEqual(mock_get_imodule.call_count, 3)
+        self.assertIsNot(first, second)
+        self.assertIsNot(second, third)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
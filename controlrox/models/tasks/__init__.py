@@ -9,6 +9,7 @@ from .app import (
 # Generator section
 from .generator import (
     EmulationGenerator,
+    ModuleContribution,
 )
 
 # Introspective section
@@ -21,6 +22,11 @@ from .mod import (
     ControllerModificationSchema,
 )
 
+# Plan section
+from .plan import (
+    ModificationPlan,
+)
+
 # Task section
 from .task import (
     ControllerApplicationTask,
@@ -38,6 +44,7 @@ __all__ = (
 
     # Generator section
     'EmulationGenerator',
+    'ModuleContribution',
 
     # Introspective section
     'IntrospectiveModule',
@@ -45,6 +52,9 @@ __all__ = (
     # Modification section
     'ControllerModificationSchema',
 
+    # Plan section
+    'ModificationPlan',
+
     # Task section
     'ControllerApplicationTask',
 
@@ -0,0 +1,669 @@
+"""Validation findings store for controller validators.
+
+Findings are keyed by (rule id, object path) and remember which objects the rule read while it was evaluated.
+After an edit, only the findings whose inputs changed are re-evaluated instead of re-running the entire validation.
+"""
+import csv
+import functools
+import hashlib
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from controlrox.interfaces import (
+    IAddOnInstruction,
+    IController,
+    IDatatype,
+    IDatatypeMember,
+    IModule,
+    IPlcObject,
+    IProgram,
+    IRoutine,
+    IRung,
+    ITag,
+)
+from controlrox.models.plc.rockwell.meta import (
+    L5X_ASSET_ADDONINSTRUCTIONDEFINITIONS,
+    L5X_ASSET_DATATYPES,
+    L5X_ASSET_MODULES,
+    L5X_ASSET_PROGRAMS,
+    L5X_ASSET_TAGS,
+    L5X_ASSETS,
+)
+from .profiling import active_profiler
+
+__all__ = (
+    'CONTROLLER_PATH',
+    'FindingKey',
+    'ValidationFinding',
+    'ValidationFindingsStore',
+    'ValidationSeverity',
+    'active_findings_store',
+    'collect_findings',
+    'fingerprint',
+    'get_object_path',
+    'report_result',
+    'resolve_object_path',
+    'rule_scope',
+)
+
+CONTROLLER_PATH = 'Controller'
+PATH_SEPARATOR = '/'
+
+FindingKey = tuple[str, str]
+
+
+class ValidationSeverity(str, Enum):
+    """Severity of a validation finding, ordered from least to most severe."""
+    PASS = 'pass'
+    DEBUG = 'debug'
+    SUCCESS = 'success'
+    WARNING = 'warning'
+    FAILURE = 'failure'
+
+    @property
+    def rank(self) -> int:
+        return list(ValidationSeverity).index(self)
+
+
+@dataclass
+class ValidationFinding:
+    """A single validation result for one rule evaluated against one object.
+
+    Attributes:
+        rule_id: Identifier of the rule that produced this finding.
+        object_path: Path of the object the rule was evaluated against (e.g. 'Programs/Main/Routines/R1').
+        severity: Severity of the finding.
+        passed: Whether the rule passed.
+        message: Message(s) emitted by the rule.
+        dependencies: Mapping of every object path the rule read to the fingerprint it had at evaluation time.
+        evaluated_at: Time the rule was evaluated.
+    """
+    rule_id: str
+    object_path: str
+    severity: ValidationSeverity = ValidationSeverity.PASS
+    passed: bool = True
+    message: str = ''
+    dependencies: dict[str, str] = field(default_factory=dict)
+    evaluated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def key(self) -> FindingKey:
+        return (self.rule_id, self.object_path)
+
+    def to_dict(self) -> dict:
+        return {
+            'rule_id': self.rule_id,
+            'object_path': self.object_path,
+            'severity': self.severity.value,
+            'passed': self.passed,
+            'message': self.message,
+            'dependencies': sorted(self.dependencies),
+            'evaluated_at': self.evaluated_at.isoformat(),
+        }
+
+
+@dataclass
+class _RuleScope:
+    """Messages emitted by the validation helpers while a rule is being evaluated."""
+    messages: list[tuple[ValidationSeverity, str]] = field(default_factory=list)
+
+
+@dataclass
+class _RuleEvaluation:
+    """Everything required to re-evaluate a rule without re-running the validation.
+
+    Arguments that are PLC objects are stored by path and resolved again on re-evaluation,
+    so edits that recompile the controller do not leave stale object references behind.
+    """
+    rule: Callable[..., bool]
+    owner: type
+    arguments: tuple[tuple[bool, Any], ...]
+
+
+_active_store: ContextVar[Optional['ValidationFindingsStore']] = ContextVar('_active_store', default=None)
+_active_scope: ContextVar[Optional[_RuleScope]] = ContextVar('_active_scope', default=None)
+
+
+def _path_prefixes(path: str) -> list[str]:
+    """Get every prefix of a path, including the path itself (e.g. 'A', 'A/B', 'A/B/C')."""
+    parts = path.split(PATH_SEPARATOR)
+    return [PATH_SEPARATOR.join(parts[:index]) for index in range(1, len(parts) + 1)]
+
+
+def fingerprint(value: Any) -> str:
+    """Get a short content fingerprint for a meta data value.
+
+    Args:
+        value: The value to fingerprint. PLC objects are fingerprinted by their meta data.
+
+    Returns:
+        str: A hex digest that changes whenever the content of the value changes.
+    """
+    if isinstance(value, IController):
+        # Only the controller attributes, child assets carry their own paths
+        value = {k: v for k, v in value.controller_meta_data.items() if k.startswith('@')}  # type: ignore
+    elif isinstance(value, IPlcObject):
+        value = value.meta_data
+    return hashlib.blake2b(repr(value).encode(), digest_size=8).hexdigest()
+
+
+def get_object_path(plc_object: Any) -> str:
+    """Get the path of a PLC object inside its controller.
+
+    Args:
+        plc_object: The PLC object to get the path of.
+
+    Returns:
+        str: The object path (e.g. 'Modules/RIO1', 'Programs/Main/Routines/R1/Rungs/4').
+    """
+    if plc_object is None or isinstance(plc_object, IController):
+        return CONTROLLER_PATH
+
+    if isinstance(plc_object, IRung):
+        routine = plc_object.routine
+        parent = get_object_path(routine) if routine else ''
+        return PATH_SEPARATOR.join(x for x in (parent, 'Rungs', str(plc_object.number)) if x)
+
+    if isinstance(plc_object, IRoutine):
+        try:
+            container = plc_object.container
+        except ValueError:
+            container = None
+        parent = get_object_path(container) if isinstance(container, IProgram) else ''
+        return PATH_SEPARATOR.join(x for x in (parent, 'Routines', plc_object.name) if x)
+
+    if isinstance(plc_object, IDatatypeMember):
+        parent = get_object_path(plc_object.get_parent_datatype())
+        return PATH_SEPARATOR.join((parent, 'Members', plc_object.name))
+
+    if isinstance(plc_object, ITag):
+        try:
+            container = plc_object.container
+        except ValueError:
+            container = None
+        if isinstance(container, IProgram):
+            return PATH_SEPARATOR.join((get_object_path(container), L5X_ASSET_TAGS, plc_object.name))
+        return PATH_SEPARATOR.join((L5X_ASSET_TAGS, plc_object.name))
+
+    for asset_type, interface in (
+        (L5X_ASSET_PROGRAMS, IProgram),
+        (L5X_ASSET_MODULES, IModule),
+        (L5X_ASSET_DATATYPES, IDatatype),
+        (L5X_ASSET_ADDONINSTRUCTIONDEFINITIONS, IAddOnInstruction),
+    ):
+        if isinstance(plc_object, interface):
+            return PATH_SEPARATOR.join((asset_type, plc_object.name))
+
+    return PATH_SEPARATOR.join((plc_object.__class__.__name__, getattr(plc_object, 'name', str(plc_object))))
+
+
+def resolve_object_path(
+    controller: IController,
+    path: str
+) -> Any:
+    """Resolve an object path back to the value it refers to in a controller.
+
+    Top level asset paths (e.g. 'Programs') resolve to the raw meta data list of that asset type.
+
+    Args:
+        controller: The controller to resolve the path in.
+        path: The object path to resolve.
+
+    Returns:
+        Any: The resolved object, or None if the path no longer exists.
+    """
+    if path == CONTROLLER_PATH:
+        return controller
+
+    parts = path.split(PATH_SEPARATOR)
+    if parts[0] not in L5X_ASSETS:
+        return None
+
+    if len(parts) == 1:
+        return controller.get_raw_l5x_asset_list(parts[0])  # type: ignore
+
+    containers = {
+        L5X_ASSET_PROGRAMS: controller.programs,
+        L5X_ASSET_MODULES: controller.modules,
+        L5X_ASSET_DATATYPES: controller.datatypes,
+        L5X_ASSET_ADDONINSTRUCTIONDEFINITIONS: controller.aois,
+        L5X_ASSET_TAGS: controller.tags,
+    }
+    current = containers[parts[0]].get(parts[1], None)
+
+    remaining = parts[2:]
+    while current is not None and len(remaining) >= 2:
+        kind, name = remaining[0], remaining[1]
+        remaining = remaining[2:]
+        match kind:
+            case 'Routines':
+                current = current.routines.get(name, None)
+            case 'Tags':
+                current = current.tags.get(name, None)
+            case 'Members':
+                current = next((x for x in current.members if x.name == name), None)
+            case 'Rungs':
+                rungs = current.rungs
+                current = rungs[int(name)] if name.isdigit() and int(name) < len(rungs) else None
+            case _:
+                current = None
+
+    return current if not remaining else None
+
+
+class ValidationFindingsStore:
+    """Store of validation findings keyed by (rule id, object path).
+
+    Every finding records the fingerprint of each object the rule read. Invalidating an object path
+    marks every finding that read that path (or any parent / child of it) as stale, and only stale
+    findings are re-evaluated by :meth:`revalidate`.
+
+    Args:
+        controller: The controller the findings belong to.
+    """
+
+    def __init__(
+        self,
+        controller: Optional[IController] = None
+    ) -> None:
+        self.controller = controller
+        self._findings: dict[FindingKey, ValidationFinding] = {}
+        self._evaluations: dict[FindingKey, _RuleEvaluation] = {}
+        self._dependents: dict[str, set[FindingKey]] = {}
+        self._descendants: dict[str, set[FindingKey]] = {}
+        self._stale: set[FindingKey] = set()
+        self._version: int = 0
+        # Fingerprints of the paths declared read by rules, computed once per collection pass
+        self._read_fingerprints: dict[str, str] = {}
+
+    def __contains__(self, key: FindingKey) -> bool:
+        return key in self._findings
+
+    def __iter__(self) -> Iterator[ValidationFinding]:
+        return iter(self._findings.values())
+
+    def __len__(self) -> int:
+        return len(self._findings)
+
+    @property
+    def findings(self) -> list[ValidationFinding]:
+        """All findings, in the order they were first recorded."""
+        return list(self._findings.values())
+
+    @property
+    def failures(self) -> list[ValidationFinding]:
+        """All findings that did not pass."""
+        return [x for x in self._findings.values() if not x.passed]
+
+    @property
+    def stale_keys(self) -> set[FindingKey]:
+        """Keys of the findings that must be re-evaluated."""
+        return set(self._stale)
+
+    @property
+    def version(self) -> int:
+        """Counter that increments on every change, used by views to poll for updates."""
+        return self._version
+
+    def _index(self, finding: ValidationFinding) -> None:
+        for path in finding.dependencies:
+            self._dependents.setdefault(path, set()).add(finding.key)
+            for prefix in _path_prefixes(path):
+                self._descendants.setdefault(prefix, set()).add(finding.key)
+
+    def _unindex(self, finding: ValidationFinding) -> None:
+        for path in finding.dependencies:
+            self._dependents.get(path, set()).discard(finding.key)
+            for prefix in _path_prefixes(path):
+                self._descendants.get(prefix, set()).discard(finding.key)
+
+    def clear(self) -> None:
+        """Remove every finding from the store."""
+        self._findings.clear()
+        self._evaluations.clear()
+        self._dependents.clear()
+        self._descendants.clear()
+        self._stale.clear()
+        self._read_fingerprints.clear()
+        self._version += 1
+
+    def discard(
+        self,
+        key: FindingKey
+    ) -> None:
+        """Remove a finding from the store.
+
+        Args:
+            key: The (rule id, object path) key of the finding to remove.
+        """
+        finding = self._findings.pop(key, None)
+        if finding is not None:
+            self._unindex(finding)
+        self._evaluations.pop(key, None)
+        self._stale.discard(key)
+        self._version += 1
+
+    def fingerprint_read(
+        self,
+        controller: IController,
+        path: str
+    ) -> str:
+        """Get the fingerprint of an object path read by a rule, computed at most once per collection pass.
+
+        Rules of every module read the same top level assets (e.g. 'Programs'), which are fingerprinted
+        once instead of once per rule evaluation.
+
+        Args:
+            controller: The controller to resolve the path in.
+            path: The object path the rule read.
+
+        Returns:
+            str: The fingerprint of the object at the path.
+        """
+        digest = self._read_fingerprints.get(path, None)
+        if digest is None:
+            digest = self._read_fingerprints[path] = fingerprint(resolve_object_path(controller, path))
+        return digest
+
+    def get(
+        self,
+        rule_id: str,
+        object_path: str
+    ) -> Optional[ValidationFinding]:
+        return self._findings.get((rule_id, object_path), None)
+
+    def get_findings_for_path(
+        self,
+        object_path: str
+    ) -> list[ValidationFinding]:
+        """Get every finding evaluated against an object path.
+
+        Args:
+            object_path: The object path to get findings for.
+
+        Returns:
+            list[ValidationFinding]: The findings for the object path.
+        """
+        return [x for x in self._findings.values() if x.object_path == object_path]
+
+    def invalidate(
+        self,
+        *object_paths: str
+    ) -> set[FindingKey]:
+        """Mark every finding that read any of the object paths as stale.
+
+        A finding that read a parent of the path (e.g. 'Programs' for 'Programs/Main') or a child of the path
+        is also invalidated.
+
+        Args:
+            *object_paths: The object paths that were edited.
+
+        Returns:
+            set[FindingKey]: The keys of the findings that were invalidated.
+        """
+        self._read_fingerprints.clear()
+        invalidated: set[FindingKey] = set()
+        for path in object_paths:
+            invalidated |= self._descendants.get(path, set())
+            for prefix in _path_prefixes(path)[:-1]:
+                invalidated |= self._dependents.get(prefix, set())
+        self._stale |= invalidated
+        if invalidated:
+            self._version += 1
+        return invalidated
+
+    def invalidate_changed(self) -> set[FindingKey]:
+        """Invalidate every finding whose dependencies no longer match their recorded fingerprints.
+
+        Each distinct dependency path is resolved and fingerprinted once per call.
+
+        Returns:
+            set[FindingKey]: The keys of the findings that were invalidated.
+        """
+        if not self.controller:
+            raise RuntimeError('No controller is set for this findings store!')
+
+        current: dict[str, Optional[str]] = {}
+        changed: set[str] = set()
+        for finding in self._findings.values():
+            for path, recorded in finding.dependencies.items():
+                if path not in current:
+                    value = resolve_object_path(self.controller, path)
+                    current[path] = None if value is None else fingerprint(value)
+                if current[path] != recorded:
+                    changed.add(path)
+
+        invalidated: set[FindingKey] = set()
+        for path in changed:
+            invalidated |= self._dependents.get(path, set())
+        self._stale |= invalidated
+        if invalidated:
+            self._version += 1
+        return invalidated
+
+    def record(
+        self,
+        finding: ValidationFinding,
+        evaluation: Optional[_RuleEvaluation] = None
+    ) -> None:
+        """Record a finding, replacing any previous finding with the same key.
+
+        Args:
+            finding: The finding to record.
+            evaluation: How to re-evaluate the rule that produced the finding.
+        """
+        previous = self._findings.get(finding.key, None)
+        if previous is not None:
+            self._unindex(previous)
+        self._findings[finding.key] = finding
+        self._index(finding)
+        if evaluation is not None:
+            self._evaluations[finding.key] = evaluation
+        self._stale.discard(finding.key)
+        self._version += 1
+
+    def revalidate(self) -> list[FindingKey]:
+        """Re-evaluate every stale finding.
+
+        Findings whose object no longer exists in the controller are removed.
+
+        Returns:
+            list[FindingKey]: The keys of the findings that were re-evaluated.
+        """
+        if not self.controller:
+            raise RuntimeError('No controller is set for this findings store!')
+
+        evaluated: list[FindingKey] = []
+        with collect_findings(self):
+            for key in list(self._stale):
+                evaluation = self._evaluations.get(key, None)
+                if evaluation is None:
+                    self.discard(key)
+                    continue
+
+                arguments = []
+                for is_path, value in evaluation.arguments:
+                    if is_path:
+                        value = resolve_object_path(self.controller, value)
+                        if value is None:
+                            break
+                    arguments.append(value)
+                else:
+                    evaluation.rule(evaluation.owner, self.controller, *arguments)
+                    evaluated.append(key)
+                    continue
+
+                self.discard(key)  # The object the rule was evaluated against was removed
+        return evaluated
+
+    def to_dict_list(self) -> list[dict]:
+        return [x.to_dict() for x in self._findings.values()]
+
+    def to_csv(
+        self,
+        file_location: Union[str, Path]
+    ) -> None:
+        """Export the findings to a CSV file.
+
+        Args:
+            file_location: The file to write.
+        """
+        rows = self.to_dict_list()
+        with open(file_location, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(ValidationFinding('', '').to_dict().keys()))
+            writer.writeheader()
+            for row in rows:
+                row['dependencies'] = ';'.join(row['dependencies'])
+                writer.writerow(row)
+
+    def to_json(
+        self,
+        file_location: Union[str, Path]
+    ) -> None:
+        """Export the findings to a JSON file.
+
+        Args:
+            file_location: The file to write.
+        """
+        with open(file_location, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict_list(), f, indent=2)
+
+
+def active_findings_store() -> Optional[ValidationFindingsStore]:
+    """Get the findings store currently collecting findings, if any."""
+    return _active_store.get()
+
+
+@contextmanager
+def collect_findings(store: ValidationFindingsStore) -> Iterator[ValidationFindingsStore]:
+    """Collect findings from every validation rule evaluated within this context into a store.
+
+    The context is one collection pass: the objects read by rules are fingerprinted once for the whole pass,
+    so the controller must not be edited within it.
+
+    Args:
+        store: The store to collect findings into.
+    """
+    store._read_fingerprints.clear()
+    token = _active_store.set(store)
+    try:
+        yield store
+    finally:
+        _active_store.reset(token)
+        store._read_fingerprints.clear()
+
+
+def report_result(
+    severity: ValidationSeverity,
+    message: str
+) -> None:
+    """Report a message from a validation helper to the rule currently being evaluated.
+
+    Args:
+        severity: The severity of the message.
+        message: The message.
+    """
+    scope = _active_scope.get()
+    if scope is not None:
+        scope.messages.append((severity, message))
+
+
+def rule_scope(
+    reads: tuple[Union[str, Callable[..., str]], ...] = ()
+) -> Callable[[Callable[..., bool]], Callable[..., bool]]:
+    """Decorator turning a validator check method into a tracked validation rule.
+
+    The decorated function must take (cls, controller, *arguments). PLC object arguments determine the object path
+    of the finding (the last PLC object) and are recorded as dependencies, as are the extra object paths in ``reads``.
+    The evaluation time of the rule, including fingerprinting its dependencies, is reported to the active profiler
+    (see profiling.profile_validation).
+    When neither a findings store is collecting nor a profiler is active, the rule runs exactly as it would undecorated.
+
+    Args:
+        reads: Additional object paths the rule reads (e.g. ('Programs',) for rules that search the logic),
+            or functions of the rule arguments (controller, *arguments) returning such a path, for rules that
+            only read an object of their own (e.g. the tag of a module).
+    """
+    def decorator(func: Callable[..., bool]) -> Callable[..., bool]:
+        rule_id = func.__name__.lstrip('_')
+
+        @functools.wraps(func)
+        def wrapper(cls, controller, *args, **kwargs) -> bool:
+            store = _active_store.get()
+            profiler = active_profiler()
+            if store is None and profiler is None:
+                return func(cls, controller, *args, **kwargs)
+
+            subjects = [x for x in args if isinstance(x, IPlcObject)] or [controller]
+            object_path = get_object_path(subjects[-1])
+
+            scope = _RuleScope()
+            token = _active_scope.set(scope)
+            started = time.perf_counter()
+            try:
+                passed = bool(func(cls, controller, *args, **kwargs))
+                if store is not None:
+                    _record_finding(store, cls, controller, args, subjects, object_path, passed, scope)
+            finally:
+                _active_scope.reset(token)
+                if profiler is not None:
+                    profiler.record_rule(rule_id, object_path, time.perf_counter() - started)
+            return passed
+
+        def _record_finding(
+            store: ValidationFindingsStore,
+            cls: type,
+            controller: IController,
+            args: tuple,
+            subjects: list,
+            object_path: str,
+            passed: bool,
+            scope: _RuleScope
+        ) -> None:
+            if scope.messages:
+                severity = max((x[0] for x in scope.messages), key=lambda x: x.rank)
+            else:
+                severity = ValidationSeverity.PASS if passed else ValidationSeverity.FAILURE
+
+            dependencies = {get_object_path(x): fingerprint(x) for x in subjects}
+            for path in reads:
+                if callable(path):
+                    path = path(controller, *args)
+                dependencies[path] = store.fingerprint_read(controller, path)
+
+            store.controller = store.controller or controller
+            store.record(
+                ValidationFinding(
+                    rule_id=rule_id,
+                    object_path=object_path,
+                    severity=severity,
+                    passed=passed,
+                    message='\n'.join(x[1] for x in scope.messages),
+                    dependencies=dependencies,
+                ),
+                _RuleEvaluation(
+                    rule=wrapper,
+                    owner=cls,
+                    arguments=tuple(
+                        (True, get_object_path(x)) if isinstance(x, IPlcObject) else (False, x)
+                        for x in args
+                    ),
+                )
+            )
+
+        wrapper.rule_id = rule_id  # type: ignore
+        return wrapper
+    return decorator
@@ -1,10 +1,12 @@
 """Emulation Generator module for pyrox applications.
 """
+from dataclasses import dataclass, field
 from typing import Optional
 
 from controlrox.interfaces import (
     IController,
     IEmulationGenerator,
+    IIntrospectiveModule,
     IModule,
     IRoutine,
     IRung,
@@ -12,15 +14,39 @@ from controlrox.interfaces import (
     ModuleControlsType,
 )
 from controlrox.models.tasks.mod import ControllerModificationSchema
+from controlrox.models.tasks.plan import ModificationPlan
 from controlrox.services import ControllerInstanceManager
 from controlrox.services.tasks.generator import EmulationGeneratorFactory
-from controlrox.services.plc.introspective import IntrospectiveModuleWarehouseFactory
 from pyrox.models import FactoryTypeMeta
 from pyrox.services.logging import log
 
 from controlrox.models.plc.meta import PlcObject
 
 
+@dataclass
+class ModuleContribution:
+    """Everything the emulation of one introspected module adds to the modification schema.
+
+    Contributions are computed independently per module, then merged into the schema in module order.
+
+    Attributes:
+        module_name: Name of the emulated module.
+        controls_type: The controls type the module was generated as.
+        imports: L5X imports as tuples (file_location, [asset_types]).
+        tags: Controller tag dictionaries with keys matching `add_controller_tag` arguments.
+        safety_mapping: The (standard_tag, safety_tag) mapping, empty names for none.
+        standard_rungs: Rungs for the standard emulation routine.
+        safety_rungs: Rungs for the safety emulation routine.
+    """
+    module_name: str
+    controls_type: ModuleControlsType
+    imports: list[tuple[str, list[str]]] = field(default_factory=list)
+    tags: list[dict] = field(default_factory=list)
+    safety_mapping: tuple[str, str] = ('', '')
+    standard_rungs: list[IRung] = field(default_factory=list)
+    safety_rungs: list[IRung] = field(default_factory=list)
+
+
 class EmulationGenerator(
     IEmulationGenerator,
     PlcObject,
@@ -38,6 +64,7 @@ class EmulationGenerator(
     ) -> None:
         PlcObject.__init__(self)
         self.schema = ControllerModificationSchema()
+        self.plan: Optional[ModificationPlan] = None
         self._emulation_standard_routine = None
         self._emulation_safety_routine = None
 
@@ -343,9 +370,15 @@ class EmulationGenerator(
         log(self).debug(f"Blocking JSR call to routine '{routine_name}' in program '{program_name}'")
         ...
 
-    def generate_emulation_logic(self) -> ControllerModificationSchema:
+    def generate_emulation_logic(
+        self,
+        dry_run: bool = False
+    ) -> ControllerModificationSchema:
         """Main entry point to generate emulation logic.
 
+        Args:
+            dry_run: Only build the schema and plan its changes into `plan`, without changing the controller.
+
         Returns:
             ControllerModificationSchema: The modification schema with all changes.
         """
@@ -355,10 +388,27 @@ class EmulationGenerator(
         self._generate_custom_module_emulation()
         self._generate_custom_logic()
 
-        self.schema.execute()
+        if dry_run:
+            self.plan = self.schema.plan()
+            self.plan.log_summary()
+            log(self).info(f"Emulation generation planned for {self.controller.name}")
+            return self.schema
+
+        self.schema.execute(batch=True)
         log(self).info(f"Emulation generation completed for {self.controller.name}")
         return self.schema
 
+    def plan_emulation_logic(self) -> ModificationPlan:
+        """Plan the emulation logic generation without changing the controller.
+
+        Returns:
+            ModificationPlan: Every change generating the emulation logic would make.
+        """
+        self.generate_emulation_logic(dry_run=True)
+        if self.plan is None:
+            raise RuntimeError("Emulation generation did not produce a plan.")
+        return self.plan
+
     def _generate_base_emulation(self) -> None:
         """Generate the base emulation logic common to all controllers."""
         self._generate_base_tags()
@@ -474,50 +524,115 @@ class EmulationGenerator(
     def _generate_base_module_emulation(self) -> None:
         """Generate base module emulation logic common to all controllers."""
         log(self).info("Generating base module emulation...")
-        for controller_type in ModuleControlsType:
-            self._generate_builtin_common(controller_type)
+        grouped = self.controller.group_introspected_modules()
+        self.merge_module_contributions(self.collect_module_contributions([
+            (controls_type, imodule)
+            for controls_type in ModuleControlsType
+            for imodule in grouped.get(controls_type, [])
+        ]))
 
     def _generate_builtin_common(
         self,
-        generation_type: ModuleControlsType
+        generation_type: ModuleControlsType,
+        imodules: Optional[list[IIntrospectiveModule]] = None
     ) -> None:
-        imodules = IntrospectiveModuleWarehouseFactory.filter_modules_by_type(
-            self.controller.modules,
-            generation_type
-        )
+        if imodules is None:
+            imodules = self.controller.get_introspected_modules(by_type=generation_type)
         log(self).info(
             "Generating built-in common emulation for %d modules of type %s...",
             len(imodules),
             generation_type.value
         )
+        self.merge_module_contributions(self.collect_module_contributions([
+            (generation_type, imodule) for imodule in imodules
+        ]))
 
-        for introspective_module in imodules:
-            if not introspective_module:
-                log(self).warning("Module has no introspective_module, skipping...")
-                continue
-            if not introspective_module.base_module:
-                log(self).warning("IntrospectiveModule has no associated module, skipping...")
-                continue
-            log(self).info(
-                "Generating emulation for %s %s of class %s",
-                generation_type.value,
-                introspective_module.base_module.name,
-                introspective_module.__class__.__name__
-            )
+    def create_module_contribution(
+        self,
+        generation_type: ModuleControlsType,
+        introspective_module: Optional[IIntrospectiveModule]
+    ) -> Optional[ModuleContribution]:
+        """Compute what the emulation of one introspected module adds, without changing the schema.
 
-            self.add_l5x_imports(introspective_module.get_required_imports())
-            self.add_controller_tags(introspective_module.get_required_tags())
-            self.add_safety_tag_mapping(*introspective_module.get_required_standard_to_safety_mapping())
-            self.add_rungs(
-                self.emulation_standard_program_name,
-                self.get_emulation_standard_routine_name(),
-                introspective_module.get_required_standard_rungs()
-            )
-            self.add_rungs(
-                self.emulation_safety_program_name,
-                self.get_emulation_safety_routine_name(),
-                introspective_module.get_required_safety_rungs()
-            )
+        Args:
+            generation_type: The controls type the module is generated as.
+            introspective_module: The introspected module.
+
+        Returns:
+            Optional[ModuleContribution]: The contribution, or None if the module can not be emulated.
+        """
+        if not introspective_module:
+            log(self).warning("Module has no introspective_module, skipping...")
+            return None
+        if not introspective_module.base_module:
+            log(self).warning("IntrospectiveModule has no associated module, skipping...")
+            return None
+        log(self).info(
+            "Generating emulation for %s %s of class %s",
+            generation_type.value,
+            introspective_module.base_module.name,
+            introspective_module.__class__.__name__
+        )
+        return ModuleContribution(
+            module_name=introspective_module.base_module.name,
+            controls_type=generation_type,
+            imports=introspective_module.get_required_imports(),
+            tags=introspective_module.get_required_tags(),
+            safety_mapping=introspective_module.get_required_standard_to_safety_mapping(),
+            standard_rungs=introspective_module.get_required_standard_rungs(),
+            safety_rungs=introspective_module.get_required_safety_rungs(),
+        )
+
+    def collect_module_contributions(
+        self,
+        imodules: list[tuple[ModuleControlsType, Optional[IIntrospectiveModule]]]
+    ) -> list[ModuleContribution]:
+        """Compute the contributions of introspected modules.
+
+        Args:
+            imodules: Tuples (generation_type, introspective_module) to compute contributions for.
+
+        Returns:
+            list[ModuleContribution]: The contributions, in the order of `imodules`, skipping modules that can not be
+            emulated.
+        """
+        contributions = [self.create_module_contribution(*x) for x in imodules]
+        return [x for x in contributions if x is not None]
+
+    def merge_module_contribution(
+        self,
+        contribution: ModuleContribution
+    ) -> None:
+        """Merge the contribution of one introspected module into the modification schema.
+
+        Args:
+            contribution: The contribution to merge.
+        """
+        self.add_l5x_imports(contribution.imports)
+        self.add_controller_tags(contribution.tags)
+        self.add_safety_tag_mapping(*contribution.safety_mapping)
+        self.add_rungs(
+            self.emulation_standard_program_name,
+            self.get_emulation_standard_routine_name(),
+            contribution.standard_rungs
+        )
+        self.add_rungs(
+            self.emulation_safety_program_name,
+            self.get_emulation_safety_routine_name(),
+            contribution.safety_rungs
+        )
+
+    def merge_module_contributions(
+        self,
+        contributions: list[ModuleContribution]
+    ) -> None:
+        """Merge the contributions of introspected modules into the modification schema, in order.
+
+        Args:
+            contributions: The contributions to merge.
+        """
+        for contribution in contributions:
+            self.merge_module_contribution(contribution)
 
     def _generate_custom_logic(self) -> None:
         """Generate custom emulation logic. Override in subclasses if needed."""
@@ -613,13 +728,10 @@ class EmulationGenerator(
         Returns:
             list[Module]: list of matching modules
         """
-        mods = []
-        for module in self.controller.modules:
-            imodule = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(module, True)
-            if not imodule:
-                continue
-            if imodule.module_controls_type == module_type:
-                mods.append(module)
+        mods = [
+            imodule.base_module
+            for imodule in self.controller.get_introspected_modules(by_type=module_type)  # type: ignore
+        ]
 
         log(self).info('Found %d modules of type %s...', len(mods), module_type)
         return mods
@@ -1,5 +1,8 @@
 """PLC Controller Modifaction Schema."""
+import copy
+import os
 from typing import (
+    Any,
     Optional,
 )
 from pyrox.services import log
@@ -11,6 +14,136 @@ from controlrox.interfaces import (
     TAG
 )
 from controlrox.services import ControllerInstanceManager
+from controlrox.services.l5x import cached_l5x_dict_from_file, get_l5x_asset_hash
+from controlrox.services.overlay import ControllerOverlay
+from .plan import ModificationPlan, PlannedChangeType
+
+# L5X asset list name -> attribute of the controller holding those assets
+L5X_IMPORT_ASSET_ATTRIBUTES = {
+    'DataTypes': 'datatypes',
+    'AddOnInstructionDefinitions': 'aois',
+    'Modules': 'modules',
+    'Tags': 'tags',
+    'Programs': 'programs',
+}
+
+# Actions whose assets are merged into their target container's raw list in bulk by a batched execute
+BATCHED_ACTION_TYPES = frozenset((
+    'add_controller_tag',
+    'add_datatype',
+    'add_program_tag',
+    'add_rung',
+))
+
+# Actions that do not change any asset container, so they never interrupt a batch
+CONTAINER_FREE_ACTION_TYPES = frozenset((
+    'safety_tag_mapping',
+    'remove_safety_tag_mapping',
+))
+
+# Actions that invalidate the containers they change themselves, so they do not require a full recompile
+SELF_INVALIDATING_ACTION_TYPES = frozenset((
+    'import_from_file',
+    'migrate_controller_tag',
+    'migrate_datatype',
+    'migrate_routine',
+    'add_routine',
+    'remove_controller_tag',
+    'remove_datatype',
+    'remove_program_tag',
+    'remove_routine',
+))
+
+
+def merge_raw_assets(
+    raw_asset_list: list[dict],
+    raw_assets: list[dict],
+    dict_lookup_key: str = '@Name'
+) -> int:
+    """Merge raw assets into a raw asset list in one pass, using a name -> index map.
+
+    An asset replaces the asset with the same name in place, otherwise it is appended.
+
+    Args:
+        raw_asset_list: The raw list to merge into.
+        raw_assets: The raw assets to merge.
+        dict_lookup_key: The key holding an asset's name.
+
+    Returns:
+        int: The number of assets that replaced an existing asset.
+    """
+    index = {x.get(dict_lookup_key): i for i, x in enumerate(raw_asset_list) if isinstance(x, dict)}
+    replaced = 0
+    for asset in raw_assets:
+        name = asset.get(dict_lookup_key)
+        position = index.get(name)
+        if position is None:
+            index[name] = len(raw_asset_list)
+            raw_asset_list.append(asset)
+        else:
+            raw_asset_list[position] = asset
+            replaced += 1
+    return replaced
+
+
+class ModificationBatch:
+    """Batched actions of a schema execution that are not applied yet, grouped by target container."""
+
+    def __init__(self) -> None:
+        self.controller_tags: list[dict] = []
+        self.datatypes: list[dict] = []
+        self.program_tags: dict[str, list[dict]] = {}
+        self.rungs: dict[tuple[str, str], list[dict]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.controller_tags or self.datatypes or self.program_tags or self.rungs)
+
+    def add(
+        self,
+        action: dict
+    ) -> bool:
+        """Add a batched action.
+
+        Args:
+            action: The action to add.
+
+        Returns:
+            bool: True if the action was added, False if it is missing its asset or target.
+        """
+        match action.get('type'):
+            case 'add_controller_tag' if isinstance(action.get('asset'), dict):
+                self.controller_tags.append(action['asset'])
+            case 'add_datatype' if isinstance(action.get('asset'), dict):
+                self.datatypes.append(action['asset'])
+            case 'add_program_tag' if action.get('program') and isinstance(action.get('asset'), dict):
+                self.program_tags.setdefault(action['program'], []).append(action['asset'])
+            case 'add_rung' if (
+                action.get('program') and action.get('routine') and isinstance(action.get('new_rung'), dict)
+                and action.get('rung_number') is None  # Rungs inserted at a position are added on their own
+            ):
+                self.rungs.setdefault((action['program'], action['routine']), []).append(action['new_rung'])
+            case _:
+                return False
+        return True
+
+    def clear(self) -> None:
+        self.controller_tags.clear()
+        self.datatypes.clear()
+        self.program_tags.clear()
+        self.rungs.clear()
+
+
+def _get_planned_meta_data(
+    overlay: ControllerOverlay,
+    container: tuple[str, ...],
+    name: str
+) -> Optional[dict]:
+    """Get the meta data an asset would have after the changes planned so far.
+
+    Planning records the meta data of planned assets in the overlay, not compiled assets.
+    """
+    asset = overlay.get(container, name)
+    return asset if asset is None or isinstance(asset, dict) else asset.meta_data
 
 
 class ControllerModificationSchema:
@@ -26,7 +159,18 @@ class ControllerModificationSchema:
 
         self._destination = ControllerInstanceManager.get_controller()
 
-        self.actions: list[dict] = []  # List of migration actions
+        self._imports: dict[tuple[str, Optional[tuple[str, ...]]], dict] = {}  # (file, asset types) -> import action
+        self.actions = []  # List of migration actions
+
+    @property
+    def actions(self) -> list[dict]:
+        """The registered actions, in execution order."""
+        return self._actions
+
+    @actions.setter
+    def actions(self, actions: list[dict]) -> None:
+        self._actions = actions
+        self._imports.clear()  # Imports scheduled by replaced actions must be scheduled again
 
     @property
     def destination(self) -> IController:
@@ -34,6 +178,16 @@ class ControllerModificationSchema:
             raise ValueError("Destination controller is not set for this ControllerModificationSchema.")
         return self._destination
 
+    def _execute_action(
+        self,
+        action: dict
+    ) -> None:
+        method = action.get('method')
+        if callable(method):
+            method(action)
+        else:
+            log(self).warning(f"No method defined for action type: {action['type']}. Skipping...")
+
     def _execute_add_controller_tag(
         self,
         action: dict
@@ -145,6 +299,8 @@ class ControllerModificationSchema:
             log(self).warning(f'Routine {routine_name} not found in program {program_name}.')
             return
 
+        if rung_number is None:
+            rung_number = -1
         rung = self.destination.create_rung(
             meta_data=rung_data,
             routine=routine,
@@ -152,7 +308,7 @@ class ControllerModificationSchema:
         )
 
         try:
-            routine.add_rung(rung)
+            routine.add_rung(rung, index=rung_number)
             log(self).info(f'Added rung {rung.number} to routine {routine_name} in program {program_name}.')
         except ValueError as e:
             log(self).warning(f'Failed to add rung {rung.number} to routine {routine_name} in program {program_name}:\n{e}')
@@ -223,9 +379,26 @@ class ControllerModificationSchema:
             log(self).warning('No file location provided for import_datatypes_from_file action.')
             return
 
+        import_from_dict = getattr(self.destination, 'import_assets_from_l5x_dict', None)
         try:
-            self.destination.import_assets_from_file(file_location, asset_types)
-            log(self).info(f'Imported assets from file {file_location} to destination controller.')
+            if not callable(import_from_dict):
+                self.destination.import_assets_from_file(file_location, asset_types)
+                log(self).info(f'Imported assets from file {file_location} to destination controller.')
+                return
+
+            l5x_dict = cached_l5x_dict_from_file(file_location)
+            if not l5x_dict:
+                log(self).warning(f'No L5X dictionary could be read from file: {file_location}')
+                return
+
+            if asset_types is None:
+                asset_types = list(L5X_IMPORT_ASSET_ATTRIBUTES)
+            new_assets, skipped = self._get_new_l5x_assets(l5x_dict, asset_types)
+            import_from_dict(new_assets, asset_types=asset_types)
+            log(self).info(
+                f'Imported assets from file {file_location} to destination controller '
+                f'({skipped} identical assets already present).'
+            )
         except Exception as e:
             log(self).warning(f'Failed to import assets from file {file_location}:\n{e}')
             raise e
@@ -370,6 +543,349 @@ class ControllerModificationSchema:
             dest_routine.rungs[rung_num] = new_rung
             log(self).info(f'Updated rung {rung_num} in routine {routine_name} of program {destination_program_name}.')
 
+    def _flush_batch(
+        self,
+        batch: ModificationBatch,
+        touched: set[tuple[str, ...]]
+    ) -> None:
+        """Apply the pending batched actions to the destination's raw lists, and invalidate the containers changed.
+
+        The containers are invalidated so that actions run after the flush see the merged assets.
+
+        Args:
+            batch: The pending actions. Cleared after applying.
+            touched: Collects the containers that were changed.
+        """
+        changed: set[tuple[str, ...]] = set()
+        if batch.controller_tags:
+            merge_raw_assets(self.destination.raw_tags, batch.controller_tags)
+            changed.add(('tags',))
+
+        if batch.datatypes:
+            merge_raw_assets(self.destination.raw_datatypes, batch.datatypes)
+            changed.add(('datatypes',))
+
+        for program_name, raw_tags in batch.program_tags.items():
+            program = self.destination.programs.get(program_name)
+            if not program:
+                log(self).warning(f'Program {program_name} not found in destination controller.')
+                continue
+            merge_raw_assets(program.raw_tags, raw_tags)
+            changed.add(('program_tags', program_name))
+
+        for (program_name, routine_name), raw_rungs in batch.rungs.items():
+            program = self.destination.programs.get(program_name)
+            if not program:
+                log(self).warning(f'Program {program_name} not found in destination controller.')
+                continue
+            routine = program.routines.get(routine_name)
+            if not routine:
+                log(self).warning(f'Routine {routine_name} not found in program {program_name}.')
+                continue
+            target = routine.raw_rungs
+            for raw_rung in raw_rungs:
+                raw_rung['@Number'] = str(len(target))
+                target.append(raw_rung)
+            changed.add(('rungs', program_name, routine_name))
+
+        batch.clear()
+        self._invalidate_containers(changed)
+        touched.update(changed)
+
+    def _invalidate_containers(
+        self,
+        containers: set[tuple[str, ...]]
+    ) -> None:
+        """Invalidate the compiled views of destination containers whose raw lists were changed.
+
+        Args:
+            containers: The changed containers.
+        """
+        for container in containers:
+            match container:
+                case ('tags',):
+                    self.destination.invalidate_tags()
+                case ('datatypes',):
+                    self.destination.invalidate_datatypes()
+                case ('program_tags', program_name):
+                    program = self.destination.programs.get(program_name)
+                    if program:
+                        program.invalidate_tags()
+                case ('rungs', program_name, routine_name):
+                    program = self.destination.programs.get(program_name)
+                    routine = program.routines.get(routine_name) if program else None
+                    if routine:
+                        routine.invalidate_rungs()
+
+    @staticmethod
+    def _get_l5x_asset_lists(
+        l5x_dict: dict,
+        asset_types: list[str]
+    ) -> Optional[dict[str, list[dict]]]:
+        """Get the raw assets of each asset type of a parsed L5X file.
+
+        Args:
+            l5x_dict: The parsed L5X file.
+            asset_types: The asset types to get.
+
+        Returns:
+            Optional[dict[str, list[dict]]]: The asset type mapped to its raw assets, or None if the file holds no controller.
+        """
+        content = l5x_dict.get('RSLogix5000Content')
+        controller_data = content.get('Controller') if isinstance(content, dict) else None
+        if not isinstance(controller_data, dict):
+            return None
+
+        asset_lists: dict[str, list[dict]] = {}
+        for asset_type in asset_types:
+            items = controller_data.get(asset_type)
+            if not isinstance(items, dict):
+                continue
+
+            item_list = items.get(asset_type[:-1], [])
+            if not isinstance(item_list, list):
+                item_list = [item_list]
+            asset_lists[asset_type] = item_list
+        return asset_lists
+
+    def _get_new_l5x_assets(
+        self,
+        l5x_dict: dict,
+        asset_types: list[str]
+    ) -> tuple[dict, int]:
+        """Get a copy of the assets of a parsed L5X file, leaving out assets already present in the destination.
+
+        An asset is left out if the destination holds an asset with the same name and identical content.
+        Assets with the same name but different content are kept, so the destination reports the conflict.
+
+        Args:
+            l5x_dict: The parsed (shared, unmodified) L5X file.
+            asset_types: The asset types to import.
+
+        Returns:
+            tuple[dict, int]: The L5X dictionary to import, and the number of assets left out.
+        """
+        asset_lists = self._get_l5x_asset_lists(l5x_dict, asset_types)
+        if asset_lists is None:
+            return l5x_dict, 0
+
+        filtered: dict[str, dict] = {}
+        skipped = 0
+        for asset_type, item_list in asset_lists.items():
+            attribute = L5X_IMPORT_ASSET_ATTRIBUTES.get(asset_type)
+            existing_assets = getattr(self.destination, attribute, None) if attribute else None
+            new_items = []
+            for item in item_list:
+                existing = existing_assets.get(item.get('@Name')) if existing_assets is not None else None
+                if existing is not None and get_l5x_asset_hash(existing.meta_data) == get_l5x_asset_hash(item):
+                    skipped += 1
+                    continue
+                new_items.append(copy.deepcopy(item))
+            filtered[asset_type] = {asset_type[:-1]: new_items}
+
+        return {'RSLogix5000Content': {'Controller': filtered}}, skipped
+
+    def _plan_action(
+        self,
+        action: dict,
+        plan: ModificationPlan,
+        overlay: ControllerOverlay,
+        rung_counts: dict[tuple[str, str], tuple[Any, int]],
+        safety_pairs: set[tuple[str, str]]
+    ) -> None:
+        match action.get('type'):
+            case 'add_controller_tag':
+                self._plan_asset(plan, overlay, ('tags',), 'Tags', action.get('asset'))
+            case 'add_datatype':
+                self._plan_asset(plan, overlay, ('datatypes',), 'DataTypes', action.get('asset'))
+            case 'add_program_tag':
+                program_name = action.get('program', '')
+                self._plan_asset(plan, overlay, ('program_tags', program_name), 'Tags', action.get('asset'),
+                                 f'Programs/{program_name}/Tags/')
+            case 'add_routine':
+                program_name = action.get('program', '')
+                self._plan_asset(plan, overlay, ('routines', program_name), 'Routines', action.get('routine'),
+                                 f'Programs/{program_name}/Routines/')
+            case 'add_rung':
+                self._plan_add_rung(action, plan, overlay, rung_counts)
+            case 'import_from_file':
+                self._plan_import(action, plan, overlay)
+            case 'migrate_controller_tag' | 'migrate_datatype':
+                kind, attribute = ('Tags', 'tags') if action['type'] == 'migrate_controller_tag' else ('DataTypes', 'datatypes')
+                asset = getattr(self.source, attribute).get(action.get('name')) if self.source else None
+                if asset is None:
+                    plan.add_change(PlannedChangeType.SKIPPED, kind, f'{kind}/{action.get("name")}', 'not found in source')
+                    return
+                self._plan_asset(plan, overlay, (attribute,), kind, asset.meta_data)
+            case 'migrate_routine':
+                self._plan_routine_migration(action, plan, overlay)
+            case 'remove_controller_tag':
+                self._plan_removal(plan, overlay, ('tags',), 'Tags', action.get('name', ''))
+            case 'remove_datatype':
+                self._plan_removal(plan, overlay, ('datatypes',), 'DataTypes', action.get('name', ''))
+            case 'remove_program_tag':
+                program_name = action.get('program', '')
+                self._plan_removal(plan, overlay, ('program_tags', program_name), 'Tags', action.get('name', ''),
+                                   f'Programs/{program_name}/Tags/')
+            case 'remove_routine':
+                program_name = action.get('program', '')
+                self._plan_removal(plan, overlay, ('routines', program_name), 'Routines', action.get('name', ''),
+                                   f'Programs/{program_name}/Routines/', 'including JSR calls to it')
+            case 'safety_tag_mapping' | 'remove_safety_tag_mapping':
+                pair = (action.get('standard', ''), action.get('safety', ''))
+                path = f'SafetyTagMap/{pair[0]}'
+                message = f'{pair[0]}={pair[1]}'
+                if action['type'] == 'safety_tag_mapping':
+                    change_type = PlannedChangeType.UNCHANGED if pair in safety_pairs else PlannedChangeType.ADD
+                    safety_pairs.add(pair)
+                elif pair in safety_pairs:
+                    change_type = PlannedChangeType.REMOVE
+                    safety_pairs.discard(pair)
+                else:
+                    change_type, message = PlannedChangeType.SKIPPED, f'{message} not mapped'
+                plan.add_change(change_type, 'SafetyTagMap', path, message)
+            case action_type:
+                plan.add_change(PlannedChangeType.SKIPPED, 'Unknown', str(action_type), 'unknown action type')
+
+    def _plan_add_rung(
+        self,
+        action: dict,
+        plan: ModificationPlan,
+        overlay: ControllerOverlay,
+        rung_counts: dict[tuple[str, str], tuple[Any, int]]
+    ) -> None:
+        """Plan appending a rung to a routine.
+
+        Rung counts hold, per routine, the routine the count is for and the number of rungs it would have,
+        so a routine replaced by the plan starts counting again.
+        """
+        program_name = action.get('program', '')
+        routine_name = action.get('routine', '')
+        path = f'Programs/{program_name}/Routines/{routine_name}/Rungs/'
+        routine = overlay.get(('routines', program_name), routine_name)
+        if routine is None:
+            plan.add_change(PlannedChangeType.SKIPPED, 'Rungs', path, 'routine not found')
+            return
+
+        key = (program_name, routine_name)
+        counted, count = rung_counts.get(key, (None, 0))
+        if counted is not routine:
+            count = 0 if isinstance(routine, dict) else len(routine.rungs)
+        rung_counts[key] = (routine, count + 1)
+
+        rung_data = action.get('new_rung') or {}
+        text = rung_data.get('Text', '') if isinstance(rung_data, dict) else ''
+        plan.add_change(PlannedChangeType.ADD, 'Rungs', f'{path}{count}', text if isinstance(text, str) else '')
+
+    def _plan_asset(
+        self,
+        plan: ModificationPlan,
+        overlay: ControllerOverlay,
+        container: tuple[str, ...],
+        kind: str,
+        meta_data: Optional[dict],
+        path_prefix: str = ''
+    ) -> None:
+        """Plan adding an asset to a container, replacing an asset with the same name.
+
+        The change is planned as unchanged if the container already holds an asset with identical content.
+        """
+        path_prefix = path_prefix or f'{kind}/'
+        name = meta_data.get('@Name', '') if isinstance(meta_data, dict) else ''
+        if not name:
+            plan.add_change(PlannedChangeType.SKIPPED, kind, path_prefix, 'no asset data')
+            return
+        if container[0] in ('program_tags', 'routines') and overlay.get(('programs',), container[1]) is None:
+            plan.add_change(PlannedChangeType.SKIPPED, kind, f'{path_prefix}{name}', 'program not found')
+            return
+
+        existing = _get_planned_meta_data(overlay, container, name)
+        if existing is None:
+            change_type = PlannedChangeType.ADD
+        elif get_l5x_asset_hash(existing) == get_l5x_asset_hash(meta_data):
+            change_type = PlannedChangeType.UNCHANGED
+        else:
+            change_type = PlannedChangeType.REPLACE
+        overlay.set(container, name, meta_data)
+        plan.add_change(change_type, kind, f'{path_prefix}{name}')
+
+    def _plan_import(
+        self,
+        action: dict,
+        plan: ModificationPlan,
+        overlay: ControllerOverlay
+    ) -> None:
+        file_location = action.get('file', '')
+        l5x_dict = cached_l5x_dict_from_file(file_location) if file_location else None
+        if not l5x_dict:
+            plan.add_change(PlannedChangeType.SKIPPED, 'Imports', file_location, 'no L5X data')
+            return
+
+        asset_types = action.get('asset_types')
+        if asset_types is None:
+            asset_types = list(L5X_IMPORT_ASSET_ATTRIBUTES)
+        asset_lists = self._get_l5x_asset_lists(l5x_dict, asset_types) or {}
+        for asset_type, item_list in asset_lists.items():
+            attribute = L5X_IMPORT_ASSET_ATTRIBUTES.get(asset_type, asset_type)
+            for item in item_list:
+                self._plan_asset(plan, overlay, (attribute,), asset_type, item)
+
+    def _plan_removal(
+        self,
+        plan: ModificationPlan,
+        overlay: ControllerOverlay,
+        container: tuple[str, ...],
+        kind: str,
+        name: str,
+        path_prefix: str = '',
+        message: str = ''
+    ) -> None:
+        path = f'{path_prefix or kind + "/"}{name}'
+        if overlay.get(container, name) is None:
+            plan.add_change(PlannedChangeType.SKIPPED, kind, path, 'not found')
+            return
+        overlay.remove(container, name)
+        plan.add_change(PlannedChangeType.REMOVE, kind, path, message)
+
+    def _plan_routine_migration(
+        self,
+        action: dict,
+        plan: ModificationPlan,
+        overlay: ControllerOverlay
+    ) -> None:
+        source_program_name = action.get('source_program', '')
+        destination_program_name = action.get('destination_program', '')
+        routine_name = action.get('routine', '')
+        path_prefix = f'Programs/{destination_program_name}/Routines/'
+
+        source_program = self.source.programs.get(source_program_name) if self.source else None
+        source_routine = source_program.routines.get(routine_name) if source_program else None
+        if source_routine is None:
+            plan.add_change(PlannedChangeType.SKIPPED, 'Routines', f'{path_prefix}{routine_name}', 'not found in source')
+            return
+
+        self._plan_asset(plan, overlay, ('routines', destination_program_name), 'Routines',
+                         source_routine.meta_data, path_prefix)
+        for rung_number in action.get('rung_updates', {}):
+            plan.add_change(PlannedChangeType.REPLACE, 'Rungs', f'{path_prefix}{routine_name}/Rungs/{rung_number}')
+
+    def _recompile_touched(
+        self,
+        touched: set[tuple[str, ...]]
+    ) -> None:
+        """Recompile the controller containers changed by batched actions.
+
+        Program tags and rungs were invalidated when the batch was applied, and are compiled again on first use.
+
+        Args:
+            touched: The changed containers.
+        """
+        if ('tags',) in touched:
+            self.destination.compile_tags()
+        if ('datatypes',) in touched:
+            self.destination.compile_datatypes()
+        log(self).debug(f'Recompiled {len(touched)} modified containers.')
+
     def _safe_register_action(
         self,
         action: dict
@@ -557,16 +1073,27 @@ class ControllerModificationSchema:
             asset_types (list[str], optional): List of asset types to import, e.g. ['DataTypes', 'Tags', 'Programs'].
                                                 \n\tDefaults to all if None.
 
+        Identical imports (same file and asset types) are only scheduled once.
+
         Raises:
             ValueError: If no valid L5X data is found in the specified file.
         """
+        key = (
+            os.path.normcase(os.path.abspath(file_location)),
+            tuple(asset_types) if asset_types is not None else None
+        )
+        if key in self._imports:
+            log(self).debug(f'Import of {asset_types} from {file_location} already scheduled, skipping duplicate.')
+            return
 
-        self._safe_register_action({
+        action = {
             'type': 'import_from_file',
             'file': file_location,
             'asset_types': asset_types,
             'method': self._execute_import_assets_from_file
-        })
+        }
+        self._imports[key] = action
+        self._safe_register_action(action)
 
     def add_safety_tag_mapping(
         self,
@@ -591,6 +1118,28 @@ class ControllerModificationSchema:
             'method': self._execute_add_safety_tag_mapping
         })
 
+    def plan(self) -> ModificationPlan:
+        """Plan the changes this schema would make to the destination controller, without executing it.
+
+        The actions are replayed against a copy-on-write overlay of the destination, so the destination is neither
+        changed nor copied, and only the assets the actions touch are recorded.
+
+        Returns:
+            ModificationPlan: Every change the schema would make, in execution order.
+        """
+        plan = ModificationPlan(controller_name=self.destination.name or '')
+        overlay = ControllerOverlay(self.destination)
+        rung_counts: dict[tuple[str, str], tuple[Any, int]] = {}
+        safety_pairs: set[tuple[str, str]] = set()
+        if any(x.get('type') in CONTAINER_FREE_ACTION_TYPES for x in self.actions):  # Only safety tag map actions
+            safety_info = getattr(self.destination, 'safety_info', None)
+            dict_list = safety_info.safety_tag_map_dict_list if safety_info is not None else []
+            safety_pairs = {(x['TagName'], x['SafetyTagName']) for x in dict_list or []}
+        for action in self.actions:
+            self._plan_action(action, plan, overlay, rung_counts, safety_pairs)
+        log(self).debug(f'Planned {len(plan)} changes for {plan.controller_name}.')
+        return plan
+
     def remove_controller_tag(
         self,
         tag_name: str
@@ -675,25 +1224,54 @@ class ControllerModificationSchema:
             'method': self._execute_remove_safety_tag_mapping
         })
 
-    def execute(self):
-        """Perform all migration and import actions."""
+    def execute(
+        self,
+        batch: bool = False
+    ) -> None:
+        """Perform all migration and import actions.
+
+        In batch mode, consecutive tag, datatype and appended rung additions are merged into their target container's
+        raw list in bulk, and only the containers that were changed are recompiled afterwards. Any other action first
+        applies the pending batch, then runs on its own. If an action of unknown effect ran, the whole destination
+        is recompiled, as in non-batch mode.
+
+        Args:
+            batch: Apply additions in bulk. If False, run every action on its own and recompile the whole destination.
+        """
         log(self).info('Executing controller modification schema...')
 
         if not self.destination:
             raise ValueError('Destination controller is not set.')
 
-        # call all action's methods
-        for action in self.actions:
-            method = action.get('method')
-            if callable(method):
-                method(action)
-            else:
-                log(self).warning(f"No method defined for action type: {action['type']}. Skipping...")
+        if not batch:
+            for action in self.actions:
+                self._execute_action(action)
+            # Compile after all imports
+            self.destination.compile()
+            return
 
-        # Compile after all imports
-        self.destination.compile()
+        pending = ModificationBatch()
+        touched: set[tuple[str, ...]] = set()
+        full_compile = False
+        for action in self.actions:
+            action_type = action.get('type')
+            if action_type in BATCHED_ACTION_TYPES and pending.add(action):
+                continue
+            if action_type not in CONTAINER_FREE_ACTION_TYPES:
+                self._flush_batch(pending, touched)
+            if action_type not in BATCHED_ACTION_TYPES | CONTAINER_FREE_ACTION_TYPES | SELF_INVALIDATING_ACTION_TYPES:
+                full_compile = True
+            self._execute_action(action)
+        self._flush_batch(pending, touched)
+
+        if full_compile:
+            self.destination.compile()
+        else:
+            self._recompile_touched(touched)
 
 
 __all__ = [
     'ControllerModificationSchema',
+    'ModificationBatch',
+    'merge_raw_assets',
 ]
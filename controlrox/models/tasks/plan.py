@@ -0,0 +1,180 @@
+"""Dry-run plans for controller modification schemas.
+
+A plan lists every change a modification schema would make to its destination controller (see
+ControllerModificationSchema.plan), without executing the schema. Plans of many controllers can be
+summarized, logged or exported to JSON for review before anything is injected.
+"""
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Optional,
+    Union,
+)
+
+from pyrox.services.logging import log
+
+__all__ = (
+    'ModificationPlan',
+    'PlannedChange',
+    'PlannedChangeType',
+)
+
+
+class PlannedChangeType(str, Enum):
+    """What a planned change does to its object."""
+    ADD = 'add'
+    REPLACE = 'replace'
+    REMOVE = 'remove'
+    UNCHANGED = 'unchanged'
+    SKIPPED = 'skipped'
+
+
+@dataclass
+class PlannedChange:
+    """A single change a schema would make to its destination controller.
+
+    Attributes:
+        change_type: What the change does.
+        kind: The kind of object changed (e.g. 'Tags', 'Rungs', 'SafetyTagMap').
+        object_path: Path of the object changed (e.g. 'Programs/Main/Routines/R1').
+        message: Why the change is skipped, or other details of the change.
+    """
+    change_type: PlannedChangeType
+    kind: str
+    object_path: str
+    message: str = ''
+
+    def to_dict(self) -> dict:
+        return {
+            'change_type': self.change_type.value,
+            'kind': self.kind,
+            'object_path': self.object_path,
+            'message': self.message,
+        }
+
+
+@dataclass
+class ModificationPlan:
+    """Every change a modification schema would make to one controller.
+
+    Attributes:
+        controller_name: Name of the destination controller.
+        changes: The planned changes, in the order the schema would make them.
+    """
+    controller_name: str = ''
+    changes: list[PlannedChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return any(x.change_type not in (PlannedChangeType.UNCHANGED, PlannedChangeType.SKIPPED) for x in self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def add_change(
+        self,
+        change_type: PlannedChangeType,
+        kind: str,
+        object_path: str,
+        message: str = ''
+    ) -> PlannedChange:
+        """Add a planned change.
+
+        Args:
+            change_type: What the change does.
+            kind: The kind of object changed.
+            object_path: Path of the object changed.
+            message: Details of the change.
+
+        Returns:
+            PlannedChange: The added change.
+        """
+        change = PlannedChange(change_type, kind, object_path, message)
+        self.changes.append(change)
+        return change
+
+    def get_changes(
+        self,
+        change_type: Optional[PlannedChangeType] = None,
+        kind: Optional[str] = None
+    ) -> list[PlannedChange]:
+        """Get the planned changes, optionally filtered by change type and kind."""
+        return [
+            x for x in self.changes
+            if (change_type is None or x.change_type == change_type) and (kind is None or x.kind == kind)
+        ]
+
+    def get_counts(self) -> dict[str, dict[str, int]]:
+        """Get the number of planned changes per kind and change type.
+
+        Returns:
+            dict[str, dict[str, int]]: The kind mapped to the count of each change type.
+        """
+        counts: dict[str, Counter] = {}
+        for change in self.changes:
+            counts.setdefault(change.kind, Counter())[change.change_type.value] += 1
+        return {k: dict(v) for k, v in counts.items()}
+
+    def to_dict(self) -> dict:
+        """Get the plan as a JSON serializable dictionary."""
+        return {
+            'controller_name': self.controller_name,
+            'counts': self.get_counts(),
+            'changes': [x.to_dict() for x in self.changes],
+        }
+
+    def to_json(
+        self,
+        file_path: Union[str, Path]
+    ) -> None:
+        """Export the plan to a JSON file.
+
+        Args:
+            file_path: The file to write.
+        """
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def get_summary_lines(
+        self,
+        detailed: bool = False
+    ) -> list[str]:
+        """Format the plan as a text table of change counts per kind.
+
+        Args:
+            detailed: Also list every change that adds, replaces, removes or skips an object.
+
+        Returns:
+            list[str]: The lines of the summary.
+        """
+        lines = [f'Modification plan for {self.controller_name or "<unnamed controller>"} ({len(self)} changes)']
+        counts = self.get_counts()
+        columns = list(PlannedChangeType)
+        width = max([len('Kind')] + [len(x) for x in counts])
+        lines.append(f'{"Kind":<{width}}' + ''.join(f' {x.value.capitalize():>9}' for x in columns))
+        lines.append('-' * (width + 10 * len(columns)))
+        for kind in sorted(counts):
+            lines.append(f'{kind:<{width}}' + ''.join(f' {counts[kind].get(x.value, 0):>9}' for x in columns))
+
+        if detailed:
+            lines.append('')
+            for change in self.changes:
+                if change.change_type == PlannedChangeType.UNCHANGED:
+                    continue
+                message = f' ({change.message})' if change.message else ''
+                lines.append(f'{change.change_type.value:<9} {change.object_path}{message}')
+        return lines
+
+    def log_summary(
+        self,
+        detailed: bool = False
+    ) -> None:
+        """Log the summary table.
+
+        Args:
+            detailed: Also log every change that adds, replaces, removes or skips an object.
+        """
+        for line in self.get_summary_lines(detailed):
+            log(self).info(line)
@@ -0,0 +1,306 @@
+"""Validation profiling for controller validators.
+
+Every tracked validation rule (see findings.rule_scope) reports its wall time to the active profiler.
+At the end of a run, the profiler summarizes call counts, cumulative and p95 times per rule and per object kind,
+and the hit rates of the caches / indexes the rules used.
+"""
+import cProfile
+import json
+import pstats
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Iterator,
+    Optional,
+    Union,
+)
+
+from pyrox.services.logging import log
+
+__all__ = (
+    'CacheStats',
+    'TimingStats',
+    'ValidationProfiler',
+    'active_profiler',
+    'get_object_kind',
+    'profile_validation',
+    'record_cache_lookup',
+)
+
+
+@dataclass
+class TimingStats:
+    """Call count and durations of one rule or object kind.
+
+    Attributes:
+        durations: Duration of every call, in seconds.
+    """
+    durations: list[float] = field(default_factory=list)
+
+    @property
+    def calls(self) -> int:
+        return len(self.durations)
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.durations else 0.0
+
+    @property
+    def p95(self) -> float:
+        """The 95th percentile duration (nearest rank)."""
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        return ordered[max(0, -(-95 * len(ordered) // 100) - 1)]
+
+    def to_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'total_ms': self.total * 1000.0,
+            'mean_ms': self.mean * 1000.0,
+            'p95_ms': self.p95 * 1000.0,
+        }
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counts of one cache or index."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+        }
+
+
+_active_profiler: ContextVar[Optional['ValidationProfiler']] = ContextVar('_active_profiler', default=None)
+
+
+def get_object_kind(object_path: str) -> str:
+    """Get the kind of object an object path points to (e.g. 'Programs/P/Routines/R/Rungs/3' -> 'Rungs').
+
+    Args:
+        object_path: The object path of a finding.
+
+    Returns:
+        str: The object kind.
+    """
+    parts = object_path.split('/')
+    return parts[-2] if len(parts) > 1 else parts[0]
+
+
+class ValidationProfiler:
+    """Collects timings of validation rules and cache lookups.
+
+    Args:
+        capture_calls: Also capture a cProfile of the whole run.
+    """
+
+    def __init__(
+        self,
+        capture_calls: bool = False
+    ) -> None:
+        self.capture_calls = capture_calls
+        self.rules: dict[str, TimingStats] = defaultdict(TimingStats)
+        self.object_kinds: dict[str, TimingStats] = defaultdict(TimingStats)
+        self.caches: dict[str, CacheStats] = defaultdict(CacheStats)
+        self.started_at: float = 0.0
+        self.elapsed: float = 0.0
+        self._profile: Optional[cProfile.Profile] = None
+
+    @property
+    def call_profile(self) -> Optional[cProfile.Profile]:
+        """The captured cProfile, if call capture was enabled."""
+        return self._profile
+
+    def clear(self) -> None:
+        """Clear all collected statistics."""
+        self.rules.clear()
+        self.object_kinds.clear()
+        self.caches.clear()
+        self.elapsed = 0.0
+        self._profile = None
+
+    def record_cache_lookup(
+        self,
+        cache_name: str,
+        hit: bool
+    ) -> None:
+        """Record a lookup in a cache or index.
+
+        Args:
+            cache_name: The name of the cache.
+            hit: Whether the lookup was served from the cache.
+        """
+        if hit:
+            self.caches[cache_name].hits += 1
+        else:
+            self.caches[cache_name].misses += 1
+
+    def record_rule(
+        self,
+        rule_id: str,
+        object_path: str,
+        duration: float
+    ) -> None:
+        """Record one evaluation of a rule.
+
+        Args:
+            rule_id: The id of the rule.
+            object_path: The path of the object the rule was evaluated for.
+            duration: The wall time of the evaluation, in seconds.
+        """
+        self.rules[rule_id].durations.append(duration)
+        self.object_kinds[get_object_kind(object_path)].durations.append(duration)
+
+    def start(self) -> None:
+        """Start timing the run (and capturing calls, if enabled)."""
+        self.started_at = time.perf_counter()
+        if self.capture_calls:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop timing the run."""
+        if self._profile:
+            self._profile.disable()
+        self.elapsed += time.perf_counter() - self.started_at
+
+    def to_dict(self) -> dict:
+        """Get the collected statistics as a JSON serializable dictionary."""
+        return {
+            'elapsed_ms': self.elapsed * 1000.0,
+            'rules': {k: v.to_dict() for k, v in self.rules.items()},
+            'object_kinds': {k: v.to_dict() for k, v in self.object_kinds.items()},
+            'caches': {k: v.to_dict() for k, v in self.caches.items()},
+        }
+
+    def to_json(
+        self,
+        file_path: Union[str, Path]
+    ) -> None:
+        """Export the collected statistics to a JSON file.
+
+        Args:
+            file_path: The file to write.
+        """
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def dump_call_profile(
+        self,
+        file_path: Union[str, Path]
+    ) -> bool:
+        """Dump the captured cProfile to a file readable by pstats / snakeviz.
+
+        Args:
+            file_path: The file to write.
+
+        Returns:
+            bool: True if a profile was captured and written, False otherwise.
+        """
+        if not self._profile:
+            return False
+        pstats.Stats(self._profile).dump_stats(str(file_path))
+        return True
+
+    def get_summary_lines(
+        self,
+        limit: int = 25
+    ) -> list[str]:
+        """Format the collected statistics as text tables.
+
+        Args:
+            limit: Maximum number of rules to list (slowest cumulative time first).
+
+        Returns:
+            list[str]: The lines of the summary.
+        """
+        lines = [f'Validation profile ({self.elapsed * 1000.0:.1f} ms total)']
+
+        def timing_table(title: str, stats: dict[str, TimingStats], rows: Optional[int] = None) -> None:
+            ordered = sorted(stats.items(), key=lambda x: x[1].total, reverse=True)[:rows]
+            width = max([len(title)] + [len(x[0]) for x in ordered])
+            lines.append(f'{title:<{width}} {"Calls":>8} {"Total ms":>10} {"Mean ms":>9} {"p95 ms":>9}')
+            lines.append('-' * (width + 40))
+            for name, timing in ordered:
+                lines.append(
+                    f'{name:<{width}} {timing.calls:>8} {timing.total * 1000.0:>10.2f}'
+                    f' {timing.mean * 1000.0:>9.3f} {timing.p95 * 1000.0:>9.3f}'
+                )
+            lines.append('')
+
+        timing_table('Rule', self.rules, limit)
+        timing_table('Object Kind', self.object_kinds)
+
+        if self.caches:
+            width = max(len('Cache'), *(len(x) for x in self.caches))
+            lines.append(f'{"Cache":<{width}} {"Hits":>8} {"Misses":>8} {"Hit rate":>9}')
+            lines.append('-' * (width + 28))
+            for name, cache in sorted(self.caches.items()):
+                lines.append(f'{name:<{width}} {cache.hits:>8} {cache.misses:>8} {cache.hit_rate:>9.1%}')
+        return lines
+
+    def log_summary(
+        self,
+        limit: int = 25
+    ) -> None:
+        """Log the summary tables.
+
+        Args:
+            limit: Maximum number of rules to list (slowest cumulative time first).
+        """
+        for line in self.get_summary_lines(limit):
+            log(self).info(line)
+
+
+def active_profiler() -> Optional[ValidationProfiler]:
+    """Get the profiler collecting timings in the current context, if any."""
+    return _active_profiler.get()
+
+
+@contextmanager
+def profile_validation(profiler: ValidationProfiler) -> Iterator[ValidationProfiler]:
+    """Collect the timings of every rule evaluated within this context into a profiler.
+
+    Args:
+        profiler: The profiler to collect into.
+    """
+    token = _active_profiler.set(profiler)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active_profiler.reset(token)
+
+
+def record_cache_lookup(
+    cache_name: str,
+    hit: bool
+) -> None:
+    """Record a cache lookup with the active profiler. Does nothing if no profiler is active.
+
+    Args:
+        cache_name: The name of the cache.
+        hit: Whether the lookup was served from the cache.
+    """
+    profiler = _active_profiler.get()
+    if profiler is not None:
+        profiler.record_cache_lookup(cache_name, hit)
@@ -0,0 +1,226 @@
+"""Unit tests for controlrox.models.tasks.findings module."""
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from controlrox.interfaces import IController, IModule
+from controlrox.models.tasks.findings import (
+    CONTROLLER_PATH,
+    ValidationFinding,
+    ValidationFindingsStore,
+    ValidationSeverity,
+    collect_findings,
+    get_object_path,
+    report_result,
+    rule_scope,
+)
+
+
+class _FakeHashList(list):
+    """List with the name lookup used by HashList."""
+
+    def get(self, key, default=None):
+        return next((x for x in self if x.name == key), default)
+
+
+def _make_module(name: str, address: str) -> MagicMock:
+    module = MagicMock(spec=IModule)
+    module.name = name
+    module.meta_data = {'@Name': name, 'address': address}
+    return module
+
+
+def _make_controller(*modules) -> MagicMock:
+    controller = MagicMock(spec=IController)
+    controller.modules = _FakeHashList(modules)
+    controller.programs = _FakeHashList()
+    controller.tags = _FakeHashList()
+    controller.datatypes = _FakeHashList()
+    controller.aois = _FakeHashList()
+    controller.controller_meta_data = {'@Name': 'TestController'}
+    controller.raw_programs = [{'@Name': 'MainProgram'}]
+    controller.get_raw_l5x_asset_list = MagicMock(
+        side_effect=lambda x: controller.raw_programs if x == 'Programs' else []
+    )
+    return controller
+
+
+class _FakeValidator:
+    calls: list[str] = []
+
+    @classmethod
+    @rule_scope()
+    def _check_module_has_address(cls, controller, module) -> bool:
+        cls.calls.append(f'address:{module.name}')
+        if not module.meta_data['address']:
+            report_result(ValidationSeverity.WARNING, f'{module.name} has no address!')
+            return False
+        return True
+
+    @classmethod
+    @rule_scope(reads=('Programs',))
+    def check_module_has_logic(cls, controller, module) -> bool:
+        cls.calls.append(f'logic:{module.name}')
+        return True
+
+    @classmethod
+    @rule_scope(reads=(lambda controller, module: f'Tags/{module.name}',))
+    def check_module_has_tag(cls, controller, module) -> bool:
+        cls.calls.append(f'tag:{module.name}')
+        return controller.tags.get(module.name) is not None
+
+
+class TestValidationFinding(unittest.TestCase):
+    """Test cases for ValidationFinding dataclass."""
+
+    def test_key(self):
+        finding = ValidationFinding('rule', 'Modules/A')
+        self.assertEqual(finding.key, ('rule', 'Modules/A'))
+
+    def test_to_dict(self):
+        finding = ValidationFinding(
+            'rule',
+            'Modules/A',
+            severity=ValidationSeverity.WARNING,
+            passed=False,
+            message='bad',
+            dependencies={'Programs': 'a', 'Modules/A': 'b'}
+        )
+        result = finding.to_dict()
+        self.assertEqual(result['severity'], 'warning')
+        self.assertFalse(result['passed'])
+        self.assertEqual(result['dependencies'], ['Modules/A', 'Programs'])
+
+
+class TestGetObjectPath(unittest.TestCase):
+    """Test cases for get_object_path function."""
+
+    def test_controller_path(self):
+        self.assertEqual(get_object_path(MagicMock(spec=IController)), CONTROLLER_PATH)
+
+    def test_module_path(self):
+        self.assertEqual(get_object_path(_make_module('RIO1', '')), 'Modules/RIO1')
+
+
+class TestValidationFindingsStore(unittest.TestCase):
+    """Test cases for ValidationFindingsStore class."""
+
+    def setUp(self):
+        _FakeValidator.calls = []
+        self.module_a = _make_module('A', '136.129.1.10')
+        self.module_b = _make_module('B', '')
+        self.controller = _make_controller(self.module_a, self.module_b)
+        self.store = ValidationFindingsStore(self.controller)
+        with collect_findings(self.store):
+            for module in self.controller.modules:
+                _FakeValidator._check_module_has_address(self.controller, module)
+                _FakeValidator.check_module_has_logic(self.controller, module)
+        _FakeValidator.calls = []
+
+    def test_findings_recorded(self):
+        self.assertEqual(len(self.store), 4)
+        finding = self.store.get('check_module_has_address', 'Modules/B')
+        self.assertIsNotNone(finding)
+        self.assertEqual(finding.severity, ValidationSeverity.WARNING)
+        self.assertEqual(finding.message, 'B has no address!')
+        self.assertEqual(len(self.store.failures), 1)
+
+    def test_rule_without_store_is_not_recorded(self):
+        store = ValidationFindingsStore(self.controller)
+        self.assertFalse(_FakeValidator._check_module_has_address(self.controller, self.module_b))
+        self.assertEqual(len(store), 0)
+
+    def test_invalidate_changed_only_reevaluates_edited_object(self):
+        self.module_b.meta_data['address'] = '136.129.1.11'
+
+        invalidated = self.store.invalidate_changed()
+        evaluated = self.store.revalidate()
+
+        self.assertEqual(invalidated, {
+            ('check_module_has_address', 'Modules/B'),
+            ('check_module_has_logic', 'Modules/B'),
+        })
+        self.assertEqual(len(evaluated), 2)
+        self.assertEqual(sorted(_FakeValidator.calls), ['address:B', 'logic:B'])
+        self.assertEqual(self.store.failures, [])
+
+    def test_invalidate_changed_scope_dependency(self):
+        self.controller.raw_programs.append({'@Name': 'NewProgram'})
+
+        self.store.invalidate_changed()
+        self.store.revalidate()
+
+        self.assertEqual(sorted(_FakeValidator.calls), ['logic:A', 'logic:B'])
+
+    def test_invalidate_parent_and_child_paths(self):
+        invalidated = self.store.invalidate('Programs/MainProgram')
+        self.assertEqual(invalidated, {
+            ('check_module_has_logic', 'Modules/A'),
+            ('check_module_has_logic', 'Modules/B'),
+        })
+
+        invalidated = self.store.invalidate('Modules')
+        self.assertEqual(len(invalidated), 4)
+
+    def test_revalidate_removed_object(self):
+        self.controller.modules.remove(self.module_b)
+        self.store.invalidate('Modules/B')
+
+        self.store.revalidate()
+
+        self.assertIsNone(self.store.get('check_module_has_address', 'Modules/B'))
+        self.assertEqual(len(self.store), 2)
+
+    def test_reads_fingerprinted_once_per_pass(self):
+        self.controller.get_raw_l5x_asset_list.reset_mock()
+        with collect_findings(self.store):
+            for module in self.controller.modules:
+                _FakeValidator.check_module_has_logic(self.controller, module)
+        self.assertEqual(self.controller.get_raw_l5x_asset_list.call_count, 1)
+
+        with collect_findings(self.store):
+            _FakeValidator.check_module_has_logic(self.controller, self.module_a)
+        self.assertEqual(self.controller.get_raw_l5x_asset_list.call_count, 2)
+
+    def test_reads_path_of_rule_arguments(self):
+        with collect_findings(self.store):
+            _FakeValidator.check_module_has_tag(self.controller, self.module_a)
+        finding = self.store.get('check_module_has_tag', 'Modules/A')
+        self.assertEqual(sorted(finding.dependencies), ['Modules/A', 'Tags/A'])
+        self.assertFalse(finding.passed)
+
+        tag = MagicMock()
+        tag.name = 'A'
+        tag.meta_data = {'@Name': 'A'}
+        self.controller.tags.append(tag)
+        invalidated = self.store.invalidate('Tags/A')
+        self.store.revalidate()
+
+        self.assertEqual(invalidated, {('check_module_has_tag', 'Modules/A')})
+        self.assertTrue(self.store.get('check_module_has_tag', 'Modules/A').passed)
+
+    def test_version_increments(self):
+        version = self.store.version
+        self.store.invalidate('Modules/A')
+        self.assertGreater(self.store.version, version)
+
+    def test_export_json_and_csv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, 'findings.json')
+            csv_path = os.path.join(tmp, 'findings.csv')
+            self.store.to_json(json_path)
+            self.store.to_csv(csv_path)
+
+            with open(json_path, encoding='utf-8') as f:
+                self.assertEqual(len(json.load(f)), 4)
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(len(rows), 4)
+            self.assertEqual(rows[1]['dependencies'], 'Modules/A;Programs')
+
+
+if __name__ == '__main__':
+    unittest.main()
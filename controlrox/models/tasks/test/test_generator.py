@@ -11,7 +11,7 @@ from controlrox.interfaces import (
 )
 from controlrox.models.plc.controller import Controller
 from controlrox.models.tasks.mod import ControllerModificationSchema
-from controlrox.models.tasks.generator import EmulationGenerator
+from controlrox.models.tasks.generator import EmulationGenerator, ModuleContribution
 
 
 class TestEmulationGenerator(unittest.TestCase):
@@ -807,8 +807,7 @@ class TestEmulationGeneratorGenerationMethods(unittest.TestCase):
         self.assertIn("Emulation routine has not been created", str(context.exception))
 
     @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
-    @patch('controlrox.models.tasks.generator.IntrospectiveModuleWarehouseFactory')
-    def test_generate_builtin_common(self, mock_warehouse, mock_get_controller):
+    def test_generate_builtin_common(self, mock_get_controller):
         """Test _generate_builtin_common method."""
         mock_get_controller.return_value = self.mock_controller
         generator = self.ConcreteClass()
@@ -823,7 +822,7 @@ class TestEmulationGeneratorGenerationMethods(unittest.TestCase):
         mock_imodule1.get_required_standard_rungs = Mock(return_value=[])
         mock_imodule1.get_required_safety_rungs = Mock(return_value=[])
 
-        mock_warehouse.filter_modules_by_type = Mock(return_value=[mock_imodule1])
+        self.mock_controller.get_introspected_modules = Mock(return_value=[mock_imodule1])
 
         generator.add_l5x_imports = Mock()
         generator.add_controller_tags = Mock()
@@ -833,7 +832,7 @@ class TestEmulationGeneratorGenerationMethods(unittest.TestCase):
         generator._generate_builtin_common(ModuleControlsType.ETHERNET)
 
         # Verify calls were made
-        mock_warehouse.filter_modules_by_type.assert_called_once()
+        self.mock_controller.get_introspected_modules.assert_called_once_with(by_type=ModuleControlsType.ETHERNET)
         generator.add_l5x_imports.assert_called_once()
         generator.add_controller_tags.assert_called_once()
         generator.add_safety_tag_mapping.assert_called_once()
@@ -871,19 +870,105 @@ class TestEmulationGeneratorGenerationMethods(unittest.TestCase):
         generator._generate_custom_safety_routines.assert_called_once()
         generator._generate_custom_safety_rungs.assert_called_once()
 
-    def test_generate_base_module_emulation(self):
+    @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
+    def test_generate_base_module_emulation(self, mock_get_controller):
         """Test _generate_base_module_emulation method."""
+        mock_get_controller.return_value = self.mock_controller
+        ethernet = Mock()
+        drive = Mock()
+        self.mock_controller.group_introspected_modules = Mock(
+            return_value={ModuleControlsType.DRIVE: [drive], ModuleControlsType.ETHERNET: [ethernet]}
+        )
         generator = self.ConcreteClass()
-        generator._generate_builtin_common = Mock()
+        generator.collect_module_contributions = Mock(return_value=['contribution'])
+        generator.merge_module_contributions = Mock()
 
         generator._generate_base_module_emulation()
 
-        # Should call _generate_builtin_common for each ModuleControlsType
-        call_count = generator._generate_builtin_common.call_count
-        self.assertGreater(call_count, 0)
-        # Verify it was called with ModuleControlsType enum values
-        for call_args in generator._generate_builtin_common.call_args_list:
-            self.assertIsInstance(call_args[0][0], ModuleControlsType)
+        # Modules are grouped once, not filtered again for every type
+        self.mock_controller.group_introspected_modules.assert_called_once()
+        # Every module is collected at once, ordered by controls type
+        imodules = generator.collect_module_contributions.call_args[0][0]
+        order = list(ModuleControlsType)
+        self.assertEqual(len(imodules), 2)
+        self.assertEqual([x[0] for x in imodules], sorted((x[0] for x in imodules), key=order.index))
+        self.assertEqual(dict(imodules), {ModuleControlsType.DRIVE: drive, ModuleControlsType.ETHERNET: ethernet})
+        generator.merge_module_contributions.assert_called_once_with(['contribution'])
+
+    @staticmethod
+    def _make_imodule(name: str) -> Mock:
+        imodule = Mock()
+        imodule.base_module.name = name
+        imodule.get_required_imports = Mock(return_value=[(f'{name}.L5X', ['DataTypes'])])
+        imodule.get_required_tags = Mock(return_value=[{'tag_name': f'zz_{name}', 'datatype': 'BOOL'}])
+        imodule.get_required_standard_to_safety_mapping = Mock(return_value=(f'zz_{name}', f'sz_{name}'))
+        imodule.get_required_standard_rungs = Mock(return_value=[f'{name}_std'])
+        imodule.get_required_safety_rungs = Mock(return_value=[])
+        return imodule
+
+    @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
+    def test_create_module_contribution(self, mock_get_controller):
+        """Test create_module_contribution computes data without changing the schema."""
+        mock_get_controller.return_value = self.mock_controller
+        generator = self.ConcreteClass()
+        generator.schema = Mock()
+
+        contribution = generator.create_module_contribution(ModuleControlsType.DRIVE, self._make_imodule('M1'))
+
+        self.assertEqual(contribution, ModuleContribution(
+            module_name='M1',
+            controls_type=ModuleControlsType.DRIVE,
+            imports=[('M1.L5X', ['DataTypes'])],
+            tags=[{'tag_name': 'zz_M1', 'datatype': 'BOOL'}],
+            safety_mapping=('zz_M1', 'sz_M1'),
+            standard_rungs=['M1_std'],
+            safety_rungs=[],
+        ))
+        self.assertEqual(generator.schema.mock_calls, [])
+
+        imodule = Mock()
+        imodule.base_module = None
+        self.assertIsNone(generator.create_module_contribution(ModuleControlsType.DRIVE, imodule))
+        self.assertIsNone(generator.create_module_contribution(ModuleControlsType.DRIVE, None))
+
+    @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
+    def test_collect_module_contributions_keeps_module_order(self, mock_get_controller):
+        """Test contributions keep module order, skipping modules that can not be emulated."""
+        mock_get_controller.return_value = self.mock_controller
+        generator = self.ConcreteClass()
+        imodules = [(ModuleControlsType.DRIVE, self._make_imodule(f'M{i}')) for i in range(4)]
+        imodules.insert(2, (ModuleControlsType.DRIVE, None))
+
+        contributions = generator.collect_module_contributions(imodules)
+
+        self.assertEqual([x.module_name for x in contributions], ['M0', 'M1', 'M2', 'M3'])
+
+    @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
+    def test_merge_module_contributions(self, mock_get_controller):
+        """Test contributions are merged into the schema in order."""
+        mock_get_controller.return_value = self.mock_controller
+        generator = self.ConcreteClass()
+        generator.schema = Mock()
+        imodules = [(ModuleControlsType.DRIVE, self._make_imodule(name)) for name in ('M1', 'M2')]
+
+        generator.merge_module_contributions(generator.collect_module_contributions(imodules))
+
+        self.assertEqual(
+            [x.kwargs['file_location'] for x in generator.schema.add_import_from_file.call_args_list],
+            ['M1.L5X', 'M2.L5X']
+        )
+        self.assertEqual(
+            [x.kwargs['sfty_tag'] for x in generator.schema.add_safety_tag_mapping.call_args_list],
+            ['sz_M1', 'sz_M2']
+        )
+        self.assertEqual(
+            [x.kwargs['rung'] for x in generator.schema.add_rung.call_args_list],
+            ['M1_std', 'M2_std']
+        )
+        self.assertEqual(
+            [x.kwargs['name'] for x in self.mock_controller.create_tag.call_args_list],
+            ['zz_M1', 'zz_M2']
+        )
 
 
 class TestEmulationGeneratorMainMethods(unittest.TestCase):
@@ -983,11 +1068,31 @@ class TestEmulationGeneratorMainMethods(unittest.TestCase):
         generator._generate_base_emulation.assert_called_once()
         generator._generate_custom_module_emulation.assert_called_once()
         generator._generate_custom_logic.assert_called_once()
-        generator.schema.execute.assert_called_once()
+        generator.schema.execute.assert_called_once_with(batch=True)
 
         # Verify it returns the schema
         self.assertIs(result, generator.schema)
 
+    @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
+    def test_plan_emulation_logic(self, mock_get_controller):
+        """Test plan_emulation_logic builds the schema without executing it."""
+        mock_get_controller.return_value = self.mock_controller
+        generator = self.ConcreteClass()
+
+        generator._generate_base_emulation = Mock()
+        generator._generate_custom_module_emulation = Mock()
+        generator._generate_custom_logic = Mock()
+        generator.schema.execute = Mock()
+        generator.schema.plan = Mock(return_value=Mock())
+
+        result = generator.plan_emulation_logic()
+
+        generator._generate_base_emulation.assert_called_once()
+        generator.schema.execute.assert_not_called()
+        generator.schema.plan.assert_called_once()
+        result.log_summary.assert_called_once()
+        self.assertIs(result, generator.plan)
+
     @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
     def test_remove_emulation_logic(self, mock_get_controller):
         """Test remove_emulation_logic main entry point."""
@@ -1121,8 +1226,7 @@ class TestEmulationGeneratorQueryMethods(unittest.TestCase):
         self.mock_controller.name = 'TestController'
 
     @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
-    @patch('controlrox.models.tasks.generator.IntrospectiveModuleWarehouseFactory')
-    def test_get_modules_by_type(self, mock_warehouse, mock_get_controller):
+    def test_get_modules_by_type(self, mock_get_controller):
         """Test get_modules_by_type method."""
         mock_get_controller.return_value = self.mock_controller
         generator = self.ConcreteClass()
@@ -1133,21 +1237,19 @@ class TestEmulationGeneratorQueryMethods(unittest.TestCase):
         mock_module3 = Mock(spec=IModule)
 
         mock_imodule1 = Mock()
-        mock_imodule1.module_controls_type = ModuleControlsType.ETHERNET
-        mock_imodule2 = Mock()
-        mock_imodule2.module_controls_type = ModuleControlsType.BLOCK
+        mock_imodule1.base_module = mock_module1
         mock_imodule3 = Mock()
-        mock_imodule3.module_controls_type = ModuleControlsType.ETHERNET
+        mock_imodule3.base_module = mock_module3
 
         self.mock_controller.modules = [mock_module1, mock_module2, mock_module3]
 
-        # Mock the warehouse to return introspective modules
-        mock_warehouse.get_imodule_from_meta_data = Mock(
-            side_effect=[mock_imodule1, mock_imodule2, mock_imodule3]
-        )
+        # The controller returns the (cached) introspective modules of the requested type
+        self.mock_controller.get_introspected_modules = Mock(return_value=[mock_imodule1, mock_imodule3])
 
         result = generator.get_modules_by_type(ModuleControlsType.ETHERNET)  # type: ignore
 
+        self.mock_controller.get_introspected_modules.assert_called_once_with(by_type=ModuleControlsType.ETHERNET)
+
         # Should return modules 1 and 3 (ETHERNET type)
         self.assertEqual(len(result), 2)
         self.assertIn(mock_module1, result)
@@ -1155,20 +1257,29 @@ class TestEmulationGeneratorQueryMethods(unittest.TestCase):
         self.assertNotIn(mock_module2, result)
 
     @patch('controlrox.models.plc.meta.ControllerInstanceManager.get_controller')
-    @patch('controlrox.models.tasks.generator.IntrospectiveModuleWarehouseFactory')
+    @patch('controlrox.models.plc.controller.IntrospectiveModuleWarehouseFactory')
     def test_get_modules_by_type_skips_none(self, mock_warehouse, mock_get_controller):
         """Test get_modules_by_type skips modules with no introspective module."""
         mock_get_controller.return_value = self.mock_controller
         generator = self.ConcreteClass()
 
         mock_module1 = Mock(spec=IModule)
+        mock_module1.name = 'Module1'
         mock_module2 = Mock(spec=IModule)
+        mock_module2.name = 'Module2'
 
         self.mock_controller.modules = [mock_module1, mock_module2]
+        self.mock_controller._iter_introspected_modules = (
+            lambda: Controller._iter_introspected_modules(self.mock_controller)
+        )
+        self.mock_controller.get_introspected_modules = (
+            lambda by_type=None: Controller.get_introspected_modules(self.mock_controller, by_type)
+        )
 
         # Mock warehouse to return None for first module, valid for second
         mock_imodule2 = Mock()
         mock_imodule2.module_controls_type = ModuleControlsType.ETHERNET
+        mock_imodule2.base_module = mock_module2
         mock_warehouse.get_imodule_from_meta_data = Mock(side_effect=[None, mock_imodule2])
 
         result = generator.get_modules_by_type(ModuleControlsType.ETHERNET)  # type: ignore
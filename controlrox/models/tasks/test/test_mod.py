@@ -5,6 +5,9 @@ from unittest.mock import Mock, patch
 from pyrox.models.list import HashList
 from controlrox.interfaces import ITag, IRoutine, IRung
 from controlrox.models import Controller, ControllerModificationSchema
+from controlrox.models.plc.rockwell import RaController
+from controlrox.models.tasks.mod import merge_raw_assets
+from controlrox.services import ControllerInstanceManager
 
 
 class TestControllerModificationSchema(unittest.TestCase):
@@ -187,6 +190,50 @@ class TestControllerModificationSchema(unittest.TestCase):
         action = self.schema.actions[0]
         self.assertIsNone(action['asset_types'])
 
+    def test_add_import_from_file_coalesces_duplicates(self):
+        """Test identical imports are scheduled once."""
+        for _ in range(3):
+            self.schema.add_import_from_file('Demo3D_DataType.L5X', ['DataTypes'])
+        self.schema.add_import_from_file('Demo3D_DataType.L5X', ['Tags'])
+
+        self.assertEqual(len(self.schema.actions), 2)
+        self.assertEqual(self.schema.actions[1]['asset_types'], ['Tags'])
+
+    def test_add_import_from_file_after_actions_reset(self):
+        """Test imports are scheduled again once the actions are replaced."""
+        self.schema.add_import_from_file('test.L5X', ['DataTypes'])
+        self.schema.actions = []
+
+        self.schema.add_import_from_file('test.L5X', ['DataTypes'])
+
+        self.assertEqual(len(self.schema.actions), 1)
+        self.assertEqual(self.schema.actions[0]['file'], 'test.L5X')
+
+    @patch('controlrox.models.tasks.mod.cached_l5x_dict_from_file')
+    def test_execute_import_skips_identical_assets(self, mock_cached):
+        """Test assets already present with identical content are not imported again."""
+        existing = {'@Name': 'Existing', '@Class': 'User'}
+        changed = {'@Name': 'Changed', '@Class': 'User'}
+        new = {'@Name': 'New', '@Class': 'User'}
+        mock_cached.return_value = {'RSLogix5000Content': {'Controller': {
+            'DataTypes': {'DataType': [dict(existing), dict(changed, **{'@Family': 'NoFamily'}), new]}
+        }}}
+        for meta_data in (existing, changed):
+            datatype = Mock()
+            datatype.name = meta_data['@Name']
+            datatype.meta_data = meta_data
+            self.destination_controller.datatypes.append(datatype)
+        self.destination_controller.import_assets_from_l5x_dict = Mock()
+
+        self.schema._execute_import_assets_from_file({'file': 'test.L5X', 'asset_types': ['DataTypes']})
+
+        mock_cached.assert_called_once_with('test.L5X')
+        imported, = self.destination_controller.import_assets_from_l5x_dict.call_args[0]
+        names = [x['@Name'] for x in imported['RSLogix5000Content']['Controller']['DataTypes']['DataType']]
+        self.assertEqual(names, ['Changed', 'New'])
+        # Imported assets are copies, the cached parse is left untouched
+        self.assertIsNot(imported['RSLogix5000Content']['Controller']['DataTypes']['DataType'][1], new)
+
     def test_add_safety_tag_mapping(self):
         """Test add_safety_tag_mapping method."""
         self.schema.add_safety_tag_mapping('StandardTag', 'SafetyTag')
@@ -304,6 +351,189 @@ class TestControllerModificationSchema(unittest.TestCase):
         # Should not raise error, just log warning and call compile
         self.destination_controller.compile.assert_called_once()
 
+    def _make_tag(self, name: str) -> Mock:
+        tag = Mock(spec=ITag)
+        tag.meta_data = {'@Name': name, '@DataType': 'DINT'}
+        return tag
+
+    def _make_rung(self, text: str) -> Mock:
+        rung = Mock(spec=IRung)
+        rung.meta_data = {'@Number': '0', 'Text': text}
+        return rung
+
+    def _make_routine(self, program_name: str, routine_name: str) -> Mock:
+        routine = Mock(spec=IRoutine)
+        routine.name = routine_name
+        routine.raw_rungs = [{'@Number': 0, 'Text': 'NOP();'}]
+        program = Mock()
+        program.name = program_name
+        program.routines = HashList('name')
+        program.routines.append(routine)
+        self.destination_controller.programs.append(program)
+        return routine
+
+    def test_execute_batch_merges_additions_per_container(self):
+        """Test batched execution merges additions in bulk and only recompiles changed containers."""
+        self.destination_controller.raw_tags = [{'@Name': 'Existing', '@DataType': 'BOOL'}]
+        self.destination_controller.safety_info = Mock()
+        routine = self._make_routine('Emulation', 'Standard')
+
+        self.schema.add_controller_tag(self._make_tag('Existing'))
+        self.schema.add_controller_tag(self._make_tag('New'))
+        self.schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(A);'))
+        self.schema.add_safety_tag_mapping('StdTag', 'SftyTag')
+        self.schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(B);'))
+
+        self.schema.execute(batch=True)
+
+        self.assertEqual(
+            self.destination_controller.raw_tags,
+            [{'@Name': 'Existing', '@DataType': 'DINT'}, {'@Name': 'New', '@DataType': 'DINT'}]
+        )
+        self.assertEqual([x['Text'] for x in routine.raw_rungs], ['NOP();', 'OTE(A);', 'OTE(B);'])
+        self.assertEqual([x['@Number'] for x in routine.raw_rungs], [0, '1', '2'])
+        self.destination_controller.safety_info.add_safety_tag_mapping.assert_called_once_with('StdTag', 'SftyTag')
+        self.destination_controller.add_tag.assert_not_called()
+        self.destination_controller.compile_tags.assert_called_once()
+        routine.invalidate_rungs.assert_called_once()
+        self.destination_controller.compile.assert_not_called()
+
+    def test_execute_batch_applies_pending_additions_before_other_actions(self):
+        """Test pending additions are applied before an action that is not batched runs."""
+        self.destination_controller.raw_tags = []
+        seen = []
+        self.schema.add_controller_tag(self._make_tag('First'))
+        self.schema.actions.append({
+            'type': 'remove_controller_tag',
+            'method': lambda _: seen.append(list(self.destination_controller.raw_tags)),
+        })
+        self.schema.add_controller_tag(self._make_tag('Second'))
+
+        self.schema.execute(batch=True)
+
+        self.assertEqual(seen, [[{'@Name': 'First', '@DataType': 'DINT'}]])
+        self.assertEqual(len(self.destination_controller.raw_tags), 2)
+
+    def test_execute_batch_invalidates_containers_before_other_actions(self):
+        """Test actions that are not batched see the containers changed by the pending additions invalidated."""
+        self.destination_controller.raw_tags = []
+        routine = self._make_routine('Emulation', 'Standard')
+        seen = []
+        self.schema.add_controller_tag(self._make_tag('First'))
+        self.schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(A);'))
+        self.schema.actions.append({
+            'type': 'remove_controller_tag',
+            'method': lambda _: seen.append((
+                self.destination_controller.invalidate_tags.called,
+                routine.invalidate_rungs.called,
+            )),
+        })
+
+        self.schema.execute(batch=True)
+
+        self.assertEqual(seen, [(True, True)])
+
+    def test_execute_batch_inserts_numbered_rungs_on_their_own(self):
+        """Test rungs added at an explicit position are not batched."""
+        routine = self._make_routine('Emulation', 'Standard')
+        rung = self._make_rung('OTE(A);')
+        self.schema.add_rung('Emulation', 'Standard', rung, rung_number=0)
+
+        self.schema.execute(batch=True)
+
+        self.destination_controller.create_rung.assert_called_once_with(
+            meta_data=rung.meta_data,
+            routine=routine,
+            rung_number=0
+        )
+        routine.add_rung.assert_called_once_with(self.destination_controller.create_rung.return_value, index=0)
+        self.assertEqual(routine.raw_rungs, [{'@Number': 0, 'Text': 'NOP();'}])
+
+    def test_execute_without_batch(self):
+        """Test non-batch execution runs every action and recompiles the whole destination."""
+        routine = self._make_routine('Emulation', 'Standard')
+        self.schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(A);'))
+
+        self.schema.execute(batch=False)
+
+        routine.add_rung.assert_called_once()
+        self.destination_controller.compile.assert_called_once()
+
+    def test_plan(self):
+        """Test plan lists the changes the schema would make, without changing the destination."""
+        existing = self._make_tag('Existing')
+        existing.name = 'Existing'
+        self.destination_controller.tags.append(existing)
+        self.destination_controller.name = 'PLC1'
+        self.destination_controller.raw_tags = []
+        routine = self._make_routine('Emulation', 'Standard')
+        routine.rungs = [Mock()]
+        safety_info = Mock()
+        safety_info.safety_tag_map_dict_list = [{'@Name': 'A', 'TagName': 'A', 'SafetyTagName': 'SA'}]
+        self.destination_controller.safety_info = safety_info
+
+        self.schema.add_controller_tag(self._make_tag('Existing'))
+        self.schema.add_controller_tag(self._make_tag('New'))
+        self.schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(A);'))
+        self.schema.add_rung('Missing', 'Standard', self._make_rung('OTE(B);'))
+        self.schema.add_safety_tag_mapping('A', 'SA')
+        self.schema.add_safety_tag_mapping('B', 'SB')
+        self.schema.remove_controller_tag('New')
+        self.schema.remove_datatype('Missing')
+
+        plan = self.schema.plan()
+
+        self.assertEqual([(x.change_type.value, x.object_path) for x in plan.changes], [
+            ('unchanged', 'Tags/Existing'),
+            ('add', 'Tags/New'),
+            ('add', 'Programs/Emulation/Routines/Standard/Rungs/1'),
+            ('skipped', 'Programs/Missing/Routines/Standard/Rungs/'),
+            ('unchanged', 'SafetyTagMap/A'),
+            ('add', 'SafetyTagMap/B'),
+            ('remove', 'Tags/New'),
+            ('skipped', 'DataTypes/Missing'),
+        ])
+        self.assertEqual(plan.get_counts()['Tags'], {'unchanged': 1, 'add': 1, 'remove': 1})
+        self.assertEqual(plan.controller_name, 'PLC1')
+        self.assertEqual(self.destination_controller.raw_tags, [])
+        self.assertEqual(len(routine.raw_rungs), 1)
+        self.destination_controller.add_tag.assert_not_called()
+        safety_info.add_safety_tag_mapping.assert_not_called()
+
+    def test_plan_routine_changes(self):
+        """Test plan numbers rungs of replaced routines from zero and sees removed routines as missing."""
+        routine = self._make_routine('Emulation', 'Standard')
+        routine.rungs = [Mock(), Mock()]
+        self.destination_controller.name = 'PLC1'
+        replacement = Mock(spec=IRoutine)
+        replacement.meta_data = {'@Name': 'Standard', 'RLLContent': {}}
+
+        self.schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(A);'))
+        self.schema.add_routine('Emulation', replacement)
+        self.schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(B);'))
+        self.schema.remove_routine('Emulation', 'Standard')
+        self.schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(C);'))
+
+        plan = self.schema.plan()
+
+        self.assertEqual([(x.change_type.value, x.object_path) for x in plan.changes], [
+            ('add', 'Programs/Emulation/Routines/Standard/Rungs/2'),
+            ('replace', 'Programs/Emulation/Routines/Standard'),
+            ('add', 'Programs/Emulation/Routines/Standard/Rungs/0'),
+            ('remove', 'Programs/Emulation/Routines/Standard'),
+            ('skipped', 'Programs/Emulation/Routines/Standard/Rungs/'),
+        ])
+        self.assertIs(self.destination_controller.programs.get('Emulation').routines.get('Standard'), routine)
+
+    def test_merge_raw_assets(self):
+        """Test merge_raw_assets replaces assets by name and appends new ones."""
+        raw = [{'@Name': 'A', 'v': 1}, {'@Name': 'B', 'v': 1}]
+
+        replaced = merge_raw_assets(raw, [{'@Name': 'B', 'v': 2}, {'@Name': 'C', 'v': 1}, {'@Name': 'C', 'v': 2}])
+
+        self.assertEqual(replaced, 2)
+        self.assertEqual(raw, [{'@Name': 'A', 'v': 1}, {'@Name': 'B', 'v': 2}, {'@Name': 'C', 'v': 2}])
+
     def test_execute_controller_tag_migration_tag_not_found(self):
         """Test _execute_controller_tag_migration when tag doesn't exist."""
         self.destination_controller.compile = Mock()
@@ -548,5 +778,83 @@ class TestControllerModificationSchemaIntegration(unittest.TestCase):
         self.assertEqual(self.schema.actions[3]['name'], 'DT2')
 
 
+class TestControllerModificationSchemaBatchEquivalence(unittest.TestCase):
+    """Test batched and non-batched execution produce the same controller."""
+
+    @staticmethod
+    def _make_controller() -> RaController:
+        return RaController(meta_data={
+            'RSLogix5000Content': {
+                'Controller': {
+                    '@Name': 'TestController',
+                    '@MajorRev': '32',
+                    '@MinorRev': '11',
+                    'Tags': {'Tag': [
+                        {'@Name': 'Existing', '@TagType': 'Base', '@DataType': 'BOOL'},
+                    ]},
+                    'Programs': {'Program': [{
+                        '@Name': 'Emulation',
+                        '@MainRoutineName': 'Standard',
+                        'Tags': {'Tag': []},
+                        'Routines': {'Routine': [{
+                            '@Name': 'Standard',
+                            '@Type': 'RLL',
+                            'RLLContent': {'Rung': [{'@Number': '0', '@Type': 'N', 'Text': 'NOP();'}]},
+                        }]},
+                    }]},
+                    'Modules': {'Module': []},
+                    'DataTypes': {'DataType': []},
+                    'AddOnInstructionDefinitions': {'AddOnInstructionDefinition': []},
+                }
+            }
+        })
+
+    @staticmethod
+    def _make_tag(name: str) -> Mock:
+        tag = Mock(spec=ITag)
+        tag.meta_data = {'@Name': name, '@TagType': 'Base', '@DataType': 'DINT'}
+        return tag
+
+    @staticmethod
+    def _make_rung(text: str) -> Mock:
+        rung = Mock(spec=IRung)
+        rung.meta_data = {'@Number': '0', '@Type': 'N', 'Text': text}
+        return rung
+
+    def _execute(self, batch: bool) -> tuple:
+        controller = self._make_controller()
+        with patch.object(ControllerInstanceManager, 'get_controller', return_value=controller):
+            schema = ControllerModificationSchema()
+        schema.add_controller_tag(self._make_tag('First'))
+        schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(A);'))
+        schema.add_program_tag('Emulation', self._make_tag('Local'))
+        schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(B);'), rung_number=0)
+        schema.add_controller_tag(self._make_tag('Second'))
+        schema.add_rung('Emulation', 'Standard', self._make_rung('OTE(C);'))
+
+        schema.execute(batch=batch)
+
+        program = controller.programs.get('Emulation')
+        routine = program.routines.get('Standard')
+        return (
+            [(x['@Name'], x['@DataType']) for x in controller.raw_tags],
+            [x.name for x in controller.tags],
+            [x['@Name'] for x in program.raw_tags],
+            [x.name for x in program.tags],
+            [(str(x['@Number']), x['Text']) for x in routine.raw_rungs],
+            [x.text for x in routine.rungs],
+        )
+
+    def test_batch_matches_non_batch(self):
+        """Test the same schema executed with and without batching gives the same L5X content."""
+        expected = self._execute(batch=False)
+
+        self.assertEqual(self._execute(batch=True), expected)
+        self.assertEqual(
+            expected[4],
+            [('0', 'OTE(B);'), ('1', 'NOP();'), ('2', 'OTE(A);'), ('3', 'OTE(C);')]
+        )
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,59 @@
+"""Unit tests for controlrox.models.tasks.plan module."""
+import json
+import os
+import tempfile
+import unittest
+
+from controlrox.models.tasks.plan import (
+    ModificationPlan,
+    PlannedChangeType,
+)
+
+
+class TestModificationPlan(unittest.TestCase):
+    """Test cases for ModificationPlan class."""
+
+    def setUp(self):
+        self.plan = ModificationPlan('PLC1')
+        self.plan.add_change(PlannedChangeType.ADD, 'Tags', 'Tags/A')
+        self.plan.add_change(PlannedChangeType.ADD, 'Tags', 'Tags/B')
+        self.plan.add_change(PlannedChangeType.UNCHANGED, 'DataTypes', 'DataTypes/T')
+        self.plan.add_change(PlannedChangeType.SKIPPED, 'Rungs', 'Programs/P/Routines/R/Rungs/', 'routine not found')
+
+    def test_counts_and_filters(self):
+        self.assertEqual(len(self.plan), 4)
+        self.assertEqual(self.plan.get_counts(), {
+            'Tags': {'add': 2},
+            'DataTypes': {'unchanged': 1},
+            'Rungs': {'skipped': 1},
+        })
+        self.assertEqual([x.object_path for x in self.plan.get_changes(kind='Tags')], ['Tags/A', 'Tags/B'])
+        self.assertEqual(len(self.plan.get_changes(PlannedChangeType.SKIPPED)), 1)
+
+    def test_bool(self):
+        self.assertTrue(self.plan)
+        self.assertFalse(ModificationPlan('PLC2', self.plan.get_changes(PlannedChangeType.UNCHANGED)))
+
+    def test_summary(self):
+        lines = self.plan.get_summary_lines()
+        self.assertEqual(lines[0], 'Modification plan for PLC1 (4 changes)')
+        self.assertTrue(any(x.startswith('Tags') and x.split()[1] == '2' for x in lines))
+
+        detailed = self.plan.get_summary_lines(detailed=True)
+        self.assertIn('skipped   Programs/P/Routines/R/Rungs/ (routine not found)', detailed)
+        self.assertFalse(any('DataTypes/T' in x for x in detailed))
+
+    def test_to_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'plan.json')
+            self.plan.to_json(path)
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        self.assertEqual(data['controller_name'], 'PLC1')
+        self.assertEqual(data['changes'][0], {
+            'change_type': 'add', 'kind': 'Tags', 'object_path': 'Tags/A', 'message': '',
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for controlrox.models.tasks.profiling module."""
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from controlrox.interfaces import IController, IModule
+from controlrox.models.tasks.findings import rule_scope
+from controlrox.models.tasks.profiling import (
+    TimingStats,
+    ValidationProfiler,
+    get_object_kind,
+    profile_validation,
+    record_cache_lookup,
+)
+
+
+class _FakeValidator:
+
+    @classmethod
+    @rule_scope()
+    def _check_module(cls, controller, module) -> bool:
+        return True
+
+    @classmethod
+    @rule_scope()
+    def _check_controller(cls, controller) -> bool:
+        return False
+
+
+class TestTimingStats(unittest.TestCase):
+    """Test cases for TimingStats dataclass."""
+
+    def test_empty(self):
+        stats = TimingStats()
+        self.assertEqual(stats.calls, 0)
+        self.assertEqual(stats.mean, 0.0)
+        self.assertEqual(stats.p95, 0.0)
+
+    def test_p95(self):
+        stats = TimingStats(durations=[x / 1000.0 for x in range(1, 101)])
+        self.assertEqual(stats.calls, 100)
+        self.assertAlmostEqual(stats.p95, 0.095)
+        self.assertAlmostEqual(stats.mean, 0.0505)
+
+
+class TestGetObjectKind(unittest.TestCase):
+    """Test cases for get_object_kind function."""
+
+    def test_object_kinds(self):
+        self.assertEqual(get_object_kind('Controller'), 'Controller')
+        self.assertEqual(get_object_kind('Modules/A'), 'Modules')
+        self.assertEqual(get_object_kind('Programs/P/Routines/R/Rungs/3'), 'Rungs')
+
+
+class TestValidationProfiler(unittest.TestCase):
+    """Test cases for ValidationProfiler class."""
+
+    def setUp(self):
+        self.controller = MagicMock(spec=IController)
+        self.module = MagicMock(spec=IModule)
+        self.module.name = 'A'
+
+    def test_rules_are_timed_only_while_profiling(self):
+        profiler = ValidationProfiler()
+        _FakeValidator._check_module(self.controller, self.module)
+        self.assertEqual(len(profiler.rules), 0)
+
+        with profile_validation(profiler):
+            _FakeValidator._check_module(self.controller, self.module)
+            _FakeValidator._check_module(self.controller, self.module)
+            self.assertFalse(_FakeValidator._check_controller(self.controller))
+
+        self.assertEqual(profiler.rules['check_module'].calls, 2)
+        self.assertEqual(profiler.rules['check_controller'].calls, 1)
+        self.assertEqual(profiler.object_kinds['Modules'].calls, 2)
+        self.assertEqual(profiler.object_kinds['Controller'].calls, 1)
+        self.assertGreater(profiler.elapsed, 0.0)
+
+    def test_cache_lookups(self):
+        profiler = ValidationProfiler()
+        record_cache_lookup('index', True)
+        with profile_validation(profiler):
+            record_cache_lookup('index', True)
+            record_cache_lookup('index', True)
+            record_cache_lookup('index', False)
+        self.assertEqual(profiler.caches['index'].hits, 2)
+        self.assertEqual(profiler.caches['index'].misses, 1)
+        self.assertAlmostEqual(profiler.caches['index'].hit_rate, 2 / 3)
+
+    def test_summary_and_artifacts(self):
+        profiler = ValidationProfiler(capture_calls=True)
+        with profile_validation(profiler):
+            _FakeValidator._check_module(self.controller, self.module)
+            record_cache_lookup('index', True)
+
+        lines = profiler.get_summary_lines()
+        self.assertTrue(any(x.startswith('check_module') for x in lines))
+        self.assertTrue(any(x.startswith('index') for x in lines))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, 'profile.json')
+            prof_path = os.path.join(tmp, 'profile.prof')
+            profiler.to_json(json_path)
+            self.assertTrue(profiler.dump_call_profile(prof_path))
+            self.assertTrue(os.path.exists(prof_path))
+            with open(json_path, encoding='utf-8') as f:
+                data = json.load(f)
+        self.assertEqual(data['rules']['check_module']['calls'], 1)
+        self.assertEqual(data['caches']['index']['hits'], 1)
+
+    def test_no_call_profile_without_capture(self):
+        profiler = ValidationProfiler()
+        with profile_validation(profiler):
+            pass
+        self.assertIsNone(profiler.call_profile)
+        self.assertFalse(profiler.dump_call_profile('unused.prof'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,15 @@
 """Plc Controller Validator Abstract Base Class and Factory.
 """
+from contextlib import AbstractContextManager
+from typing import Optional
+
 from pyrox.models.meta import PyroxObject
 from pyrox.models.factory import FactoryTypeMeta, MetaFactory
 from pyrox.services.logging import log
 from pyrox.services.stream import create_stream_to_file, FileStream
 from ..plc.rockwell.controller import RaController
+from .findings import collect_findings, FindingKey, ValidationFindingsStore
+from .profiling import profile_validation, ValidationProfiler
 
 
 class ControllerValidatorFactory(MetaFactory):
@@ -12,18 +17,20 @@ class ControllerValidatorFactory(MetaFactory):
 
     @staticmethod
     def get_validator(
-        controller: RaController
+        controller: RaController,
+        findings: Optional[ValidationFindingsStore] = None
     ) -> 'ControllerValidator':
         """Get a validator for the given controller.
 
         Args:
             controller: The controller to get a validator for.
+            findings: Optional findings store from a previous validation of the controller.
         Returns:
             A ControllerValidator instance if a matching validator is found, None otherwise.
         """
         validator_cls = ControllerValidatorFactory.get_registered_type_by_supporting_class(controller)
         if validator_cls:
-            return validator_cls(controller)
+            return validator_cls(controller, findings=findings)
         raise ValueError(f'No validator found for controller type {controller.__class__.__name__}.')
 
 
@@ -38,14 +45,18 @@ class ControllerValidator(
 
     def __init__(
         self,
-        controller: RaController
+        controller: RaController,
+        findings: Optional[ValidationFindingsStore] = None
     ) -> None:
         """Initialize the controller validator.
 
         Args:
             controller: The controller to validate.
+            findings: Optional findings store from a previous validation of the controller.
         """
         self.controller = controller
+        self.findings = findings if findings is not None else ValidationFindingsStore(controller)
+        self.profiler = ValidationProfiler()
         file_stream = create_stream_to_file(
             self.controller.file_location + '.validation.log',
             mode='w')
@@ -68,6 +79,18 @@ class ControllerValidator(
             raise TypeError("controller must be a Controller instance")
         self._controller = value
 
+    @property
+    def findings(self) -> ValidationFindingsStore:
+        """The findings produced by this validator."""
+        return self._findings
+
+    @findings.setter
+    def findings(self, value: ValidationFindingsStore) -> None:
+        if not isinstance(value, ValidationFindingsStore):
+            raise TypeError("findings must be a ValidationFindingsStore instance")
+        value.controller = self.controller
+        self._findings = value
+
     @property
     def log_file_stream(self) -> FileStream:
         """The log file stream."""
@@ -121,10 +144,61 @@ class ControllerValidator(
         """
         raise NotImplementedError("Subclass must implement abstract method")
 
+    def collect_findings(self) -> AbstractContextManager[ValidationFindingsStore]:
+        """Collect the findings of every rule evaluated within this context into this validator's findings store.
+        """
+        return collect_findings(self.findings)
+
     @classmethod
     def get_factory(cls):
         return ControllerValidatorFactory
 
+    def profile(
+        self,
+        capture_calls: bool = False
+    ) -> AbstractContextManager[ValidationProfiler]:
+        """Time every rule evaluated within this context with this validator's profiler.
+
+        Args:
+            capture_calls: Also capture a cProfile of the run.
+        """
+        self.profiler.capture_calls = capture_calls
+        return profile_validation(self.profiler)
+
+    def write_profile(self) -> list[str]:
+        """Log the profile summary and write the profile artifacts next to the validation log.
+
+        Returns:
+            list[str]: The paths of the written artifacts.
+        """
+        self.profiler.log_summary()
+        written = [self.controller.file_location + '.validation.profile.json']
+        self.profiler.to_json(written[0])
+        if self.profiler.dump_call_profile(self.controller.file_location + '.validation.prof'):
+            written.append(self.controller.file_location + '.validation.prof')
+        for file_path in written:
+            log(self).info(f'Wrote validation profile: {file_path}')
+        return written
+
+    def revalidate(
+        self,
+        *object_paths: str
+    ) -> list[FindingKey]:
+        """Re-evaluate only the findings affected by edits made since they were recorded.
+
+        Args:
+            *object_paths: Paths of the edited objects. If none are given, edits are detected
+                by comparing the fingerprints of every object the findings read.
+
+        Returns:
+            list[FindingKey]: The keys of the findings that were re-evaluated.
+        """
+        if object_paths:
+            self.findings.invalidate(*object_paths)
+        else:
+            self.findings.invalidate_changed()
+        return self.findings.revalidate()
+
     @classmethod
     def validate_all(
         cls,
@@ -5,6 +5,7 @@ from .tasks import generator
 from . import (
     debug,
     l5x,
+    overlay,
 )
 
 # Design services
@@ -16,7 +17,18 @@ from .design import (
 # Plc service classes
 from .plc import (
     # Connection imports
+    BucketStatistics,
+    CallbackQueue,
+    PlcConnection,
     PlcConnectionManager,
+    PlcConnectionRegistry,
+    PlcIoScheduler,
+    PlcRecorder,
+    PlcSession,
+    PlcSessionPool,
+    SymbolCache,
+    UdtLayout,
+    UdtView,
     # Factory imports
     AOIFactory,
     DatatypeFactory,
@@ -26,6 +38,7 @@ from .plc import (
     ProgramFactory,
     RoutineFactory,
     RungFactory,
+    RungTemplate,
     TagFactory,
 
     # Controller imports
@@ -45,6 +58,8 @@ from .plc import (
 
     # instruction extraction function
     extract_instruction_strings,
+    get_rung_template,
+    tokenize_rung_text,
 )
 
 
@@ -54,13 +69,25 @@ __all__ = (
     # 'eplan',
     'generator',
     'l5x',
+    'overlay',
 
     # Design services
     'convert_markdown_to_html',
     'render_checklist',
 
     # Connection imports
+    'BucketStatistics',
+    'CallbackQueue',
+    'PlcConnection',
     'PlcConnectionManager',
+    'PlcConnectionRegistry',
+    'PlcIoScheduler',
+    'PlcRecorder',
+    'PlcSession',
+    'PlcSessionPool',
+    'SymbolCache',
+    'UdtLayout',
+    'UdtView',
 
     # Plc Factory services
     'AOIFactory',
@@ -71,6 +98,7 @@ __all__ = (
     'ProgramFactory',
     'RoutineFactory',
     'RungFactory',
+    'RungTemplate',
     'TagFactory',
 
     # Plc service classes
@@ -89,4 +117,6 @@ __all__ = (
 
     # Instruction extraction function
     'extract_instruction_strings',
+    'get_rung_template',
+    'tokenize_rung_text',
 )
@@ -4,6 +4,8 @@ from __future__ import annotations
 import winreg
 
 
+import hashlib
+import json
 import os
 import re
 from typing import Optional, Union
@@ -18,6 +20,8 @@ from pyrox.services.file import save_file
 from pyrox.services.xml import dict_from_xml_file
 
 
+_L5X_FILE_CACHE: dict[str, tuple[tuple[int, int], Optional[dict]]] = {}
+
 KEEP_CDATA_SECTION = [
     'AdditionalHelpText',
     'Comment',
@@ -65,6 +69,58 @@ def l5x_dict_from_file(
     return dict_from_xml_file(file_location)
 
 
+def cached_l5x_dict_from_file(
+    file_location: Union[Path, str]
+) -> Optional[dict]:
+    """get a controller dictionary from a provided .l5x file location, parsing each file only once
+
+    The parsed dictionary is kept until the file's size or modification time changes.
+    The returned dictionary is shared between callers and must not be modified; copy what you need.
+
+    Args:
+        file_location (str): file location (must end in .l5x)
+
+    Raises:
+        ValueError: if provided file location is not .L5X
+
+    Returns:
+        dict: controller
+    """
+    key = os.path.normcase(os.path.abspath(str(file_location)))
+    try:
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return l5x_dict_from_file(file_location)
+
+    cached = _L5X_FILE_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    l5x_dict = l5x_dict_from_file(file_location)
+    _L5X_FILE_CACHE[key] = (signature, l5x_dict)
+    return l5x_dict
+
+
+def clear_l5x_file_cache() -> None:
+    """clear the parsed files kept by cached_l5x_dict_from_file
+    """
+    _L5X_FILE_CACHE.clear()
+
+
+def get_l5x_asset_hash(asset: dict) -> str:
+    """get a content hash of an l5x asset dictionary (e.g. a datatype or tag)
+
+    Args:
+        asset (dict): the asset's meta data
+
+    Returns:
+        str: hex digest of the asset's content, independent of key order
+    """
+    content = json.dumps(asset, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
 def dict_to_l5x_file(
     controller: dict,
     file_location: str
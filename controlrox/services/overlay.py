@@ -0,0 +1,655 @@
+"""Copy-on-write overlays over controller meta data.
+
+An overlay is a modified view of a meta data tree (the dictionaries and lists parsed from an L5X file) that shares
+every unmodified subtree with its base. Nested dictionaries and lists are only wrapped in overlays of their own when
+they are accessed, and mutations are recorded in the overlay instead of the base.
+
+Compiled assets have overlays of their own: a HashListOverlay records the assets set or removed by name over
+a compiled HashList, and a ControllerOverlay holds one per asset container of a controller, so an overlay controller
+shares every unmodified compiled container and asset with its base.
+
+Changes can be committed to the base (only the modified subtrees or assets are written back) or discarded,
+in O(delta), so what-if edits (dry runs, validating a proposed change, migrations) never need to deep copy the tree.
+"""
+import copy
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from controlrox.interfaces import IController
+
+__all__ = (
+    'REMOVED',
+    'ControllerOverlay',
+    'HashListOverlay',
+    'MetaListOverlay',
+    'MetaOverlay',
+    'create_meta_overlay',
+    'is_overlay',
+)
+
+# Asset container of a controller overlay -> attribute of its owner holding the assets, name of the asset kind in the
+# add_<kind> / remove_<kind> methods of the owner. The owner is the controller, or the program named in the container.
+_ASSET_CONTAINERS = {
+    'aois': ('aois', 'aoi'),
+    'datatypes': ('datatypes', 'datatype'),
+    'modules': ('modules', 'module'),
+    'programs': ('programs', 'program'),
+    'tags': ('tags', 'tag'),
+    'program_tags': ('tags', 'tag'),
+    'routines': ('routines', 'routine'),
+}
+_PROGRAM_CONTAINERS = frozenset(('program_tags', 'routines'))
+
+
+class _Removed:
+    """Marker for a key removed by an overlay."""
+
+    def __repr__(self) -> str:
+        return 'REMOVED'
+
+
+REMOVED = _Removed()
+
+
+def is_overlay(value: Any) -> bool:
+    """Check if a value is a meta data overlay."""
+    return isinstance(value, (MetaOverlay, MetaListOverlay))
+
+
+def create_meta_overlay(
+    base: Union[dict, list],
+    parent: Optional[Union['MetaOverlay', 'MetaListOverlay']] = None
+) -> Union['MetaOverlay', 'MetaListOverlay']:
+    """Create an overlay over a meta data dictionary or list.
+
+    Args:
+        base: The dictionary or list to overlay.
+        parent: The overlay the base was accessed through, if any.
+
+    Returns:
+        Union[MetaOverlay, MetaListOverlay]: The overlay.
+
+    Raises:
+        ValueError: If the base is not a dictionary or list.
+    """
+    if isinstance(base, dict):
+        return MetaOverlay(base, parent)
+    if isinstance(base, list):
+        return MetaListOverlay(base, parent)
+    raise ValueError(f'Can only overlay a dict or list, got {type(base)}')
+
+
+def _unwrap(value: Any) -> Any:
+    """Commit an overlay value and get its base, or get a plain value as is."""
+    if is_overlay(value):
+        value.commit()
+        return value.base
+    return value
+
+
+class _OverlayMixin:
+    """Change tracking shared by dictionary and list overlays."""
+
+    def _init_overlay(
+        self,
+        base: Union[dict, list],
+        parent: Optional[Union['MetaOverlay', 'MetaListOverlay']]
+    ) -> None:
+        self._base = base
+        self._parent = parent
+        self._dirty = False
+        self._dirty_children: dict[int, Union['MetaOverlay', 'MetaListOverlay']] = {}
+        self._child_positions: dict[int, Any] = {}  # id of a child overlay -> key or index it was accessed at
+
+    @property
+    def base(self) -> Union[dict, list]:
+        """The dictionary or list this overlay is over."""
+        return self._base
+
+    @property
+    def is_modified(self) -> bool:
+        """Whether this overlay or any overlay below it holds uncommitted changes."""
+        return self._dirty
+
+    def _child_modified(
+        self,
+        child: Union['MetaOverlay', 'MetaListOverlay']
+    ) -> None:
+        self._dirty_children[id(child)] = child
+        self._touch()
+
+    def _touch(self) -> None:
+        if self._dirty:
+            return
+        self._dirty = True
+        if self._parent is not None:
+            self._parent._child_modified(self)  # type: ignore[arg-type]
+
+    def _get_child_position(
+        self,
+        child: Union['MetaOverlay', 'MetaListOverlay']
+    ) -> Any:
+        """Get the key or index a child overlay is still held at, or None if it was replaced or removed."""
+        position = self._child_positions.get(id(child))
+        try:
+            if position is not None and self._get_raw(position) is child:
+                return position
+        except (IndexError, KeyError):
+            pass
+        return None
+
+    def _get_raw(self, position: Any) -> Any:
+        raise NotImplementedError
+
+    def _wrap(
+        self,
+        position: Any,
+        value: Any
+    ) -> Any:
+        if not isinstance(value, (dict, list)) or (is_overlay(value) and value._parent is self):
+            return value
+        wrapped = create_meta_overlay(value, self)  # type: ignore[arg-type]
+        self._child_positions[id(wrapped)] = position
+        return wrapped
+
+
+class MetaOverlay(_OverlayMixin, dict):
+    """Copy-on-write overlay over a meta data dictionary.
+
+    The overlay is a dictionary holding the same items as its base. Nested dictionaries and lists are wrapped in
+    overlays when they are accessed, so changes anywhere below the overlay are recorded instead of applied to the base.
+
+    Args:
+        base: The dictionary to overlay.
+        parent: The overlay the base was accessed through, if any.
+    """
+
+    def __init__(
+        self,
+        base: dict,
+        parent: Optional[Union['MetaOverlay', 'MetaListOverlay']] = None
+    ) -> None:
+        dict.__init__(self, base)
+        self._init_overlay(base, parent)
+        self._changed: set = set()
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {k: copy.deepcopy(v, memo) for k, v in dict.items(self)}
+
+    def _get_raw(self, position: Any) -> Any:
+        return dict.__getitem__(self, position)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = dict.__getitem__(self, key)
+        wrapped = self._wrap(key, value)
+        if wrapped is not value:
+            dict.__setitem__(self, key, wrapped)
+        return wrapped
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+        self._changed.add(key)
+        self._touch()
+
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        self._changed.add(key)
+        self._touch()
+
+    def __ior__(self, other: Any) -> 'MetaOverlay':
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        for key in list(dict.keys(self)):
+            del self[key]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if dict.__contains__(self, key) else default
+
+    def items(self) -> list[tuple[Any, Any]]:  # type: ignore[override]
+        return [(key, self[key]) for key in list(dict.keys(self))]
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        if not dict.__contains__(self, key):
+            return dict.pop(self, key, *args)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        key = next(reversed(dict.keys(self)))
+        return key, self.pop(key)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        return [self[key] for key in list(dict.keys(self))]
+
+    @property
+    def delta(self) -> dict:
+        """The uncommitted changes, as a tree of changed keys (REMOVED for removed keys) and modified subtrees."""
+        delta: dict = {}
+        for key in self._changed:
+            delta[key] = dict.__getitem__(self, key) if dict.__contains__(self, key) else REMOVED
+        for child in self._dirty_children.values():
+            key = self._get_child_position(child)
+            if key is not None and key not in self._changed:
+                delta[key] = child.delta
+        return delta
+
+    def commit(self) -> None:
+        """Write the changes of this overlay and every overlay below it to the base.
+
+        Only changed keys and modified subtrees are written. The overlay stays usable afterwards.
+        """
+        if not self._dirty:
+            return
+        for key in self._changed:
+            if dict.__contains__(self, key):
+                self._base[key] = _unwrap(dict.__getitem__(self, key))
+            else:
+                self._base.pop(key, None)
+        for child in self._dirty_children.values():
+            if self._get_child_position(child) is not None:
+                child.commit()
+        self._changed.clear()
+        self._dirty_children.clear()
+        self._dirty = False
+
+    def discard(self) -> None:
+        """Drop every uncommitted change, so the overlay shows its base again.
+
+        Only the changed keys and modified subtrees are restored.
+        """
+        if not self._dirty:
+            return
+        for key in self._changed:
+            if key in self._base:
+                dict.__setitem__(self, key, self._base[key])
+            else:
+                dict.pop(self, key, None)
+        for child in self._dirty_children.values():
+            if self._get_child_position(child) is not None:
+                child.discard()
+        self._changed.clear()
+        self._dirty_children.clear()
+        self._dirty = False
+
+
+class MetaListOverlay(_OverlayMixin, list):
+    """Copy-on-write overlay over a meta data list.
+
+    The overlay is a list holding the same elements as its base. Dictionaries and lists in it are wrapped in overlays
+    when they are accessed. Adding, removing or reordering elements replaces the contents of the base on commit;
+    changes inside elements only commit the modified elements.
+
+    Args:
+        base: The list to overlay.
+        parent: The overlay the base was accessed through, if any.
+    """
+
+    def __init__(
+        self,
+        base: list,
+        parent: Optional[Union['MetaOverlay', 'MetaListOverlay']] = None
+    ) -> None:
+        list.__init__(self, base)
+        self._init_overlay(base, parent)
+        self._structural = False
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(x, memo) for x in list.__iter__(self)]
+
+    def _get_raw(self, position: Any) -> Any:
+        return list.__getitem__(self, position)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        value = list.__getitem__(self, index)
+        wrapped = self._wrap(index, value)
+        if wrapped is not value:
+            list.__setitem__(self, index, wrapped)
+        return wrapped
+
+    def __iter__(self) -> Iterator[Any]:
+        index = 0
+        while index < len(self):
+            yield self[index]
+            index += 1
+
+    def __reversed__(self) -> Iterator[Any]:
+        for index in range(len(self) - 1, -1, -1):
+            yield self[index]
+
+    def _structural_change(self) -> None:
+        self._structural = True
+        self._touch()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        list.__setitem__(self, index, value)
+        self._structural_change()
+
+    def __delitem__(self, index: Any) -> None:
+        list.__delitem__(self, index)
+        self._structural_change()
+
+    def __iadd__(self, other: Any) -> 'MetaListOverlay':
+        self.extend(other)
+        return self
+
+    def __imul__(self, count: Any) -> 'MetaListOverlay':
+        list.__imul__(self, count)
+        self._structural_change()
+        return self
+
+    def append(self, value: Any) -> None:
+        list.append(self, value)
+        self._structural_change()
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._structural_change()
+
+    def extend(self, values: Any) -> None:
+        list.extend(self, values)
+        self._structural_change()
+
+    def insert(self, index: Any, value: Any) -> None:
+        list.insert(self, index, value)
+        self._structural_change()
+
+    def pop(self, index: Any = -1) -> Any:
+        value = self[index]
+        list.pop(self, index)
+        self._structural_change()
+        return value
+
+    def remove(self, value: Any) -> None:
+        list.remove(self, value)
+        self._structural_change()
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        self._structural_change()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        list.sort(self, *args, **kwargs)
+        self._structural_change()
+
+    @property
+    def delta(self) -> Union[list, dict]:
+        """The uncommitted changes: the whole new list after adding, removing or reordering elements,
+        otherwise the changes of the modified elements by index."""
+        if self._structural:
+            return list(list.__iter__(self))
+        delta: dict = {}
+        for child in self._dirty_children.values():
+            index = self._get_child_position(child)
+            if index is not None:
+                delta[index] = child.delta
+        return delta
+
+    def commit(self) -> None:
+        """Write the changes of this overlay and every overlay below it to the base.
+
+        If elements were added, removed or reordered, the contents of the base list are replaced (in place),
+        otherwise only the modified elements are written. The overlay stays usable afterwards.
+        """
+        if not self._dirty:
+            return
+        if self._structural:
+            self._base[:] = [_unwrap(x) for x in list.__iter__(self)]
+        else:
+            for child in self._dirty_children.values():
+                if self._get_child_position(child) is not None:
+                    child.commit()
+        self._structural = False
+        self._dirty_children.clear()
+        self._dirty = False
+
+    def discard(self) -> None:
+        """Drop every uncommitted change, so the overlay shows its base again.
+
+        If elements were added, removed or reordered, the elements of the base are restored,
+        otherwise only the modified elements are.
+        """
+        if not self._dirty:
+            return
+        if self._structural:
+            list.clear(self)
+            list.extend(self, self._base)
+            self._child_positions.clear()
+        else:
+            for child in self._dirty_children.values():
+                if self._get_child_position(child) is not None:
+                    child.discard()
+        self._structural = False
+        self._dirty_children.clear()
+        self._dirty = False
+
+
+class HashListOverlay:
+    """Copy-on-write overlay over a compiled HashList of named assets.
+
+    Lookups fall through to the base until an asset is set or removed through the overlay. Changes are recorded
+    in a delta of name -> asset (REMOVED for a removed asset), so every unmodified asset is shared with the base,
+    and committing or discarding the changes costs O(delta).
+
+    Args:
+        base: The HashList to overlay, None for a container that does not exist (yet).
+    """
+
+    def __init__(
+        self,
+        base: Optional[Any] = None
+    ) -> None:
+        self._base = base
+        self._delta: dict[str, Any] = {}
+
+    def __contains__(self, name: Any) -> bool:
+        return self.get(name) is not None
+
+    def __iter__(self) -> Iterator[Any]:
+        for asset in self._base if self._base is not None else ():
+            value = self._delta.get(asset.name, asset)
+            if value is not REMOVED:
+                yield value
+        for name, value in self._delta.items():
+            if value is not REMOVED and (self._base is None or self._base.get(name) is None):
+                yield value
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def base(self) -> Optional[Any]:
+        """The HashList this overlay is over."""
+        return self._base
+
+    @property
+    def delta(self) -> dict[str, Any]:
+        """The uncommitted changes, as name -> asset (REMOVED for removed assets)."""
+        return dict(self._delta)
+
+    @property
+    def is_modified(self) -> bool:
+        """Whether this overlay holds uncommitted changes."""
+        return bool(self._delta)
+
+    def get(
+        self,
+        name: str,
+        default: Any = None
+    ) -> Any:
+        """Get an asset by name, as it is after the changes recorded so far."""
+        if name in self._delta:
+            value = self._delta[name]
+            return default if value is REMOVED else value
+        asset = self._base.get(name) if self._base is not None else None
+        return default if asset is None else asset
+
+    def set(
+        self,
+        name: str,
+        asset: Any
+    ) -> None:
+        """Record adding an asset, replacing the asset with the same name."""
+        self._delta[name] = asset
+
+    def remove(
+        self,
+        name: str
+    ) -> None:
+        """Record removing an asset."""
+        self._delta[name] = REMOVED
+
+    def commit(
+        self,
+        add: Callable[[Any], None],
+        remove: Callable[[Any], None]
+    ) -> None:
+        """Apply the changes to the base, through the methods of the object owning it.
+
+        Args:
+            add: Adds an asset to the owner, replacing the asset with the same name (e.g. `controller.add_tag`).
+            remove: Removes an asset from the owner (e.g. `controller.remove_tag`).
+        """
+        for name, value in self._delta.items():
+            if value is not REMOVED:
+                add(value)
+                continue
+            asset = self._base.get(name) if self._base is not None else None
+            if asset is not None:
+                remove(asset)
+        self._delta.clear()
+
+    def discard(self) -> None:
+        """Drop every uncommitted change, so the overlay shows its base again."""
+        self._delta.clear()
+
+
+class ControllerOverlay:
+    """Copy-on-write overlay over the compiled assets of a controller.
+
+    Asset containers are addressed by tuples: (attribute,) for the assets of the controller (e.g. ('tags',)),
+    and ('program_tags', program_name) or ('routines', program_name) for the assets of a program (which may itself
+    be recorded in the overlay). Each container gets a HashListOverlay on first access, so containers that are not
+    changed are never copied, and committing or discarding the changes costs O(delta).
+
+    Args:
+        controller: The controller to overlay.
+    """
+
+    def __init__(
+        self,
+        controller: IController
+    ) -> None:
+        self._controller = controller
+        self._containers: dict[tuple[str, ...], HashListOverlay] = {}
+
+    @property
+    def controller(self) -> IController:
+        """The controller this overlay is over."""
+        return self._controller
+
+    @property
+    def delta(self) -> dict[tuple[str, ...], dict[str, Any]]:
+        """The uncommitted changes of every modified container."""
+        return {k: v.delta for k, v in self._containers.items() if v.is_modified}
+
+    @property
+    def is_modified(self) -> bool:
+        """Whether any container holds uncommitted changes."""
+        return any(x.is_modified for x in self._containers.values())
+
+    def _get_owner(
+        self,
+        container: tuple[str, ...]
+    ) -> Any:
+        """Get the controller or program owning a container, as it is after the changes recorded so far."""
+        if len(container) == 1:
+            return self._controller
+        return self.get(('programs',), container[1])
+
+    def get_container(
+        self,
+        container: tuple[str, ...]
+    ) -> HashListOverlay:
+        """Get the overlay of an asset container.
+
+        Raises:
+            ValueError: If the container is not an asset container of a controller.
+        """
+        overlay = self._containers.get(container)
+        if overlay is None:
+            if container[0] not in _ASSET_CONTAINERS or len(container) != (
+                2 if container[0] in _PROGRAM_CONTAINERS else 1
+            ):
+                raise ValueError(f'Unknown asset container {container}!')
+            attribute = _ASSET_CONTAINERS[container[0]][0]
+            overlay = self._containers[container] = HashListOverlay(
+                getattr(self._get_owner(container), attribute, None)
+            )
+        return overlay
+
+    def get(
+        self,
+        container: tuple[str, ...],
+        name: str,
+        default: Any = None
+    ) -> Any:
+        """Get an asset of a container by name, as it is after the changes recorded so far."""
+        return self.get_container(container).get(name, default)
+
+    def set(
+        self,
+        container: tuple[str, ...],
+        name: str,
+        asset: Any
+    ) -> None:
+        """Record adding an asset to a container, replacing the asset with the same name."""
+        self.get_container(container).set(name, asset)
+
+    def remove(
+        self,
+        container: tuple[str, ...],
+        name: str
+    ) -> None:
+        """Record removing an asset from a container."""
+        self.get_container(container).remove(name)
+
+    def commit(self) -> None:
+        """Apply the changes to the controller, through the add / remove methods of each container's owner.
+
+        Raises:
+            ValueError: If the program owning a modified container does not exist.
+        """
+        for container, overlay in list(self._containers.items()):
+            if not overlay.is_modified:
+                continue
+            owner = self._get_owner(container)
+            if owner is None:
+                raise ValueError(f'Program {container[1]} not found in {self._controller.name}!')
+            kind = _ASSET_CONTAINERS[container[0]][1]
+            overlay.commit(getattr(owner, f'add_{kind}'), getattr(owner, f'remove_{kind}'))
+
+    def discard(self) -> None:
+        """Drop every uncommitted change, so the overlay shows the controller again."""
+        for overlay in self._containers.values():
+            overlay.discard()
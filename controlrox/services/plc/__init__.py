@@ -1,15 +1,26 @@
 # Connection imports
-from .connection import PlcConnectionManager
+from .connection import (
+    PlcConnection,
+    PlcConnectionManager,
+    PlcConnectionRegistry,
+    PlcSession,
+    PlcSessionPool,
+)
+from .dispatch import CallbackQueue
+from .recorder import PlcRecorder
+from .scheduler import BucketStatistics, PlcIoScheduler
+from .symbols import SymbolCache
+from .udt import UdtLayout, UdtView
 
 # Factory imports
 from .aoi import AOIFactory
 from .datatype import DatatypeFactory
-from .instruction import InstructionFactory, extract_instruction_strings
+from .instruction import InstructionFactory, extract_instruction_strings, tokenize_rung_text
 from .module import ModuleFactory
 from .operand import OperandFactory
 from .program import ProgramFactory
 from .routine import RoutineFactory
-from .rung import RungFactory
+from .rung import RungFactory, RungTemplate, get_rung_template
 from .tag import TagFactory
 
 
@@ -31,7 +42,18 @@ from .emu import (
 
 __all__ = (
     # Connection imports
+    'BucketStatistics',
+    'CallbackQueue',
+    'PlcConnection',
     'PlcConnectionManager',
+    'PlcConnectionRegistry',
+    'PlcIoScheduler',
+    'PlcRecorder',
+    'PlcSession',
+    'PlcSessionPool',
+    'SymbolCache',
+    'UdtLayout',
+    'UdtView',
     # Factory imports
     'AOIFactory',
     'DatatypeFactory',
@@ -41,6 +63,7 @@ __all__ = (
     'ProgramFactory',
     'RoutineFactory',
     'RungFactory',
+    'RungTemplate',
     'TagFactory',
 
     # Controller imports
@@ -59,4 +82,6 @@ __all__ = (
 
     # Instruction extraction function
     'extract_instruction_strings',
+    'get_rung_template',
+    'tokenize_rung_text',
 )
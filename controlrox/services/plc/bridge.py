@@ -4,12 +4,15 @@ Bridges PLC tags with scene objects, enabling real-time bidirectional synchroniz
 between PLCs and physics simulation scenes.
 """
 from __future__ import annotations
+import time
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import Callable, Any, Optional
 from pyrox.services.logging import log
 from pyrox.interfaces import IScene
-from controlrox.services.plc.connection import PlcConnectionManager
+from controlrox.services.plc.connection import PlcConnection, PlcConnectionManager, is_significant_change
 from pylogix.lgx_response import Response
 
 
@@ -20,6 +23,29 @@ class BindingDirection(Enum):
     BOTH = "both"  # Bidirectional synchronization
 
 
+READ_DIRECTIONS = (BindingDirection.READ, BindingDirection.BOTH)
+WRITE_DIRECTIONS = (BindingDirection.WRITE, BindingDirection.BOTH)
+
+
+def get_binding_key(tag_name: str, object_id: str, property_path: str) -> str:
+    """Get the key of a binding in the bridge."""
+    return f"{tag_name}::{object_id}::{property_path}"
+
+
+@lru_cache(maxsize=None)
+def compile_property_path(property_path: str) -> tuple[attrgetter, Optional[attrgetter], str]:
+    """Compile a property path into accessors.
+
+    Args:
+        property_path: Object property path (e.g., 'speed', 'position.x')
+
+    Returns:
+        The getter of the property, the getter of its parent (None for a direct property) and the property name
+    """
+    parent_path, _, name = property_path.rpartition('.')
+    return attrgetter(property_path), attrgetter(parent_path) if parent_path else None, name
+
+
 @dataclass
 class PlcTagBinding:
     """Represents a binding between a PLC tag and a scene object property.
@@ -49,6 +75,9 @@ class PlcTagBinding:
             property_path="is_active",
             direction=BindingDirection.BOTH
         )
+
+    The tag, object, property path, direction and enabled state of a binding are fixed once it is added to a bridge
+    (the bridge indexes them); enable or disable it with `PlcSceneBridge.set_binding_enabled`.
     """
     tag_name: str
     object_id: str
@@ -63,6 +92,45 @@ class PlcTagBinding:
     # Metadata
     description: str = ""
     tags: list[str] = field(default_factory=list)
+    # Update rate of the tag in milliseconds (0 for the RPI of the connection)
+    rate: int = 0
+    # Smallest change of a numeric PLC value to apply to the scene (0 for any change)
+    deadband: float = 0.0
+    # Maximum number of updates per second published for the tag (0 for no limit)
+    max_publish_rate: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._getter, self._parent_getter, self._property_name = compile_property_path(self.property_path)
+
+    @property
+    def key(self) -> str:
+        """The key of the binding in the bridge."""
+        return get_binding_key(self.tag_name, self.object_id, self.property_path)
+
+    def get_value(self, obj: Any) -> Any:
+        """Get the bound property of a scene object.
+
+        Returns:
+            Property value or None if not found
+        """
+        try:
+            return self._getter(obj)
+        except AttributeError:
+            return None
+
+    def set_value(self, obj: Any, value: Any) -> None:
+        """Set the bound property of a scene object.
+
+        Raises:
+            ValueError: If the parent of the property is not found on the object
+        """
+        parent = obj
+        if self._parent_getter is not None:
+            try:
+                parent = self._parent_getter(obj)
+            except AttributeError as e:
+                raise ValueError(f"Property path {self.property_path} not found on {self.object_id}") from e
+        setattr(parent, self._property_name, value)
 
 
 class PlcSceneBridge:
@@ -110,22 +178,46 @@ class PlcSceneBridge:
 
         # Optional: Control write behavior
         bridge.set_write_enabled(True)
-        bridge.set_write_throttle(100)  # Min 100ms between writes
+        bridge.set_write_throttle(100)  # Min 100ms between write batches
     """
 
-    def __init__(self, scene: Optional[IScene] = None):
+    def __init__(
+        self,
+        scene: Optional[IScene] = None,
+        connection: Optional[PlcConnection] = None
+    ):
         """Initialize the PLC-Scene bridge.
 
         Args:
             scene: The scene to bind PLC tags to
+            connection: The PLC connection to synchronize with (the default connection if None)
         """
         self._scene = scene
+        self._connection = connection
         self._bindings: dict[str, PlcTagBinding] = {}
+        # Secondary indexes of the bindings, by key in insertion order
+        self._bindings_by_tag: dict[str, dict[str, PlcTagBinding]] = {}
+        self._bindings_by_object: dict[str, dict[str, PlcTagBinding]] = {}
+        self._bindings_by_direction: dict[BindingDirection, dict[str, PlcTagBinding]] = {
+            direction: {} for direction in BindingDirection
+        }
+        self._write_bindings: dict[str, PlcTagBinding] = {}
+        self._enabled_keys: set[str] = set()
+        self._tag_callbacks: dict[str, Callable[[Response | list[Response]], None]] = {}
         self._active = False
         self._write_enabled = True
-        self._last_write_time: dict[str, float] = {}
-        self._write_throttle_ms = 100  # Minimum time between writes for same tag
+        self._last_write_time = 0.0
+        self._write_throttle_ms = 100  # Minimum time between write batches
+        self._writes_sent = 0
+        self._writes_coalesced = 0
         self._tick_callback_registered = False
+        self._updates_delivered = 0
+        self._updates_suppressed = 0
+
+    @property
+    def connection(self) -> PlcConnection | type[PlcConnectionManager]:
+        """The PLC connection the bridge synchronizes with."""
+        return self._connection if self._connection is not None else PlcConnectionManager
 
     def set_scene(self, scene: Optional[IScene]) -> None:
         """Set the scene for bindings.
@@ -146,7 +238,10 @@ class PlcSceneBridge:
         data_type: int = 0,
         transform: Optional[Callable[[Any], Any]] = None,
         inverse_transform: Optional[Callable[[Any], Any]] = None,
-        description: str = ""
+        description: str = "",
+        rate: int = 0,
+        deadband: float = 0.0,
+        max_publish_rate: float = 0.0
     ) -> PlcTagBinding:
         """Add a binding between a PLC tag and scene object property.
 
@@ -159,6 +254,9 @@ class PlcSceneBridge:
             transform: Function to transform PLC value to scene value
             inverse_transform: Function to transform scene value to PLC value
             description: Human-readable description of binding
+            rate: Update rate of the tag in milliseconds (0 for the RPI of the connection)
+            deadband: Smallest change of a numeric PLC value to apply to the scene (0 for any change)
+            max_publish_rate: Maximum number of updates per second published for the tag (0 for no limit)
 
         Returns:
             The created PlcTagBinding
@@ -171,14 +269,19 @@ class PlcSceneBridge:
             data_type=data_type,
             transform=transform,
             inverse_transform=inverse_transform,
-            description=description
+            description=description,
+            rate=rate,
+            deadband=deadband,
+            max_publish_rate=max_publish_rate
         )
 
-        binding_key = f"{tag_name}::{object_id}::{property_path}"
-        self._bindings[binding_key] = binding
+        previous = self._bindings.get(binding.key)
+        if previous is not None:
+            self._unindex_binding(previous)
+        self._index_binding(binding)
 
         # If already active, set up the watch immediately
-        if self._active and direction in (BindingDirection.READ, BindingDirection.BOTH):
+        if self._active and direction in READ_DIRECTIONS:
             self._setup_watch_for_binding(binding)
 
         log(self).info(
@@ -197,26 +300,90 @@ class PlcSceneBridge:
         Returns:
             True if binding was removed, False if not found
         """
-        binding_key = f"{tag_name}::{object_id}::{property_path}"
-        if binding_key in self._bindings:
-            binding = self._bindings[binding_key]
-
-            # Remove from watch table if it was being watched
-            if self._active and binding.direction in (BindingDirection.READ, BindingDirection.BOTH):
-                # Only remove if no other bindings use this tag
-                if not any(b.tag_name == tag_name for k, b in self._bindings.items() if k != binding_key):
-                    PlcConnectionManager.remove_watch_tag(tag_name)
-
-            del self._bindings[binding_key]
-            log(self).info(f"Removed binding: {binding_key}")
+        binding_key = get_binding_key(tag_name, object_id, property_path)
+        binding = self._bindings.get(binding_key)
+        if binding is None:
+            return False
+
+        self._unindex_binding(binding)
+
+        # Remove from watch table if it was being watched, and no other binding reads the tag
+        if self._active and binding.direction in READ_DIRECTIONS and not self._is_tag_read(tag_name):
+            self.connection.remove_watch_tag(tag_name)
+            self._tag_callbacks.pop(tag_name, None)
+
+        log(self).info(f"Removed binding: {binding_key}")
+        return True
+
+    def _index_binding(self, binding: PlcTagBinding) -> None:
+        """Add a binding and its secondary index entries."""
+        key = binding.key
+        self._bindings[key] = binding
+        self._bindings_by_tag.setdefault(binding.tag_name, {})[key] = binding
+        self._bindings_by_object.setdefault(binding.object_id, {})[key] = binding
+        self._bindings_by_direction[binding.direction][key] = binding
+        if binding.direction in WRITE_DIRECTIONS:
+            self._write_bindings[key] = binding
+        if binding.enabled:
+            self._enabled_keys.add(key)
+
+    def _unindex_binding(self, binding: PlcTagBinding) -> None:
+        """Remove a binding and its secondary index entries."""
+        key = binding.key
+        self._bindings.pop(key, None)
+        for index, value in ((self._bindings_by_tag, binding.tag_name), (self._bindings_by_object, binding.object_id)):
+            bindings = index.get(value)
+            if bindings is not None:
+                bindings.pop(key, None)
+                if not bindings:
+                    del index[value]
+        self._bindings_by_direction[binding.direction].pop(key, None)
+        self._write_bindings.pop(key, None)
+        self._enabled_keys.discard(key)
+
+    def set_binding_enabled(self, tag_name: str, object_id: str, property_path: str, enabled: bool) -> bool:
+        """Enable or disable a binding.
+
+        Enabling a readable binding while the bridge is active watches its tag.
+
+        Args:
+            tag_name: PLC tag name
+            object_id: Scene object ID
+            property_path: Property path
+            enabled: True to enable the binding, False to disable it
+
+        Returns:
+            True if the binding was found, False otherwise
+        """
+        binding = self._bindings.get(get_binding_key(tag_name, object_id, property_path))
+        if binding is None:
+            return False
+
+        binding.enabled = enabled
+        if not enabled:
+            self._enabled_keys.discard(binding.key)
             return True
-        return False
+        self._enabled_keys.add(binding.key)
+        if self._active and binding.direction in READ_DIRECTIONS:
+            self._setup_watch_for_binding(binding)
+        return True
+
+    def _is_tag_read(self, tag_name: str) -> bool:
+        """Check if any binding reads a tag."""
+        return any(b.direction in READ_DIRECTIONS for b in self._bindings_by_tag.get(tag_name, {}).values())
 
     def clear_bindings(self) -> None:
         """Clear all bindings."""
         if self._active:
             self.stop()
         self._bindings.clear()
+        self._bindings_by_tag.clear()
+        self._bindings_by_object.clear()
+        for bindings in self._bindings_by_direction.values():
+            bindings.clear()
+        self._write_bindings.clear()
+        self._enabled_keys.clear()
+        self._tag_callbacks.clear()
         log(self).info("Cleared all bindings")
 
     def get_bindings(self) -> list[PlcTagBinding]:
@@ -227,6 +394,19 @@ class PlcSceneBridge:
         """
         return list(self._bindings.values())
 
+    def get_binding(self, tag_name: str, object_id: str, property_path: str) -> Optional[PlcTagBinding]:
+        """Get a binding.
+
+        Args:
+            tag_name: PLC tag name
+            object_id: Scene object ID
+            property_path: Property path
+
+        Returns:
+            The binding, or None if not found
+        """
+        return self._bindings.get(get_binding_key(tag_name, object_id, property_path))
+
     def get_bindings_for_object(self, object_id: str) -> list[PlcTagBinding]:
         """Get all bindings for a specific scene object.
 
@@ -236,7 +416,7 @@ class PlcSceneBridge:
         Returns:
             List of bindings for the object
         """
-        return [b for b in self._bindings.values() if b.object_id == object_id]
+        return list(self._bindings_by_object.get(object_id, {}).values())
 
     def get_bindings_for_tag(self, tag_name: str) -> list[PlcTagBinding]:
         """Get all bindings for a specific PLC tag.
@@ -247,7 +427,7 @@ class PlcSceneBridge:
         Returns:
             List of bindings for the tag
         """
-        return [b for b in self._bindings.values() if b.tag_name == tag_name]
+        return list(self._bindings_by_tag.get(tag_name, {}).values())
 
     def is_active(self) -> bool:
         """Check if the bridge is currently active.
@@ -279,23 +459,21 @@ class PlcSceneBridge:
         Returns:
             Dictionary with binding statistics
         """
-        read_count = sum(1 for b in self._bindings.values()
-                         if b.direction == BindingDirection.READ)
-        write_count = sum(1 for b in self._bindings.values()
-                          if b.direction == BindingDirection.WRITE)
-        both_count = sum(1 for b in self._bindings.values()
-                         if b.direction == BindingDirection.BOTH)
-        enabled_count = sum(1 for b in self._bindings.values() if b.enabled)
+        enabled_count = len(self._enabled_keys)
 
         return {
             'total': len(self._bindings),
             'enabled': enabled_count,
             'disabled': len(self._bindings) - enabled_count,
-            'read': read_count,
-            'write': write_count,
-            'both': both_count,
+            'read': len(self._bindings_by_direction[BindingDirection.READ]),
+            'write': len(self._bindings_by_direction[BindingDirection.WRITE]),
+            'both': len(self._bindings_by_direction[BindingDirection.BOTH]),
             'active': self._active,
-            'write_enabled': self._write_enabled
+            'write_enabled': self._write_enabled,
+            'updates_delivered': self._updates_delivered,
+            'updates_suppressed': self._updates_suppressed,
+            'writes_sent': self._writes_sent,
+            'writes_coalesced': self._writes_coalesced
         }
 
     def start(self) -> None:
@@ -309,13 +487,14 @@ class PlcSceneBridge:
             return
 
         # Set up watches for all READ and BOTH bindings
-        for binding in self._bindings.values():
-            if binding.enabled and binding.direction in (BindingDirection.READ, BindingDirection.BOTH):
-                self._setup_watch_for_binding(binding)
+        for direction in READ_DIRECTIONS:
+            for binding in self._bindings_by_direction[direction].values():
+                if binding.enabled:
+                    self._setup_watch_for_binding(binding)
 
         # Register tick callback for write support
         if not self._tick_callback_registered:
-            PlcConnectionManager.subscribe_to_ticks(self._on_tick)
+            self.connection.subscribe_to_ticks(self._on_tick)
             self._tick_callback_registered = True
 
         self._active = True
@@ -327,17 +506,13 @@ class PlcSceneBridge:
             return
 
         # Remove all watches (but only tags we added)
-        watched_tags = set()
-        for binding in self._bindings.values():
-            if binding.direction in (BindingDirection.READ, BindingDirection.BOTH):
-                watched_tags.add(binding.tag_name)
-
-        for tag_name in watched_tags:
-            PlcConnectionManager.remove_watch_tag(tag_name)
+        for tag_name in list(self._tag_callbacks):
+            self.connection.remove_watch_tag(tag_name)
+        self._tag_callbacks.clear()
 
         # Unregister tick callback
         if self._tick_callback_registered:
-            PlcConnectionManager.unsubscribe_from_ticks(self._on_tick)
+            self.connection.unsubscribe_from_ticks(self._on_tick)
             self._tick_callback_registered = False
 
         self._active = False
@@ -357,7 +532,7 @@ class PlcSceneBridge:
         log(self).info(f"PLC write {'enabled' if enabled else 'disabled'}")
 
     def set_write_throttle(self, throttle_ms: float) -> None:
-        """Set the minimum time between writes for the same tag.
+        """Set the minimum time between write batches.
 
         Args:
             throttle_ms: Throttle time in milliseconds
@@ -370,27 +545,25 @@ class PlcSceneBridge:
 
         This is called automatically on each PLC tick when the bridge is active.
         Can also be called manually for immediate updates.
+
+        All changed values are sent in one multi-tag write, at most once per write throttle. When several
+        bindings write the same tag, the last one wins.
         """
         if not self._active or not self._write_enabled:
             return
 
-        import time
         current_time = time.time() * 1000  # Convert to ms
+        if current_time - self._last_write_time < self._write_throttle_ms:
+            return
 
-        for binding in self._bindings.values():
+        writes: dict[str, Any] = {}
+        written: list[tuple[PlcTagBinding, Any]] = []
+        for binding in self._write_bindings.values():
             if not binding.enabled:
                 continue
 
-            if binding.direction not in (BindingDirection.WRITE, BindingDirection.BOTH):
-                continue
-
-            # Throttle writes
-            last_write = self._last_write_time.get(binding.tag_name, 0)
-            if current_time - last_write < self._write_throttle_ms:
-                continue
-
             # Get current scene value
-            scene_value = self._get_scene_property(binding.object_id, binding.property_path)
+            scene_value = self._get_binding_value(binding)
             if scene_value is None:
                 continue
 
@@ -407,14 +580,21 @@ class PlcSceneBridge:
                     log(self).error(f"Transform error for {binding.tag_name}: {e}")
                     continue
 
-            # Write to PLC
-            PlcConnectionManager.write_watch_tag(binding.tag_name, plc_value)
+            if binding.tag_name in writes:
+                self._writes_coalesced += 1
+            writes[binding.tag_name] = plc_value
+            written.append((binding, scene_value))
+
+        if not writes:
+            return
+
+        # Write to PLC
+        self.connection.write_watch_tags(writes)
+        for binding, scene_value in written:
             binding.last_scene_value = scene_value
-            self._last_write_time[binding.tag_name] = current_time
-            log(self).debug(
-                f"Wrote to PLC: {binding.tag_name} = {plc_value} "
-                f"(from {binding.object_id}.{binding.property_path})"
-            )
+        self._last_write_time = current_time
+        self._writes_sent += len(writes)
+        log(self).debug(f"Wrote {len(writes)} tags to PLC")
 
     def force_write_binding(
         self,
@@ -432,7 +612,7 @@ class PlcSceneBridge:
         Returns:
             True if write was successful, False otherwise
         """
-        binding_key = f"{tag_name}::{object_id}::{property_path}"
+        binding_key = get_binding_key(tag_name, object_id, property_path)
         binding = self._bindings.get(binding_key)
 
         if not binding:
@@ -443,12 +623,12 @@ class PlcSceneBridge:
             log(self).warning(f"Binding disabled: {binding_key}")
             return False
 
-        if binding.direction not in (BindingDirection.WRITE, BindingDirection.BOTH):
+        if binding.direction not in WRITE_DIRECTIONS:
             log(self).warning(f"Binding is not configured for writing: {binding_key}")
             return False
 
         # Get current scene value
-        scene_value = self._get_scene_property(binding.object_id, binding.property_path)
+        scene_value = self._get_binding_value(binding)
         if scene_value is None:
             log(self).warning(f"Could not get scene value for {binding_key}")
             return False
@@ -463,24 +643,38 @@ class PlcSceneBridge:
                 return False
 
         # Write to PLC
-        import time
-        PlcConnectionManager.write_watch_tag(binding.tag_name, plc_value)
+        self.connection.write_watch_tag(binding.tag_name, plc_value)
         binding.last_scene_value = scene_value
-        self._last_write_time[binding.tag_name] = time.time() * 1000
         log(self).info(f"Force wrote to PLC: {binding.tag_name} = {plc_value}")
         return True
 
     def _setup_watch_for_binding(self, binding: PlcTagBinding) -> None:
-        """Set up PLC watch for a binding."""
-        def callback(response: Response | list[Response]) -> None:
-            self._on_tag_update(binding, response)
+        """Set up PLC watch for a binding.
+
+        All bindings of a tag share one watch callback, which fans each update out to the bindings of the tag.
+        """
+        callback = self._tag_callbacks.get(binding.tag_name)
+        if callback is None:
+            callback = self._create_tag_callback(binding.tag_name)
+            self._tag_callbacks[binding.tag_name] = callback
 
-        PlcConnectionManager.add_watch_tag(
+        self.connection.add_watch_tag(
             binding.tag_name,
             data_type=binding.data_type,
-            callback=callback
+            callback=callback,
+            rate=binding.rate,
+            deadband=binding.deadband,
+            max_publish_rate=binding.max_publish_rate
         )
 
+    def _create_tag_callback(self, tag_name: str) -> Callable[[Response | list[Response]], None]:
+        """Create the watch callback of a tag, applying its updates to the readable bindings of the tag."""
+        def callback(response: Response | list[Response]) -> None:
+            for binding in list(self._bindings_by_tag.get(tag_name, {}).values()):
+                if binding.direction in READ_DIRECTIONS:
+                    self._on_tag_update(binding, response)
+        return callback
+
     def _on_tag_update(
         self,
         binding: PlcTagBinding,
@@ -502,8 +696,13 @@ class PlcSceneBridge:
         if not response or response.Status != 'Success':
             return
 
-        # Get PLC value
+        # Get PLC value, skipping updates that do not change it meaningfully
         plc_value = response.Value
+        if binding.last_plc_value is not None and not is_significant_change(
+            binding.last_plc_value, plc_value, binding.deadband
+        ):
+            self._updates_suppressed += 1
+            return
         binding.last_plc_value = plc_value
 
         # Transform value if needed
@@ -520,69 +719,34 @@ class PlcSceneBridge:
             log(self).debug(
                 f"Setting {binding.object_id}.{binding.property_path} = {scene_value} (type: {type(scene_value).__name__})"
             )
-            self._set_scene_property(binding.object_id, binding.property_path, scene_value)
+            self._set_binding_value(binding, scene_value)
             binding.last_scene_value = scene_value
+            self._updates_delivered += 1
             log(self).debug(f"Successfully set {binding.object_id}.{binding.property_path}")
         except Exception as e:
             log(self).error(
                 f"Error setting {binding.object_id}.{binding.property_path} = {scene_value}: {e}"
             )
 
-    def _get_scene_property(self, object_id: str, property_path: str) -> Any:
-        """Get a property value from a scene object.
-
-        Args:
-            object_id: Object ID in scene
-            property_path: Property path (e.g., 'speed' or 'position.x')
-
-        Returns:
-            Property value or None if not found
-        """
+    def _get_binding_value(self, binding: PlcTagBinding) -> Any:
+        """Get the value of the scene property of a binding, None if not found."""
         if not self._scene:
             return None
 
-        obj = self._scene.get_scene_object(object_id)
+        obj = self._scene.get_scene_object(binding.object_id)
         if not obj:
             return None
+        return binding.get_value(obj)
 
-        # Navigate property path
-        parts = property_path.split('.')
-        current = obj
-        for part in parts:
-            if hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                return None
-
-        return current
-
-    def _set_scene_property(self, object_id: str, property_path: str, value: Any) -> None:
-        """Set a property value on a scene object.
-
-        Args:
-            object_id: Object ID in scene
-            property_path: Property path (e.g., 'speed' or 'position.x')
-            value: Value to set
-        """
+    def _set_binding_value(self, binding: PlcTagBinding, value: Any) -> None:
+        """Set the value of the scene property of a binding."""
         if not self._scene:
             raise ValueError("No scene set")
 
-        obj = self._scene.get_scene_object(object_id)
+        obj = self._scene.get_scene_object(binding.object_id)
         if not obj:
-            raise ValueError(f"Object {object_id} not found in scene")
-
-        # Navigate to parent of property
-        parts = property_path.split('.')
-        current = obj
-        for part in parts[:-1]:
-            if hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                raise ValueError(f"Property path {property_path} not found on {object_id}")
-
-        # Set final property
-        property_name = parts[-1]
-        setattr(current, property_name, value)
+            raise ValueError(f"Object {binding.object_id} not found in scene")
+        binding.set_value(obj, value)
 
     def to_dict(self) -> dict:
         """Serialize bridge configuration to dictionary.
@@ -600,7 +764,10 @@ class PlcSceneBridge:
                     'data_type': b.data_type,
                     'enabled': b.enabled,
                     'description': b.description,
-                    'tags': b.tags
+                    'tags': b.tags,
+                    'rate': b.rate,
+                    'deadband': b.deadband,
+                    'max_publish_rate': b.max_publish_rate
                 }
                 for b in self._bindings.values()
             ],
@@ -623,7 +790,10 @@ class PlcSceneBridge:
                 property_path=binding_data['property_path'],
                 direction=BindingDirection(binding_data['direction']),
                 data_type=binding_data.get('data_type', 0),
-                description=binding_data.get('description', '')
+                description=binding_data.get('description', ''),
+                rate=binding_data.get('rate', 0),
+                deadband=binding_data.get('deadband', 0.0),
+                max_publish_rate=binding_data.get('max_publish_rate', 0.0)
             )
 
         self._write_enabled = data.get('write_enabled', True)
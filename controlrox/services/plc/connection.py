@@ -1,16 +1,24 @@
 """PLC IO Application Manager.
 """
+import functools
+import threading
+import time
 from datetime import datetime
+from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 
 from pylogix.lgx_response import Response
 from pylogix import PLC
-from pyrox.services import log, EnvManager, TimerService
+from pyrox.services import log, EnvManager
 from pyrox.models.network import Ipv4Address
 
 from controlrox.interfaces import ControlRoxEnvironmentKeys
+from .dispatch import Dispatcher
+from .scheduler import BucketStatistics, PlcIoScheduler
+from .symbols import PATH_ERRORS, SymbolCache, SymbolInstancePLC, get_symbol_cache_path
+from .udt import UdtLayout
 
 
 @dataclass
@@ -39,9 +47,34 @@ class ConnectionCommand:
     response_cb: Callable[[Response | list[Response]], None]
 
 
+def is_significant_change(
+    previous: Any,
+    value: Any,
+    deadband: float = 0.0
+) -> bool:
+    """Whether a value changed from the previous one by more than a deadband.
+
+    The deadband only applies to numbers; other values are significant whenever they differ.
+    """
+    if deadband and _is_number(previous) and _is_number(value):
+        return abs(value - previous) > deadband
+    return value != previous
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
 @dataclass
 class WatchTableEntry:
     """Watch Table Entry for monitoring PLC tags.
+
+    Entries are read in rate buckets: all entries with the same update rate (in milliseconds, 0 for the RPI of the
+    connection) are read together in one batch.
+
+    Reads are published to the callbacks only when they change: when the status changes, or when the value changes
+    by more than the deadband. With a max publish rate (publications per second, 0 for no limit), changes arriving
+    faster are held back and the latest value is published once the interval has passed.
     """
     tag_name: str
     data_type: int = 0
@@ -49,178 +82,845 @@ class WatchTableEntry:
     last_update: datetime | None = None
     error_count: int = 0
     callbacks: list[Callable[[Response | list[Response]], None]] = field(default_factory=list)
+    rate: int = 0
+    deadband: float = 0.0
+    max_publish_rate: float = 0.0
+    published_value: Any = None
+    published_status: Optional[str] = None
+    last_publish: float = 0.0
+    delivered: int = 0
+    suppressed: int = 0
 
+    def should_publish(
+        self,
+        response: Response,
+        now: float
+    ) -> bool:
+        """Check whether a read is a meaningful change to publish, and count it as delivered or suppressed.
 
-class PlcConnectionManager:
-    """Static Connection Manager for PLC IO Applications.
+        Args:
+            response: The response of the read.
+            now: The monotonic time of the read, in seconds.
+
+        Returns:
+            bool: True if the read should be published to the callbacks.
+        """
+        first = self.published_status is None
+        if first or response.Status != self.published_status:
+            changed = True
+        elif response.Status != 'Success':
+            changed = False
+        else:
+            changed = is_significant_change(self.published_value, response.Value, self.deadband)
+
+        if changed and not first and self.max_publish_rate:
+            changed = now - self.last_publish >= 1.0 / self.max_publish_rate
+
+        if not changed:
+            self.suppressed += 1
+            return False
+        self.published_value = response.Value
+        self.published_status = response.Status
+        self.last_publish = now
+        self.delivered += 1
+        return True
+
+
+@dataclass
+class ConnectionStatistics:
+    """Connection statistics of a PLC session.
+    """
+    connects: int = 0
+    disconnects: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    requests: int = 0
+    request_errors: int = 0
+    health_checks: int = 0
+    last_connect: datetime | None = None
+    last_failure: datetime | None = None
+    last_error: str = ''
+
+
+class PlcSession:
+    """Long-lived, reconnecting session to one PLC endpoint.
+
+    The session keeps one pylogix connection open between requests instead of opening (and forward-opening) a new one
+    for every batch. Successful requests double as health checks; the PLC is only probed explicitly after the session
+    has been idle for `health_check_interval` seconds. When the connection fails, the session closes it and waits with
+    exponential backoff before reconnecting.
+
+    With a symbol cache, the known data types are seeded into every new connection, and the controller tags of a live
+    cache are addressed by symbol instance. Instance addressing stops when the connection fails or the PLC rejects a
+    path, since either may mean a different project was downloaded.
     """
-    connection_parameters: ConnectionParameters = ConnectionParameters()
-    _connected: bool = False
-    _commands: list[ConnectionCommand] = []
-    _subscribers: list[Callable] = []
-    _timer_service = TimerService()
-    _watch_table: dict[str, WatchTableEntry] = {}
+
+    def __init__(
+        self,
+        ip_address: str,
+        slot: int = 0,
+        port: int = 44818,
+        timeout: float = 5.0,
+        health_check_interval: float = 1.0,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+    ) -> None:
+        self.ip_address = ip_address
+        self.slot = slot
+        self.port = port
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.statistics = ConnectionStatistics()
+        self.symbol_cache: Optional[SymbolCache] = None
+        self._comm: Optional[PLC] = None
+        self._lock = threading.RLock()
+        self._last_success = 0.0
+        self._retry_at = 0.0
+
+    def __enter__(self) -> 'PlcSession':
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._lock.release()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the session holds an open connection."""
+        return self._comm is not None
+
+    @property
+    def retry_delay(self) -> float:
+        """Seconds to wait until the session may reconnect (0 if it may reconnect now)."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def _fail(self, error: str) -> None:
+        self.statistics.failures += 1
+        self.statistics.consecutive_failures += 1
+        self.statistics.last_failure = datetime.now()
+        self.statistics.last_error = error
+        backoff = min(self.backoff_max, self.backoff_initial * 2 ** (self.statistics.consecutive_failures - 1))
+        self._retry_at = time.monotonic() + backoff
+        log(self).warning('Connection to PLC at %s failed (%s), retrying in %.1fs', self.ip_address, error, backoff)
+        self._close()
+        self._drop_instance_ids()
+
+    def _close(self) -> None:
+        if self._comm is None:
+            return
+        try:
+            self._comm.Close()
+        except Exception as e:
+            log(self).debug('Error closing connection to PLC at %s: %s', self.ip_address, e)
+        self._comm = None
+        self.statistics.disconnects += 1
+
+    def _drop_instance_ids(self) -> None:
+        if self.symbol_cache is not None and self.symbol_cache.live:
+            log(self).info('Stopped addressing tags of PLC at %s by symbol instance', self.ip_address)
+            self.symbol_cache.live = False
+
+    def _create_comm(self) -> PLC:
+        instance_ids = self.symbol_cache.get_instance_ids() if self.symbol_cache is not None else {}
+        if instance_ids:
+            comm = SymbolInstancePLC(ip_address=self.ip_address, slot=self.slot, timeout=self.timeout, port=self.port,
+                                     instance_ids=instance_ids)
+        else:
+            comm = PLC(ip_address=self.ip_address, slot=self.slot, timeout=self.timeout, port=self.port)
+        if self.symbol_cache is not None:
+            self.symbol_cache.seed(comm.KnownTags)
+        return comm
+
+    def _request(
+        self,
+        request: Callable[[PLC], Any]
+    ) -> Any:
+        """Run a request on the open connection, tracking the health of the session.
+        """
+        if self._comm is None:
+            raise ConnectionError(f'No connection to PLC at {self.ip_address}')
+        comm = self._comm
+        self.statistics.requests += 1
+        try:
+            response = request(comm)
+        except OSError as e:
+            self._fail(str(e))
+            raise ConnectionError(f'Connection to PLC at {self.ip_address} failed: {e}') from e
+
+        responses = response if isinstance(response, list) else [response]
+        if all(x.Status == 'Success' for x in responses):
+            self._last_success = time.monotonic()
+            self.statistics.consecutive_failures = 0
+            return response
+
+        self.statistics.request_errors += 1
+        if not comm.conn.SocketConnected:
+            self._fail(str(responses[0].Status))
+        elif isinstance(comm, SymbolInstancePLC) and any(x.Status in PATH_ERRORS for x in responses):
+            self._drop_instance_ids()
+            self._close()
+        return response
+
+    def open(self) -> bool:
+        """Open the connection, unless it is already open or the session is backing off.
+
+        Returns:
+            bool: True if the connection is open.
+        """
+        with self._lock:
+            if self._comm is not None:
+                return True
+            if self.retry_delay > 0:
+                return False
+            self._comm = self._create_comm()
+            try:
+                response = self._request(lambda comm: comm.GetPLCTime())
+            except ConnectionError:
+                return False
+            if self._comm is None:
+                return False
+            if response.Status != 'Success':
+                self._fail(str(response.Status))
+                return False
+            self.statistics.connects += 1
+            self.statistics.last_connect = datetime.now()
+            log(self).info('Opened connection to PLC at %s', self.ip_address)
+            return True
+
+    def close(self) -> None:
+        """Close the connection and forget any pending backoff.
+        """
+        with self._lock:
+            self._close()
+            self._drop_instance_ids()
+            self._retry_at = 0.0
+            self.statistics.consecutive_failures = 0
+
+    def check_health(self) -> bool:
+        """Check the connection, probing the PLC only if no request succeeded recently.
+
+        Returns:
+            bool: True if the connection is open and healthy.
+        """
+        with self._lock:
+            if self._comm is None:
+                return self.open()
+            if time.monotonic() - self._last_success < self.health_check_interval:
+                return True
+            self.statistics.health_checks += 1
+            try:
+                return self._request(lambda comm: comm.GetPLCTime()).Status == 'Success'
+            except ConnectionError:
+                return False
+
+    def _ensure_open(self) -> None:
+        if not self.open():
+            raise ConnectionError(f'No connection to PLC at {self.ip_address}, retrying in {self.retry_delay:.1f}s')
+
+    def read(
+        self,
+        tag_name: str | list,
+        datatype: Optional[int] = None
+    ) -> Response | list[Response]:
+        """Read a tag (or a list of tags) from the PLC, opening the connection if needed.
+
+        Raises:
+            ConnectionError: If the connection can not be opened or fails during the request.
+        """
+        with self._lock:
+            self._ensure_open()
+            return self._request(lambda comm: comm.Read(tag_name, datatype=datatype))
+
+    def read_structure(
+        self,
+        tag_name: str,
+        layout: UdtLayout
+    ) -> Response:
+        """Read a whole structure tag in one request, opening the connection if needed.
+
+        Structures are read on their own, as pylogix drops the first bytes of structures in batched replies.
+
+        Args:
+            tag_name: The name of the structure tag.
+            layout: The layout of the structure.
+
+        Returns:
+            Response: The response, its value a view of the structure on the reply data if successful.
+
+        Raises:
+            ConnectionError: If the connection can not be opened or fails during the request.
+        """
+        response = self.read(tag_name, datatype=0xA0)
+        if response.Status != 'Success':
+            return response
+        if not isinstance(response.Value, (bytes, bytearray)) or len(response.Value) < layout.size:
+            return Response(tag_name, None, f'Not a {layout.name} structure')
+        return Response(tag_name, layout.view(response.Value), response.Status)
+
+    def write(
+        self,
+        tag_name: str | list,
+        value: Any = None,
+        datatype: Optional[int] = None
+    ) -> Response | list[Response]:
+        """Write a value to a tag (or a list of tag/value pairs) in the PLC, opening the connection if needed.
+
+        Raises:
+            ConnectionError: If the connection can not be opened or fails during the request.
+        """
+        with self._lock:
+            self._ensure_open()
+            return self._request(lambda comm: comm.Write(tag_name, value, datatype=datatype))
+
+    def read_tags(
+        self,
+        tags: list[tuple[str, int]]
+    ) -> list[Response]:
+        """Read many tags in batched multi-tag requests, opening the connection if needed.
+
+        pylogix packs the reads into Multiple Service Packet requests, split to fit the connection size.
+
+        Args:
+            tags: Tuples (tag_name, data_type), data type 0 to detect it.
+
+        Returns:
+            list[Response]: One response per tag, in the order of `tags`.
+
+        Raises:
+            ConnectionError: If the connection can not be opened or fails during the request.
+        """
+        if not tags:
+            return []
+        with self._lock:
+            self._ensure_open()
+            request = [(tag_name, 1, data_type or None) for tag_name, data_type in tags]
+            return self._demux(tags, self._request(lambda comm: comm.Read(request)))
+
+    def write_tags(
+        self,
+        tags: list[tuple[str, Any, int]]
+    ) -> list[Response]:
+        """Write many tags in batched multi-tag requests, opening the connection if needed.
+
+        Args:
+            tags: Tuples (tag_name, value, data_type), data type 0 to detect it.
+
+        Returns:
+            list[Response]: One response per tag, in the order of `tags`.
+
+        Raises:
+            ConnectionError: If the connection can not be opened or fails during the request.
+        """
+        if not tags:
+            return []
+        with self._lock:
+            self._ensure_open()
+            request = [
+                (tag_name, value, data_type) if data_type else (tag_name, value)
+                for tag_name, value, data_type in tags
+            ]
+            return self._demux(tags, self._request(lambda comm: comm.Write(request)))
+
+    @staticmethod
+    def _demux(
+        tags: list[tuple],
+        response: Response | list[Response]
+    ) -> list[Response]:
+        """Get one response per requested tag from the response of a batched request."""
+        if isinstance(response, list) and len(response) == len(tags):
+            return response
+        status = response.Status if isinstance(response, Response) else 'Error'
+        return [Response(tag[0], None, status) for tag in tags]
+
+    def get_tag_list(
+        self,
+        all_tags: bool = True
+    ) -> Response:
+        """Get the tag list of the PLC.
+        """
+        with self._lock:
+            if not self.open():
+                return Response(None, None, 'Connection failure')
+            response = self._request(lambda comm: comm.GetTagList(allTags=all_tags))
+            if self._comm is not None and self.symbol_cache is not None:
+                self.symbol_cache.seed(self._comm.KnownTags)  # pylogix forgets the known tags when reading the list
+            return response
+
+    def set_symbol_cache(self, cache: Optional[SymbolCache]) -> None:
+        """Use a symbol cache for the requests of the session (None to stop using one).
+
+        The open connection is reopened if it does not address tags the way the cache allows.
+        """
+        with self._lock:
+            self.symbol_cache = cache
+            if self._comm is None:
+                return
+            instance_ids = cache.get_instance_ids() if cache is not None else {}
+            if bool(instance_ids) != isinstance(self._comm, SymbolInstancePLC):
+                self._close()
+            elif cache is not None:
+                cache.seed(self._comm.KnownTags)
+                if instance_ids:
+                    self._comm.InstanceIDs = instance_ids
+
+
+class PlcSessionPool:
+    """Pool of PLC sessions, one per endpoint (ip address and slot).
+    """
+    _lock = threading.Lock()
+    _sessions: dict[tuple[str, int], PlcSession] = {}
 
     def __init__(self) -> None:
-        raise ValueError('PlcConnectionManager is a static class and cannot be instantiated.')
+        raise ValueError('PlcSessionPool is a static class and cannot be instantiated.')
 
     @classmethod
-    def _connection_loop(cls) -> None:
+    def get_session(
+        cls,
+        parameters: ConnectionParameters
+    ) -> PlcSession:
+        """Get the session for the endpoint of the connection parameters, creating it if needed.
+        """
+        key = (str(parameters.ip_address), parameters.slot)
+        with cls._lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                session = PlcSession(ip_address=key[0], slot=key[1])
+                cls._sessions[key] = session
+            return session
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close and forget all sessions.
+        """
+        with cls._lock:
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+class PlcConnection:
+    """Connection to one PLC: its session, watch table, command buffer and subscribers.
+
+    Connections are created through the `PlcConnectionRegistry`, which drives all of them from one shared
+    I/O scheduler, so a cell of several PLCs can be monitored at once.
+
+    The connection loop runs every RPI: it checks the health of the session, calls the tick subscribers, runs the
+    queued commands and reads the watched tags of the RPI bucket. Watched tags with their own update rate are read
+    by a separate task per rate bucket, so a slow bucket does not hold up the others.
+
+    These run on the worker threads of the I/O scheduler, so the tick, read, watch and write response callbacks are
+    called there too, unless a dispatcher is set (see `set_dispatcher`) to deliver them to the GUI thread.
+
+    Reading the tag list of the PLC fills the symbol cache of the connection, which is persisted next to the project
+    set with `use_symbol_cache` and gives the data types of watched tags and the symbol instances to address them by.
+
+    Args:
+        name: The name of the connection in the registry.
+        connection_parameters: The connection parameters of the PLC.
+        scheduler: The I/O scheduler running the connection loop and the rate buckets.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connection_parameters: Optional[ConnectionParameters] = None,
+        scheduler: Optional[PlcIoScheduler] = None
+    ) -> None:
+        self.name = name
+        self.connection_parameters = connection_parameters or ConnectionParameters()
+        self._connected = False
+        self._running = False
+        self._generation = 0
+        self._commands: list[ConnectionCommand] = []
+        self._commands_lock = threading.Lock()
+        self._subscribers: list[Callable] = []
+        self._read_subscribers: list[Callable[[float, list[Response]], None]] = []
+        self._dispatcher: Optional[Dispatcher] = None
+        self._scheduler = scheduler or PlcIoScheduler()
+        self._watch_table: dict[str, WatchTableEntry] = {}
+        self._buckets: set[int] = set()
+        self._bucket_lock = threading.Lock()
+        self._bucket_statistics: dict[int, BucketStatistics] = {}
+        self._due: dict[int, float] = {}
+        self._symbol_cache: Optional[SymbolCache] = None
+        self._symbol_key = ('', '')
+        self._symbol_cache_path: Optional[Path] = None
+
+    def __repr__(self) -> str:
+        return f'PlcConnection(name={self.name!r}, ip_address={self.connection_parameters.ip_address})'
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the PLC answered the last connection loop."""
+        return self._connected
+
+    @property
+    def symbol_cache(self) -> Optional[SymbolCache]:
+        """The symbol cache of the controller, if one was loaded or read from the PLC."""
+        return self._symbol_cache
+
+    @property
+    def rpi(self) -> int:
+        """The RPI of the connection, in milliseconds."""
+        return int(self.connection_parameters.rpi)
+
+    def get_entry_rate(self, entry: WatchTableEntry) -> int:
+        """Get the update rate of a watch table entry, in milliseconds."""
+        return entry.rate or self.rpi
+
+    def set_dispatcher(self, dispatcher: Optional[Dispatcher]) -> None:
+        """Set the dispatcher delivering the callbacks of the connection to the thread of their subscribers.
+
+        The dispatcher is called on an I/O thread with each tick, read, watch and write response callback bound to
+        its arguments, and must run it later on the subscribers' thread, e.g. `CallbackQueue.put` with the queue
+        drained by the Tk main loop. Without a dispatcher, callbacks run on the I/O threads.
+
+        Args:
+            dispatcher: The dispatcher, None to call the callbacks on the I/O threads.
+        """
+        self._dispatcher = dispatcher
+
+    def _deliver(
+        self,
+        callback: Callable,
+        *args: Any
+    ) -> None:
+        """Call a callback of the connection, through the dispatcher if one is set."""
+        if self._dispatcher is not None:
+            self._dispatcher(functools.partial(callback, *args))
+        else:
+            callback(*args)
+
+    def _get_bucket_entries(self, rate: int) -> list[WatchTableEntry]:
+        return [x for x in list(self._watch_table.values()) if self.get_entry_rate(x) == rate]
+
+    def _connection_loop(self) -> None:
         """Main connection loop for the PLC.
         """
+        generation = self._generation
         try:
-            if not cls._strobe_plc():
-                cls._connected = False
-                log(cls).warning('Failed to strobe PLC at %s', cls.connection_parameters.ip_address)
-                return
-            if not cls._connected:
-                log(cls).info('Connected to PLC at %s', cls.connection_parameters.ip_address)
-                cls._connected = True
-        except Exception:
-            log(cls).error('Error connecting to PLC at %s', cls.connection_parameters.ip_address)
-            cls._connected = False
+            healthy = self.get_session().check_health()
+        except Exception as e:
+            log(self).error('Error connecting to PLC at %s: %s', self.connection_parameters.ip_address, e)
+            healthy = False
+
+        if generation != self._generation:
+            return  # disconnected while checking the session
+        if not healthy:
+            if self._connected:
+                log(self).warning('Lost connection to PLC at %s', self.connection_parameters.ip_address)
+            self._connected = False
+            self._schedule()
             return
+        if not self._connected:
+            log(self).info('Connected to PLC at %s', self.connection_parameters.ip_address)
+            self._connected = True
 
-        [callback() for callback in cls._subscribers]
-        cls._run_commands()
-        cls._schedule()
+        for callback in list(self._subscribers):
+            self._deliver(callback)
+        self._run_commands()
+        if generation == self._generation:
+            self._start_buckets()
+            self._schedule()
 
-    @classmethod
-    def _strobe_plc(cls) -> bool:
-        with PLC(
-            ip_address=str(cls.connection_parameters.ip_address),
-            slot=cls.connection_parameters.slot
-        ) as comm:
-            return comm.GetPLCTime().Status == 'Success'
+    def _take_commands(self) -> list[ConnectionCommand]:
+        """Take the queued commands, leaving an empty buffer for the commands queued while they run."""
+        with self._commands_lock:
+            commands, self._commands = self._commands, []
+        return commands
 
-    @classmethod
-    def _run_commands(cls):
-        if not cls._connected:
+    def _run_commands(self):
+        if not self._connected:
             return
 
-        with PLC(
-            ip_address=str(cls.connection_parameters.ip_address),
-            slot=cls.connection_parameters.slot
-        ) as comm:
-            cls._run_commands_read(comm)
-            cls._run_commands_write(comm)
-            cls._run_watch_table_reads(comm)
-        cls._commands.clear()
+        commands = self._take_commands()
+        try:
+            with self.get_session() as session:
+                self._run_commands_read(session, commands)
+                self._run_commands_write(session, commands)
+                self._run_watch_table_reads(session)
+        except ConnectionError as e:
+            log(self).warning('Stopped running commands: %s', e)
+            self._connected = False
 
-    @classmethod
-    def _run_commands_read(
-        cls,
-        comm: PLC
-    ) -> None:
-        """Run read commands from the command buffer.
+    def _read_tags(
+        self,
+        session: PlcSession,
+        tags: list[tuple[str, int]]
+    ) -> list[Response]:
+        """Read tags in one batch, falling back to one request per tag if the batch can not be processed.
         """
-        read_commands = [cmd for cmd in cls._commands if cmd.type == ConnectionCommandType.READ]
-        for command in read_commands:
+        try:
+            return session.read_tags(tags)
+        except KeyError:
+            log(self).debug('Batched read failed, reading %d tags one by one', len(tags))
+
+        responses = []
+        for tag_name, data_type in tags:
             try:
-                response = comm.Read(
-                    command.tag_name,
-                    datatype=command.data_type
-                )
-                command.response_cb(response)
+                responses.append(session.read(tag_name, datatype=data_type))
             except KeyError:
-                command.response_cb(
-                    Response(
-                        tag_name=command.tag_name,
-                        value=None,
-                        status='Error'
-                    )
-                )
+                responses.append(Response(tag_name=tag_name, value=None, status='Error'))
+        return responses
 
-    @classmethod
-    def _run_commands_write(cls, comm: PLC):
-        """Run write commands from the command buffer.
+    def _write_tags(
+        self,
+        session: PlcSession,
+        tags: list[tuple[str, Any, int]]
+    ) -> list[Response]:
+        """Write tags in one batch, falling back to one request per tag if the batch can not be processed.
         """
-        write_commands = [cmd for cmd in cls._commands if cmd.type == ConnectionCommandType.WRITE]
-        for command in write_commands:
+        try:
+            return session.write_tags(tags)
+        except (KeyError, TypeError, ValueError):
+            log(self).debug('Batched write failed, writing %d tags one by one', len(tags))
+
+        responses = []
+        for tag_name, tag_value, data_type in tags:
             try:
-                try:
-                    tag_value = int(command.tag_value)
-                except (ValueError, TypeError):
-                    tag_value = command.tag_value  # keep as string if conversion fails
-                response = comm.Write(
-                    command.tag_name,
-                    tag_value,
-                    datatype=command.data_type
-                )
-                command.response_cb(response)
+                responses.append(session.write(tag_name, tag_value, datatype=data_type))
             except KeyError:
-                command.response_cb(
-                    Response(
-                        tag_name=command.tag_name,
-                        value=None,
-                        status='Error')
-                )
+                responses.append(Response(tag_name=tag_name, value=None, status='Error'))
+        return responses
 
-    @classmethod
-    def _run_watch_table_reads(cls, comm: PLC) -> None:
-        """Automatically read all tags in the watch table.
+    def _run_commands_read(
+        self,
+        session: PlcSession,
+        commands: list[ConnectionCommand]
+    ) -> None:
+        """Run read commands taken from the command buffer in one batch.
+        """
+        read_commands = [cmd for cmd in commands if cmd.type == ConnectionCommandType.READ]
+        responses = self._read_tags(session, [(cmd.tag_name, cmd.data_type) for cmd in read_commands])
+        for command, response in zip(read_commands, responses):
+            self._deliver(command.response_cb, response)
+
+    def _run_commands_write(
+        self,
+        session: PlcSession,
+        commands: list[ConnectionCommand]
+    ) -> None:
+        """Run write commands taken from the command buffer in one batch.
+
+        Writes are coalesced per tag: only the last value queued for a tag is written, and every command for the
+        tag gets the response of that write.
+        """
+        write_commands = [cmd for cmd in commands if cmd.type == ConnectionCommandType.WRITE]
+        latest: dict[str, ConnectionCommand] = {}
+        for command in write_commands:
+            latest.pop(command.tag_name, None)
+            latest[command.tag_name] = command
+
+        tags = []
+        for command in latest.values():
+            try:
+                tag_value = int(command.tag_value)
+            except (ValueError, TypeError):
+                tag_value = command.tag_value  # keep as string if conversion fails
+            tags.append((command.tag_name, tag_value, command.data_type))
+
+        responses = dict(zip(latest, self._write_tags(session, tags)))
+        for command in write_commands:
+            self._deliver(command.response_cb, responses[command.tag_name])
+
+    def _run_watch_table_reads(
+        self,
+        session: PlcSession,
+        rate: int = 0
+    ) -> None:
+        """Automatically read the tags of a rate bucket of the watch table (the RPI bucket by default), in one batch.
         """
-        for tag_name, entry in cls._watch_table.items():
+        rate = rate or self.rpi
+        entries = self._get_bucket_entries(rate)
+        if not entries:
+            return
+        statistics = self._bucket_statistics.setdefault(rate, BucketStatistics(rate))
+        statistics.tags = len(entries)
+        start = time.monotonic()
+        try:
+            responses = self._read_tags(session, [(x.tag_name, x.data_type) for x in entries])
+        except ConnectionError:
+            statistics.errors += 1
+            for entry in entries:
+                entry.error_count += 1
+            raise
+        except Exception as e:
+            log(self).error('Error reading watch table: %s', e)
+            statistics.errors += 1
+            for entry in entries:
+                entry.error_count += 1
+            return
+        statistics.record(max(0.0, start - self._due.get(rate, start)), time.monotonic() - start)
+
+        now = datetime.now()
+        read_time = time.monotonic()
+        for callback in list(self._read_subscribers):
             try:
-                response = comm.Read(tag_name, datatype=entry.data_type)
-
-                # Handle both single Response and list[Response]
-                if isinstance(response, list):
-                    response = response[0] if response else Response(tag_name, None, 'Error')
-
-                if response.Status == 'Success':
-                    entry.last_value = response.Value
-                    entry.last_update = datetime.now()
-                    entry.error_count = 0
-                else:
-                    entry.error_count += 1
-                    log(cls).warning('Failed to read watched tag %s: %s', tag_name, response.Status)
-
-                # Call any registered callbacks for this tag
-                for callback in entry.callbacks:
-                    try:
-                        callback(response)
-                    except Exception as e:
-                        log(cls).error('Error in watch callback for %s: %s', tag_name, e)
+                self._deliver(callback, now.timestamp(), responses)
             except Exception as e:
+                log(self).error('Error in read subscriber: %s', e)
+
+        for entry, response in zip(entries, responses):
+            if response.Status == 'Success':
+                entry.last_value = response.Value
+                entry.last_update = now
+                entry.error_count = 0
+            else:
                 entry.error_count += 1
-                log(cls).error('Error reading watched tag %s: %s', tag_name, e)
+                log(self).warning('Failed to read watched tag %s: %s', entry.tag_name, response.Status)
 
-    @classmethod
-    def _schedule(cls) -> None:
+            if not entry.should_publish(response, read_time):
+                continue
+
+            # Call any registered callbacks for this tag
+            for callback in entry.callbacks:
+                try:
+                    self._deliver(callback, response)
+                except Exception as e:
+                    log(self).error('Error in watch callback for %s: %s', entry.tag_name, e)
+
+    def _schedule(self) -> None:
         """Schedule the next connection loop iteration.
+
+        While connected, the loop runs every RPI. While a requested connection is down, the loop retries once the
+        session's backoff has elapsed.
+        """
+        # Convert RPI from milliseconds to seconds for the scheduler
+        delay = self.connection_parameters.rpi / 1000.0
+        if not self._connected:
+            if not self._running:
+                return
+            delay = max(delay, self.get_session().retry_delay)
+
+        self._due[self.rpi] = time.monotonic() + delay
+        self._scheduler.schedule_task(self._create_task(self._connection_loop), delay)
+
+    def _create_task(
+        self,
+        task: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Wrap a task so that it is dropped if the connection was stopped since scheduling it.
         """
-        if not cls._connected:
+        generation = self._generation
+
+        def run() -> None:
+            if generation == self._generation:
+                task()
+        return run
+
+    def _start_buckets(self) -> None:
+        """Start a task for each rate bucket that has no task yet (the RPI bucket is read by the connection loop).
+        """
+        rates = {self.get_entry_rate(x) for x in list(self._watch_table.values())}
+        rates.discard(self.rpi)
+        with self._bucket_lock:
+            rates -= self._buckets
+            self._buckets.update(rates)
+        for rate in rates:
+            self._schedule_bucket(rate, time.monotonic())
+
+    def _schedule_bucket(
+        self,
+        rate: int,
+        due: float
+    ) -> None:
+        self._due[rate] = due
+        self._scheduler.schedule_task(
+            self._create_task(lambda: self._run_bucket(rate)),
+            due - time.monotonic()
+        )
+
+    def _run_bucket(self, rate: int) -> None:
+        """Read a rate bucket and schedule its next read, at a fixed rate.
+
+        If a read takes longer than the period, the missed periods are skipped and counted as overruns. The task
+        ends once the bucket has no entries left.
+        """
+        if rate == self.rpi or not self._get_bucket_entries(rate):
+            with self._bucket_lock:
+                self._buckets.discard(rate)
+            return
+
+        generation = self._generation
+        if self._connected:
+            try:
+                with self.get_session() as session:
+                    self._run_watch_table_reads(session, rate)
+            except ConnectionError as e:
+                log(self).warning('Stopped reading the %d ms bucket: %s', rate, e)
+                self._connected = False
+        if generation != self._generation:
             return
 
-        # Convert RPI from milliseconds to seconds for timer service
-        cls._timer_service.schedule_task(cls._connection_loop, cls.connection_parameters.rpi / 1000.0)
+        period = rate / 1000.0
+        due = self._due[rate] + period
+        now = time.monotonic()
+        if due < now:
+            missed = int((now - due) / period) + 1
+            self._bucket_statistics.setdefault(rate, BucketStatistics(rate)).overruns += missed
+            due += missed * period
+        self._schedule_bucket(rate, due)
 
-    @classmethod
-    def connect(cls) -> None:
+    def get_bucket_statistics(self) -> dict[int, BucketStatistics]:
+        """Get the timing statistics of the rate buckets.
+
+        Returns:
+            dict[int, BucketStatistics]: Update rates in milliseconds mapped to the statistics of their bucket.
+        """
+        return self._bucket_statistics.copy()
+
+    def connect(self) -> None:
         """Connect to the PLC.
+
+        The connection is opened by the first connection loop, which runs on the I/O scheduler, so calling this from
+        the GUI does not block it.
         """
-        if cls._connected:
+        if self._connected or self._running:
             return
-        if not cls.connection_parameters:
-            log(cls).warning('No connection parameters provided, using default values')
-            cls.connection_parameters = ConnectionParameters()
-        log(cls).info('Connecting to PLC at %s...', cls.connection_parameters.ip_address)
-        cls.save_connection_parameters()
-        cls._connection_loop()
+        if not self.connection_parameters:
+            log(self).warning('No connection parameters provided, using default values')
+            self.connection_parameters = ConnectionParameters()
+        log(self).info('Connecting to PLC at %s...', self.connection_parameters.ip_address)
+        if self._symbol_cache is not None:
+            self.get_session().set_symbol_cache(self._symbol_cache)
+        self._running = True
+        self._scheduler.schedule_task(self._create_task(self._connection_loop), 0.0)
 
-    @classmethod
-    def disconnect(cls) -> None:
+    def disconnect(self) -> None:
         """Disconnect from the PLC.
+
+        The session is closed on the I/O scheduler.
         """
-        if not cls._connected:
+        if not self._connected and not self._running:
             return
-        log(cls).info('Disconnecting from PLC at %s...', cls.connection_parameters.ip_address)
-        cls._connected = False
-        cls._timer_service.clear_all_tasks()
+        log(self).info('Disconnecting from PLC at %s...', self.connection_parameters.ip_address)
+        self._connected = False
+        self._running = False
+        self._generation += 1  # drop the loop iterations and bucket reads already scheduled
+        with self._bucket_lock:
+            self._buckets.clear()
+        self._scheduler.schedule_task(self.get_session().close, 0.0)
 
-    @classmethod
-    def subscribe_to_ticks(cls, callback: Callable) -> None:
+    def get_session(self) -> PlcSession:
+        """Get the pooled session for the current connection parameters.
+
+        Returns:
+            PlcSession: The session to the PLC endpoint.
+        """
+        return PlcSessionPool.get_session(self.connection_parameters)
+
+    def get_connection_statistics(self) -> ConnectionStatistics:
+        """Get the connection statistics of the current PLC endpoint.
+
+        Returns:
+            ConnectionStatistics: The statistics of the pooled session.
+        """
+        return self.get_session().statistics
+
+    def subscribe_to_ticks(self, callback: Callable) -> None:
         """Subscribe to tick events.
 
         Args:
@@ -228,21 +928,41 @@ class PlcConnectionManager:
         """
         if not callable(callback):
             raise ValueError('Callback must be callable')
-        cls._subscribers.append(callback)
+        self._subscribers.append(callback)
 
-    @classmethod
-    def unsubscribe_from_ticks(cls, callback: Callable) -> None:
+    def subscribe_to_reads(self, callback: Callable[[float, list[Response]], None]) -> None:
+        """Subscribe to every batch of watch table reads, changed or not.
+
+        The callback runs on the I/O thread reading the batch (or is delivered by the dispatcher, see
+        `set_dispatcher`), so it must return quickly.
+
+        Args:
+            callback: Function called with the time of the reads (seconds since the epoch) and their responses
+        """
+        if not callable(callback):
+            raise ValueError('Callback must be callable')
+        self._read_subscribers.append(callback)
+
+    def unsubscribe_from_reads(self, callback: Callable[[float, list[Response]], None]) -> None:
+        """Unsubscribe from watch table reads.
+
+        Args:
+            callback: Function to remove from the read subscribers
+        """
+        if callback in self._read_subscribers:
+            self._read_subscribers.remove(callback)
+
+    def unsubscribe_from_ticks(self, callback: Callable) -> None:
         """Unsubscribe from tick events.
 
         Args:
             callback: Function to remove from subscribers
         """
-        if callback in cls._subscribers:
-            cls._subscribers.remove(callback)
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
 
-    @classmethod
     def read_plc_tag_table(
-        cls,
+        self,
         all_tags: bool = True
     ) -> Response:
         """Read the entire PLC tag table.
@@ -253,41 +973,110 @@ class PlcConnectionManager:
         Returns:
             Response: A response object containing the tag table data or an error status
         """
-        with PLC(
-            ip_address=str(cls.connection_parameters.ip_address),
-            slot=cls.connection_parameters.slot
-        ) as comm:
-            return comm.GetTagList(allTags=all_tags)
+        response = self.get_session().get_tag_list(all_tags)
+        if response.Status != 'Success' or not response.Value:
+            return response
+
+        cache = SymbolCache.from_tag_list(response.Value, *self._symbol_key)
+        self._set_symbol_cache(cache)
+        if self._symbol_cache_path is not None:
+            try:
+                cache.save(self._symbol_cache_path)
+            except OSError as e:
+                log(self).warning('Could not save symbol cache %s: %s', self._symbol_cache_path, e)
+        return response
+
+    def use_symbol_cache(
+        self,
+        controller_name: str,
+        modified_date: str = '',
+        project_path: Optional[Path | str] = None
+    ) -> Optional[SymbolCache]:
+        """Use the symbol cache of a controller project, loading the persisted one if it is up to date.
+
+        Caches built by reading the tag list afterwards are persisted next to the project file. The cache in use is
+        kept if it is for the same controller and project.
+
+        Args:
+            controller_name: The name of the controller.
+            modified_date: The modified date of the project.
+            project_path: The path of the project file, None to not persist the cache.
+
+        Returns:
+            Optional[SymbolCache]: The cache in use, None if there is none for this controller and project.
+        """
+        path = get_symbol_cache_path(project_path) if project_path else None
+        same_project = self._symbol_key == (controller_name, modified_date) and self._symbol_cache_path == path
+        if same_project and self._symbol_cache is not None:
+            return self._symbol_cache
+        self._symbol_key = (controller_name, modified_date)
+        self._symbol_cache_path = path
+        cache = None
+        if self._symbol_cache_path is not None:
+            cache = SymbolCache.load(self._symbol_cache_path, controller_name, modified_date)
+        self._set_symbol_cache(cache)
+        return cache
+
+    def _set_symbol_cache(self, cache: Optional[SymbolCache]) -> None:
+        self._symbol_cache = cache
+        self.get_session().set_symbol_cache(cache)
+        if cache is None:
+            return
+        for entry in list(self._watch_table.values()):
+            if not entry.data_type:
+                entry.data_type = cache.get_data_type(entry.tag_name)
+
+    def _get_cached_data_type(self, tag_name: str) -> int:
+        return self._symbol_cache.get_data_type(tag_name) if self._symbol_cache is not None else 0
 
-    @classmethod
     def add_watch_tag(
-        cls,
+        self,
         tag_name: str,
         data_type: int = 0,
-        callback: Callable[[Response | list[Response]], None] | None = None
+        callback: Callable[[Response | list[Response]], None] | None = None,
+        rate: int = 0,
+        deadband: float = 0.0,
+        max_publish_rate: float = 0.0
     ) -> None:
         """Add a tag to the watch table for automatic monitoring.
 
+        A tag watched several times is read and published for the most demanding watcher: at the fastest rate, with
+        the smallest deadband and the highest publish rate.
+
         Args:
             tag_name: Name of the PLC tag to watch
-            data_type: PyLogix data type code (0 for auto-detect)
-            callback: Optional callback function to call when tag value updates
+            data_type: PyLogix data type code (0 to take it from the symbol cache, or auto-detect)
+            callback: Optional callback function to call when tag value changes
+            rate: Update rate in milliseconds (0 for the RPI of the connection)
+            deadband: Smallest change of a numeric value to publish to the callbacks (0 for any change)
+            max_publish_rate: Maximum number of publications per second (0 for no limit)
         """
-        if tag_name in cls._watch_table:
-            log(cls).debug('Tag %s already in watch table', tag_name)
-            if callback and callback not in cls._watch_table[tag_name].callbacks:
-                cls._watch_table[tag_name].callbacks.append(callback)
+        if tag_name in self._watch_table:
+            log(self).debug('Tag %s already in watch table', tag_name)
+            entry = self._watch_table[tag_name]
+            if callback and callback not in entry.callbacks:
+                entry.callbacks.append(callback)
+                entry.published_status = None  # publish the next read, so the new callback gets the current value
+            if rate and (not entry.rate or rate < entry.rate):
+                entry.rate = rate
+            entry.deadband = min(entry.deadband, deadband)
+            if not max_publish_rate or not entry.max_publish_rate:
+                entry.max_publish_rate = 0.0
+            else:
+                entry.max_publish_rate = max(entry.max_publish_rate, max_publish_rate)
         else:
             callbacks = [callback] if callback else []
-            cls._watch_table[tag_name] = WatchTableEntry(
+            self._watch_table[tag_name] = WatchTableEntry(
                 tag_name=tag_name,
-                data_type=data_type,
-                callbacks=callbacks
+                data_type=data_type or self._get_cached_data_type(tag_name),
+                callbacks=callbacks,
+                rate=rate,
+                deadband=deadband,
+                max_publish_rate=max_publish_rate
             )
-            log(cls).info('Added tag %s to watch table', tag_name)
+            log(self).info('Added tag %s to watch table', tag_name)
 
-    @classmethod
-    def remove_watch_tag(cls, tag_name: str) -> bool:
+    def remove_watch_tag(self, tag_name: str) -> bool:
         """Remove a tag from the watch table.
 
         Args:
@@ -296,29 +1085,38 @@ class PlcConnectionManager:
         Returns:
             bool: True if tag was removed, False if not found
         """
-        if tag_name in cls._watch_table:
-            del cls._watch_table[tag_name]
-            log(cls).info('Removed tag %s from watch table', tag_name)
+        if tag_name in self._watch_table:
+            del self._watch_table[tag_name]
+            log(self).info('Removed tag %s from watch table', tag_name)
             return True
         return False
 
-    @classmethod
-    def clear_watch_table(cls) -> None:
+    def clear_watch_table(self) -> None:
         """Clear all tags from the watch table."""
-        cls._watch_table.clear()
-        log(cls).info('Cleared watch table')
+        self._watch_table.clear()
+        log(self).info('Cleared watch table')
 
-    @classmethod
-    def get_watch_table(cls) -> dict[str, WatchTableEntry]:
+    def get_watch_table(self) -> dict[str, WatchTableEntry]:
         """Get the current watch table.
 
         Returns:
             dict: Dictionary of tag names to WatchTableEntry objects
         """
-        return cls._watch_table.copy()
+        return self._watch_table.copy()
 
-    @classmethod
-    def get_watched_tag_value(cls, tag_name: str) -> Any | None:
+    def get_publish_statistics(self) -> dict[str, int]:
+        """Get the number of watch table reads delivered to and suppressed from the callbacks.
+
+        Returns:
+            dict: The 'delivered' and 'suppressed' counts, summed over the watch table
+        """
+        entries = list(self._watch_table.values())
+        return {
+            'delivered': sum(x.delivered for x in entries),
+            'suppressed': sum(x.suppressed for x in entries),
+        }
+
+    def get_watched_tag_value(self, tag_name: str) -> Any | None:
         """Get the last known value of a watched tag.
 
         Args:
@@ -327,12 +1125,11 @@ class PlcConnectionManager:
         Returns:
             The last known value or None if tag not watched or no value yet
         """
-        entry = cls._watch_table.get(tag_name)
+        entry = self._watch_table.get(tag_name)
         return entry.last_value if entry else None
 
-    @classmethod
     def write_watch_tag(
-        cls,
+        self,
         tag_name: str,
         value: Any,
         callback: Callable[[Response | list[Response]], None] | None = None
@@ -340,7 +1137,7 @@ class PlcConnectionManager:
         """Write a value to a watched tag (or any tag).
 
         This method is designed for GUI integration to allow editing tag values.
-        If the tag is in the watch table, it uses the stored data type.
+        If the tag is in the watch table, it uses the stored data type, otherwise the one of the symbol cache.
 
         Args:
             tag_name: Name of the PLC tag to write
@@ -349,8 +1146,9 @@ class PlcConnectionManager:
         """
         # Get data type from watch table if available
         data_type = 0
-        if tag_name in cls._watch_table:
-            data_type = cls._watch_table[tag_name].data_type
+        if tag_name in self._watch_table:
+            data_type = self._watch_table[tag_name].data_type
+        data_type = data_type or self._get_cached_data_type(tag_name)
 
         # Create default callback if none provided
         def default_callback(response: Response | list[Response]) -> None:
@@ -359,26 +1157,190 @@ class PlcConnectionManager:
                 response = response[0] if response else Response(tag_name, None, 'Error')
 
             if response.Status == 'Success':
-                log(cls).debug('Successfully wrote %s to tag %s', value, tag_name)
+                log(self).debug('Successfully wrote %s to tag %s', value, tag_name)
                 # Update watch table entry if tag is watched
-                if tag_name in cls._watch_table:
-                    cls._watch_table[tag_name].last_value = value
-                    cls._watch_table[tag_name].last_update = datetime.now()
+                if tag_name in self._watch_table:
+                    self._watch_table[tag_name].last_value = value
+                    self._watch_table[tag_name].last_update = datetime.now()
             else:
-                log(cls).warning('Failed to write to tag %s: %s', tag_name, response.Status)
+                log(self).warning('Failed to write to tag %s: %s', tag_name, response.Status)
 
         response_cb = callback if callback else default_callback
 
-        # Add write command to command buffer
-        cls._commands.append(
-            ConnectionCommand(
-                type=ConnectionCommandType.WRITE,
-                tag_name=tag_name,
-                tag_value=value,
-                data_type=data_type,
-                response_cb=response_cb
-            )
+        # Add write command to command buffer (taken by the connection loop on an I/O thread)
+        command = ConnectionCommand(
+            type=ConnectionCommandType.WRITE,
+            tag_name=tag_name,
+            tag_value=value,
+            data_type=data_type,
+            response_cb=response_cb
         )
+        with self._commands_lock:
+            self._commands.append(command)
+
+    def write_watch_tags(
+        self,
+        values: dict[str, Any],
+        callback: Callable[[Response | list[Response]], None] | None = None
+    ) -> None:
+        """Write values to several watched tags (or any tags) in one multi-tag write.
+
+        Args:
+            values: Values to write, by tag name
+            callback: Optional callback to handle the response of each tag
+        """
+        for tag_name, value in values.items():
+            self.write_watch_tag(tag_name, value, callback)
+
+
+class PlcConnectionRegistry:
+    """Registry of named PLC connections.
+
+    All connections are driven by one shared I/O scheduler (a timing thread and a worker pool), so the blocking
+    requests of one PLC do not hold up the connection loops of the others.
+    """
+    DEFAULT_NAME = 'default'
+    max_workers: int = 8
+    _lock = threading.Lock()
+    _connections: dict[str, PlcConnection] = {}
+    _scheduler: Optional[PlcIoScheduler] = None
+
+    def __init__(self) -> None:
+        raise ValueError('PlcConnectionRegistry is a static class and cannot be instantiated.')
+
+    @classmethod
+    def _create_connection(
+        cls,
+        name: str,
+        connection_parameters: Optional[ConnectionParameters]
+    ) -> PlcConnection:
+        if cls._scheduler is None:
+            cls._scheduler = PlcIoScheduler(max_workers=cls.max_workers)
+        return PlcConnection(name, connection_parameters, cls._scheduler)
+
+    @classmethod
+    def get_connection(
+        cls,
+        name: str = DEFAULT_NAME,
+        connection_parameters: Optional[ConnectionParameters] = None
+    ) -> PlcConnection:
+        """Get a connection by name, creating it if needed.
+
+        Args:
+            name: The name of the connection.
+            connection_parameters: The connection parameters of the PLC. Replaces the parameters of an existing
+                connection if given.
+
+        Returns:
+            PlcConnection: The connection.
+        """
+        with cls._lock:
+            connection = cls._connections.get(name)
+            if connection is None:
+                connection = cls._create_connection(name, connection_parameters)
+                cls._connections[name] = connection
+            elif connection_parameters is not None:
+                connection.connection_parameters = connection_parameters
+            return connection
+
+    @classmethod
+    def get_default(cls) -> PlcConnection:
+        """Get the default connection, used by the `PlcConnectionManager` facade.
+        """
+        return cls.get_connection(cls.DEFAULT_NAME)
+
+    @classmethod
+    def get_connections(cls) -> dict[str, PlcConnection]:
+        """Get all connections by name.
+        """
+        with cls._lock:
+            return cls._connections.copy()
+
+    @classmethod
+    def remove_connection(cls, name: str) -> bool:
+        """Disconnect and remove a connection.
+
+        Args:
+            name: The name of the connection.
+
+        Returns:
+            bool: True if the connection was removed, False if not found
+        """
+        with cls._lock:
+            connection = cls._connections.pop(name, None)
+        if connection is None:
+            return False
+        connection.disconnect()
+        return True
+
+    @classmethod
+    def disconnect_all(cls) -> None:
+        """Disconnect all connections, keeping them registered.
+        """
+        for connection in cls.get_connections().values():
+            connection.disconnect()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Disconnect and remove all connections and stop the shared I/O scheduler.
+        """
+        cls.disconnect_all()
+        with cls._lock:
+            cls._connections.clear()
+            scheduler, cls._scheduler = cls._scheduler, None
+        if scheduler is not None:
+            scheduler.shutdown(wait=True)
+        PlcSessionPool.close_all()
+
+
+class _PlcConnectionManagerMeta(type):
+    """Forwards the attributes of the static `PlcConnectionManager` facade to the default connection.
+    """
+
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(PlcConnectionRegistry.get_default(), name)
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name.startswith('__') or name in vars(cls):
+            super().__setattr__(name, value)
+        else:
+            setattr(PlcConnectionRegistry.get_default(), name, value)
+
+    def __delattr__(cls, name: str) -> None:
+        if name in vars(cls):
+            super().__delattr__(name)
+        else:
+            delattr(PlcConnectionRegistry.get_default(), name)
+
+
+class PlcConnectionManager(metaclass=_PlcConnectionManagerMeta):
+    """Static Connection Manager for PLC IO Applications.
+
+    Facade over the default connection of the `PlcConnectionRegistry`: the attributes and methods of that connection
+    (e.g. `connection_parameters`, `add_watch_tag`) are available on this class.
+    """
+
+    def __init__(self) -> None:
+        raise ValueError('PlcConnectionManager is a static class and cannot be instantiated.')
+
+    @classmethod
+    def get_connection(cls) -> PlcConnection:
+        """Get the default connection behind this facade.
+        """
+        return PlcConnectionRegistry.get_default()
+
+    @classmethod
+    def connect(cls) -> None:
+        """Connect to the PLC, saving the connection parameters as the defaults.
+        """
+        connection = cls.get_connection()
+        if connection.is_connected:
+            return
+        if connection.connection_parameters:
+            cls.save_connection_parameters()
+        connection.connect()
 
     @classmethod
     def save_connection_parameters(cls) -> None:
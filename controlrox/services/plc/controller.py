@@ -1,4 +1,3 @@
-import copy
 import importlib
 import threading
 from typing import List, Optional, Self, Tuple, Type, Union
@@ -11,6 +10,7 @@ from pyrox.models.factory import MetaFactory, FactoryTypeMeta
 
 from controlrox.interfaces import IController, IDatatype
 from controlrox.services.l5x import dict_to_l5x_file, l5x_dict_from_file
+from controlrox.services.overlay import MetaOverlay
 
 from xml.parsers import expat
 
@@ -464,7 +464,7 @@ class ControllerInstanceManager:
         if len(meta_data.keys()) != 1:
             raise ValueError('controller.meta_data contains unexpected keys!')
 
-        write_dict = copy.deepcopy(meta_data)
+        write_dict = MetaOverlay(meta_data)  # strip None values from shallow copies of the nodes, not the controller
         remove_none_values_inplace(write_dict)
 
         dict_to_l5x_file(
@@ -557,7 +557,7 @@ def save_controller_to_file_location(
     if len(meta_data.keys()) != 1:
         raise ValueError('controller.meta_data contains unexpected keys!')
 
-    write_dict = copy.deepcopy(meta_data)
+    write_dict = MetaOverlay(meta_data)  # strip None values from shallow copies of the nodes, not the controller
     remove_none_values_inplace(write_dict)
     dict_to_l5x_file(
         write_dict,
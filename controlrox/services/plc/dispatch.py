@@ -0,0 +1,89 @@
+"""Delivery of PLC connection callbacks to the thread of their subscribers.
+
+Connections run their loop and rate buckets on the worker threads of the I/O scheduler, concurrently across
+buckets. Subscribers that update the GUI (Tk widgets, scene objects) must not run there: a connection with a
+dispatcher (see `PlcConnection.set_dispatcher`) hands every tick, read, watch and write response callback to it
+instead. A `CallbackQueue` is such a dispatcher, drained in order by the GUI thread, e.g. from the Tk `after` loop.
+"""
+from collections import deque
+from typing import Any, Callable, Optional
+
+from pyrox.services import log
+
+__all__ = (
+    'CallbackQueue',
+    'Dispatcher',
+)
+
+# Takes a callback without arguments and runs it later, on the thread of the subscribers
+Dispatcher = Callable[[Callable[[], None]], None]
+
+
+class CallbackQueue:
+    """Thread-safe queue of callbacks, run by the thread draining it.
+
+    Args:
+        max_batch: The most callbacks run per drain, so a burst of updates does not block the draining thread.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 1000
+    ) -> None:
+        self.max_batch = max_batch
+        self._queue: deque[Callable[[], None]] = deque()  # appends and pops of a deque are atomic
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def put(self, callback: Callable[[], None]) -> None:
+        """Queue a callback (the dispatcher of a connection). Safe to call from any thread."""
+        self._queue.append(callback)
+
+    def clear(self) -> None:
+        """Drop the queued callbacks."""
+        self._queue.clear()
+
+    def drain(
+        self,
+        limit: Optional[int] = None
+    ) -> int:
+        """Run queued callbacks on the calling thread, in the order they were queued.
+
+        Args:
+            limit: The most callbacks to run, `max_batch` if None.
+
+        Returns:
+            int: The number of callbacks run.
+        """
+        limit = self.max_batch if limit is None else limit
+        count = 0
+        while count < limit:
+            try:
+                callback = self._queue.popleft()
+            except IndexError:
+                break
+            count += 1
+            try:
+                callback()
+            except Exception as e:
+                log(self).error('Error in dispatched PLC callback: %s', e)
+        return count
+
+    def drain_with_tk(
+        self,
+        widget: Any,
+        interval: int = 20
+    ) -> None:
+        """Drain the queue from the Tk main loop of a widget, every `interval` milliseconds until it is destroyed.
+
+        Args:
+            widget: The Tk widget whose `after` loop drains the queue.
+            interval: Milliseconds between drains.
+        """
+        def run() -> None:
+            if not widget.winfo_exists():
+                return
+            self.drain()
+            widget.after(interval, run)
+        widget.after(interval, run)
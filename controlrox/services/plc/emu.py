@@ -8,6 +8,7 @@ from controlrox.services.eplan import get_project
 
 __all__ = (
     'inject_emulation_routine',
+    'plan_emulation_routine',
     'remove_emulation_routine',
 )
 
@@ -63,6 +64,22 @@ def inject_emulation_routine(
     generator.generate_emulation_logic()
 
 
+def plan_emulation_routine(
+    ctrl: IController
+):
+    """Plans injecting the emulation routine into a controller, without changing the controller.
+
+    Args:
+        ctrl (plc.Controller): The controller to plan the emulation routine injection for.
+
+    Returns:
+        The plan of every change the injection would make (see ModificationPlan.get_summary_lines).
+    """
+    generator = _get_generator(ctrl)
+    _work_precheck(ctrl, generator)
+    return generator.plan_emulation_logic()
+
+
 def remove_emulation_routine(
     controller: IController
 ) -> None:
@@ -317,3 +317,68 @@ def extract_instruction_strings(
             instructions.append(instruction)
 
     return instructions
+
+
+def tokenize_rung_text(
+    text: str
+) -> list[str]:
+    """Tokenize rung text into instructions and branch markers.
+
+    Brackets and commas inside an instruction (array references, operand separators) stay part of the instruction,
+    all others are branch start ('['), branch end (']') and next branch (',') markers.
+
+    Args:
+        text (str): The rung text to tokenize.
+
+    Returns:
+        List[str]: The instruction and branch marker tokens, in rung order.
+    """
+    tokens = []
+
+    # First, extract all instructions using the balanced parentheses method
+    instructions = extract_instruction_strings(text)
+    instruction_ranges = []
+
+    # Find the positions of each instruction in the text
+    search_start = 0
+    for instruction in instructions:
+        pos = text.find(instruction, search_start)
+        if pos != -1:
+            instruction_ranges.append((pos, pos + len(instruction)))
+            search_start = pos + len(instruction)
+
+    # Process the text character by character
+    i = 0
+    current_segment = ""
+
+    while i < len(text):
+        char = text[i]
+
+        if char in ['[', ']', ',']:
+            # Check if this symbol is inside any instruction
+            inside_instruction = any(start <= i < end for start, end in instruction_ranges)
+
+            if inside_instruction:
+                # This bracket is part of an instruction (array reference), keep it
+                current_segment += char
+            else:
+                # This is a branch marker or next-branch marker
+                if current_segment.strip():
+                    # Extract instructions from current segment using our method
+                    segment_instructions = extract_instruction_strings(current_segment)
+                    tokens.extend(segment_instructions)
+                    current_segment = ""
+
+                # Add the branch marker
+                tokens.append(char)
+        else:
+            current_segment += char
+
+        i += 1
+
+    # Process any remaining segment
+    if current_segment.strip():
+        segment_instructions = extract_instruction_strings(current_segment)
+        tokens.extend(segment_instructions)
+
+    return tokens
@@ -1,4 +1,5 @@
-from typing import Optional, List, Union
+import weakref
+from typing import Any, Callable, Optional, List, Sequence, Union
 from pyrox.models import FactoryTypeMeta, HashList, MetaFactory
 from pyrox.services import log
 from controlrox.interfaces import (
@@ -7,10 +8,190 @@ from controlrox.interfaces import (
     IModule,
 )
 
+LAZY_MATCH_EXCLUDED_CATALOG = 'ETHERNET-MODULE'
+
+ModuleClassProvider = Callable[[IModule, bool], Optional[type[IIntrospectiveModule]]]
+
+
+def get_module_match_key(module: Union[IModule, IIntrospectiveModule]) -> tuple[Any, ...]:
+    """Get the key a module is matched to an introspective module class by.
+
+    Args:
+        module: The module (or introspective module) to get the key of.
+
+    Returns:
+        tuple: (catalog number, input / output / config connection points, input / output / config connection sizes)
+    """
+    return (
+        module.catalog_number,
+        module.input_connection_point,
+        module.output_connection_point,
+        module.config_connection_point,
+        module.input_connection_size,
+        module.output_connection_size,
+        module.config_connection_size,
+    )
+
+
+class _CatalogTrieNode:
+    """Node of a catalog number trie. Holds the lowest class order of the catalog numbers ending here."""
+    __slots__ = ('children', 'order')
+
+    def __init__(self) -> None:
+        self.children: dict[str, '_CatalogTrieNode'] = {}
+        self.order: Optional[int] = None
+
+
+class IntrospectiveModuleIndex:
+    """Match index over the known introspective module classes.
+
+    Each class is instantiated once when it is added to the index to read its catalog number, connection points and
+    sizes. Matching a module is then a dict lookup (exact match) plus a trie walk over the module's catalog number
+    (lazy match), and only the winning class is instantiated for the module.
+
+    When several classes match, the class listed first wins, as with a linear scan.
+
+    The index does not keep a reference to the sample module: classes queued with `defer` are added with the sample
+    module passed to `add_deferred` (the next module matched).
+
+    Args:
+        module_classes: The known introspective module classes, in match priority order.
+        sample_module: A module used to instantiate each class while reading its match key.
+    """
+
+    def __init__(
+        self,
+        module_classes: Sequence[type[IIntrospectiveModule]],
+        sample_module: IModule,
+    ) -> None:
+        self.module_classes: list[type[IIntrospectiveModule]] = []
+        self._deferred: list[type[IIntrospectiveModule]] = []
+        self._orders: dict[type[IIntrospectiveModule], int] = {}
+        self._exact: dict[tuple[Any, ...], int] = {}
+        self._trie = _CatalogTrieNode()
+
+        for im in module_classes:
+            self.add(im, sample_module)
+
+    def __contains__(self, module_class: type[IIntrospectiveModule]) -> bool:
+        return module_class in self._orders
+
+    def __len__(self) -> int:
+        return len(self.module_classes)
+
+    def add(
+        self,
+        module_class: type[IIntrospectiveModule],
+        sample_module: IModule,
+    ) -> bool:
+        """Add a module class to the index, after (with a lower priority than) the classes already in it.
+
+        Only the added class is instantiated, to read its match key.
+
+        Args:
+            module_class: The module class to add.
+            sample_module: A module used to instantiate the class while reading its match key.
+
+        Returns:
+            bool: True if the class was added, False if it was already in the index.
+        """
+        if module_class in self._orders:
+            return False
+        order = len(self.module_classes)
+        imodule = module_class.create_from_module(sample_module)
+        imodule.set_base_module(sample_module)
+        key = get_module_match_key(imodule)
+        self._exact.setdefault(key, order)
+        if isinstance(imodule.catalog_number, str):
+            self._insert_catalog(imodule.catalog_number, order)
+        self.module_classes.append(module_class)
+        self._orders[module_class] = order
+        return True
+
+    def defer(
+        self,
+        module_class: type[IIntrospectiveModule]
+    ) -> None:
+        """Queue a module class to be added by the next `add_deferred` call.
+
+        Args:
+            module_class: The module class to add.
+        """
+        if module_class not in self._orders and module_class not in self._deferred:
+            self._deferred.append(module_class)
+
+    def add_deferred(
+        self,
+        sample_module: IModule
+    ) -> None:
+        """Add the module classes queued with `defer`, in the order they were queued.
+
+        Args:
+            sample_module: A module used to instantiate each class while reading its match key.
+        """
+        deferred, self._deferred = self._deferred, []
+        for im in deferred:
+            self.add(im, sample_module)
+
+    def _insert_catalog(
+        self,
+        catalog_number: str,
+        order: int
+    ) -> None:
+        node = self._trie
+        for char in catalog_number:
+            node = node.children.setdefault(char, _CatalogTrieNode())
+        if node.order is None or order < node.order:
+            node.order = order
+
+    def _find_lazy(
+        self,
+        catalog_number: str
+    ) -> Optional[int]:
+        """Find the first class whose catalog number is contained in a catalog number."""
+        best = self._trie.order
+        for start in range(len(catalog_number)):
+            node = self._trie
+            for char in catalog_number[start:]:
+                node = node.children.get(char)
+                if node is None:
+                    break
+                if node.order is not None and (best is None or node.order < best):
+                    best = node.order
+        return best
+
+    def match(
+        self,
+        module: IModule,
+        lazy_match_catalog: Optional[bool] = False
+    ) -> Optional[type[IIntrospectiveModule]]:
+        """Get the introspective module class matching a module.
+
+        Args:
+            module: The module to match.
+            lazy_match_catalog: Also match classes whose catalog number is contained in the module's catalog number.
+
+        Returns:
+            Optional[type[IIntrospectiveModule]]: The matching class, or None if no class matches.
+        """
+        best = self._exact.get(get_module_match_key(module))
+
+        catalog_number = module.catalog_number
+        if lazy_match_catalog and catalog_number and catalog_number != LAZY_MATCH_EXCLUDED_CATALOG:
+            lazy = self._find_lazy(catalog_number)
+            if lazy is not None and (best is None or lazy < best):
+                best = lazy
+
+        return self.module_classes[best] if best is not None else None
+
 
 class IntrospectiveModuleWarehouseFactory(MetaFactory):
     """Factory for creating ModuleWarehouse instances."""
 
+    _module_index: Optional[IntrospectiveModuleIndex] = None
+    _module_providers: list[ModuleClassProvider] = []
+    _unregistered_module_classes: 'weakref.WeakSet[type[IIntrospectiveModule]]' = weakref.WeakSet()
+
     @classmethod
     def get_all_known_modules(cls) -> List[type[IIntrospectiveModule]]:
         """Get all known module CLASSES from all registered warehouses.
@@ -27,7 +208,132 @@ class IntrospectiveModuleWarehouseFactory(MetaFactory):
             else:
                 log(cls).warning(f'Warehouse class for {warehouse_name} is None')
 
-        return module_classes
+        unregistered = IntrospectiveModuleWarehouseFactory._unregistered_module_classes
+        return [x for x in module_classes if x not in unregistered]
+
+    @classmethod
+    def get_module_index(
+        cls,
+        sample_module: IModule
+    ) -> IntrospectiveModuleIndex:
+        """Get the match index of the known module classes, building it on first use.
+
+        Module classes registered afterwards are added to the index with the next sample module (see
+        `register_module_class`), and registering a new warehouse discards it.
+
+        Args:
+            sample_module: A module used to instantiate each class added to the index by this call.
+
+        Returns:
+            IntrospectiveModuleIndex: The match index.
+        """
+        index = IntrospectiveModuleWarehouseFactory._module_index
+        if index is None:
+            index = IntrospectiveModuleIndex(cls.get_all_known_modules(), sample_module)
+            IntrospectiveModuleWarehouseFactory._module_index = index
+        else:
+            index.add_deferred(sample_module)
+        return index
+
+    @classmethod
+    def register_module_class(
+        cls,
+        module_class: type[IIntrospectiveModule],
+        sample_module: Optional[IModule] = None,
+    ) -> None:
+        """Add a module class registered after the match index was built to the index.
+
+        Called when a module class is created (e.g. on demand by a module class provider), so matching never has to
+        walk the warehouses again. Without a sample module, the class is added on the next match.
+
+        Args:
+            module_class: The module class to add.
+            sample_module: A module used to instantiate the class while reading its match key.
+        """
+        index = IntrospectiveModuleWarehouseFactory._module_index
+        if index is None:
+            return
+        if sample_module is None:
+            index.defer(module_class)
+        else:
+            index.add(module_class, sample_module)
+
+    @classmethod
+    def unregister_module_class(
+        cls,
+        module_class: type[IIntrospectiveModule]
+    ) -> None:
+        """Unregister a module class from the warehouses, e.g. when the configuration it was created from changed.
+
+        The match index is discarded, so the class is no longer matched even if a class with the same match key was
+        registered after it.
+
+        Args:
+            module_class: The module class to unregister.
+        """
+        for warehouse_cls in cls.get_registered_types().values():
+            if not warehouse_cls:
+                continue
+            registered = warehouse_cls.get_registered_types()
+            for name in [name for name, known in registered.items() if known is module_class]:
+                del registered[name]
+        IntrospectiveModuleWarehouseFactory._unregistered_module_classes.add(module_class)
+        cls.invalidate_module_index()
+
+    @classmethod
+    def invalidate_module_index(cls) -> None:
+        """Discard the match index so it is rebuilt on the next match."""
+        IntrospectiveModuleWarehouseFactory._module_index = None
+
+    @classmethod
+    def register_module_provider(
+        cls,
+        provider: ModuleClassProvider
+    ) -> None:
+        """Register a provider of module classes that are not known (imported) yet.
+
+        Providers are asked, in registration order, for a class matching a module only when no known module class
+        matches it. A provider can create (and register) the class on demand, e.g. from a configuration file.
+
+        Args:
+            provider: Callable taking a module and the lazy catalog match flag, returning a matching class or None.
+        """
+        if provider not in IntrospectiveModuleWarehouseFactory._module_providers:
+            IntrospectiveModuleWarehouseFactory._module_providers.append(provider)
+
+    @classmethod
+    def unregister_module_provider(
+        cls,
+        provider: ModuleClassProvider
+    ) -> None:
+        """Unregister a provider of module classes.
+
+        Args:
+            provider: The provider to unregister.
+        """
+        if provider in IntrospectiveModuleWarehouseFactory._module_providers:
+            IntrospectiveModuleWarehouseFactory._module_providers.remove(provider)
+
+    @classmethod
+    def get_module_class_from_providers(
+        cls,
+        module: IModule,
+        lazy_match_catalog: Optional[bool] = False
+    ) -> Optional[type[IIntrospectiveModule]]:
+        """Get a module class matching a module from the registered module class providers.
+
+        Args:
+            module: The module to match.
+            lazy_match_catalog: Also match classes whose catalog number is contained in the module's catalog number.
+
+        Returns:
+            Optional[type[IIntrospectiveModule]]: The class of the first provider that matched, or None.
+        """
+        for provider in list(IntrospectiveModuleWarehouseFactory._module_providers):
+            im = provider(module, bool(lazy_match_catalog))
+            if im:
+                return im
+        return None
 
     @classmethod
     def get_modules_by_type(
@@ -86,7 +392,8 @@ class IntrospectiveModuleWarehouseFactory(MetaFactory):
         lazy_match_catalog: Optional[bool] = False
     ) -> Optional[IIntrospectiveModule]:
         """Create an IntrospectiveModule from a Module instance.
-        This method will attempt to match the module to a known IntrospectiveModule subclass
+        This method will attempt to match the module to a known IntrospectiveModule subclass,
+        then ask the registered module class providers (see register_module_provider).
 
         Args:
             module (Module): The Module instance to wrap.
@@ -103,30 +410,14 @@ class IntrospectiveModuleWarehouseFactory(MetaFactory):
         if not module:
             raise ValueError('Module is required to create an IntrospectiveModule.')
 
-        all_introspective_modules = cls.get_all_known_modules()
-
-        for im in all_introspective_modules:
+        im = cls.get_module_index(module).match(module, lazy_match_catalog)
+        if not im:
+            im = cls.get_module_class_from_providers(module, lazy_match_catalog)
+            if im:
+                cls.register_module_class(im, module)
+        if im:
             imodule = im.create_from_module(module)
             imodule.set_base_module(module)
-
-            if lazy_match_catalog and module.catalog_number and module.catalog_number != 'ETHERNET-MODULE':
-                if imodule.catalog_number in module.catalog_number:
-                    return imodule
-
-            if imodule.catalog_number != module.catalog_number:
-                continue
-            if imodule.input_connection_point != module.input_connection_point:
-                continue
-            if imodule.output_connection_point != module.output_connection_point:
-                continue
-            if imodule.config_connection_point != module.config_connection_point:
-                continue
-            if imodule.input_connection_size != module.input_connection_size:
-                continue
-            if imodule.output_connection_size != module.output_connection_size:
-                continue
-            if imodule.config_connection_size != module.config_connection_size:
-                continue
             return imodule
 
         log(cls).warning(
@@ -160,6 +451,7 @@ class IntrospectiveModuleWarehouse(
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         cls.supports_registering = True  # Subclasses can be used to match
+        IntrospectiveModuleWarehouseFactory.invalidate_module_index()  # The index is rebuilt with the new warehouse
 
     @classmethod
     def get_factory(cls) -> type[IntrospectiveModuleWarehouseFactory]:
@@ -0,0 +1,232 @@
+"""Columnar module network table for controller-wide network checks.
+
+The table is built in a single pass over a controller's modules. Network rules (address ranges, duplicate addresses,
+subnet-by-type policies, RPI expectations and RPI budgets per adapter) then look up the parsed columns of a module's
+row, and the address groups and adapter budgets shared by every module are computed once per table.
+"""
+from array import array
+from collections import defaultdict
+from typing import (
+    Callable,
+    Iterable,
+    Optional,
+)
+
+from pyrox.services.logging import log
+from controlrox.interfaces import IModule, ModuleControlsType
+from .introspective import IntrospectiveModuleWarehouseFactory
+
+__all__ = (
+    'NO_ADDRESS',
+    'NO_RPI',
+    'ModuleNetworkTable',
+    'format_ipv4',
+    'parse_ipv4',
+)
+
+NO_ADDRESS = 0
+NO_RPI = -1.0
+
+
+def parse_ipv4(address: Optional[str]) -> int:
+    """Parse a dotted IPv4 address into an integer.
+
+    Args:
+        address: The address to parse (e.g. '136.129.1.10').
+
+    Returns:
+        int: The address as an integer, or NO_ADDRESS if the value is not a dotted IPv4 address.
+    """
+    if not address:
+        return NO_ADDRESS
+    octets = address.strip().split('.')
+    if len(octets) != 4:
+        return NO_ADDRESS
+    value = 0
+    for octet in octets:
+        if not octet.isdigit():
+            return NO_ADDRESS
+        octet_value = int(octet)
+        if octet_value > 255:
+            return NO_ADDRESS
+        value = (value << 8) | octet_value
+    return value
+
+
+def format_ipv4(value: int) -> str:
+    """Format an integer IPv4 address as a dotted string.
+
+    Args:
+        value: The address as an integer.
+
+    Returns:
+        str: The dotted address.
+    """
+    return '.'.join(str((value >> shift) & 0xFF) for shift in (24, 16, 8, 0))
+
+
+def _parse_rpi(rpi: Optional[str]) -> float:
+    try:
+        return float(rpi) if rpi else NO_RPI
+    except ValueError:
+        return NO_RPI
+
+
+def _default_controls_type_resolver(module: IModule) -> Optional[ModuleControlsType]:
+    get_introspective_module = getattr(module, 'get_introspective_module', None)
+    if get_introspective_module:
+        imodule = get_introspective_module()
+    else:
+        imodule = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(module)
+    return imodule.module_controls_type if imodule else None
+
+
+class ModuleNetworkTable:
+    """Network attributes of every module of a controller, stored as columns.
+
+    Attributes:
+        names: Module names.
+        addresses: Module IPv4 addresses as integers (NO_ADDRESS when the module has none).
+        rpis: Module RPIs in microseconds (NO_RPI when the module has none).
+        controls_types: Module controls types (None when the module could not be introspected).
+        parents: Parent (adapter) module names.
+
+    Args:
+        modules: The modules to build the table from.
+        controls_type_resolver: Callable resolving the controls type of a module.
+            Defaults to matching the module against the introspective module warehouses.
+    """
+
+    def __init__(
+        self,
+        modules: Iterable[IModule],
+        controls_type_resolver: Optional[Callable[[IModule], Optional[ModuleControlsType]]] = None,
+    ) -> None:
+        self._resolver = controls_type_resolver or _default_controls_type_resolver
+        self.names: list[str] = []
+        self.addresses: array = array('L')
+        self.rpis: array = array('d')
+        self.controls_types: list[Optional[ModuleControlsType]] = []
+        self.parents: list[str] = []
+        self._modules: list[IModule] = []
+        self._raw: list[tuple[str, str]] = []
+        self._index: dict[str, int] = {}
+        self._address_groups: Optional[dict[int, list[int]]] = None
+        self._rpi_budget: Optional[dict[str, float]] = None
+
+        for module in modules:
+            self._index[module.name] = len(self.names)
+            self.names.append(module.name)
+            self.addresses.append(NO_ADDRESS)
+            self.rpis.append(NO_RPI)
+            self.controls_types.append(self._resolver(module))
+            self.parents.append('')
+            self._modules.append(module)
+            self._raw.append(('', ''))
+            self._update_row(self._index[module.name], module)
+
+    def __contains__(self, module_name: str) -> bool:
+        return module_name in self._index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _update_row(
+        self,
+        row: int,
+        module: IModule
+    ) -> None:
+        address, rpi = module.ip_address or '', module.rpi or ''
+        self.addresses[row] = parse_ipv4(address)
+        self.rpis[row] = _parse_rpi(rpi)
+        self.parents[row] = module.meta_data.get('@ParentModule', '') if isinstance(module.meta_data, dict) else ''
+        self._raw[row] = (address, rpi)
+        self._address_groups = None
+        self._rpi_budget = None
+
+    def has_module(
+        self,
+        module: IModule
+    ) -> bool:
+        """Check if a module object is the one the table was built from.
+
+        Modules compiled again after the module list of a controller was invalidated are new objects, so a table
+        built before is stale for them.
+        """
+        row = self._index.get(module.name, -1)
+        return row >= 0 and self._modules[row] is module
+
+    def get_row(
+        self,
+        module: IModule
+    ) -> int:
+        """Get the row of a module, re-parsing it if its address or RPI changed since the table was built.
+
+        Args:
+            module: The module to get the row of.
+
+        Returns:
+            int: The row index, or -1 if the module is not in the table.
+        """
+        row = self._index.get(module.name, -1)
+        if row >= 0 and self._raw[row] != (module.ip_address or '', module.rpi or ''):
+            self._update_row(row, module)
+        return row
+
+    def get_octet(
+        self,
+        row: int,
+        octet: int
+    ) -> int:
+        """Get one octet (0 - 3) of the address in a row."""
+        return (self.addresses[row] >> (8 * (3 - octet))) & 0xFF
+
+    def get_addressed_rows(self) -> list[int]:
+        """Get the rows of every module that has an IPv4 address."""
+        return [row for row, address in enumerate(self.addresses) if address != NO_ADDRESS]
+
+    def _get_address_groups(self) -> dict[int, list[int]]:
+        if self._address_groups is None:
+            groups: dict[int, list[int]] = defaultdict(list)
+            for row, address in enumerate(self.addresses):
+                if address != NO_ADDRESS:
+                    groups[address].append(row)
+            self._address_groups = dict(groups)
+        return self._address_groups
+
+    def get_rows_sharing_address(
+        self,
+        row: int
+    ) -> list[int]:
+        """Get the other rows that have the same address as a row.
+
+        Args:
+            row: The row to check.
+
+        Returns:
+            list[int]: The other rows with the same address.
+        """
+        address = self.addresses[row]
+        if address == NO_ADDRESS:
+            return []
+        return [x for x in self._get_address_groups().get(address, []) if x != row]
+
+    def get_rpi_budget_by_parent(self) -> dict[str, float]:
+        """Get the total connection packets per second produced through each parent (adapter) module.
+
+        Returns:
+            dict[str, float]: The parent module name mapped to its packets per second.
+        """
+        if self._rpi_budget is None:
+            budget: dict[str, float] = defaultdict(float)
+            for row, rpi in enumerate(self.rpis):
+                if rpi > 0:
+                    budget[self.parents[row]] += 1_000_000.0 / rpi
+            self._rpi_budget = dict(budget)
+        return self._rpi_budget
+
+    def log_summary(self) -> None:
+        """Log the number of addressed modules and the RPI budget of each adapter."""
+        log(self).info(f'Module network table: {len(self)} modules, {len(self.get_addressed_rows())} addressed.')
+        for parent, packets_per_second in sorted(self.get_rpi_budget_by_parent().items()):
+            log(self).info(f'RPI budget for {parent or "<no parent>"}: {packets_per_second:.1f} packets/s')
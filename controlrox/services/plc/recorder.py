@@ -0,0 +1,396 @@
+"""PLC value recorder.
+
+The recorder captures every read of the watched tags of a PLC connection (not only the changes published to watch
+callbacks), as timestamped samples in a fixed-size ring buffer per tag, so recording for minutes at the RPI takes a
+bounded amount of memory and an O(1) append per sample.
+
+Samples can be flushed in the background to a recording file: a zip archive of chunks, each chunk a JSON manifest of
+the tags and sample counts it holds and a binary entry of their columns (times, then values, as little-endian
+doubles), appended on every flush.
+"""
+import json
+import sys
+import threading
+import zipfile
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from pylogix.lgx_response import Response
+from pyrox.services import log
+
+__all__ = (
+    'PlcRecorder',
+    'SampleBuffer',
+    'decimate',
+)
+
+Samples = tuple[array, array]
+
+
+def _to_sample(value: Any) -> Optional[float]:
+    """Get the numeric sample of a tag value, None for values that can not be plotted (strings, structures)."""
+    if isinstance(value, (bool, int, float)):
+        return float(value)
+    return None
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array('d', values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data: bytes) -> array:
+    values = array('d')
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def decimate(
+    times: array,
+    values: array,
+    max_points: int = 1000
+) -> tuple[list[float], list[float]]:
+    """Decimate samples for plotting.
+
+    The samples are split in `max_points / 2` buckets, each reduced to its minimum and maximum sample in time order,
+    so peaks survive the decimation.
+
+    Returns:
+        tuple[list[float], list[float]]: The times and values of at most `max_points` samples.
+    """
+    count = len(times)
+    if count <= max_points:
+        return times.tolist(), values.tolist()
+
+    buckets = max(1, max_points // 2)
+    result_times: list[float] = []
+    result_values: list[float] = []
+    for bucket in range(buckets):
+        first = bucket * count // buckets
+        chunk = values[first:(bucket + 1) * count // buckets]
+        low = first + chunk.index(min(chunk))
+        high = first + chunk.index(max(chunk))
+        for index in sorted({low, high}):
+            result_times.append(times[index])
+            result_values.append(values[index])
+    return result_times, result_values
+
+
+class SampleBuffer:
+    """Ring buffer of the timestamped samples of one tag, preallocated to a fixed capacity.
+
+    Once full, each new sample overwrites the oldest. Samples are expected in increasing time order.
+
+    Args:
+        capacity: The number of samples kept.
+    """
+    __slots__ = ('capacity', 'times', 'values', 'total', '_start', '_count')
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError('Capacity must be at least 1')
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))
+        self.values = array('d', bytes(8 * capacity))
+        self.total = 0
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(
+        self,
+        timestamp: float,
+        value: float
+    ) -> None:
+        """Append a sample, overwriting the oldest one if the buffer is full."""
+        if self._count < self.capacity:
+            index = (self._start + self._count) % self.capacity
+            self._count += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self.capacity
+        self.times[index] = timestamp
+        self.values[index] = value
+        self.total += 1
+
+    def _bisect(
+        self,
+        timestamp: float,
+        right: bool = False
+    ) -> int:
+        """Get the position of a time among the samples, in order from the oldest."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            value = self.times[(self._start + middle) % self.capacity]
+            if value < timestamp or (right and value == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _slice(
+        self,
+        first: int,
+        last: int
+    ) -> Samples:
+        """Copy the samples between two positions, in order from the oldest."""
+        if last <= first:
+            return array('d'), array('d')
+        start = (self._start + first) % self.capacity
+        end = start + last - first
+        if end <= self.capacity:
+            return self.times[start:end], self.values[start:end]
+        end -= self.capacity
+        return self.times[start:] + self.times[:end], self.values[start:] + self.values[:end]
+
+    def get_range(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Samples:
+        """Get the samples between two times (inclusive, open ended if None).
+
+        Returns:
+            tuple[array, array]: The times and values of the samples.
+        """
+        first = 0 if start is None else self._bisect(start)
+        last = self._count if end is None else self._bisect(end, right=True)
+        return self._slice(first, last)
+
+    def get_since(self, total: int) -> tuple[Samples, int]:
+        """Get the samples appended after the first `total` samples.
+
+        Returns:
+            tuple: The times and values of the samples still in the buffer, and the number of samples that were
+                overwritten before they could be returned.
+        """
+        new = self.total - total
+        count = min(new, self._count)
+        return self._slice(self._count - count, self._count), new - count
+
+    def get_decimated(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        max_points: int = 1000
+    ) -> tuple[list[float], list[float]]:
+        """Get the samples between two times, decimated to at most `max_points` for plotting (see `decimate`).
+        """
+        return decimate(*self.get_range(start, end), max_points)
+
+
+class PlcRecorder:
+    """Records the watch table reads of a PLC connection in ring buffers, flushing them to a file in the background.
+
+    Args:
+        capacity: The number of samples kept in memory per tag (16 bytes each, allocated when a tag is first recorded).
+        path: The recording file flushed to, None to keep the samples in memory only.
+        flush_interval: Seconds between background flushes.
+        tags: The tags to record, None for every watched tag.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 60000,
+        path: Optional[Union[Path, str]] = None,
+        flush_interval: float = 5.0,
+        tags: Optional[Iterable[str]] = None
+    ) -> None:
+        self.capacity = capacity
+        self.path = Path(path) if path else None
+        self.flush_interval = flush_interval
+        self.tags = set(tags) if tags is not None else None
+        self.dropped = 0
+        self.skipped = 0
+        self._buffers: dict[str, SampleBuffer] = {}
+        self._flushed: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._connection: Any = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self) -> str:
+        return f'PlcRecorder(tags={len(self._buffers)}, capacity={self.capacity}, path={self.path})'
+
+    @property
+    def is_recording(self) -> bool:
+        return self._connection is not None
+
+    def start(self, connection: Any) -> None:
+        """Start recording the watch table reads of a connection, and flushing in the background if there is a path.
+
+        Args:
+            connection: The PLC connection (or the connection manager).
+        """
+        if self._connection is not None:
+            return
+        self._connection = connection
+        connection.subscribe_to_reads(self.record_responses)
+        if self.path is not None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run_flush, name='plc-recorder', daemon=True)
+            self._thread.start()
+        log(self).info(f'Started recording to {self.path or "memory"}')
+
+    def stop(self) -> None:
+        """Stop recording, and flush the samples not flushed yet."""
+        if self._connection is None:
+            return
+        self._connection.unsubscribe_from_reads(self.record_responses)
+        self._connection = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.path is not None:
+            self.flush()
+        log(self).info('Stopped recording')
+
+    def _run_flush(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                log(self).error(f'Error flushing recording: {e}')
+
+    def record(
+        self,
+        tag_name: str,
+        timestamp: float,
+        value: Any
+    ) -> bool:
+        """Record a sample of a tag.
+
+        Returns:
+            bool: True if the sample was recorded, False if the tag is not recorded or the value is not numeric.
+        """
+        with self._lock:
+            return self._record(tag_name, timestamp, value)
+
+    def _record(
+        self,
+        tag_name: str,
+        timestamp: float,
+        value: Any
+    ) -> bool:
+        if self.tags is not None and tag_name not in self.tags:
+            return False
+        sample = _to_sample(value)
+        if sample is None:
+            self.skipped += 1
+            return False
+        buffer = self._buffers.get(tag_name)
+        if buffer is None:
+            buffer = self._buffers[tag_name] = SampleBuffer(self.capacity)
+        buffer.append(timestamp, sample)
+        return True
+
+    def record_responses(
+        self,
+        timestamp: float,
+        responses: list[Response]
+    ) -> None:
+        """Record the successful responses of a batch of reads (the read subscriber of the connection)."""
+        with self._lock:
+            for response in responses:
+                if response.Status == 'Success':
+                    self._record(response.TagName, timestamp, response.Value)
+
+    def clear(self) -> None:
+        """Drop the samples in memory."""
+        with self._lock:
+            self._buffers.clear()
+            self._flushed.clear()
+
+    def get_tags(self) -> list[str]:
+        """Get the names of the tags with samples in memory."""
+        with self._lock:
+            return list(self._buffers)
+
+    def get_samples(
+        self,
+        tag_name: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Samples:
+        """Get the samples of a tag between two times (seconds since the epoch, inclusive, open ended if None).
+
+        Returns:
+            tuple[array, array]: The times and values of the samples, empty if the tag has none.
+        """
+        with self._lock:
+            buffer = self._buffers.get(tag_name)
+            if buffer is None:
+                return array('d'), array('d')
+            return buffer.get_range(start, end)
+
+    def get_decimated(
+        self,
+        tag_name: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        max_points: int = 1000
+    ) -> tuple[list[float], list[float]]:
+        """Get the samples of a tag between two times, decimated to at most `max_points` for plotting.
+        """
+        return decimate(*self.get_samples(tag_name, start, end), max_points)
+
+    def flush(self) -> int:
+        """Append the samples recorded since the last flush to the recording file, as one chunk.
+
+        Samples overwritten in memory before they could be flushed are counted in `dropped`.
+
+        Returns:
+            int: The number of samples written.
+        """
+        if self.path is None:
+            return 0
+        with self._flush_lock:
+            chunk: dict[str, Samples] = {}
+            with self._lock:
+                for tag_name, buffer in self._buffers.items():
+                    samples, dropped = buffer.get_since(self._flushed.get(tag_name, 0))
+                    self._flushed[tag_name] = buffer.total
+                    self.dropped += dropped
+                    if samples[0]:
+                        chunk[tag_name] = samples
+            if not chunk:
+                return 0
+
+            manifest = {'tags': {tag_name: len(times) for tag_name, (times, _) in chunk.items()}}
+            data = b''.join(_to_bytes(times) + _to_bytes(values) for times, values in chunk.values())
+            with zipfile.ZipFile(self.path, 'a', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+                name = f'chunk{sum(x.endswith(".json") for x in archive.namelist()):06d}'
+                archive.writestr(f'{name}.json', json.dumps(manifest))
+                archive.writestr(f'{name}.bin', data)
+            return sum(manifest['tags'].values())
+
+    @staticmethod
+    def load(path: Union[Path, str]) -> dict[str, Samples]:
+        """Load the samples of a recording file.
+
+        Returns:
+            dict[str, tuple[array, array]]: Tag names mapped to the times and values of their samples.
+        """
+        samples: dict[str, Samples] = {}
+        with zipfile.ZipFile(path, 'r') as archive:
+            for name in sorted(x for x in archive.namelist() if x.endswith('.json')):
+                manifest = json.loads(archive.read(name))
+                data = archive.read(f'{name[:-5]}.bin')
+                offset = 0
+                for tag_name, count in manifest['tags'].items():
+                    size = count * 8
+                    times, values = samples.setdefault(tag_name, (array('d'), array('d')))
+                    times.extend(_from_bytes(data[offset:offset + size]))
+                    values.extend(_from_bytes(data[offset + size:offset + 2 * size]))
+                    offset += 2 * size
+        return samples
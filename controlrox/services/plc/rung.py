@@ -1,5 +1,286 @@
+"""Rung services: the rung factory and rung templates.
+
+A rung template holds rung text with named placeholders (e.g. ``COP({source},{module.name}:I,1);``). The text is
+tokenized, validated and sequenced once when the template is created. Binding a vector of operands to the template
+then only substitutes the placeholders, producing rung meta data, tokens and a compiled sequence without parsing
+the rung text again, so thousands of similar rungs can be stamped out from one template.
+"""
+import functools
+import re
+from dataclasses import replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
 from pyrox.models.factory import MetaFactory
+from controlrox.interfaces.plc.rung import RungElement, RungElementType
+from .instruction import InstructionSequenceBuilder, tokenize_rung_text
+
+if TYPE_CHECKING:
+    from controlrox.interfaces import IController, IRoutine, IRung
+
+__all__ = (
+    'PLACEHOLDER_PATTERN',
+    'RungFactory',
+    'RungTemplate',
+    'get_rung_template',
+)
+
+# Named placeholders, e.g. {source} or {module.parent_module}
+PLACEHOLDER_PATTERN = re.compile(r'\{([A-Za-z_][A-Za-z0-9_.]*)\}')
+
+# Characters a bound operand can not hold, as they would change how the rung is tokenized
+_INVALID_OPERAND_CHARACTERS = frozenset('();')
+
+_BRANCH_TOKENS = ('[', ']', ',')
+
+OperandVector = Union[Mapping[str, Any], Sequence[Any]]
 
 
 class RungFactory(MetaFactory):
     pass
+
+
+class RungTemplate:
+    """Rung text with named placeholders, tokenized and validated once.
+
+    Placeholders can only be used inside instructions (as operands or parts of operands), so that binding operands
+    never changes the structure of the rung.
+
+    Attributes:
+        text: The rung text template.
+        comment: The rung comment template (may use placeholders as well).
+        rung_type: The rung type written to the meta data of created rungs.
+        fields: The placeholder names, in order of first use (text first, then comment).
+
+    Args:
+        text: The rung text template.
+        comment: The rung comment template.
+        rung_type: The rung type written to the meta data of created rungs.
+
+    Raises:
+        ValueError: If the text has no instructions, unbalanced branches or placeholders outside of instructions.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        comment: str = '',
+        rung_type: str = 'N',
+    ) -> None:
+        self.text = text
+        self.comment = comment
+        self.rung_type = rung_type
+        self._text_parts = tuple(PLACEHOLDER_PATTERN.split(text))
+        self._comment_parts = tuple(PLACEHOLDER_PATTERN.split(comment))
+        self._text_fields = frozenset(self._text_parts[1::2])
+        self.fields: tuple[str, ...] = tuple(dict.fromkeys(self._text_parts[1::2] + self._comment_parts[1::2]))
+
+        tokens = tokenize_rung_text(text)
+        self._validate(tokens)
+        self._tokens = tuple(tokens)
+        self._token_parts = tuple(
+            None if token in _BRANCH_TOKENS else tuple(PLACEHOLDER_PATTERN.split(token))
+            for token in tokens
+        )
+        try:
+            self._sequence = tuple(InstructionSequenceBuilder(tokens).build_sequence())
+        except (IndexError, KeyError, ValueError) as e:
+            raise ValueError(f'Invalid rung template {text!r}: {e}') from e
+
+    def __repr__(self) -> str:
+        return f'RungTemplate(text={self.text!r}, fields={self.fields})'
+
+    def _validate(
+        self,
+        tokens: list[str]
+    ) -> None:
+        instructions = [x for x in tokens if x not in _BRANCH_TOKENS]
+        if not instructions:
+            raise ValueError(f'Rung template {self.text!r} has no instructions.')
+        if tokens.count('[') != tokens.count(']'):
+            raise ValueError(f'Rung template {self.text!r} has unbalanced branches.')
+        placeholders = sum(len(PLACEHOLDER_PATTERN.findall(x)) for x in instructions)
+        if placeholders != len(self._text_parts) // 2:
+            raise ValueError(f'Rung template {self.text!r} has placeholders outside of instructions.')
+
+    @staticmethod
+    def _render(
+        parts: tuple[str, ...],
+        values: Mapping[str, str]
+    ) -> str:
+        if len(parts) == 1:
+            return parts[0]
+        return ''.join(values[x] if i % 2 else x for i, x in enumerate(parts))
+
+    def bind(
+        self,
+        operands: OperandVector
+    ) -> dict[str, str]:
+        """Bind operands to the placeholders of the template.
+
+        Args:
+            operands: The placeholder names mapped to their operands, or a sequence of operands in field order.
+
+        Returns:
+            dict[str, str]: The placeholder names mapped to their operand text.
+
+        Raises:
+            ValueError: If an operand is missing or would change the structure of the rung.
+        """
+        if isinstance(operands, Mapping):
+            missing = [x for x in self.fields if x not in operands]
+            if missing:
+                raise ValueError(f'Missing operands for {missing} in rung template {self.text!r}')
+            values = {x: str(operands[x]) for x in self.fields}
+        else:
+            if len(operands) != len(self.fields):
+                raise ValueError(
+                    f'Rung template {self.text!r} takes {len(self.fields)} operands, got {len(operands)}'
+                )
+            values = {x: str(v) for x, v in zip(self.fields, operands)}
+
+        for field in self._text_fields:
+            if _INVALID_OPERAND_CHARACTERS.intersection(values[field]):
+                raise ValueError(f'Invalid operand {values[field]!r} for {field} in rung template {self.text!r}')
+        return values
+
+    def render(
+        self,
+        operands: OperandVector
+    ) -> str:
+        """Render the rung text for a vector of operands."""
+        return self._render(self._text_parts, self.bind(operands))
+
+    def render_comment(
+        self,
+        operands: OperandVector
+    ) -> str:
+        """Render the rung comment for a vector of operands."""
+        return self._render(self._comment_parts, self.bind(operands))
+
+    def _create_tokens(
+        self,
+        values: Mapping[str, str]
+    ) -> list[str]:
+        return [
+            token if parts is None else self._render(parts, values)
+            for token, parts in zip(self._tokens, self._token_parts)
+        ]
+
+    def render_tokens(
+        self,
+        operands: OperandVector
+    ) -> list[str]:
+        """Get the instruction and branch marker tokens of the rung for a vector of operands."""
+        return self._create_tokens(self.bind(operands))
+
+    def _create_sequence(
+        self,
+        tokens: list[str]
+    ) -> list[RungElement]:
+        return [
+            replace(x, instruction=tokens[x.position]) if x.element_type == RungElementType.INSTRUCTION else replace(x)
+            for x in self._sequence
+        ]
+
+    def create_sequence(
+        self,
+        operands: OperandVector
+    ) -> list[RungElement]:
+        """Get the compiled sequence of the rung for a vector of operands, without tokenizing the rung text."""
+        return self._create_sequence(self.render_tokens(operands))
+
+    def create_meta_data(
+        self,
+        operands: OperandVector,
+        rung_number: int = 0
+    ) -> dict:
+        """Create the meta data of a rung for a vector of operands.
+
+        Args:
+            operands: The operands to bind.
+            rung_number: The number of the rung.
+
+        Returns:
+            dict: The rung meta data.
+        """
+        values = self.bind(operands)
+        return {
+            '@Number': rung_number,
+            '@Type': self.rung_type,
+            'Comment': self._render(self._comment_parts, values),
+            'Text': self._render(self._text_parts, values),
+        }
+
+    def create_rung(
+        self,
+        controller: 'IController',
+        operands: OperandVector,
+        routine: Optional['IRoutine'] = None,
+        rung_number: int = -1
+    ) -> 'IRung':
+        """Create a rung for a vector of operands, with its sequence already compiled.
+
+        Args:
+            controller: The controller creating the rung.
+            operands: The operands to bind.
+            routine: The routine of the rung.
+            rung_number: The number of the rung.
+
+        Returns:
+            IRung: The rung.
+        """
+        values = self.bind(operands)
+        rung = controller.create_rung(
+            meta_data={
+                '@Number': rung_number,
+                '@Type': self.rung_type,
+                'Comment': self._render(self._comment_parts, values),
+                'Text': self._render(self._text_parts, values),
+            },
+            routine=routine,
+            rung_number=rung_number
+        )
+        rung.set_sequence(self._create_sequence(self._create_tokens(values)))
+        return rung
+
+    def create_rungs(
+        self,
+        controller: 'IController',
+        operand_vectors: Sequence[OperandVector],
+        routine: Optional['IRoutine'] = None
+    ) -> list['IRung']:
+        """Create one rung per vector of operands.
+
+        Args:
+            controller: The controller creating the rungs.
+            operand_vectors: The operands to bind, one vector per rung.
+            routine: The routine of the rungs.
+
+        Returns:
+            list[IRung]: The rungs, in the order of the operand vectors.
+        """
+        return [self.create_rung(controller, x, routine) for x in operand_vectors]
+
+
+@functools.lru_cache(maxsize=4096)
+def get_rung_template(
+    text: str,
+    comment: str = ''
+) -> RungTemplate:
+    """Get a rung template, creating (tokenizing and validating) it only once per text and comment.
+
+    Args:
+        text: The rung text template.
+        comment: The rung comment template.
+
+    Returns:
+        RungTemplate: The template.
+    """
+    return RungTemplate(text, comment)
@@ -0,0 +1,179 @@
+"""PLC I/O scheduler.
+
+A dedicated timing thread keeps the due tasks of all PLC connections in a heap and hands each due task to a shared
+worker pool, so blocking pylogix requests never run on the GUI main loop or on the timing thread itself, and a slow
+PLC (or a slow rate bucket) does not delay the tasks of the others.
+"""
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from pyrox.services import log
+
+__all__ = (
+    'BucketStatistics',
+    'PlcIoScheduler',
+)
+
+
+@dataclass
+class BucketStatistics:
+    """Timing statistics of a rate bucket (a batch of watched tags sharing an update rate).
+
+    Jitter is how late a batch started compared to its due time, latency is how long the batched request took,
+    both in seconds. An overrun is a period missed because the previous batch took too long.
+    """
+    rate: int
+    tags: int = 0
+    runs: int = 0
+    overruns: int = 0
+    errors: int = 0
+    last_jitter: float = 0.0
+    max_jitter: float = 0.0
+    total_jitter: float = 0.0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        return self.total_jitter / self.runs if self.runs else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.runs if self.runs else 0.0
+
+    def record(
+        self,
+        jitter: float,
+        latency: float
+    ) -> None:
+        """Record the timing of one batch.
+        """
+        self.runs += 1
+        self.last_jitter = jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+        self.total_jitter += jitter
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.total_latency += latency
+
+
+class PlcIoScheduler:
+    """Dedicated I/O thread running scheduled PLC tasks on a worker pool.
+
+    The scheduling interface matches `TimerService` (`schedule_task`, `cancel_task`, `clear_all_tasks`,
+    `shutdown`). The timing thread and the worker pool are started on first use.
+
+    Args:
+        max_workers: The number of worker threads running tasks.
+        name: The name prefix of the scheduler threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        name: str = 'plc-io'
+    ) -> None:
+        self.max_workers = max_workers
+        self.name = name
+        self._tasks: dict[str, Callable[[], None]] = {}
+        self._queue: list[tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def _start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        self._thread = threading.Thread(target=self._run, name=f'{self.name}-timer', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        with self._condition:
+            while self._running:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                due, _, task_id = self._queue[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._queue)
+                callback = self._tasks.pop(task_id, None)
+                if callback is not None and self._executor is not None:
+                    self._executor.submit(self._run_task, task_id, callback)
+
+    def _run_task(
+        self,
+        task_id: str,
+        callback: Callable[[], None]
+    ) -> None:
+        try:
+            callback()
+        except Exception as e:
+            log(self).error('Error in scheduled PLC task %s: %s', task_id, e)
+
+    def schedule_task(
+        self,
+        callback: Callable[[], None],
+        delay: float
+    ) -> str:
+        """Schedule a task to run on the worker pool.
+
+        Args:
+            callback: The task.
+            delay: Seconds until the task is due.
+
+        Returns:
+            str: The id of the task.
+        """
+        with self._condition:
+            self._start()
+            task_id = f'{self.name}-{next(self._counter)}'
+            self._tasks[task_id] = callback
+            heapq.heappush(self._queue, (time.monotonic() + max(0.0, delay), next(self._counter), task_id))
+            self._condition.notify()
+            return task_id
+
+    def cancel_task(self, task_id: str) -> bool:
+        """Cancel a task that is not due yet.
+
+        Returns:
+            bool: True if the task was cancelled, False if not found
+        """
+        with self._condition:
+            return self._tasks.pop(task_id, None) is not None
+
+    def clear_all_tasks(self) -> None:
+        """Cancel all tasks that are not due yet."""
+        with self._condition:
+            self._tasks.clear()
+            self._queue.clear()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Cancel all pending tasks and stop the timing thread and the worker pool.
+
+        Args:
+            wait: Whether to wait for running tasks to finish.
+        """
+        with self._condition:
+            self._tasks.clear()
+            self._queue.clear()
+            self._running = False
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
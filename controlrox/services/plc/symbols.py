@@ -0,0 +1,254 @@
+"""PLC symbol cache.
+
+Reading a tag by name makes the PLC resolve the symbolic path of the tag on every request, and unless the data type
+is given, pylogix first reads the tag once to discover its type. The symbol cache keeps what the tag list of a
+controller tells about its symbols (instance ids, data types and structure handles), so reads and writes can skip the
+type discovery and address controller tags by their symbol instance instead of by name.
+
+Caches are persisted next to the project file, keyed by the controller name and the modified date of the project.
+"""
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from struct import pack
+from typing import Any, Iterable, Optional, Union
+
+from pylogix import PLC
+from pyrox.services import log
+
+__all__ = (
+    'SymbolCache',
+    'SymbolInfo',
+    'SymbolInstancePLC',
+    'get_symbol_cache_path',
+)
+
+PATH_ERRORS = ('Path segment error', 'Path destination unknown')
+
+_ARRAY_INDEX = re.compile(r'\[[^\]]*\]$')
+
+# CIP elementary data types (BOOL to LWORD); other symbol types are programs, routines, modules and the like
+_ATOMIC_TYPES = range(0xC1, 0xDF)
+
+
+def get_symbol_cache_path(project_path: Union[Path, str]) -> Path:
+    """Get the path of the symbol cache persisted next to a project file.
+
+    Args:
+        project_path: The path of the project file.
+
+    Returns:
+        Path: The path of the symbol cache file.
+    """
+    path = Path(project_path)
+    return path.with_name(f'{path.stem}.symbols.json')
+
+
+def _split_symbol_name(tag_name: str) -> tuple[str, list[str]]:
+    """Split a tag name into the name of its symbol (without array index) and the member path after it."""
+    segments = tag_name.split('.')
+    count = 2 if segments[0].startswith('Program:') and len(segments) > 1 else 1
+    return _ARRAY_INDEX.sub('', '.'.join(segments[:count])), segments[count:]
+
+
+@dataclass
+class SymbolInfo:
+    """A symbol of the controller tag list.
+
+    Attributes:
+        name: The name of the symbol, prefixed by 'Program:<name>.' for program tags.
+        instance_id: The instance of the symbol in the symbol object of the controller.
+        data_type: The atomic data type code of the symbol (or of its elements), 0 for structures.
+        template_id: The structure handle (template instance) of a structure symbol, 0 for atomic symbols.
+        array: The number of array dimensions.
+        size: The number of elements of the first array dimension.
+        data_type_name: The name of the structure data type, if known.
+    """
+    name: str
+    instance_id: int
+    data_type: int = 0
+    template_id: int = 0
+    array: int = 0
+    size: int = 0
+    data_type_name: str = ''
+
+    @property
+    def is_program_tag(self) -> bool:
+        return self.name.startswith('Program:')
+
+    @property
+    def is_struct(self) -> bool:
+        return self.template_id != 0
+
+    @classmethod
+    def from_tag(cls, tag: Any) -> 'SymbolInfo':
+        """Get the symbol of a pylogix tag list entry.
+        """
+        struct = bool(tag.Struct)
+        return cls(
+            name=tag.TagName,
+            instance_id=tag.InstanceID,
+            data_type=tag.SymbolType if not struct and tag.SymbolType in _ATOMIC_TYPES else 0,
+            template_id=tag.DataTypeValue if struct else 0,
+            array=tag.Array,
+            size=tag.Size,
+            data_type_name=tag.DataType if struct else '',
+        )
+
+
+class SymbolCache:
+    """Symbols of one controller, by name.
+
+    Data types are safe to reuse from a persisted cache: batched reads take the type of the reply, and the PLC rejects
+    writes of the wrong type. Instance ids change when a different project is downloaded, so they are only used from
+    a cache built from the tag list of the running session (`live`), and are dropped as soon as the PLC rejects a path.
+
+    Args:
+        controller_name: The name of the controller.
+        modified_date: The modified date of the project the cache was built for.
+        symbols: The symbols of the controller.
+        live: Whether the cache was built from the tag list of the current PLC session.
+    """
+
+    def __init__(
+        self,
+        controller_name: str = '',
+        modified_date: str = '',
+        symbols: Optional[Iterable[SymbolInfo]] = None,
+        live: bool = False
+    ) -> None:
+        self.controller_name = controller_name
+        self.modified_date = modified_date
+        self.symbols: dict[str, SymbolInfo] = {x.name: x for x in symbols or ()}
+        self.live = live
+
+    def __repr__(self) -> str:
+        return f'SymbolCache(controller_name={self.controller_name!r}, symbols={len(self.symbols)}, live={self.live})'
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, tag_name: str) -> bool:
+        return self.get_symbol(tag_name) is not None
+
+    @classmethod
+    def from_tag_list(
+        cls,
+        tags: Iterable[Any],
+        controller_name: str = '',
+        modified_date: str = ''
+    ) -> 'SymbolCache':
+        """Build a live cache from the tag list read from the PLC (the value of a `GetTagList` response).
+        """
+        return cls(controller_name, modified_date, [SymbolInfo.from_tag(x) for x in tags], live=True)
+
+    def matches(
+        self,
+        controller_name: str,
+        modified_date: str
+    ) -> bool:
+        """Whether the cache was built for a controller name and project modified date.
+        """
+        return self.controller_name == controller_name and self.modified_date == modified_date
+
+    def get_symbol(self, tag_name: str) -> Optional[SymbolInfo]:
+        """Get the symbol a tag name refers to (the array, structure or word of an element, member or bit).
+        """
+        return self.symbols.get(_split_symbol_name(tag_name)[0])
+
+    def get_data_type(self, tag_name: str) -> int:
+        """Get the atomic data type code of a tag.
+
+        Returns:
+            int: The data type code, 0 if unknown (unknown symbols and members of structures).
+        """
+        name, members = _split_symbol_name(tag_name)
+        symbol = self.symbols.get(name)
+        if symbol is None or symbol.is_struct:
+            return 0
+        if not members or (len(members) == 1 and members[0].isdigit()):
+            return symbol.data_type
+        return 0
+
+    def get_instance_ids(self) -> dict[str, int]:
+        """Get the instance ids usable to address controller tags, none unless the cache is live.
+        """
+        if not self.live:
+            return {}
+        return {x.name: x.instance_id for x in self.symbols.values() if not x.is_program_tag}
+
+    def seed(self, known_tags: dict[str, tuple[int, int]]) -> None:
+        """Seed the known tags of a pylogix connection with the atomic data types of the cache.
+        """
+        for symbol in self.symbols.values():
+            if symbol.data_type and not symbol.is_struct:
+                known_tags.setdefault(symbol.name, (symbol.data_type, 0))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'controller_name': self.controller_name,
+            'modified_date': self.modified_date,
+            'symbols': [asdict(x) for x in self.symbols.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'SymbolCache':
+        return cls(
+            controller_name=data.get('controller_name', ''),
+            modified_date=data.get('modified_date', ''),
+            symbols=[SymbolInfo(**x) for x in data.get('symbols', [])],
+        )
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Persist the cache to a JSON file.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[Path, str],
+        controller_name: str,
+        modified_date: str
+    ) -> Optional['SymbolCache']:
+        """Load a persisted cache, if it exists and was built for the controller name and project modified date.
+
+        Returns:
+            Optional[SymbolCache]: The cache, None if it is missing, unreadable or stale.
+        """
+        if not Path(path).is_file():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cache = cls.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            log(cls).warning('Could not load symbol cache %s: %s', path, e)
+            return None
+        if not cache.matches(controller_name, modified_date):
+            log(cls).info('Ignoring stale symbol cache %s', path)
+            return None
+        return cache
+
+
+class SymbolInstancePLC(PLC):
+    """pylogix PLC addressing controller tags by symbol instance.
+
+    The symbolic segment of the tag name (two bytes plus the padded name) is replaced by a six byte logical path to
+    the instance of the symbol object, so the PLC does not need to look the name up. Members, array indexes and
+    program tags keep their symbolic segments.
+    """
+    __slots__ = ('InstanceIDs',)
+
+    def __init__(self, *args, instance_ids: Optional[dict[str, int]] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.InstanceIDs = instance_ids or {}
+
+    def _build_ioi(self, tag_name, data_type):
+        ioi = super()._build_ioi(tag_name, data_type)
+        instance_id = self.InstanceIDs.get(tag_name.split('.', 1)[0].split('[', 1)[0])
+        if instance_id is None or not ioi or ioi[0] != 0x91:
+            return ioi
+        name_length = ioi[1] + ioi[1] % 2
+        return pack('<BBBBH', 0x20, 0x6B, 0x25, 0x00, instance_id) + ioi[2 + name_length:]
@@ -0,0 +1,68 @@
+"""Benchmark of watch table reads against a local stand-in PLC.
+
+Reads a watch table of DINT tags from a :class:`LogixServer` one request per tag, in batched multi-tag requests, and
+in batched requests addressing the tags by symbol instance, and reports the tags read per second for each.
+
+Run with ``python -m controlrox.services.plc.test.bench_watch_table [tag_count] [rounds]``.
+"""
+import sys
+import time
+
+from controlrox.services.plc.connection import PlcSession
+from controlrox.services.plc.symbols import SymbolCache
+from controlrox.services.plc.test.lgx_server import DINT, LogixServer
+
+
+def _measure(
+    read_round,
+    tag_count: int,
+    rounds: int
+) -> float:
+    """Get the tags read per second over a number of rounds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        read_round()
+    return tag_count * rounds / (time.perf_counter() - start)
+
+
+def run(
+    tag_count: int = 500,
+    rounds: int = 20
+) -> dict[str, float]:
+    """Benchmark per-tag and batched reads of a watch table.
+
+    Args:
+        tag_count: The number of watched tags.
+        rounds: The number of times the watch table is read.
+
+    Returns:
+        dict[str, float]: The tags read per second, by read mode.
+    """
+    tags = [(f'WatchTableTag{i}', DINT) for i in range(tag_count)]
+    with LogixServer({name: (DINT, i) for i, (name, _) in enumerate(tags)}) as server:
+        session = PlcSession('127.0.0.1', port=server.port)
+        try:
+            session.open()
+            results = {
+                'per_tag': _measure(lambda: [session.read(name, datatype=dt) for name, dt in tags], tag_count, rounds),
+                'batched': _measure(lambda: session.read_tags(tags), tag_count, rounds),
+            }
+            session.set_symbol_cache(SymbolCache.from_tag_list(session.get_tag_list().Value))
+            results['instance'] = _measure(lambda: session.read_tags(tags), tag_count, rounds)
+            return results
+        finally:
+            session.close()
+
+
+def main(argv: list[str]) -> None:
+    tag_count = int(argv[0]) if argv else 500
+    rounds = int(argv[1]) if len(argv) > 1 else 20
+    results = run(tag_count, rounds)
+    for mode, rate in results.items():
+        print(f'{mode:>8}: {rate:12.0f} tags/s')
+    print(f' speedup: {results["batched"] / results["per_tag"]:12.1f}x batched, '
+          f'{results["instance"] / results["per_tag"]:.1f}x by instance')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
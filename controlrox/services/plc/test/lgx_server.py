@@ -0,0 +1,310 @@
+"""Local stand-in for a Logix PLC speaking the EtherNet/IP subset pylogix uses.
+
+The server answers session registration, forward open/close, atomic tag reads and writes (also packed in Multiple
+Service Packet requests, and addressed by name or by symbol instance), structure tag reads, tag list and controller
+clock reads, which is enough to exercise PLC sessions end to end without hardware. It counts the connections and
+requests it serves so tests can check how a client uses the network.
+"""
+import socket
+import socketserver
+import struct
+import threading
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+# CIP atomic data types: code -> struct format
+ATOMIC_TYPES = {
+    0xC1: '<?',  # BOOL
+    0xC2: '<b',  # SINT
+    0xC3: '<h',  # INT
+    0xC4: '<i',  # DINT
+    0xCA: '<f',  # REAL
+}
+
+BOOL = 0xC1
+SINT = 0xC2
+INT = 0xC3
+DINT = 0xC4
+REAL = 0xCA
+STRUCT = 0xA0
+
+_REGISTER_SESSION = 0x65
+_UNREGISTER_SESSION = 0x66
+_SEND_RR_DATA = 0x6F
+_SEND_UNIT_DATA = 0x70
+
+_FORWARD_OPEN = 0x54
+_LARGE_FORWARD_OPEN = 0x5B
+_FORWARD_CLOSE = 0x4E
+_GET_ATTRIBUTE_LIST = 0x03
+_MULTIPLE_SERVICE_PACKET = 0x0A
+_READ_TAG = 0x4C
+_WRITE_TAG = 0x4D
+_GET_INSTANCE_ATTRIBUTE_LIST = 0x55
+
+_SUCCESS = 0x00
+_PARTIAL_TRANSFER = 0x06
+_PATH_SEGMENT_ERROR = 0x04
+_SERVICE_NOT_SUPPORTED = 0x08
+_EMBEDDED_SERVICE_ERROR = 0x1E
+
+_MAX_REPLY_SIZE = 480
+
+_HEADER = struct.Struct('<HHII8sI')
+
+
+def _parse_tag_name(
+    path: bytes,
+    instances: Optional[dict[int, str]] = None
+) -> Optional[str]:
+    """Get the tag name of a symbolic path (ANSI extended symbol segments joined by dots).
+
+    The path may start with a logical segment addressing the symbol object instance of a tag.
+    """
+    names = []
+    offset = 0
+    if path[:4] == b'\x20\x6b\x25\x00' and len(path) >= 6:
+        name = (instances or {}).get(struct.unpack_from('<H', path, 4)[0])
+        if name is None:
+            return None
+        names.append(name)
+        offset = 6
+    while offset < len(path):
+        if path[offset] != 0x91:
+            return None
+        length = path[offset + 1]
+        names.append(path[offset + 2:offset + 2 + length].decode('utf-8'))
+        offset += 2 + length + length % 2
+    return '.'.join(names)
+
+
+class LogixServer(socketserver.ThreadingTCPServer):
+    """Threaded EtherNet/IP server standing in for a Logix PLC on the local host.
+
+    Attributes:
+        tags: Tag names mapped to (data type code, value), the value of structures a tuple (handle, raw bytes).
+        instance_ids: Tag names mapped to their symbol instance, in the order of `tags` from 1.
+        sessions: Number of sessions registered.
+        forward_opens: Number of CIP connections opened.
+        forward_closes: Number of CIP connections closed.
+        requests: Number of connected (unit data) requests served.
+        instance_paths: Number of services addressed by symbol instance.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(
+        self,
+        tags: Optional[dict[str, tuple[int, Any]]] = None,
+        host: str = '127.0.0.1',
+        port: int = 0
+    ) -> None:
+        super().__init__((host, port), _LogixRequestHandler)
+        self._lock = threading.Lock()
+        self.tags: dict[str, tuple[int, Any]] = dict(tags or {})
+        self.instance_ids: dict[str, int] = {}
+        self._instances: dict[int, str] = {}
+        self.set_instance_ids({name: i for i, name in enumerate(self.tags, 1)})
+        self.sessions = 0
+        self.forward_opens = 0
+        self.forward_closes = 0
+        self.requests = 0
+        self.instance_paths = 0
+        self._thread: Optional[threading.Thread] = None
+        self._connections: set[socket.socket] = set()
+
+    def __enter__(self) -> 'LogixServer':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and drop every open connection."""
+        self.shutdown()
+        self.drop_connections()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def drop_connections(self) -> None:
+        """Drop every open client connection, as a PLC going offline would."""
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def read_tag(self, tag_name: str) -> tuple[int, bytes]:
+        with self._lock:
+            if tag_name not in self.tags:
+                return _PATH_SEGMENT_ERROR, b''
+            data_type, value = self.tags[tag_name]
+        if data_type == STRUCT:
+            return _SUCCESS, struct.pack('<BBH', STRUCT, 0x02, value[0]) + bytes(value[1])
+        return _SUCCESS, struct.pack('<BB', data_type, 0) + struct.pack(ATOMIC_TYPES[data_type], value)
+
+    def set_instance_ids(self, instance_ids: dict[str, int]) -> None:
+        """Renumber the symbol instances of the tags, as a download of a changed project would."""
+        with self._lock:
+            self.instance_ids = dict(instance_ids)
+            self._instances = {i: name for name, i in self.instance_ids.items()}
+
+    def get_tag_list(self, start: int) -> tuple[int, bytes]:
+        """Get the symbol instance attributes (name, type and dimensions) of the tags from an instance on.
+
+        Like a PLC, the server answers with a partial transfer when the tags do not fit one reply.
+        """
+        with self._lock:
+            symbols = [(i, name, self._get_symbol_type(name)) for name, i in self.instance_ids.items() if i >= start]
+        data = b''
+        for instance_id, name, data_type in symbols:
+            encoded = name.encode('utf-8')
+            entry = struct.pack('<IH', instance_id, len(encoded)) + encoded + struct.pack('<HIII', data_type, 0, 0, 0)
+            if len(data) + len(entry) > _MAX_REPLY_SIZE:
+                return _PARTIAL_TRANSFER, data
+            data += entry
+        return _SUCCESS, data
+
+    def _get_symbol_type(self, tag_name: str) -> int:
+        data_type, value = self.tags[tag_name]
+        return 0x8000 | value[0] if data_type == STRUCT else data_type
+
+    def write_tag(self, tag_name: str, data: bytes) -> int:
+        data_type, _, _ = struct.unpack_from('<BBH', data)
+        with self._lock:
+            if tag_name not in self.tags or data_type not in ATOMIC_TYPES:
+                return _PATH_SEGMENT_ERROR
+            self.tags[tag_name] = (data_type, struct.unpack_from(ATOMIC_TYPES[data_type], data, 4)[0])
+        return _SUCCESS
+
+
+class _LogixRequestHandler(socketserver.BaseRequestHandler):
+    server: LogixServer
+
+    def setup(self) -> None:
+        with self.server._lock:
+            self.server._connections.add(self.request)
+        self.session_handle = 0
+        self.connection_id = 0
+
+    def finish(self) -> None:
+        with self.server._lock:
+            self.server._connections.discard(self.request)
+
+    def _receive(self, size: int) -> bytes:
+        data = b''
+        while len(data) < size:
+            part = self.request.recv(size - len(data))
+            if not part:
+                raise ConnectionError('Client closed the connection')
+            data += part
+        return data
+
+    def handle(self) -> None:
+        try:
+            while True:
+                header = self._receive(_HEADER.size)
+                command, length, _, _, context, _ = _HEADER.unpack(header)
+                payload = self._receive(length)
+                if command == _UNREGISTER_SESSION:
+                    return
+                reply = self._handle_command(command, payload)
+                self.request.sendall(_HEADER.pack(command, len(reply), self.session_handle, 0, context, 0) + reply)
+        except (ConnectionError, OSError):
+            return
+
+    def _handle_command(self, command: int, payload: bytes) -> bytes:
+        if command == _REGISTER_SESSION:
+            self.server.count('sessions')
+            self.session_handle = 0x1000 + self.server.sessions
+            return struct.pack('<HH', 1, 0)
+        if command == _SEND_RR_DATA:
+            return self._handle_unconnected(payload[16:])
+        if command == _SEND_UNIT_DATA:
+            sequence = struct.unpack_from('<H', payload, 20)[0]
+            status, data = self._handle_connected(payload[22:])
+            cip = struct.pack('<BBBB', payload[22] | 0x80, 0, status, 0) + data
+            return struct.pack(
+                '<IHHHHIHHH', 0, 0, 2, 0xA1, 4, self.connection_id, 0xB1, len(cip) + 2, sequence
+            ) + cip
+        return b''
+
+    def _handle_unconnected(self, cip: bytes) -> bytes:
+        service = cip[0]
+        status, data = _SERVICE_NOT_SUPPORTED, b''
+        if service in (_FORWARD_OPEN, _LARGE_FORWARD_OPEN):
+            self.server.count('forward_opens')
+            self.connection_id = 0x2000 + self.server.forward_opens
+            to_connection_id, serial, vendor, originator = struct.unpack_from('<IHHI', cip, 12)
+            status, data = _SUCCESS, struct.pack(
+                '<IIHHIIIBB', self.connection_id, to_connection_id, serial, vendor, originator, 0, 0, 0, 0
+            )
+        elif service == _FORWARD_CLOSE:
+            self.server.count('forward_closes')
+            status = _SUCCESS
+        reply = struct.pack('<BBBB', service | 0x80, 0, status, 0) + data
+        return struct.pack('<IHHHHHH', 0, 0, 2, 0, 0, 0xB2, len(reply)) + reply
+
+    def _handle_connected(self, cip: bytes) -> tuple[int, bytes]:
+        self.server.count('requests')
+        if cip[0] == _MULTIPLE_SERVICE_PACKET:
+            return self._handle_multiple_services(cip[6:])
+        return self._handle_service(cip)
+
+    def _handle_multiple_services(self, data: bytes) -> tuple[int, bytes]:
+        count = struct.unpack_from('<H', data)[0]
+        offsets = list(struct.unpack_from(f'<{count}H', data, 2)) + [len(data)]
+        replies = []
+        for start, end in zip(offsets, offsets[1:]):
+            status, reply = self._handle_service(data[start:end])
+            replies.append(struct.pack('<BBBB', data[start] | 0x80, 0, status, 0) + reply)
+
+        offset = 2 + count * 2
+        reply_offsets = []
+        for reply in replies:
+            reply_offsets.append(offset)
+            offset += len(reply)
+        status = _EMBEDDED_SERVICE_ERROR if any(x[2] for x in replies) else _SUCCESS
+        return status, struct.pack(f'<H{count}H', count, *reply_offsets) + b''.join(replies)
+
+    def _handle_service(self, cip: bytes) -> tuple[int, bytes]:
+        service, path_words = cip[0], cip[1]
+        path = cip[2:2 + path_words * 2]
+        data = cip[2 + path_words * 2:]
+
+        if service == _GET_ATTRIBUTE_LIST and path[:2] == b'\x20\x8b':
+            now = datetime.now(timezone.utc).replace(tzinfo=None) - datetime(1970, 1, 1)
+            microseconds = (now.days * 86400 + now.seconds) * 1000000 + now.microseconds
+            return _SUCCESS, struct.pack('<HHHQ', 1, 0x0B, 0, microseconds)
+
+        if service == _GET_INSTANCE_ATTRIBUTE_LIST and path[:2] == b'\x20\x6b':
+            start = path[3] if path[2] == 0x24 else struct.unpack_from('<H', path, 4)[0]
+            return self.server.get_tag_list(start)
+
+        if path[:2] == b'\x20\x6b':
+            self.server.count('instance_paths')
+        tag_name = _parse_tag_name(path, self.server._instances)
+        if tag_name is None:
+            return _PATH_SEGMENT_ERROR, b''
+        if service == _READ_TAG:
+            return self.server.read_tag(tag_name)
+        if service == _WRITE_TAG:
+            return self.server.write_tag(tag_name, data), b''
+        return _SERVICE_NOT_SUPPORTED, b''
@@ -82,6 +82,59 @@ class TestPlcTagBinding(unittest.TestCase):
         )
         self.assertEqual(binding.property_path, "position.x")
 
+    def test_get_value_simple(self):
+        """Test getting simple property from scene object."""
+        binding = PlcTagBinding(tag_name="Tag1", object_id="obj1", property_path="speed")
+        mock_obj = Mock()
+        mock_obj.speed = 42.5
+
+        self.assertEqual(binding.get_value(mock_obj), 42.5)
+
+    def test_get_value_nested(self):
+        """Test getting nested property from scene object."""
+        binding = PlcTagBinding(tag_name="Tag1", object_id="obj1", property_path="position.x")
+        mock_obj = Mock()
+        mock_obj.position = Mock()
+        mock_obj.position.x = 100.0
+
+        self.assertEqual(binding.get_value(mock_obj), 100.0)
+
+    def test_get_value_not_found(self):
+        """Test getting non-existent property returns None."""
+        binding = PlcTagBinding(tag_name="Tag1", object_id="obj1", property_path="nonexistent")
+        mock_obj = Mock(spec=['speed'])  # Only has speed
+
+        self.assertIsNone(binding.get_value(mock_obj))
+
+    def test_set_value_simple(self):
+        """Test setting simple property on scene object."""
+        binding = PlcTagBinding(tag_name="Tag1", object_id="obj1", property_path="speed")
+        mock_obj = Mock()
+
+        binding.set_value(mock_obj, 75.0)
+
+        self.assertEqual(mock_obj.speed, 75.0)
+
+    def test_set_value_nested(self):
+        """Test setting nested property on scene object."""
+        binding = PlcTagBinding(tag_name="Tag1", object_id="obj1", property_path="position.x")
+        mock_obj = Mock()
+        mock_obj.position = Mock()
+
+        binding.set_value(mock_obj, 200.0)
+
+        self.assertEqual(mock_obj.position.x, 200.0)
+
+    def test_set_value_parent_not_found(self):
+        """Test setting property whose parent is not found raises error."""
+        binding = PlcTagBinding(tag_name="Tag1", object_id="obj1", property_path="position.x")
+        mock_obj = Mock(spec=['speed'])
+
+        with self.assertRaises(ValueError) as cm:
+            binding.set_value(mock_obj, 200.0)
+
+        self.assertIn("not found", str(cm.exception))
+
 
 class TestPlcSceneBridge(unittest.TestCase):
     """Test cases for PlcSceneBridge class."""
@@ -271,6 +324,71 @@ class TestPlcSceneBridge(unittest.TestCase):
         self.assertEqual(len(tag1_bindings), 2)
         self.assertTrue(all(b.tag_name == "Tag1" for b in tag1_bindings))
 
+    def test_indexes_follow_add_replace_and_remove(self):
+        """Test that the binding indexes are kept up to date."""
+        self.bridge.add_binding("Tag1", "obj1", "speed", direction=BindingDirection.READ)
+        self.bridge.add_binding("Tag1", "obj2", "speed", direction=BindingDirection.WRITE)
+        replaced = self.bridge.add_binding("Tag1", "obj1", "speed", direction=BindingDirection.BOTH)
+
+        self.assertIs(self.bridge.get_binding("Tag1", "obj1", "speed"), replaced)
+        self.assertEqual(len(self.bridge.get_bindings_for_tag("Tag1")), 2)
+        self.assertEqual(list(self.bridge._write_bindings), ["Tag1::obj2::speed", "Tag1::obj1::speed"])
+        stats = self.bridge.get_binding_stats()
+        self.assertEqual((stats['read'], stats['write'], stats['both'], stats['enabled']), (0, 1, 1, 2))
+
+        self.bridge.remove_binding("Tag1", "obj1", "speed")
+
+        self.assertIsNone(self.bridge.get_binding("Tag1", "obj1", "speed"))
+        self.assertEqual(self.bridge.get_bindings_for_object("obj1"), [])
+        self.assertEqual(list(self.bridge._write_bindings), ["Tag1::obj2::speed"])
+        self.assertEqual(self.bridge.get_binding_stats()['enabled'], 1)
+
+        # A removed binding can no longer be enabled or disabled
+        self.assertFalse(self.bridge.set_binding_enabled("Tag1", "obj1", "speed", False))
+        self.assertEqual(self.bridge.get_binding_stats()['enabled'], 1)
+
+    @patch('controlrox.services.plc.bridge.PlcConnectionManager')
+    def test_tag_update_fans_out_to_tag_bindings(self, mock_manager):
+        """Test that the bindings of a tag share one watch callback, reaching only the readable bindings."""
+        self.bridge.add_binding("Tag1", "obj1", "speed", direction=BindingDirection.READ)
+        self.bridge.add_binding("Tag1", "obj2", "speed", direction=BindingDirection.BOTH)
+        self.bridge.add_binding("Tag1", "obj3", "speed", direction=BindingDirection.WRITE)
+        self.bridge.add_binding("Tag2", "obj4", "speed", direction=BindingDirection.READ)
+        self.bridge.start()
+
+        callbacks = {c.args[0]: c.kwargs['callback'] for c in mock_manager.add_watch_tag.call_args_list}
+        self.assertIs(callbacks["Tag1"], self.bridge._tag_callbacks["Tag1"])
+        self.assertEqual(mock_manager.add_watch_tag.call_count, 3)
+
+        with patch.object(self.bridge, '_on_tag_update') as on_tag_update:
+            response = Mock(Status='Success', Value=5)
+            callbacks["Tag1"](response)
+
+        self.assertEqual(
+            [c.args[0].object_id for c in on_tag_update.call_args_list],
+            ["obj1", "obj2"]
+        )
+
+        # The watch stays until the last readable binding of the tag is removed
+        self.bridge.remove_binding("Tag1", "obj1", "speed")
+        mock_manager.remove_watch_tag.assert_not_called()
+        self.bridge.remove_binding("Tag1", "obj2", "speed")
+        mock_manager.remove_watch_tag.assert_called_once_with("Tag1")
+
+    @patch('controlrox.services.plc.bridge.PlcConnectionManager')
+    def test_enabling_binding_while_active_sets_up_watch(self, mock_manager):
+        """Test that enabling a readable binding of an active bridge watches its tag."""
+        self.bridge.add_binding("Tag1", "obj1", "speed", direction=BindingDirection.READ)
+        self.bridge.set_binding_enabled("Tag1", "obj1", "speed", False)
+        self.bridge.start()
+        mock_manager.add_watch_tag.assert_not_called()
+        self.assertEqual(self.bridge.get_binding_stats()['disabled'], 1)
+
+        self.assertTrue(self.bridge.set_binding_enabled("Tag1", "obj1", "speed", True))
+
+        mock_manager.add_watch_tag.assert_called_once()
+        self.assertEqual(self.bridge.get_binding_stats()['enabled'], 1)
+
     @patch('controlrox.services.plc.bridge.PlcConnectionManager')
     def test_start_bridge(self, mock_manager):
         """Test starting the bridge."""
@@ -334,87 +452,37 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         mock_manager.remove_watch_tag.assert_not_called()
 
-    def test_get_scene_property_simple(self):
-        """Test getting simple property from scene object."""
-        mock_obj = Mock()
-        mock_obj.speed = 42.5
-        self.mock_scene.get_scene_object.return_value = mock_obj
-
-        value = self.bridge._get_scene_property("obj1", "speed")
-
-        self.assertEqual(value, 42.5)
-        self.mock_scene.get_scene_object.assert_called_with("obj1")
-
-    def test_get_scene_property_nested(self):
-        """Test getting nested property from scene object."""
-        mock_obj = Mock()
-        mock_obj.position = Mock()
-        mock_obj.position.x = 100.0
-        self.mock_scene.get_scene_object.return_value = mock_obj
-
-        value = self.bridge._get_scene_property("obj1", "position.x")
-
-        self.assertEqual(value, 100.0)
-
-    def test_get_scene_property_not_found(self):
-        """Test getting non-existent property returns None."""
-        mock_obj = Mock(spec=['speed'])  # Only has speed
-        self.mock_scene.get_scene_object.return_value = mock_obj
-
-        value = self.bridge._get_scene_property("obj1", "nonexistent")
-
-        self.assertIsNone(value)
-
-    def test_get_scene_property_object_not_found(self):
-        """Test getting property from non-existent object returns None."""
+    def test_get_binding_value_object_not_found(self):
+        """Test getting the value of a binding to a non-existent object returns None."""
+        binding = self.bridge.add_binding("Tag1", "nonexistent", "speed")
         self.mock_scene.get_scene_object.return_value = None
 
-        value = self.bridge._get_scene_property("nonexistent", "speed")
-
-        self.assertIsNone(value)
+        self.assertIsNone(self.bridge._get_binding_value(binding))
 
-    def test_get_scene_property_no_scene(self):
-        """Test getting property with no scene returns None."""
+    def test_get_binding_value_no_scene(self):
+        """Test getting the value of a binding with no scene returns None."""
         bridge = PlcSceneBridge()  # No scene
+        binding = bridge.add_binding("Tag1", "obj1", "speed")
 
-        value = bridge._get_scene_property("obj1", "speed")
-
-        self.assertIsNone(value)
-
-    def test_set_scene_property_simple(self):
-        """Test setting simple property on scene object."""
-        mock_obj = Mock()
-        self.mock_scene.get_scene_object.return_value = mock_obj
-
-        self.bridge._set_scene_property("obj1", "speed", 75.0)
+        self.assertIsNone(bridge._get_binding_value(binding))
 
-        self.assertEqual(mock_obj.speed, 75.0)
-
-    def test_set_scene_property_nested(self):
-        """Test setting nested property on scene object."""
-        mock_obj = Mock()
-        mock_obj.position = Mock()
-        self.mock_scene.get_scene_object.return_value = mock_obj
-
-        self.bridge._set_scene_property("obj1", "position.x", 200.0)
-
-        self.assertEqual(mock_obj.position.x, 200.0)
-
-    def test_set_scene_property_object_not_found(self):
-        """Test setting property on non-existent object raises error."""
+    def test_set_binding_value_object_not_found(self):
+        """Test setting the value of a binding to a non-existent object raises error."""
+        binding = self.bridge.add_binding("Tag1", "nonexistent", "speed")
         self.mock_scene.get_scene_object.return_value = None
 
         with self.assertRaises(ValueError) as cm:
-            self.bridge._set_scene_property("nonexistent", "speed", 50.0)
+            self.bridge._set_binding_value(binding, 50.0)
 
         self.assertIn("not found", str(cm.exception))
 
-    def test_set_scene_property_no_scene(self):
-        """Test setting property with no scene raises error."""
+    def test_set_binding_value_no_scene(self):
+        """Test setting the value of a binding with no scene raises error."""
         bridge = PlcSceneBridge()  # No scene
+        binding = bridge.add_binding("Tag1", "obj1", "speed")
 
         with self.assertRaises(ValueError) as cm:
-            bridge._set_scene_property("obj1", "speed", 50.0)
+            bridge._set_binding_value(binding, 50.0)
 
         self.assertIn("No scene", str(cm.exception))
 
@@ -436,6 +504,34 @@ class TestPlcSceneBridge(unittest.TestCase):
         self.assertEqual(binding.last_plc_value, 50.0)
         self.assertEqual(binding.last_scene_value, 50.0)
 
+    def test_on_tag_update_skips_unchanged_values(self):
+        """Test that updates within the deadband of a binding are not applied to the scene."""
+        mock_obj = Mock()
+        self.mock_scene.get_scene_object.return_value = mock_obj
+        transform = Mock(side_effect=lambda x: x * 2)
+        binding = self.bridge.add_binding("Tag1", "obj1", "speed", transform=transform, deadband=0.5)
+
+        for value in (10.0, 10.0, 10.4, 11.0):
+            response = Mock(spec=Response)
+            response.Status = 'Success'
+            response.Value = value
+            self.bridge._on_tag_update(binding, response)
+
+        self.assertEqual([x.args[0] for x in transform.call_args_list], [10.0, 11.0])
+        self.assertEqual(mock_obj.speed, 22.0)
+        stats = self.bridge.get_binding_stats()
+        self.assertEqual(stats['updates_delivered'], 2)
+        self.assertEqual(stats['updates_suppressed'], 2)
+
+    @patch('controlrox.services.plc.bridge.PlcConnectionManager')
+    def test_watch_uses_binding_publication_settings(self, mock_manager):
+        """Test that the watch of a binding uses its rate, deadband and publish rate."""
+        self.bridge.add_binding("Tag1", "obj1", "speed", rate=50, deadband=0.1, max_publish_rate=30.0)
+        self.bridge.start()
+
+        kwargs = mock_manager.add_watch_tag.call_args.kwargs
+        self.assertEqual((kwargs['rate'], kwargs['deadband'], kwargs['max_publish_rate']), (50, 0.1, 30.0))
+
     def test_on_tag_update_with_transform(self):
         """Test tag update with transform function."""
         mock_obj = Mock()
@@ -465,7 +561,7 @@ class TestPlcSceneBridge(unittest.TestCase):
         self.mock_scene.get_scene_object.return_value = mock_obj
 
         binding = self.bridge.add_binding("Tag1", "obj1", "speed")
-        binding.enabled = False
+        self.bridge.set_binding_enabled("Tag1", "obj1", "speed", False)
 
         response = Mock(spec=Response)
         response.Status = 'Success'
@@ -561,7 +657,7 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         self.bridge.update_scene_to_plc()
 
-        mock_manager.write_watch_tag.assert_called_with("Tag1", 100.0)
+        mock_manager.write_watch_tags.assert_called_with({"Tag1": 100.0})
 
     @patch('time.time')
     @patch('controlrox.services.plc.bridge.PlcConnectionManager')
@@ -585,7 +681,7 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         self.bridge.update_scene_to_plc()
 
-        mock_manager.write_watch_tag.assert_called_with("Tag1", 1500.0)
+        mock_manager.write_watch_tags.assert_called_with({"Tag1": 1500.0})
 
     @patch('time.time')
     @patch('controlrox.services.plc.bridge.PlcConnectionManager')
@@ -606,7 +702,7 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         # First write
         self.bridge.update_scene_to_plc()
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 1)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 1)
 
         # Second call at 1050ms (only 50ms later, under throttle)
         mock_time.return_value = 1.05
@@ -614,14 +710,14 @@ class TestPlcSceneBridge(unittest.TestCase):
         self.bridge.update_scene_to_plc()
 
         # Should still be 1 call (throttled)
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 1)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 1)
 
         # Third call at 1150ms (150ms later, over throttle)
         mock_time.return_value = 1.15
         self.bridge.update_scene_to_plc()
 
         # Should now be 2 calls
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 2)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 2)
 
     @patch('time.time')
     @patch('controlrox.services.plc.bridge.PlcConnectionManager')
@@ -641,14 +737,59 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         # First write
         self.bridge.update_scene_to_plc()
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 1)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 1)
 
         # Value hasn't changed - advance time past throttle
         mock_time.return_value = 2.0
         self.bridge.update_scene_to_plc()
 
         # Should still be 1 call (value didn't change)
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 1)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 1)
+
+    @patch('time.time')
+    @patch('controlrox.services.plc.bridge.PlcConnectionManager')
+    def test_update_scene_to_plc_batches_and_coalesces(self, mock_manager, mock_time):
+        """Test that changed bindings are written in one batch, the last binding of a tag winning."""
+        mock_time.return_value = 1.0
+
+        objects = {"obj1": Mock(speed=1.0), "obj2": Mock(speed=2.0), "obj3": Mock(speed=3.0)}
+        self.mock_scene.get_scene_object.side_effect = objects.get
+
+        self.bridge.add_binding("Tag1", "obj1", "speed", direction=BindingDirection.WRITE)
+        self.bridge.add_binding("Tag2", "obj2", "speed", direction=BindingDirection.BOTH)
+        self.bridge.add_binding("Tag2", "obj3", "speed", direction=BindingDirection.WRITE)
+        self.bridge.add_binding("Tag3", "obj3", "speed", direction=BindingDirection.READ)
+        self.bridge.start()
+
+        self.bridge.update_scene_to_plc()
+
+        mock_manager.write_watch_tags.assert_called_once_with({"Tag1": 1.0, "Tag2": 3.0})
+        mock_manager.write_watch_tag.assert_not_called()
+        stats = self.bridge.get_binding_stats()
+        self.assertEqual(stats['writes_sent'], 2)
+        self.assertEqual(stats['writes_coalesced'], 1)
+
+        # Only the changed binding is written in the next batch
+        mock_time.return_value = 2.0
+        objects["obj1"].speed = 5.0
+        self.bridge.update_scene_to_plc()
+
+        mock_manager.write_watch_tags.assert_called_with({"Tag1": 5.0})
+
+    def test_binding_accessors(self):
+        """Test the compiled property accessors of a binding."""
+        binding = PlcTagBinding(tag_name="Robot_X", object_id="robot_1", property_path="position.x")
+        obj = Mock(spec=['position'])
+        obj.position = Mock(spec=['x'])
+        obj.position.x = 1.0
+
+        self.assertEqual(binding.get_value(obj), 1.0)
+        binding.set_value(obj, 2.0)
+        self.assertEqual(obj.position.x, 2.0)
+
+        self.assertIsNone(binding.get_value(Mock(spec=[])))
+        with self.assertRaises(ValueError):
+            binding.set_value(Mock(spec=[]), 3.0)
 
     @patch('controlrox.services.plc.bridge.PlcConnectionManager')
     def test_update_scene_to_plc_inactive_bridge(self, mock_manager):
@@ -665,7 +806,7 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         self.bridge.update_scene_to_plc()
 
-        mock_manager.write_watch_tag.assert_not_called()
+        mock_manager.write_watch_tags.assert_not_called()
 
     def test_to_dict_serialization(self):
         """Test converting bridge configuration to dictionary."""
@@ -732,6 +873,9 @@ class TestPlcSceneBridge(unittest.TestCase):
         bindings = self.bridge.get_bindings()
         self.assertEqual(bindings[0].tag_name, 'Tag1')
         self.assertEqual(bindings[0].description, 'Speed control')
+        self.assertEqual(bindings[0].rate, 0)
+        self.assertEqual(bindings[0].deadband, 0.0)
+        self.assertEqual(bindings[0].max_publish_rate, 0.0)
 
     def test_from_dict_clears_existing(self):
         """Test that from_dict clears existing bindings."""
@@ -764,7 +908,10 @@ class TestPlcSceneBridge(unittest.TestCase):
         self.bridge.add_binding(
             "Tag1", "obj1", "speed",
             direction=BindingDirection.BOTH,
-            description="Test binding"
+            description="Test binding",
+            rate=250,
+            deadband=0.5,
+            max_publish_rate=10.0
         )
 
         # Serialize
@@ -782,6 +929,9 @@ class TestPlcSceneBridge(unittest.TestCase):
         self.assertEqual(new_bindings[0].tag_name, original_bindings[0].tag_name)
         self.assertEqual(new_bindings[0].object_id, original_bindings[0].object_id)
         self.assertEqual(new_bindings[0].direction, original_bindings[0].direction)
+        self.assertEqual(new_bindings[0].rate, 250)
+        self.assertEqual(new_bindings[0].deadband, 0.5)
+        self.assertEqual(new_bindings[0].max_publish_rate, 10.0)
 
     # ==================== New Features Tests ====================
 
@@ -847,7 +997,7 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         self.bridge.update_scene_to_plc()
 
-        mock_manager.write_watch_tag.assert_not_called()
+        mock_manager.write_watch_tags.assert_not_called()
 
     def test_set_write_throttle(self):
         """Test setting write throttle."""
@@ -872,18 +1022,18 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         # First write
         self.bridge.update_scene_to_plc()
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 1)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 1)
 
         # 150ms later (under 200ms throttle)
         mock_time.return_value = 1.15
         mock_obj.speed = 120.0
         self.bridge.update_scene_to_plc()
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 1)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 1)
 
         # 250ms later (over 200ms throttle)
         mock_time.return_value = 1.25
         self.bridge.update_scene_to_plc()
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 2)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 2)
 
     def test_is_active(self):
         """Test is_active method."""
@@ -932,7 +1082,7 @@ class TestPlcSceneBridge(unittest.TestCase):
         self.bridge.add_binding("Tag4", "obj4", "acc", direction=BindingDirection.READ)
 
         # Disable one binding
-        self.bridge._bindings["Tag4::obj4::acc"].enabled = False
+        self.bridge.set_binding_enabled("Tag4", "obj4", "acc", False)
 
         stats = self.bridge.get_binding_stats()
 
@@ -994,7 +1144,7 @@ class TestPlcSceneBridge(unittest.TestCase):
     def test_force_write_binding_disabled(self):
         """Test force_write_binding with disabled binding."""
         self.bridge.add_binding("Tag1", "obj1", "speed", direction=BindingDirection.WRITE)
-        self.bridge._bindings["Tag1::obj1::speed"].enabled = False
+        self.bridge.set_binding_enabled("Tag1", "obj1", "speed", False)
 
         result = self.bridge.force_write_binding("Tag1", "obj1", "speed")
 
@@ -1023,14 +1173,14 @@ class TestPlcSceneBridge(unittest.TestCase):
 
         # First write via update
         self.bridge.update_scene_to_plc()
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 1)
+        self.assertEqual(mock_manager.write_watch_tags.call_count, 1)
 
         # Immediate force write (0ms later - would be throttled normally)
         mock_obj.speed = 120.0
         result = self.bridge.force_write_binding("Tag1", "obj1", "speed")
 
         self.assertTrue(result)
-        self.assertEqual(mock_manager.write_watch_tag.call_count, 2)
+        self.assertEqual(mock_manager.write_watch_tag.call_count, 1)
 
     def test_force_write_binding_none_value(self):
         """Test force_write_binding when property returns None."""
@@ -1091,7 +1241,7 @@ class TestPlcSceneBridge(unittest.TestCase):
             mock_obj.speed = 100.0
             self.bridge.update_scene_to_plc()
 
-            mock_manager.write_watch_tag.assert_called_with("Tag1", 100.0)
+            mock_manager.write_watch_tags.assert_called_with({"Tag1": 100.0})
 
     @patch('controlrox.services.plc.bridge.PlcConnectionManager')
     def test_start_only_watches_readable_bindings(self, mock_manager):
@@ -1,5 +1,6 @@
 """Unit tests for PLC connection services."""
 import unittest
+import time
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
@@ -8,11 +9,29 @@ from controlrox.services.plc.connection import (
     ConnectionCommandType,
     ConnectionCommand,
     WatchTableEntry,
+    PlcConnection,
     PlcConnectionManager,
+    PlcConnectionRegistry,
+    PlcSession,
+    PlcSessionPool,
 )
+from controlrox.services.plc.dispatch import CallbackQueue
+from controlrox.services.plc.scheduler import PlcIoScheduler
 from pyrox.models.network import Ipv4Address
 from pylogix.lgx_response import Response
 
+from controlrox.services.plc.test.lgx_server import DINT, LogixServer
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    """Wait until a predicate holds, for work running on the I/O scheduler."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
 
 class TestConnectionParameters(unittest.TestCase):
     """Test cases for ConnectionParameters dataclass."""
@@ -170,6 +189,117 @@ class TestConnectionCommand(unittest.TestCase):
         self.mock_callback.assert_called_once_with(mock_response)
 
 
+class TestPlcSession(unittest.TestCase):
+    """Test cases for PlcSession against a local stand-in PLC."""
+
+    def setUp(self):
+        self.server = LogixServer({'Counter': (DINT, 5), 'Output': (DINT, 0)})
+        self.server.start()
+        self.session = PlcSession('127.0.0.1', port=self.server.port, timeout=1.0, backoff_initial=0.0)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+
+    def test_requests_share_one_connection(self):
+        """Test that requests reuse the open connection instead of opening one each."""
+        for value in range(5):
+            self.assertEqual(self.session.write('Output', value).Status, 'Success')
+            self.assertEqual(self.session.read('Counter').Value, 5)
+
+        self.assertEqual(self.server.tags['Output'], (DINT, 4))
+        self.assertEqual(self.server.sessions, 1)
+        self.assertEqual(self.server.forward_opens, 1)
+        self.assertEqual(self.session.statistics.connects, 1)
+
+    def test_tag_errors_keep_the_connection(self):
+        """Test that a failed request for a missing tag does not drop the connection."""
+        self.assertEqual(self.session.read('Missing').Status, 'Path segment error')
+        self.assertEqual(self.session.read('Counter').Value, 5)
+
+        self.assertEqual(self.server.forward_opens, 1)
+        self.assertEqual(self.session.statistics.request_errors, 1)
+        self.assertEqual(self.session.statistics.failures, 0)
+
+    def test_health_check_probes_only_when_idle(self):
+        """Test that health checks ride on successful requests."""
+        self.assertTrue(self.session.check_health())
+        requests = self.server.requests
+        self.assertTrue(self.session.check_health())
+        self.assertEqual(self.server.requests, requests)
+
+        self.session.health_check_interval = 0.0
+        self.assertTrue(self.session.check_health())
+        self.assertEqual(self.server.requests, requests + 1)
+        self.assertEqual(self.session.statistics.health_checks, 1)
+
+    def test_reconnects_after_connection_drop(self):
+        """Test that a dropped connection is reopened on the next request."""
+        self.assertEqual(self.session.read('Counter').Value, 5)
+        self.server.drop_connections()
+
+        self.assertEqual(self.session.read('Counter').Status, 'Connection failure')
+        self.assertFalse(self.session.is_open)
+        self.assertEqual(self.session.read('Counter').Value, 5)
+
+        self.assertEqual(self.server.forward_opens, 2)
+        self.assertEqual(self.session.statistics.failures, 1)
+        self.assertEqual(self.session.statistics.connects, 2)
+
+    def test_backoff_after_failed_connect(self):
+        """Test that failed connects back off exponentially."""
+        session = PlcSession('127.0.0.1', port=self.server.port, timeout=1.0, backoff_initial=10.0)
+        self.server.stop()
+
+        self.assertFalse(session.open())
+        self.assertGreater(session.retry_delay, 9.0)
+        self.assertFalse(session.open())
+        with self.assertRaises(ConnectionError):
+            session.read('Counter')
+        self.assertEqual(session.statistics.failures, 1)
+
+        session._retry_at = 0.0
+        self.assertFalse(session.open())
+        self.assertGreater(session.retry_delay, 19.0)
+        self.assertEqual(session.statistics.consecutive_failures, 2)
+
+        session.close()
+        self.assertEqual(session.retry_delay, 0.0)
+        self.assertEqual(session.statistics.consecutive_failures, 0)
+
+    def test_read_tags_packs_requests(self):
+        """Test that a batched read packs many tags into few requests and demuxes each tag's status."""
+        self.server.tags.update({f'Tag{i}': (DINT, i) for i in range(300)})
+        tags = [(f'Tag{i}', DINT) for i in range(300)] + [('Missing', 0)]
+        self.session.open()
+        requests = self.server.requests
+
+        responses = self.session.read_tags(tags)
+
+        self.assertEqual(len(responses), 301)
+        self.assertEqual([x.Value for x in responses[:300]], list(range(300)))
+        self.assertEqual(responses[-1].TagName, 'Missing')
+        self.assertEqual(responses[-1].Status, 'Path segment error')
+        self.assertLess(self.server.requests - requests, 30)
+        self.assertEqual(self.session.statistics.requests, 2)
+        self.assertEqual(self.session.statistics.request_errors, 1)
+
+    def test_write_tags(self):
+        """Test that a batched write writes every tag."""
+        self.server.tags.update({f'Tag{i}': (DINT, 0) for i in range(50)})
+
+        responses = self.session.write_tags([(f'Tag{i}', i * 2, DINT) for i in range(50)])
+
+        self.assertTrue(all(x.Status == 'Success' for x in responses))
+        self.assertEqual([self.server.tags[f'Tag{i}'][1] for i in range(50)], [i * 2 for i in range(50)])
+
+    def test_empty_batches(self):
+        """Test that empty batches do not touch the network."""
+        self.assertEqual(self.session.read_tags([]), [])
+        self.assertEqual(self.session.write_tags([]), [])
+        self.assertEqual(self.server.sessions, 0)
+
+
 class TestPlcConnectionManager(unittest.TestCase):
     """Test cases for PlcConnectionManager static class."""
 
@@ -178,18 +308,32 @@ class TestPlcConnectionManager(unittest.TestCase):
         # Reset the static class state before each test
         PlcConnectionManager.connection_parameters = ConnectionParameters()
         PlcConnectionManager._connected = False
+        PlcConnectionManager._running = False
         PlcConnectionManager._commands = []
         PlcConnectionManager._subscribers = []
+        PlcConnectionManager._read_subscribers = []
         PlcConnectionManager._watch_table = {}
-        PlcConnectionManager._timer_service.clear_all_tasks()
+        PlcConnectionManager._scheduler.clear_all_tasks()
+        PlcConnectionManager.set_dispatcher(None)
 
     def tearDown(self):
         """Clean up after tests."""
+        PlcConnectionManager.disconnect()
         PlcConnectionManager._connected = False
+        PlcConnectionManager._running = False
         PlcConnectionManager._commands = []
         PlcConnectionManager._subscribers = []
+        PlcConnectionManager._read_subscribers = []
         PlcConnectionManager._watch_table = {}
-        PlcConnectionManager._timer_service.clear_all_tasks()
+        PlcConnectionManager._scheduler.clear_all_tasks()
+        PlcConnectionManager.set_dispatcher(None)
+        PlcSessionPool.close_all()
+
+    @staticmethod
+    def _use_plc(mock_plc_class, mock_plc):
+        """Make the patched PLC class create the mock PLC, answering health checks."""
+        mock_plc_class.return_value = mock_plc
+        mock_plc.GetPLCTime.return_value = Response(tag_name=None, value=datetime.now(), status='Success')
 
     def test_cannot_instantiate(self):
         """Test that PlcConnectionManager cannot be instantiated."""
@@ -235,42 +379,63 @@ class TestPlcConnectionManager(unittest.TestCase):
         self.assertNotIn(mock_callback, PlcConnectionManager._subscribers)
 
     @patch('controlrox.services.plc.connection.PLC')
-    def test_strobe_plc_success(self, mock_plc_class):
-        """Test successful PLC strobe."""
+    def test_session_is_reused_between_ticks(self, mock_plc_class):
+        """Test that ticks share one pooled PLC connection."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
-        mock_plc.GetPLCTime.return_value.Status = 'Success'
+        self._use_plc(mock_plc_class, mock_plc)
+        mock_plc.Read.return_value = Response(tag_name='TestTag', value=1, status='Success')
+        PlcConnectionManager.add_watch_tag('TestTag')
 
-        result = PlcConnectionManager._strobe_plc()
-        self.assertTrue(result)
+        PlcConnectionManager._connection_loop()
+        PlcConnectionManager._connection_loop()
+
+        mock_plc_class.assert_called_once_with(ip_address='192.168.1.2', slot=0, timeout=5.0, port=44818)
+        mock_plc.Close.assert_not_called()
+        self.assertEqual(mock_plc.Read.call_count, 2)
+        # Successful reads count as health checks, the PLC is only probed when opening the session
         mock_plc.GetPLCTime.assert_called_once()
+        self.assertIs(PlcConnectionManager.get_session(), PlcSessionPool.get_session(ConnectionParameters()))
+        self.assertEqual(PlcConnectionManager.get_connection_statistics().connects, 1)
 
     @patch('controlrox.services.plc.connection.PLC')
-    def test_strobe_plc_failure(self, mock_plc_class):
-        """Test failed PLC strobe."""
+    def test_connection_loop_backs_off_after_failure(self, mock_plc_class):
+        """Test that a failed connection is retried after the session backoff."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
-        mock_plc.GetPLCTime.return_value.Status = 'Failed'
+        self._use_plc(mock_plc_class, mock_plc)
+        mock_plc.GetPLCTime.return_value.Status = 'Connection failure'
+        mock_plc.conn.SocketConnected = False
+        PlcConnectionManager._running = True
 
-        result = PlcConnectionManager._strobe_plc()
-        self.assertFalse(result)
+        with patch.object(PlcConnectionManager._scheduler, 'schedule_task') as mock_schedule:
+            PlcConnectionManager._connection_loop()
+            PlcConnectionManager._connection_loop()
+
+        self.assertFalse(PlcConnectionManager._connected)
+        # The second tick is still backing off and does not touch the network
+        mock_plc.GetPLCTime.assert_called_once()
+        mock_plc.Close.assert_called_once()
+        delay = mock_schedule.call_args[0][1]
+        self.assertGreater(delay, PlcConnectionManager.connection_parameters.rpi / 1000.0)
+        statistics = PlcConnectionManager.get_connection_statistics()
+        self.assertEqual(statistics.failures, 1)
+        self.assertEqual(statistics.last_error, 'Connection failure')
 
     @patch('controlrox.services.plc.connection.PLC')
     def test_connect_success(self, mock_plc_class):
         """Test successful connection to PLC."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_plc.GetPLCTime.return_value.Status = 'Success'
 
         PlcConnectionManager.connect()
-        self.assertTrue(PlcConnectionManager._connected)
+        self.assertTrue(_wait_for(lambda: PlcConnectionManager._connected))
 
     @patch('controlrox.services.plc.connection.PLC')
     def test_connect_already_connected(self, mock_plc_class):
         """Test connecting when already connected."""
         PlcConnectionManager._connected = True
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         PlcConnectionManager.connect()
         # Should not call PLC methods if already connected
@@ -293,9 +458,9 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_run_commands_read(self, mock_plc_class):
         """Test running READ commands."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_response = Response(tag_name='TestTag', value=42, status='Success')
-        mock_plc.Read.return_value = mock_response
+        mock_plc.Read.return_value = [mock_response]
 
         mock_callback = Mock()
         PlcConnectionManager._connected = True
@@ -311,15 +476,16 @@ class TestPlcConnectionManager(unittest.TestCase):
 
         PlcConnectionManager._run_commands()
         mock_callback.assert_called_once_with(mock_response)
+        mock_plc.Read.assert_called_once_with([('TestTag', 1, None)])
         self.assertEqual(len(PlcConnectionManager._commands), 0)  # Commands should be cleared
 
     @patch('controlrox.services.plc.connection.PLC')
     def test_run_commands_write(self, mock_plc_class):
         """Test running WRITE commands."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_response = Response(tag_name='OutputTag', value=100, status='Success')
-        mock_plc.Write.return_value = mock_response
+        mock_plc.Write.return_value = [mock_response]
 
         mock_callback = Mock()
         PlcConnectionManager._connected = True
@@ -335,15 +501,15 @@ class TestPlcConnectionManager(unittest.TestCase):
 
         PlcConnectionManager._run_commands()
         mock_callback.assert_called_once_with(mock_response)
-        mock_plc.Write.assert_called_once_with('OutputTag', 100, datatype=1)
+        mock_plc.Write.assert_called_once_with([('OutputTag', 100, 1)])
 
     @patch('controlrox.services.plc.connection.PLC')
     def test_run_commands_write_string_value(self, mock_plc_class):
         """Test running WRITE command with string value."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_response = Response(tag_name='StringTag', value='test', status='Success')
-        mock_plc.Write.return_value = mock_response
+        mock_plc.Write.return_value = [mock_response]
 
         mock_callback = Mock()
         PlcConnectionManager._connected = True
@@ -359,13 +525,13 @@ class TestPlcConnectionManager(unittest.TestCase):
 
         PlcConnectionManager._run_commands()
         # Should keep as string if conversion to int fails
-        mock_plc.Write.assert_called_once_with('StringTag', 'test_string', datatype=2)
+        mock_plc.Write.assert_called_once_with([('StringTag', 'test_string', 2)])
 
     @patch('controlrox.services.plc.connection.PLC')
     def test_run_commands_read_error_handling(self, mock_plc_class):
         """Test error handling during READ command."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_plc.Read.side_effect = KeyError('Tag not found')
 
         mock_callback = Mock()
@@ -392,7 +558,7 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_run_commands_write_error_handling(self, mock_plc_class):
         """Test error handling during WRITE command."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_plc.Write.side_effect = KeyError('Tag not found')
 
         mock_callback = Mock()
@@ -415,6 +581,25 @@ class TestPlcConnectionManager(unittest.TestCase):
         self.assertIsNone(error_response.Value)
         self.assertEqual(error_response.Status, 'Error')
 
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_run_commands_keeps_commands_queued_while_running(self, mock_plc_class):
+        """Test writes queued by another thread while the commands run are kept for the next loop."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+
+        def write(tags):
+            PlcConnectionManager.write_watch_tag('LateTag', 2)
+            return [Response(tag_name=x[0], value=x[1], status='Success') for x in tags]
+        mock_plc.Write.side_effect = write
+
+        PlcConnectionManager._connected = True
+        PlcConnectionManager.write_watch_tag('FirstTag', 1)
+
+        PlcConnectionManager._run_commands()
+
+        mock_plc.Write.assert_called_once_with([('FirstTag', 1)])
+        self.assertEqual([x.tag_name for x in PlcConnectionManager._commands], ['LateTag'])
+
     def test_run_commands_when_disconnected(self):
         """Test that commands don't run when disconnected."""
         mock_callback = Mock()
@@ -436,7 +621,7 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_connection_loop_success(self, mock_plc_class):
         """Test successful connection loop."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_plc.GetPLCTime.return_value.Status = 'Success'
 
         mock_subscriber = Mock()
@@ -450,7 +635,7 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_connection_loop_failure(self, mock_plc_class):
         """Test connection loop when PLC strobe fails."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_plc.GetPLCTime.return_value.Status = 'Failed'
 
         PlcConnectionManager._connection_loop()
@@ -468,7 +653,7 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_multiple_subscribers(self, mock_plc_class):
         """Test multiple subscribers are called during connection loop."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_plc.GetPLCTime.return_value.Status = 'Success'
 
         mock_subscriber1 = Mock()
@@ -489,12 +674,12 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_mixed_read_write_commands(self, mock_plc_class):
         """Test running mixed READ and WRITE commands."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         read_response = Response(tag_name='InputTag', value=42, status='Success')
         write_response = Response(tag_name='OutputTag', value=100, status='Success')
-        mock_plc.Read.return_value = read_response
-        mock_plc.Write.return_value = write_response
+        mock_plc.Read.return_value = [read_response]
+        mock_plc.Write.return_value = [write_response]
 
         read_callback = Mock()
         write_callback = Mock()
@@ -534,9 +719,9 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_schedule_when_disconnected(self):
         """Test that scheduling doesn't happen when disconnected."""
         PlcConnectionManager._connected = False
-        initial_tasks = len(PlcConnectionManager._timer_service._tasks)
+        initial_tasks = len(PlcConnectionManager._scheduler._tasks)
         PlcConnectionManager._schedule()
-        final_tasks = len(PlcConnectionManager._timer_service._tasks)
+        final_tasks = len(PlcConnectionManager._scheduler._tasks)
         self.assertEqual(initial_tasks, final_tasks)
 
     def test_add_watch_tag_new(self):
@@ -640,10 +825,10 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_run_watch_table_reads_success(self, mock_plc_class):
         """Test automatic reading of watched tags."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='TestTag', value=42, status='Success')
-        mock_plc.Read.return_value = mock_response
+        mock_plc.Read.return_value = [mock_response]
 
         PlcConnectionManager.add_watch_tag('TestTag', data_type=5)
         PlcConnectionManager._connected = True
@@ -651,7 +836,7 @@ class TestPlcConnectionManager(unittest.TestCase):
         PlcConnectionManager._run_commands()
 
         # Verify the tag was read
-        mock_plc.Read.assert_called_with('TestTag', datatype=5)
+        mock_plc.Read.assert_called_with([('TestTag', 1, 5)])
 
         # Verify the entry was updated
         entry = PlcConnectionManager._watch_table['TestTag']
@@ -663,10 +848,10 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_run_watch_table_reads_with_callback(self, mock_plc_class):
         """Test that callbacks are invoked when watched tags are read."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='TestTag', value=100, status='Success')
-        mock_plc.Read.return_value = mock_response
+        mock_plc.Read.return_value = [mock_response]
 
         mock_callback = Mock()
         PlcConnectionManager.add_watch_tag('TestTag', callback=mock_callback)
@@ -679,14 +864,107 @@ class TestPlcConnectionManager(unittest.TestCase):
         call_args = mock_callback.call_args[0][0]
         self.assertEqual(call_args.Value, 100)
 
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_run_watch_table_reads_publishes_changes_only(self, mock_plc_class):
+        """Test that callbacks only get reads that change the value or status of the tag."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+        mock_callback = Mock()
+        PlcConnectionManager.add_watch_tag('TestTag', callback=mock_callback)
+        PlcConnectionManager._connected = True
+
+        reads = ((1, 'Success'), (1, 'Success'), (2, 'Success'), (None, 'Error'), (None, 'Error'), (2, 'Success'))
+        for value, status in reads:
+            mock_plc.Read.return_value = [Response(tag_name='TestTag', value=value, status=status)]
+            PlcConnectionManager._run_commands()
+
+        statuses = [x.args[0].Status for x in mock_callback.call_args_list]
+        self.assertEqual(statuses, ['Success', 'Success', 'Error', 'Success'])
+        self.assertEqual([x.args[0].Value for x in mock_callback.call_args_list], [1, 2, None, 2])
+        self.assertEqual(PlcConnectionManager.get_publish_statistics(), {'delivered': 4, 'suppressed': 2})
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_run_watch_table_reads_notifies_read_subscribers(self, mock_plc_class):
+        """Test that read subscribers get every batch of reads, changed or not."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+        subscriber = Mock()
+        PlcConnectionManager.subscribe_to_reads(subscriber)
+        PlcConnectionManager.add_watch_tag('TestTag')
+        PlcConnectionManager._connected = True
+
+        for _ in range(3):
+            mock_plc.Read.return_value = [Response(tag_name='TestTag', value=1, status='Success')]
+            PlcConnectionManager._run_commands()
+
+        self.assertEqual(subscriber.call_count, 3)
+        timestamp, responses = subscriber.call_args.args
+        self.assertIsInstance(timestamp, float)
+        self.assertEqual([x.Value for x in responses], [1])
+
+        PlcConnectionManager.unsubscribe_from_reads(subscriber)
+        PlcConnectionManager._run_commands()
+        self.assertEqual(subscriber.call_count, 3)
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_run_watch_table_reads_deadband(self, mock_plc_class):
+        """Test that numeric changes within the deadband are not published."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+        mock_callback = Mock()
+        PlcConnectionManager.add_watch_tag('TestTag', callback=mock_callback, deadband=0.5)
+        PlcConnectionManager._connected = True
+
+        for value in (10.0, 10.3, 10.5, 10.6, 10.2, 9.9):
+            mock_plc.Read.return_value = [Response(tag_name='TestTag', value=value, status='Success')]
+            PlcConnectionManager._run_commands()
+
+        self.assertEqual([x.args[0].Value for x in mock_callback.call_args_list], [10.0, 10.6, 9.9])
+        self.assertEqual(PlcConnectionManager.get_watched_tag_value('TestTag'), 9.9)
+
+    @patch('controlrox.services.plc.connection.time.monotonic')
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_run_watch_table_reads_max_publish_rate(self, mock_plc_class, mock_monotonic):
+        """Test that changes arriving faster than the publish rate are held back until the interval has passed."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+        mock_callback = Mock()
+        PlcConnectionManager.add_watch_tag('TestTag', callback=mock_callback, max_publish_rate=10.0)
+        PlcConnectionManager._connected = True
+
+        for now, value in ((100.0, 1), (100.05, 2), (100.08, 3), (100.1, 3), (100.15, 3)):
+            mock_monotonic.return_value = now
+            mock_plc.Read.return_value = [Response(tag_name='TestTag', value=value, status='Success')]
+            PlcConnectionManager._run_commands()
+
+        self.assertEqual([x.args[0].Value for x in mock_callback.call_args_list], [1, 3])
+        entry = PlcConnectionManager.get_watch_table()['TestTag']
+        self.assertEqual((entry.delivered, entry.suppressed), (2, 3))
+
+    def test_add_watch_tag_most_demanding_watcher(self):
+        """Test that a tag watched several times is published for the most demanding watcher."""
+        first, second = Mock(), Mock()
+        PlcConnectionManager.add_watch_tag('TestTag', callback=first, deadband=1.0, max_publish_rate=5.0)
+        PlcConnectionManager._watch_table['TestTag'].published_status = 'Success'
+        PlcConnectionManager.add_watch_tag('TestTag', callback=second, deadband=0.25, max_publish_rate=20.0)
+
+        entry = PlcConnectionManager._watch_table['TestTag']
+        self.assertEqual(entry.deadband, 0.25)
+        self.assertEqual(entry.max_publish_rate, 20.0)
+        self.assertIsNone(entry.published_status)
+
+        PlcConnectionManager.add_watch_tag('TestTag')
+        self.assertEqual(entry.deadband, 0.0)
+        self.assertEqual(entry.max_publish_rate, 0.0)
+
     @patch('controlrox.services.plc.connection.PLC')
     def test_run_watch_table_reads_failure(self, mock_plc_class):
         """Test error handling when watched tag read fails."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='TestTag', value=None, status='Failed')
-        mock_plc.Read.return_value = mock_response
+        mock_plc.Read.return_value = [mock_response]
 
         PlcConnectionManager.add_watch_tag('TestTag')
         PlcConnectionManager._connected = True
@@ -701,7 +979,7 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_run_watch_table_reads_exception(self, mock_plc_class):
         """Test error handling when exception occurs during watch read."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
         mock_plc.Read.side_effect = Exception('Read error')
 
         PlcConnectionManager.add_watch_tag('TestTag')
@@ -714,36 +992,59 @@ class TestPlcConnectionManager(unittest.TestCase):
         self.assertEqual(entry.error_count, 1)
 
     @patch('controlrox.services.plc.connection.PLC')
-    def test_run_watch_table_reads_list_response(self, mock_plc_class):
-        """Test handling of list response from PLC read."""
+    def test_run_watch_table_reads_single_response(self, mock_plc_class):
+        """Test handling of a single response to a batched read."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
-        # Some pylogix operations return lists
-        mock_response = Response(tag_name='TestTag', value=99, status='Success')
-        mock_plc.Read.return_value = [mock_response]
+        mock_plc.Read.return_value = Response(tag_name='TestTag', value=None, status='Connection failure')
 
         PlcConnectionManager.add_watch_tag('TestTag')
         PlcConnectionManager._connected = True
 
         PlcConnectionManager._run_commands()
 
-        # Verify the first response was used
+        # The status of the batch is reported for every tag
         entry = PlcConnectionManager._watch_table['TestTag']
-        self.assertEqual(entry.last_value, 99)
+        self.assertIsNone(entry.last_value)
+        self.assertEqual(entry.error_count, 1)
 
     @patch('controlrox.services.plc.connection.PLC')
     def test_run_watch_table_reads_multiple_tags(self, mock_plc_class):
         """Test automatic reading of multiple watched tags."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
-        def mock_read(tag_name, datatype):
-            if tag_name == 'Tag1':
-                return Response(tag_name='Tag1', value=10, status='Success')
-            elif tag_name == 'Tag2':
-                return Response(tag_name='Tag2', value=20, status='Success')
-            return Response(tag_name=tag_name, value=None, status='Error')
+        mock_plc.Read.return_value = [
+            Response(tag_name='Tag1', value=10, status='Success'),
+            Response(tag_name='Tag2', value=None, status='Path segment error'),
+            Response(tag_name='Tag3', value=30, status='Success'),
+        ]
+
+        PlcConnectionManager.add_watch_tag('Tag1')
+        PlcConnectionManager.add_watch_tag('Tag2', data_type=0xC4)
+        PlcConnectionManager.add_watch_tag('Tag3')
+        PlcConnectionManager._connected = True
+
+        PlcConnectionManager._run_commands()
+
+        # All tags are read in one batch and the responses are matched back to their entries
+        mock_plc.Read.assert_called_once_with([('Tag1', 1, None), ('Tag2', 1, 0xC4), ('Tag3', 1, None)])
+        self.assertEqual(PlcConnectionManager._watch_table['Tag1'].last_value, 10)
+        self.assertIsNone(PlcConnectionManager._watch_table['Tag2'].last_value)
+        self.assertEqual(PlcConnectionManager._watch_table['Tag2'].error_count, 1)
+        self.assertEqual(PlcConnectionManager._watch_table['Tag3'].last_value, 30)
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_run_watch_table_reads_falls_back_to_single_reads(self, mock_plc_class):
+        """Test that tags are read one by one when the batch can not be processed."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+
+        def mock_read(tag, datatype=None):
+            if isinstance(tag, list) or tag == 'Tag2':
+                raise KeyError(tag)
+            return Response(tag_name=tag, value=10, status='Success')
 
         mock_plc.Read.side_effect = mock_read
 
@@ -753,18 +1054,19 @@ class TestPlcConnectionManager(unittest.TestCase):
 
         PlcConnectionManager._run_commands()
 
-        # Verify both tags were read
+        self.assertEqual(mock_plc.Read.call_count, 3)
         self.assertEqual(PlcConnectionManager._watch_table['Tag1'].last_value, 10)
-        self.assertEqual(PlcConnectionManager._watch_table['Tag2'].last_value, 20)
+        self.assertEqual(PlcConnectionManager._watch_table['Tag2'].error_count, 1)
+        self.assertTrue(PlcConnectionManager._connected)
 
     @patch('controlrox.services.plc.connection.PLC')
     def test_write_watch_tag_new_tag(self, mock_plc_class):
         """Test writing to a tag not in watch table."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='NewTag', value=50, status='Success')
-        mock_plc.Write.return_value = mock_response
+        mock_plc.Write.return_value = [mock_response]
 
         PlcConnectionManager._connected = True
         PlcConnectionManager.write_watch_tag('NewTag', 50)
@@ -772,16 +1074,16 @@ class TestPlcConnectionManager(unittest.TestCase):
         # Should add write command to buffer
         PlcConnectionManager._run_commands()
 
-        mock_plc.Write.assert_called_once_with('NewTag', 50, datatype=0)
+        mock_plc.Write.assert_called_once_with([('NewTag', 50)])
 
     @patch('controlrox.services.plc.connection.PLC')
     def test_write_watch_tag_watched_tag(self, mock_plc_class):
         """Test writing to a tag in watch table."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='TestTag', value=75, status='Success')
-        mock_plc.Write.return_value = mock_response
+        mock_plc.Write.return_value = [mock_response]
 
         PlcConnectionManager.add_watch_tag('TestTag', data_type=5)
         PlcConnectionManager._connected = True
@@ -790,20 +1092,38 @@ class TestPlcConnectionManager(unittest.TestCase):
         PlcConnectionManager._run_commands()
 
         # Should use data type from watch table
-        mock_plc.Write.assert_called_once_with('TestTag', 75, datatype=5)
+        mock_plc.Write.assert_called_once_with([('TestTag', 75, 5)])
 
         # Should update watch table entry
         entry = PlcConnectionManager._watch_table['TestTag']
         self.assertEqual(entry.last_value, 75)
 
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_write_watch_tags_coalesces_per_tag(self, mock_plc_class):
+        """Test that queued writes go out in one batch, with the last value written per tag."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+        mock_plc.Write.side_effect = lambda tags: [Response(x[0], x[1], 'Success') for x in tags]
+        callback = Mock()
+
+        PlcConnectionManager._connected = True
+        PlcConnectionManager.write_watch_tags({'Tag1': 1, 'Tag2': 2}, callback=callback)
+        PlcConnectionManager.write_watch_tags({'Tag1': 3}, callback=callback)
+
+        PlcConnectionManager._run_commands()
+
+        mock_plc.Write.assert_called_once_with([('Tag2', 2), ('Tag1', 3)])
+        self.assertEqual(callback.call_count, 3)
+        self.assertEqual([x.args[0].Value for x in callback.call_args_list], [3, 2, 3])
+
     @patch('controlrox.services.plc.connection.PLC')
     def test_write_watch_tag_with_callback(self, mock_plc_class):
         """Test writing with custom callback."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='TestTag', value=30, status='Success')
-        mock_plc.Write.return_value = mock_response
+        mock_plc.Write.return_value = [mock_response]
 
         mock_callback = Mock()
         PlcConnectionManager._connected = True
@@ -818,10 +1138,10 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_write_watch_tag_failure(self, mock_plc_class):
         """Test write failure handling."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='TestTag', value=None, status='Failed')
-        mock_plc.Write.return_value = mock_response
+        mock_plc.Write.return_value = [mock_response]
 
         PlcConnectionManager.add_watch_tag('TestTag')
         PlcConnectionManager._connected = True
@@ -834,10 +1154,10 @@ class TestPlcConnectionManager(unittest.TestCase):
         self.assertIsNone(entry.last_value)  # Should still be None
 
     @patch('controlrox.services.plc.connection.PLC')
-    def test_write_watch_tag_list_response(self, mock_plc_class):
-        """Test handling list response from write operation."""
+    def test_write_watch_tag_updates_watch_table(self, mock_plc_class):
+        """Test that a successful write updates the watch table."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='TestTag', value=88, status='Success')
         mock_plc.Write.return_value = [mock_response]
@@ -856,10 +1176,10 @@ class TestPlcConnectionManager(unittest.TestCase):
     def test_watch_callback_exception_handling(self, mock_plc_class):
         """Test that callback exceptions don't break watch reads."""
         mock_plc = MagicMock()
-        mock_plc_class.return_value.__enter__.return_value = mock_plc
+        self._use_plc(mock_plc_class, mock_plc)
 
         mock_response = Response(tag_name='TestTag', value=123, status='Success')
-        mock_plc.Read.return_value = mock_response
+        mock_plc.Read.return_value = [mock_response]
 
         # Callback that raises exception
         def bad_callback(response):
@@ -875,6 +1195,276 @@ class TestPlcConnectionManager(unittest.TestCase):
         entry = PlcConnectionManager._watch_table['TestTag']
         self.assertEqual(entry.last_value, 123)
 
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_dispatcher_delivers_callbacks(self, mock_plc_class):
+        """Test that a dispatcher gets the callbacks, which run once its queue is drained."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+        mock_plc.Read.return_value = [Response(tag_name='TestTag', value=5, status='Success')]
+        mock_plc.Write.return_value = [Response(tag_name='OutTag', value=1, status='Success')]
+        queue = CallbackQueue()
+        PlcConnectionManager.set_dispatcher(queue.put)
+
+        tick, reads, watch, write = Mock(), Mock(), Mock(), Mock()
+        PlcConnectionManager.subscribe_to_ticks(tick)
+        PlcConnectionManager.subscribe_to_reads(reads)
+        PlcConnectionManager.add_watch_tag('TestTag', callback=watch)
+        PlcConnectionManager.write_watch_tag('OutTag', 1, callback=write)
+
+        PlcConnectionManager._connection_loop()
+
+        for callback in (tick, reads, watch, write):
+            callback.assert_not_called()
+        self.assertEqual(queue.drain(), 4)
+        tick.assert_called_once_with()
+        self.assertEqual(reads.call_args.args[1][0].Value, 5)
+        self.assertEqual(watch.call_args.args[0].Value, 5)
+        self.assertEqual(write.call_args.args[0].Value, 1)
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_dispatched_callback_exception_handling(self, mock_plc_class):
+        """Test that a dispatched callback raising does not stop the others."""
+        mock_plc = MagicMock()
+        self._use_plc(mock_plc_class, mock_plc)
+        mock_plc.Read.return_value = [Response(tag_name='TestTag', value=123, status='Success')]
+        queue = CallbackQueue()
+        PlcConnectionManager.set_dispatcher(queue.put)
+        good_callback = Mock()
+        PlcConnectionManager.add_watch_tag('TestTag', callback=Mock(side_effect=RuntimeError('Callback error')))
+        PlcConnectionManager.add_watch_tag('TestTag', callback=good_callback)
+        PlcConnectionManager._connected = True
+
+        PlcConnectionManager._run_commands()
+
+        self.assertEqual(queue.drain(), 2)
+        good_callback.assert_called_once()
+        self.assertEqual(PlcConnectionManager._watch_table['TestTag'].last_value, 123)
+
+
+class TestPlcConnectionRegistry(unittest.TestCase):
+    """Test cases for PlcConnectionRegistry and connections to several PLCs."""
+
+    def setUp(self):
+        self.parameters = [ConnectionParameters(ip_address=Ipv4Address(f'10.0.0.{i}')) for i in range(1, 5)]
+
+    def tearDown(self):
+        for name in PlcConnectionRegistry.get_connections():
+            if name != PlcConnectionRegistry.DEFAULT_NAME:
+                PlcConnectionRegistry.remove_connection(name)
+        PlcSessionPool.close_all()
+
+    def test_cannot_instantiate(self):
+        with self.assertRaises(ValueError):
+            PlcConnectionRegistry()
+
+    def test_get_connection(self):
+        """Test that connections are created once per name."""
+        cell = PlcConnectionRegistry.get_connection('Cell1', self.parameters[0])
+
+        self.assertIsInstance(cell, PlcConnection)
+        self.assertIs(PlcConnectionRegistry.get_connection('Cell1'), cell)
+        self.assertIsNot(PlcConnectionRegistry.get_connection('Cell2'), cell)
+        self.assertIn('Cell1', PlcConnectionRegistry.get_connections())
+
+        PlcConnectionRegistry.get_connection('Cell1', self.parameters[1])
+        self.assertEqual(str(cell.connection_parameters.ip_address), '10.0.0.2')
+
+    def test_connections_share_scheduler(self):
+        """Test that all connections are driven by the same I/O scheduler."""
+        first = PlcConnectionRegistry.get_connection('Cell1', self.parameters[0])
+        second = PlcConnectionRegistry.get_connection('Cell2', self.parameters[1])
+
+        self.assertIsInstance(first._scheduler, PlcIoScheduler)
+        self.assertIs(first._scheduler, second._scheduler)
+
+    def test_connections_are_independent(self):
+        """Test that each connection has its own watch table, commands and session."""
+        first = PlcConnectionRegistry.get_connection('Cell1', self.parameters[0])
+        second = PlcConnectionRegistry.get_connection('Cell2', self.parameters[1])
+
+        first.add_watch_tag('Conveyor')
+        second.write_watch_tag('Robot', 1)
+
+        self.assertEqual(list(first.get_watch_table()), ['Conveyor'])
+        self.assertEqual(second.get_watch_table(), {})
+        self.assertEqual(len(first._commands), 0)
+        self.assertEqual(len(second._commands), 1)
+        self.assertIsNot(first.get_session(), second.get_session())
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_cell_of_plcs(self, mock_plc_class):
+        """Test connecting to and reading from several PLCs."""
+        plcs = {}
+
+        def create_plc(ip_address, **kwargs):
+            plc = MagicMock()
+            plc.GetPLCTime.return_value = Response(tag_name=None, value=datetime.now(), status='Success')
+            plc.Read.side_effect = lambda tags: [Response(x[0], ip_address, 'Success') for x in tags]
+            plcs[ip_address] = plc
+            return plc
+
+        mock_plc_class.side_effect = create_plc
+        connections = [
+            PlcConnectionRegistry.get_connection(f'Cell{i}', x) for i, x in enumerate(self.parameters)
+        ]
+        for connection in connections:
+            connection.add_watch_tag('Status')
+            connection.connect()
+
+        self.assertTrue(_wait_for(lambda: all(x.get_watched_tag_value('Status') for x in connections)))
+        self.assertEqual(len(plcs), 4)
+        self.assertEqual(
+            [x.get_watched_tag_value('Status') for x in connections],
+            [str(x.ip_address) for x in self.parameters]
+        )
+
+    def test_disconnect_drops_scheduled_loops(self):
+        """Test that loop iterations scheduled before a disconnect do not run."""
+        scheduler = Mock()
+        connection = PlcConnection('Cell1', self.parameters[0], scheduler)
+        connection._connected = True
+
+        with patch.object(connection, '_connection_loop') as mock_loop:
+            connection._schedule()
+            scheduler.schedule_task.call_args[0][0]()
+            mock_loop.assert_called_once()
+
+            connection._schedule()
+            scheduled = scheduler.schedule_task.call_args[0][0]
+            connection.disconnect()
+            scheduled()
+            mock_loop.assert_called_once()
+
+    def test_remove_connection(self):
+        """Test that removing a connection disconnects it."""
+        connection = PlcConnectionRegistry.get_connection('Cell1', self.parameters[0])
+        connection._connected = True
+
+        self.assertTrue(PlcConnectionRegistry.remove_connection('Cell1'))
+        self.assertFalse(connection.is_connected)
+        self.assertNotIn('Cell1', PlcConnectionRegistry.get_connections())
+        self.assertFalse(PlcConnectionRegistry.remove_connection('Cell1'))
+
+    def test_manager_is_facade_over_default_connection(self):
+        """Test that the static manager reads and writes the state of the default connection."""
+        default = PlcConnectionRegistry.get_default()
+
+        self.assertIs(PlcConnectionManager.get_connection(), default)
+        self.assertIs(PlcConnectionManager.connection_parameters, default.connection_parameters)
+
+        PlcConnectionManager.add_watch_tag('FacadeTag')
+        try:
+            self.assertIn('FacadeTag', default.get_watch_table())
+            PlcConnectionManager._connected = True
+            self.assertTrue(default.is_connected)
+        finally:
+            default._connected = False
+            default.remove_watch_tag('FacadeTag')
+
+
+class TestRateBuckets(unittest.TestCase):
+    """Test cases for watched tags read in rate buckets."""
+
+    def setUp(self):
+        self.scheduler = PlcIoScheduler(max_workers=4, name='test-plc-io')
+        self.connections = []
+
+    def tearDown(self):
+        for connection in self.connections:
+            connection.disconnect()
+        self.scheduler.shutdown(wait=True)
+        PlcSessionPool.close_all()
+
+    def _create_connection(self, ip_address: str, read_delay: float = 0.0) -> tuple[PlcConnection, MagicMock]:
+        plc = MagicMock()
+        plc.GetPLCTime.return_value = Response(tag_name=None, value=datetime.now(), status='Success')
+
+        def read(tags):
+            time.sleep(read_delay)
+            return [Response(x[0], 1, 'Success') for x in tags]
+
+        plc.Read.side_effect = read
+        parameters = ConnectionParameters(ip_address=Ipv4Address(ip_address), rpi=1000)
+        connection = PlcConnection(ip_address, parameters, self.scheduler)
+        self.connections.append(connection)
+        return connection, plc
+
+    @staticmethod
+    def _read_count(plc: MagicMock, tag_name: str) -> int:
+        return sum(1 for x in plc.Read.call_args_list if any(t[0] == tag_name for t in x.args[0]))
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_buckets_read_at_their_rate(self, mock_plc_class):
+        """Test that tags are batched per rate bucket and read at their own rate."""
+        connection, plc = self._create_connection('10.0.1.1')
+        mock_plc_class.return_value = plc
+        connection.add_watch_tag('Slow')
+        connection.add_watch_tag('Fast1', rate=20)
+        connection.add_watch_tag('Fast2', rate=20)
+        connection.connect()
+
+        self.assertTrue(_wait_for(lambda: self._read_count(plc, 'Fast1') >= 5))
+        self.assertEqual(self._read_count(plc, 'Slow'), 1)
+        self.assertTrue(all(
+            [t[0] for t in x.args[0]] in (['Slow'], ['Fast1', 'Fast2']) for x in plc.Read.call_args_list
+        ))
+
+        statistics = connection.get_bucket_statistics()
+        self.assertEqual(sorted(statistics), [20, 1000])
+        self.assertEqual(statistics[20].tags, 2)
+        self.assertGreaterEqual(statistics[20].runs, 5)
+        self.assertGreaterEqual(statistics[20].max_jitter, statistics[20].mean_jitter)
+        self.assertGreater(statistics[20].max_latency, 0.0)
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_bucket_ends_with_its_last_entry(self, mock_plc_class):
+        """Test that a bucket task stops once its tags are removed from the watch table."""
+        connection, plc = self._create_connection('10.0.1.1')
+        mock_plc_class.return_value = plc
+        connection.add_watch_tag('Fast', rate=20)
+        connection.connect()
+        self.assertTrue(_wait_for(lambda: connection._buckets == {20}))
+
+        connection.remove_watch_tag('Fast')
+
+        self.assertTrue(_wait_for(lambda: not connection._buckets))
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_slow_bucket_counts_overruns(self, mock_plc_class):
+        """Test that periods missed by a slow bucket are skipped and counted."""
+        connection, plc = self._create_connection('10.0.1.1', read_delay=0.05)
+        mock_plc_class.return_value = plc
+        connection.add_watch_tag('Fast', rate=10)
+        connection.connect()
+
+        self.assertTrue(_wait_for(lambda: connection.get_bucket_statistics().get(10, Mock(runs=0)).runs >= 3))
+        self.assertGreater(connection.get_bucket_statistics()[10].overruns, 0)
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_slow_plc_does_not_stall_others(self, mock_plc_class):
+        """Test that a PLC answering slowly does not hold up the buckets of another PLC."""
+        slow, slow_plc = self._create_connection('10.0.1.1', read_delay=0.5)
+        fast, fast_plc = self._create_connection('10.0.1.2')
+        mock_plc_class.side_effect = lambda ip_address, **kwargs: slow_plc if ip_address == '10.0.1.1' else fast_plc
+        slow.add_watch_tag('Tag', rate=20)
+        fast.add_watch_tag('Tag', rate=20)
+        slow.connect()
+        fast.connect()
+
+        self.assertTrue(_wait_for(lambda: self._read_count(fast_plc, 'Tag') >= 10, timeout=1.0))
+        self.assertLessEqual(self._read_count(slow_plc, 'Tag'), 2)
+
+    def test_tag_watched_at_several_rates(self):
+        """Test that a tag watched at several rates is read at the fastest one."""
+        connection, _ = self._create_connection('10.0.1.1')
+        connection.add_watch_tag('Tag', rate=100)
+        connection.add_watch_tag('Tag', rate=50)
+        connection.add_watch_tag('Tag', rate=200)
+        connection.add_watch_tag('Other')
+
+        self.assertEqual(connection.get_entry_rate(connection.get_watch_table()['Tag']), 50)
+        self.assertEqual(connection.get_entry_rate(connection.get_watch_table()['Other']), 1000)
+
 
 if __name__ == '__main__':
     unittest.main()
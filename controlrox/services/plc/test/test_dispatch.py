@@ -0,0 +1,100 @@
+"""Unit tests for the delivery of PLC connection callbacks."""
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from controlrox.services.plc.dispatch import CallbackQueue
+
+
+class TestCallbackQueue(unittest.TestCase):
+    """Test cases for CallbackQueue."""
+
+    def test_drain_runs_callbacks_in_order(self):
+        """Test that drained callbacks run in the order they were queued."""
+        queue = CallbackQueue()
+        calls = []
+        for i in range(3):
+            queue.put(lambda i=i: calls.append(i))
+
+        self.assertEqual(calls, [])
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.drain(), 3)
+        self.assertEqual(calls, [0, 1, 2])
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(queue.drain(), 0)
+
+    def test_drain_limit(self):
+        """Test that a drain runs at most its limit, or max_batch, of callbacks."""
+        queue = CallbackQueue(max_batch=2)
+        calls = []
+        for i in range(5):
+            queue.put(lambda i=i: calls.append(i))
+
+        self.assertEqual(queue.drain(), 2)
+        self.assertEqual(queue.drain(limit=1), 1)
+        self.assertEqual(calls, [0, 1, 2])
+        self.assertEqual(len(queue), 2)
+
+    @patch('controlrox.services.plc.dispatch.log')
+    def test_drain_continues_after_error(self, mock_log):
+        """Test that a failing callback is logged and does not stop the drain."""
+        queue = CallbackQueue()
+        calls = []
+        queue.put(Mock(side_effect=RuntimeError('boom')))
+        queue.put(lambda: calls.append('after'))
+
+        self.assertEqual(queue.drain(), 2)
+        self.assertEqual(calls, ['after'])
+        mock_log.return_value.error.assert_called_once()
+
+    def test_callbacks_run_on_draining_thread(self):
+        """Test that callbacks queued from other threads run on the thread draining the queue."""
+        queue = CallbackQueue()
+        threads = []
+        putters = [
+            threading.Thread(target=queue.put, args=(lambda: threads.append(threading.current_thread()),))
+            for _ in range(4)
+        ]
+        for putter in putters:
+            putter.start()
+        for putter in putters:
+            putter.join()
+
+        self.assertEqual(queue.drain(), 4)
+        self.assertEqual(threads, [threading.current_thread()] * 4)
+
+    def test_clear(self):
+        queue = CallbackQueue()
+        callback = Mock()
+        queue.put(callback)
+
+        queue.clear()
+
+        self.assertEqual(queue.drain(), 0)
+        callback.assert_not_called()
+
+    def test_drain_with_tk(self):
+        """Test that the Tk after loop drains the queue until the widget is destroyed."""
+        queue = CallbackQueue()
+        widget = Mock()
+        widget.winfo_exists.return_value = True
+        callback = Mock()
+
+        queue.drain_with_tk(widget, interval=10)
+        self.assertEqual(widget.after.call_args.args[0], 10)
+        run = widget.after.call_args.args[1]
+
+        queue.put(callback)
+        run()
+        callback.assert_called_once()
+        self.assertEqual(widget.after.call_count, 2)
+
+        widget.winfo_exists.return_value = False
+        queue.put(callback)
+        run()
+        callback.assert_called_once()
+        self.assertEqual(widget.after.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 """Unit tests for controlrox.services.plc.introspective module."""
+import gc
 import unittest
+import weakref
 from unittest.mock import Mock, patch
 
 from controlrox.interfaces import (
@@ -11,6 +13,7 @@ from controlrox.interfaces import (
 from controlrox.models import PlcObject
 
 from controlrox.services.plc.introspective import (
+    IntrospectiveModuleIndex,
     IntrospectiveModuleWarehouseFactory,
     IntrospectiveModuleWarehouse,
 )
@@ -162,6 +165,10 @@ class TestIntrospectiveModuleWarehouseFactory(unittest.TestCase):
         self.mock_module.input_connection_size = 10
         self.mock_module.output_connection_size = 20
         self.mock_module.config_connection_size = 5
+        IntrospectiveModuleWarehouseFactory.invalidate_module_index()
+
+    def tearDown(self):
+        IntrospectiveModuleWarehouseFactory.invalidate_module_index()
 
     @patch.object(IntrospectiveModuleWarehouseFactory, 'get_registered_types')
     def test_get_all_known_modules_returns_list(self, mock_get_registered):
@@ -477,6 +484,180 @@ class TestIntrospectiveModuleWarehouseFactory(unittest.TestCase):
         self.assertEqual(mock_log.call_count, 2)
 
 
+class _CatalogModule(ConcreteIntrospectiveModule):
+    """Introspective module with a fixed catalog number and connection."""
+    catalog = ''
+    instances = 0
+
+    def __init__(self, base_module: IModule):
+        super().__init__(base_module)
+        type(self).instances += 1
+
+    def get_catalog_number(self) -> str:
+        return self.catalog
+
+    def get_input_connection_point(self) -> int:
+        return 1
+
+    def get_output_connection_point(self) -> int:
+        return 2
+
+    def get_config_connection_point(self) -> int:
+        return 3
+
+    def get_input_connection_size(self) -> int:
+        return 10
+
+    def get_output_connection_size(self) -> int:
+        return 20
+
+    def get_config_connection_size(self) -> int:
+        return 5
+
+
+class _ExactModule(_CatalogModule):
+    catalog = '1234-ABCD'
+
+
+class _PrefixModule(_CatalogModule):
+    catalog = '1234'
+
+
+class _SuffixModule(_CatalogModule):
+    catalog = 'ABCD'
+
+
+class TestIntrospectiveModuleIndex(unittest.TestCase):
+    """Test cases for IntrospectiveModuleIndex class."""
+
+    def setUp(self):
+        self.mock_module = Mock(spec=IModule)
+        self.mock_module.name = 'TestModule'
+        self.mock_module.catalog_number = '1234-ABCD'
+        self.mock_module.input_connection_point = 1
+        self.mock_module.output_connection_point = 2
+        self.mock_module.config_connection_point = 3
+        self.mock_module.input_connection_size = 10
+        self.mock_module.output_connection_size = 20
+        self.mock_module.config_connection_size = 5
+        IntrospectiveModuleWarehouseFactory.invalidate_module_index()
+
+    def tearDown(self):
+        IntrospectiveModuleWarehouseFactory.invalidate_module_index()
+
+    def test_exact_match(self):
+        index = IntrospectiveModuleIndex([_SuffixModule, _ExactModule], self.mock_module)
+        self.assertIs(index.match(self.mock_module), _ExactModule)
+
+    def test_exact_match_requires_connection(self):
+        index = IntrospectiveModuleIndex([_ExactModule], self.mock_module)
+        self.mock_module.input_connection_size = 11
+        self.assertIsNone(index.match(self.mock_module))
+
+    def test_lazy_match_first_class_wins(self):
+        index = IntrospectiveModuleIndex([_SuffixModule, _PrefixModule, _ExactModule], self.mock_module)
+        self.mock_module.catalog_number = '1234-ABCD/A'
+        self.assertIsNone(index.match(self.mock_module))
+        self.assertIs(index.match(self.mock_module, lazy_match_catalog=True), _SuffixModule)
+
+    def test_lazy_match_skips_ethernet_module(self):
+        class EthernetModule(_CatalogModule):
+            catalog = 'ETHERNET'
+
+        self.mock_module.catalog_number = 'ETHERNET-MODULE'
+        index = IntrospectiveModuleIndex([EthernetModule], self.mock_module)
+        self.assertIsNone(index.match(self.mock_module, lazy_match_catalog=True))
+
+    @patch.object(IntrospectiveModuleWarehouseFactory, 'get_all_known_modules')
+    def test_only_winning_class_instantiated(self, mock_get_all):
+        mock_get_all.return_value = [_SuffixModule, _PrefixModule, _ExactModule]
+        IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(self.mock_module)
+
+        _SuffixModule.instances = _PrefixModule.instances = _ExactModule.instances = 0
+        for _ in range(10):
+            result = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(self.mock_module)
+
+        self.assertIsInstance(result, _ExactModule)
+        self.assertEqual(_ExactModule.instances, 10)
+        self.assertEqual(_SuffixModule.instances + _PrefixModule.instances, 0)
+
+    @patch.object(IntrospectiveModuleWarehouseFactory, 'get_all_known_modules')
+    def test_index_updated_on_registration(self, mock_get_all):
+        mock_get_all.return_value = [_SuffixModule]
+        index = IntrospectiveModuleWarehouseFactory.get_module_index(self.mock_module)
+        self.assertIs(IntrospectiveModuleWarehouseFactory.get_module_index(self.mock_module), index)
+
+        _SuffixModule.instances = _ExactModule.instances = 0
+        IntrospectiveModuleWarehouseFactory.register_module_class(_ExactModule)
+        IntrospectiveModuleWarehouseFactory.register_module_class(_ExactModule)
+
+        self.assertEqual(len(index), 1)
+
+        self.assertIs(IntrospectiveModuleWarehouseFactory.get_module_index(self.mock_module), index)
+        self.assertEqual(len(index), 2)
+        self.assertEqual((_SuffixModule.instances, _ExactModule.instances), (0, 1))
+        self.assertIs(index.match(self.mock_module), _ExactModule)
+        mock_get_all.assert_called_once()
+
+        class NewWarehouse(IntrospectiveModuleWarehouse):
+            pass
+
+        self.assertIsNot(IntrospectiveModuleWarehouseFactory.get_module_index(self.mock_module), index)
+
+    @patch.object(IntrospectiveModuleWarehouseFactory, 'get_all_known_modules')
+    def test_index_does_not_keep_sample_module(self, mock_get_all):
+        mock_get_all.return_value = [_SuffixModule]
+        sample = Mock(spec=IModule)
+        sample_ref = weakref.ref(sample)
+        index = IntrospectiveModuleWarehouseFactory.get_module_index(sample)
+        IntrospectiveModuleWarehouseFactory.register_module_class(_ExactModule, sample)
+        del sample
+        gc.collect()
+
+        self.assertIsNone(sample_ref())
+        self.assertIs(index.match(self.mock_module), _ExactModule)
+
+    @patch.object(IntrospectiveModuleWarehouseFactory, 'get_registered_types')
+    def test_unregister_module_class(self, mock_get_registered):
+        class _ReplacedModule(_CatalogModule):
+            catalog = '1234-ABCD'
+
+        registered = {'_ReplacedModule': _ReplacedModule, '_SuffixModule': _SuffixModule}
+        warehouse = Mock()
+        warehouse.get_registered_types.return_value = registered
+        warehouse.get_known_module_classes.return_value = [_ReplacedModule, _SuffixModule]
+        mock_get_registered.return_value = {'TestWarehouse': warehouse}
+        index = IntrospectiveModuleWarehouseFactory.get_module_index(self.mock_module)
+        self.assertIs(index.match(self.mock_module), _ReplacedModule)
+
+        IntrospectiveModuleWarehouseFactory.unregister_module_class(_ReplacedModule)
+
+        self.assertEqual(registered, {'_SuffixModule': _SuffixModule})
+        self.assertEqual(IntrospectiveModuleWarehouseFactory.get_all_known_modules(), [_SuffixModule])
+        new_index = IntrospectiveModuleWarehouseFactory.get_module_index(self.mock_module)
+        self.assertIsNot(new_index, index)
+        self.assertIsNone(new_index.match(self.mock_module))
+
+    @patch.object(IntrospectiveModuleWarehouseFactory, 'get_all_known_modules')
+    def test_module_provider_used_when_no_class_matches(self, mock_get_all):
+        mock_get_all.return_value = [_SuffixModule]
+        provider = Mock(return_value=_ExactModule)
+        IntrospectiveModuleWarehouseFactory.register_module_provider(provider)
+        IntrospectiveModuleWarehouseFactory.register_module_provider(provider)
+        try:
+            result = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(self.mock_module)
+            again = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(self.mock_module)
+            lazy = IntrospectiveModuleWarehouseFactory.get_imodule_from_meta_data(self.mock_module, True)
+        finally:
+            IntrospectiveModuleWarehouseFactory.unregister_module_provider(provider)
+
+        self.assertIsInstance(result, _ExactModule)
+        self.assertIsInstance(again, _ExactModule)
+        self.assertIsInstance(lazy, _SuffixModule)
+        provider.assert_called_once_with(self.mock_module, False)
+        self.assertIsNone(IntrospectiveModuleWarehouseFactory.get_module_class_from_providers(self.mock_module))
+
+
 class TestIntrospectiveModuleWarehouse(unittest.TestCase):
     """Test cases for IntrospectiveModuleWarehouse class."""
 
@@ -0,0 +1,86 @@
+"""Unit tests for controlrox.services.plc.network module."""
+import unittest
+from unittest.mock import MagicMock
+
+from controlrox.interfaces import IModule, ModuleControlsType
+from controlrox.services.plc.network import (
+    NO_ADDRESS,
+    NO_RPI,
+    ModuleNetworkTable,
+    format_ipv4,
+    parse_ipv4,
+)
+
+
+def _make_module(name: str, address: str, rpi: str, parent: str = 'Local') -> MagicMock:
+    module = MagicMock(spec=IModule)
+    module.name = name
+    module.ip_address = address
+    module.rpi = rpi
+    module.meta_data = {'@Name': name, '@ParentModule': parent}
+    return module
+
+
+class TestParseIpv4(unittest.TestCase):
+    """Test cases for parse_ipv4 and format_ipv4 functions."""
+
+    def test_round_trip(self):
+        self.assertEqual(format_ipv4(parse_ipv4('136.129.1.10')), '136.129.1.10')
+
+    def test_invalid_addresses(self):
+        for address in (None, '', '136.129.1', '136.129.1.256', '136.129.a.1'):
+            self.assertEqual(parse_ipv4(address), NO_ADDRESS, address)
+
+
+class TestModuleNetworkTable(unittest.TestCase):
+    """Test cases for ModuleNetworkTable class."""
+
+    def setUp(self):
+        self.modules = [
+            _make_module('Drive1', '136.129.6.10', '30000.0', 'Adapter'),
+            _make_module('Block1', '136.129.1.10', '20000.0', 'Adapter'),
+            _make_module('Block2', '136.129.1.10', '20000.0'),
+            _make_module('Other', '10.0.17.1', ''),
+            _make_module('Rack', '', '10000.0'),
+        ]
+        types = {
+            'Drive1': ModuleControlsType.DRIVE,
+            'Block1': ModuleControlsType.INPUT_BLOCK,
+            'Block2': ModuleControlsType.INPUT_BLOCK,
+        }
+        self.table = ModuleNetworkTable(self.modules, lambda x: types.get(x.name))
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(self.table.rpis[0], 30000.0)
+        self.assertEqual(self.table.rpis[3], NO_RPI)
+        self.assertEqual(self.table.addresses[4], NO_ADDRESS)
+        self.assertEqual(self.table.get_octet(0, 2), 6)
+        self.assertEqual(self.table.get_addressed_rows(), [0, 1, 2, 3])
+
+    def test_rows_sharing_address(self):
+        self.assertEqual(self.table.get_rows_sharing_address(1), [2])
+        self.assertEqual(self.table.get_rows_sharing_address(4), [])
+
+    def test_rpi_budget_by_parent(self):
+        budget = self.table.get_rpi_budget_by_parent()
+        self.assertAlmostEqual(budget['Adapter'], 1000.0 / 30.0 + 50.0)
+        self.assertAlmostEqual(budget['Local'], 150.0)
+
+    def test_get_row_reparses_edited_module(self):
+        self.modules[2].ip_address = '136.129.1.11'
+        row = self.table.get_row(self.modules[2])
+        self.assertEqual(format_ipv4(self.table.addresses[row]), '136.129.1.11')
+        self.assertEqual(self.table.get_rows_sharing_address(1), [])
+
+    def test_has_module(self):
+        self.assertTrue(self.table.has_module(self.modules[0]))
+        self.assertFalse(self.table.has_module(_make_module('Drive1', '136.129.6.10', '30000.0')))
+        self.assertFalse(self.table.has_module(_make_module('New', '', '')))
+
+    def test_get_row_unknown_module(self):
+        self.assertEqual(self.table.get_row(_make_module('New', '', '')), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Unit tests for the PLC value recorder."""
+import os
+import tempfile
+import unittest
+from array import array
+from unittest.mock import Mock
+
+from pylogix.lgx_response import Response
+
+from controlrox.services.plc.recorder import PlcRecorder, SampleBuffer, decimate
+
+
+class TestSampleBuffer(unittest.TestCase):
+    """Test cases for SampleBuffer."""
+
+    def setUp(self):
+        self.buffer = SampleBuffer(4)
+
+    def test_append_wraps_around(self):
+        for i in range(6):
+            self.buffer.append(float(i), i * 10.0)
+
+        self.assertEqual(len(self.buffer), 4)
+        self.assertEqual(self.buffer.total, 6)
+        times, values = self.buffer.get_range()
+        self.assertEqual(times.tolist(), [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(values.tolist(), [20.0, 30.0, 40.0, 50.0])
+
+    def test_get_range(self):
+        for i in range(6):
+            self.buffer.append(float(i), i * 10.0)
+
+        self.assertEqual(self.buffer.get_range(3.0, 4.0)[0].tolist(), [3.0, 4.0])
+        self.assertEqual(self.buffer.get_range(3.5)[0].tolist(), [4.0, 5.0])
+        self.assertEqual(self.buffer.get_range(end=2.5)[1].tolist(), [20.0])
+        self.assertEqual(len(self.buffer.get_range(6.0)[0]), 0)
+
+    def test_get_since(self):
+        for i in range(3):
+            self.buffer.append(float(i), 0.0)
+        (times, _), dropped = self.buffer.get_since(1)
+        self.assertEqual((times.tolist(), dropped), ([1.0, 2.0], 0))
+
+        for i in range(3, 9):
+            self.buffer.append(float(i), 0.0)
+        (times, _), dropped = self.buffer.get_since(3)
+        self.assertEqual((times.tolist(), dropped), ([5.0, 6.0, 7.0, 8.0], 2))
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            SampleBuffer(0)
+
+
+class TestDecimate(unittest.TestCase):
+    """Test cases for decimate."""
+
+    def test_keeps_small_ranges(self):
+        times, values = decimate(array('d', [1.0, 2.0]), array('d', [5.0, 6.0]), 10)
+        self.assertEqual((times, values), ([1.0, 2.0], [5.0, 6.0]))
+
+    def test_keeps_peaks(self):
+        values = array('d', [0.0] * 1000)
+        values[123] = 50.0
+        values[777] = -20.0
+
+        times, decimated = decimate(array('d', range(1000)), values, 20)
+
+        self.assertLessEqual(len(times), 20)
+        self.assertIn(50.0, decimated)
+        self.assertIn(-20.0, decimated)
+        self.assertEqual(times, sorted(times))
+
+
+class TestPlcRecorder(unittest.TestCase):
+    """Test cases for PlcRecorder."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'recording.zip')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_record_responses(self):
+        recorder = PlcRecorder(capacity=10)
+        recorder.record_responses(1.0, [
+            Response('Speed', 1.5, 'Success'),
+            Response('Running', True, 'Success'),
+            Response('Name', 'Pump', 'Success'),
+            Response('Missing', None, 'Path segment error'),
+        ])
+
+        self.assertEqual(sorted(recorder.get_tags()), ['Running', 'Speed'])
+        self.assertEqual(recorder.get_samples('Running')[1].tolist(), [1.0])
+        self.assertEqual(recorder.skipped, 1)
+        self.assertEqual(len(recorder.get_samples('Other')[0]), 0)
+
+    def test_record_selected_tags(self):
+        recorder = PlcRecorder(tags=['Speed'])
+
+        self.assertTrue(recorder.record('Speed', 1.0, 2))
+        self.assertFalse(recorder.record('Level', 1.0, 3))
+        self.assertEqual(recorder.get_tags(), ['Speed'])
+
+    def test_flush_and_load(self):
+        recorder = PlcRecorder(capacity=4, path=self.path)
+        for i in range(3):
+            recorder.record('Speed', float(i), i * 2)
+        self.assertEqual(recorder.flush(), 3)
+        self.assertEqual(recorder.flush(), 0)
+
+        for i in range(3, 9):
+            recorder.record('Speed', float(i), i * 2)
+            recorder.record('Level', float(i), -i)
+        self.assertEqual(recorder.flush(), 8)
+
+        samples = PlcRecorder.load(self.path)
+        self.assertEqual(samples['Speed'][0].tolist(), [0.0, 1.0, 2.0, 5.0, 6.0, 7.0, 8.0])
+        self.assertEqual(samples['Speed'][1].tolist(), [0.0, 2.0, 4.0, 10.0, 12.0, 14.0, 16.0])
+        self.assertEqual(samples['Level'][1].tolist(), [-5.0, -6.0, -7.0, -8.0])
+        self.assertEqual(recorder.dropped, 4)
+
+    def test_start_and_stop(self):
+        connection = Mock()
+        recorder = PlcRecorder(path=self.path, flush_interval=60.0)
+
+        recorder.start(connection)
+        self.assertTrue(recorder.is_recording)
+        connection.subscribe_to_reads.assert_called_once_with(recorder.record_responses)
+        recorder.record_responses(1.0, [Response('Speed', 3, 'Success')])
+        recorder.stop()
+
+        self.assertFalse(recorder.is_recording)
+        connection.unsubscribe_from_reads.assert_called_once_with(recorder.record_responses)
+        self.assertEqual(PlcRecorder.load(self.path)['Speed'][1].tolist(), [3.0])
+
+    def test_get_decimated(self):
+        recorder = PlcRecorder(capacity=1000)
+        for i in range(1000):
+            recorder.record('Speed', float(i), float(i % 10))
+
+        times, values = recorder.get_decimated('Speed', 100.0, 899.0, max_points=50)
+
+        self.assertLessEqual(len(times), 50)
+        self.assertGreaterEqual(times[0], 100.0)
+        self.assertLessEqual(times[-1], 899.0)
+        self.assertEqual((min(values), max(values)), (0.0, 9.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
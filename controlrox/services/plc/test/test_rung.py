@@ -0,0 +1,97 @@
+"""Unit tests for controlrox.services.plc.rung module."""
+import unittest
+from unittest.mock import Mock
+
+from controlrox.services.plc.instruction import InstructionSequenceBuilder, tokenize_rung_text
+from controlrox.services.plc.rung import RungTemplate, get_rung_template
+
+
+TEXT = 'XIC({input})[OTE({output}[1]),MOV({input},{output}.Data)];'
+
+
+class TestRungTemplate(unittest.TestCase):
+    """Test cases for RungTemplate class."""
+
+    def setUp(self):
+        self.template = RungTemplate(TEXT, 'Map {input} to {output} on {module.name}')
+
+    def test_fields(self):
+        self.assertEqual(self.template.fields, ('input', 'output', 'module.name'))
+
+    def test_render(self):
+        operands = {'input': 'Local:1:I.Data.0', 'output': 'zz_Out', 'module.name': 'Local'}
+
+        self.assertEqual(self.template.render(operands), 'XIC(Local:1:I.Data.0)[OTE(zz_Out[1]),MOV(Local:1:I.Data.0,zz_Out.Data)];')
+        self.assertEqual(self.template.render_comment(operands), 'Map Local:1:I.Data.0 to zz_Out on Local')
+
+    def test_render_operand_vector(self):
+        self.assertEqual(self.template.render(['A', 'B', 'M']), 'XIC(A)[OTE(B[1]),MOV(A,B.Data)];')
+
+    def test_render_tokens_match_tokenizer(self):
+        operands = ['A', 'B', 'M']
+
+        self.assertEqual(self.template.render_tokens(operands), tokenize_rung_text(self.template.render(operands)))
+
+    def test_create_sequence_matches_built_sequence(self):
+        operands = ['A', 'B', 'M']
+        expected = InstructionSequenceBuilder(tokenize_rung_text(self.template.render(operands))).build_sequence()
+
+        first = self.template.create_sequence(operands)
+        second = self.template.create_sequence(['C', 'D', 'M'])
+
+        self.assertEqual(first, expected)
+        self.assertEqual(second[0].instruction, 'XIC(C)')
+        self.assertIsNot(first[1], second[1])
+
+    def test_create_meta_data(self):
+        meta_data = self.template.create_meta_data(['A', 'B', 'M'], 4)
+
+        self.assertEqual(meta_data, {
+            '@Number': 4,
+            '@Type': 'N',
+            'Comment': 'Map A to B on M',
+            'Text': 'XIC(A)[OTE(B[1]),MOV(A,B.Data)];',
+        })
+
+    def test_create_rungs(self):
+        controller = Mock()
+        rungs = self.template.create_rungs(controller, [['A', 'B', 'M'], ['C', 'D', 'M']])
+
+        self.assertEqual(len(rungs), 2)
+        self.assertEqual(controller.create_rung.call_count, 2)
+        meta_data = controller.create_rung.call_args_list[1].kwargs['meta_data']
+        self.assertEqual(meta_data['Text'], 'XIC(C)[OTE(D[1]),MOV(C,D.Data)];')
+        sequence = controller.create_rung.return_value.set_sequence.call_args.args[0]
+        self.assertEqual(sequence[0].instruction, 'XIC(C)')
+
+    def test_missing_operands(self):
+        with self.assertRaises(ValueError):
+            self.template.render({'input': 'A'})
+        with self.assertRaises(ValueError):
+            self.template.render(['A'])
+
+    def test_operand_changing_structure(self):
+        with self.assertRaises(ValueError):
+            self.template.render(['A)OTE(B', 'B', 'M'])
+
+    def test_invalid_templates(self):
+        with self.assertRaises(ValueError):
+            RungTemplate('XIC(A)[OTE(B);')
+        with self.assertRaises(ValueError):
+            RungTemplate('{instruction}(A);')
+        with self.assertRaises(ValueError):
+            RungTemplate('')
+
+    def test_template_without_placeholders(self):
+        template = RungTemplate('NOP();')
+
+        self.assertEqual(template.fields, ())
+        self.assertEqual(template.render([]), 'NOP();')
+
+    def test_get_rung_template_is_cached(self):
+        self.assertIs(get_rung_template(TEXT, 'comment'), get_rung_template(TEXT, 'comment'))
+        self.assertIsNot(get_rung_template(TEXT, 'comment'), get_rung_template(TEXT, 'other'))
+
+
+if __name__ == '__main__':
+    unittest.main()
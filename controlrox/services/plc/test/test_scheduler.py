@@ -0,0 +1,108 @@
+"""Unit tests for the PLC I/O scheduler."""
+import threading
+import time
+import unittest
+
+from controlrox.services.plc.scheduler import BucketStatistics, PlcIoScheduler
+
+
+class TestBucketStatistics(unittest.TestCase):
+    """Test cases for BucketStatistics."""
+
+    def test_record(self):
+        statistics = BucketStatistics(rate=100)
+        self.assertEqual(statistics.mean_jitter, 0.0)
+        self.assertEqual(statistics.mean_latency, 0.0)
+
+        statistics.record(0.002, 0.010)
+        statistics.record(0.004, 0.030)
+
+        self.assertEqual(statistics.runs, 2)
+        self.assertEqual(statistics.last_jitter, 0.004)
+        self.assertEqual(statistics.max_jitter, 0.004)
+        self.assertAlmostEqual(statistics.mean_jitter, 0.003)
+        self.assertEqual(statistics.last_latency, 0.030)
+        self.assertEqual(statistics.max_latency, 0.030)
+        self.assertAlmostEqual(statistics.mean_latency, 0.020)
+
+
+class TestPlcIoScheduler(unittest.TestCase):
+    """Test cases for PlcIoScheduler."""
+
+    def setUp(self):
+        self.scheduler = PlcIoScheduler(max_workers=2, name='test-plc-io')
+
+    def tearDown(self):
+        self.scheduler.shutdown(wait=True)
+
+    def test_tasks_run_in_due_order_off_the_caller_thread(self):
+        done = threading.Event()
+        runs = []
+
+        def task(name):
+            runs.append((name, threading.current_thread()))
+            if len(runs) == 3:
+                done.set()
+
+        self.scheduler.schedule_task(lambda: task('late'), 0.06)
+        self.scheduler.schedule_task(lambda: task('first'), 0.0)
+        self.scheduler.schedule_task(lambda: task('middle'), 0.03)
+
+        self.assertTrue(done.wait(2.0))
+        self.assertEqual([x[0] for x in runs], ['first', 'middle', 'late'])
+        self.assertNotIn(threading.current_thread(), [x[1] for x in runs])
+
+    def test_cancel_task(self):
+        done = threading.Event()
+        cancelled = []
+        task_id = self.scheduler.schedule_task(lambda: cancelled.append(True), 0.02)
+        self.scheduler.schedule_task(done.set, 0.05)
+
+        self.assertTrue(self.scheduler.cancel_task(task_id))
+        self.assertFalse(self.scheduler.cancel_task(task_id))
+        self.assertTrue(done.wait(2.0))
+        self.assertEqual(cancelled, [])
+
+    def test_clear_all_tasks(self):
+        runs = []
+        self.scheduler.schedule_task(lambda: runs.append(1), 0.02)
+        self.scheduler.schedule_task(lambda: runs.append(2), 0.02)
+
+        self.scheduler.clear_all_tasks()
+        time.sleep(0.1)
+
+        self.assertEqual(runs, [])
+        self.assertEqual(self.scheduler._tasks, {})
+
+    def test_slow_task_does_not_delay_others(self):
+        release = threading.Event()
+        done = threading.Event()
+        self.scheduler.schedule_task(lambda: release.wait(2.0), 0.0)
+        self.scheduler.schedule_task(done.set, 0.01)
+
+        self.assertTrue(done.wait(0.5))
+        release.set()
+
+    def test_failing_task_does_not_stop_scheduler(self):
+        done = threading.Event()
+
+        def fail():
+            raise RuntimeError('task failed')
+
+        self.scheduler.schedule_task(fail, 0.0)
+        self.scheduler.schedule_task(done.set, 0.01)
+
+        self.assertTrue(done.wait(2.0))
+
+    def test_shutdown_and_restart(self):
+        done = threading.Event()
+        self.scheduler.schedule_task(lambda: None, 0.0)
+        self.scheduler.shutdown(wait=True)
+        self.assertIsNone(self.scheduler._thread)
+
+        self.scheduler.schedule_task(done.set, 0.0)
+        self.assertTrue(done.wait(2.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
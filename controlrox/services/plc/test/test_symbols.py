@@ -0,0 +1,224 @@
+"""Unit tests for the PLC symbol cache."""
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pylogix.lgx_response import Response
+from pylogix.lgx_tag import Tag
+from pyrox.models.network import Ipv4Address
+
+from controlrox.services.plc.connection import ConnectionParameters, PlcConnection, PlcSession, PlcSessionPool
+from controlrox.services.plc.scheduler import PlcIoScheduler
+from controlrox.services.plc.symbols import SymbolCache, SymbolInfo, SymbolInstancePLC, get_symbol_cache_path
+from controlrox.services.plc.test.lgx_server import DINT, REAL, LogixServer
+
+
+def _tag(name: str, instance_id: int, symbol_type: int, struct: bool = False, array: int = 0) -> Tag:
+    tag = Tag()
+    tag.TagName = name
+    tag.InstanceID = instance_id
+    tag.SymbolType = symbol_type & 0xff
+    tag.DataTypeValue = symbol_type
+    tag.Struct = int(struct)
+    tag.Array = array
+    tag.Size = 10 if array else 0
+    tag.DataType = 'Motor' if struct else ''
+    return tag
+
+
+TAG_LIST = [
+    _tag('Counter', 1, DINT),
+    _tag('Speeds', 2, REAL, array=1),
+    _tag('Motor1', 3, 0x0F21, struct=True),
+    _tag('Program:Main', 4, 0x68),
+    _tag('Program:Main.Step', 5, DINT),
+]
+
+
+class TestSymbolCache(unittest.TestCase):
+    """Test cases for SymbolCache."""
+
+    def setUp(self):
+        self.cache = SymbolCache.from_tag_list(TAG_LIST, 'Line1', '2026-01-01')
+
+    def test_from_tag_list(self):
+        self.assertTrue(self.cache.live)
+        self.assertEqual(len(self.cache), 5)
+        self.assertEqual(self.cache.symbols['Counter'], SymbolInfo('Counter', 1, DINT))
+        self.assertEqual(self.cache.symbols['Motor1'].template_id, 0x0F21)
+        self.assertEqual(self.cache.symbols['Motor1'].data_type, 0)
+        self.assertEqual(self.cache.symbols['Motor1'].data_type_name, 'Motor')
+        self.assertEqual(self.cache.symbols['Program:Main'].data_type, 0)
+
+    def test_get_data_type(self):
+        self.assertEqual(self.cache.get_data_type('Counter'), DINT)
+        self.assertEqual(self.cache.get_data_type('Counter.3'), DINT)
+        self.assertEqual(self.cache.get_data_type('Speeds[4]'), REAL)
+        self.assertEqual(self.cache.get_data_type('Program:Main.Step'), DINT)
+        self.assertEqual(self.cache.get_data_type('Motor1'), 0)
+        self.assertEqual(self.cache.get_data_type('Motor1.Running'), 0)
+        self.assertEqual(self.cache.get_data_type('Missing'), 0)
+        self.assertIn('Speeds[1]', self.cache)
+        self.assertNotIn('Missing', self.cache)
+
+    def test_get_instance_ids(self):
+        self.assertEqual(self.cache.get_instance_ids(), {'Counter': 1, 'Speeds': 2, 'Motor1': 3})
+
+        self.cache.live = False
+        self.assertEqual(self.cache.get_instance_ids(), {})
+
+    def test_seed(self):
+        known_tags = {'Counter': (REAL, 0)}
+        self.cache.seed(known_tags)
+
+        self.assertEqual(known_tags, {'Counter': (REAL, 0), 'Speeds': (REAL, 0), 'Program:Main.Step': (DINT, 0)})
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = get_symbol_cache_path(os.path.join(directory, 'Line1.L5X'))
+            self.assertEqual(path.name, 'Line1.symbols.json')
+            self.assertIsNone(SymbolCache.load(path, 'Line1', '2026-01-01'))
+
+            self.cache.save(path)
+            loaded = SymbolCache.load(path, 'Line1', '2026-01-01')
+
+            self.assertIsNotNone(loaded)
+            self.assertFalse(loaded.live)
+            self.assertEqual(loaded.symbols, self.cache.symbols)
+            self.assertIsNone(SymbolCache.load(path, 'Line1', '2026-02-01'))
+            self.assertIsNone(SymbolCache.load(path, 'Line2', '2026-01-01'))
+
+            path.write_text('not json')
+            self.assertIsNone(SymbolCache.load(path, 'Line1', '2026-01-01'))
+
+
+class TestSymbolInstancePLC(unittest.TestCase):
+    """Test cases for SymbolInstancePLC."""
+
+    def setUp(self):
+        self.comm = SymbolInstancePLC(instance_ids={'Counter': 0x0102, 'Speeds': 2})
+
+    def test_build_ioi(self):
+        self.assertEqual(self.comm._build_ioi('Counter', DINT), b'\x20\x6b\x25\x00\x02\x01')
+        self.assertEqual(self.comm._build_ioi('Speeds[3]', REAL), b'\x20\x6b\x25\x00\x02\x00\x28\x03')
+        self.assertEqual(self.comm._build_ioi('Other', DINT), b'\x91\x05Other\x00')
+        self.assertEqual(
+            self.comm._build_ioi('Program:Main.Counter', DINT),
+            b'\x91\x0cProgram:Main\x91\x07Counter\x00'
+        )
+
+
+class TestSymbolSession(unittest.TestCase):
+    """Test cases for PLC sessions using a symbol cache, against a local stand-in PLC."""
+
+    def setUp(self):
+        self.server = LogixServer({'Counter': (DINT, 5), 'Output': (DINT, 0), 'Level': (REAL, 1.5)})
+        self.server.start()
+        self.session = PlcSession('127.0.0.1', port=self.server.port, timeout=1.0, backoff_initial=0.0)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+
+    def _use_tag_list(self) -> SymbolCache:
+        response = self.session.get_tag_list()
+        self.assertEqual(response.Status, 'Success')
+        cache = SymbolCache.from_tag_list(response.Value)
+        self.session.set_symbol_cache(cache)
+        return cache
+
+    def test_reads_and_writes_by_instance(self):
+        """Test that a live cache addresses tags by instance and skips type discovery."""
+        cache = self._use_tag_list()
+        self.assertEqual(cache.get_instance_ids(), {'Counter': 1, 'Output': 2, 'Level': 3})
+        requests = self.server.requests
+
+        self.assertEqual(self.session.read('Counter').Value, 5)
+        self.assertEqual(self.session.write('Output', 7).Status, 'Success')
+        responses = self.session.read_tags([('Counter', 0), ('Level', 0)])
+
+        self.assertEqual([x.Value for x in responses], [5, 1.5])
+        self.assertEqual(self.server.tags['Output'], (DINT, 7))
+        self.assertEqual(self.server.instance_paths, 4)
+        self.assertEqual(self.server.requests - requests, 4)  # reconnect probe and three requests, no type reads
+
+    def test_path_error_drops_instance_ids(self):
+        """Test that a rejected instance path stops instance addressing."""
+        cache = self._use_tag_list()
+        self.server.set_instance_ids({'Counter': 11, 'Output': 12, 'Level': 13})
+
+        self.assertEqual(self.session.read('Counter').Status, 'Path segment error')
+        self.assertFalse(cache.live)
+        self.assertEqual(self.session.read('Counter').Value, 5)
+        self.assertEqual(self.session.statistics.failures, 0)
+
+    def test_connection_failure_drops_instance_ids(self):
+        """Test that instance ids are not trusted after the connection failed."""
+        cache = self._use_tag_list()
+        self.assertEqual(self.session.read('Counter').Value, 5)
+        self.server.drop_connections()
+
+        self.assertEqual(self.session.read('Counter').Status, 'Connection failure')
+        self.assertFalse(cache.live)
+        paths = self.server.instance_paths
+        self.assertEqual(self.session.read('Counter').Value, 5)
+        self.assertEqual(self.server.instance_paths, paths)
+
+
+class TestConnectionSymbolCache(unittest.TestCase):
+    """Test cases for the symbol cache of a PLC connection."""
+
+    def setUp(self):
+        self.scheduler = PlcIoScheduler(max_workers=2, name='test-plc-io')
+        parameters = ConnectionParameters(ip_address=Ipv4Address('10.0.2.1'))
+        self.connection = PlcConnection('symbols', parameters, self.scheduler)
+        self.directory = tempfile.TemporaryDirectory()
+        self.project_path = os.path.join(self.directory.name, 'Line1.L5X')
+
+    def tearDown(self):
+        self.connection.disconnect()
+        self.scheduler.shutdown(wait=True)
+        PlcSessionPool.close_all()
+        self.directory.cleanup()
+
+    @patch('controlrox.services.plc.connection.PLC')
+    def test_read_plc_tag_table_builds_and_persists_cache(self, mock_plc_class):
+        plc = MagicMock()
+        plc.GetPLCTime.return_value = Response(None, None, 'Success')
+        plc.GetTagList.return_value = Response(None, TAG_LIST, 'Success')
+        mock_plc_class.return_value = plc
+        self.assertIsNone(self.connection.use_symbol_cache('Line1', '2026-01-01', self.project_path))
+        self.connection.add_watch_tag('Counter')
+
+        response = self.connection.read_plc_tag_table()
+
+        self.assertEqual(response.Value, TAG_LIST)
+        cache = self.connection.symbol_cache
+        self.assertTrue(cache.live)
+        self.assertIs(self.connection.get_session().symbol_cache, cache)
+        self.assertEqual(self.connection.get_watch_table()['Counter'].data_type, DINT)
+        self.assertFalse(self.connection.get_session().is_open)  # reopened to address tags by instance
+        self.assertTrue(get_symbol_cache_path(self.project_path).is_file())
+
+    def test_use_symbol_cache_loads_persisted_cache(self):
+        SymbolCache.from_tag_list(TAG_LIST, 'Line1', '2026-01-01').save(get_symbol_cache_path(self.project_path))
+        self.connection.add_watch_tag('Speeds[2]')
+
+        cache = self.connection.use_symbol_cache('Line1', '2026-01-01', self.project_path)
+
+        self.assertIsNotNone(cache)
+        self.assertFalse(cache.live)
+        self.assertIs(self.connection.use_symbol_cache('Line1', '2026-01-01', self.project_path), cache)
+        self.assertEqual(self.connection.get_watch_table()['Speeds[2]'].data_type, REAL)
+        self.connection.add_watch_tag('Program:Main.Step')
+        self.assertEqual(self.connection.get_watch_table()['Program:Main.Step'].data_type, DINT)
+        self.connection.add_watch_tag('Counter', data_type=REAL)
+        self.assertEqual(self.connection.get_watch_table()['Counter'].data_type, REAL)
+
+        self.assertIsNone(self.connection.use_symbol_cache('Line1', '2026-03-01', self.project_path))
+        self.assertIsNone(self.connection.symbol_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""Unit tests for the packed structure (UDT) codec."""
+import struct
+import unittest
+
+from controlrox.models.plc.rockwell.datatype import RaDatatype
+from controlrox.services.plc.connection import PlcSession
+from controlrox.services.plc.test.lgx_server import DINT, STRUCT, LogixServer
+from controlrox.services.plc.udt import BUILTIN_LAYOUTS, UdtLayout, UdtView
+
+
+def _member(name: str, data_type: str, dimension: str = '0', hidden: bool = False, **extra) -> dict:
+    member = {'@Name': name, '@DataType': data_type, '@Dimension': dimension, '@Hidden': str(hidden).lower()}
+    member.update({f'@{key}': value for key, value in extra.items()})
+    return member
+
+
+MOTOR = RaDatatype(meta_data={
+    '@Name': 'Motor',
+    '@Family': 'NoFamily',
+    'Members': {
+        'Member': [
+            _member('ZZZZZZZZZZMotor0', 'SINT', hidden=True),
+            _member('Running', 'BIT', Target='ZZZZZZZZZZMotor0', BitNumber='0'),
+            _member('Faulted', 'BIT', Target='ZZZZZZZZZZMotor0', BitNumber='1'),
+            _member('Speed', 'REAL'),
+            _member('Mode', 'INT'),
+            _member('Counts', 'DINT', '3'),
+            _member('Flags', 'BOOL', '40'),
+            _member('Delay', 'TIMER'),
+            _member('Label', 'STRING'),
+        ]}})
+
+LINE = RaDatatype(meta_data={
+    '@Name': 'Line',
+    '@Family': 'NoFamily',
+    'Members': {
+        'Member': [
+            _member('Id', 'SINT'),
+            _member('Motors', 'Motor', '2'),
+            _member('Total', 'LREAL'),
+        ]}})
+
+DATATYPES = {'Motor': MOTOR, 'Line': LINE}
+
+
+class TestUdtLayout(unittest.TestCase):
+    """Test cases for UdtLayout."""
+
+    def setUp(self):
+        self.layouts = {}
+        self.line = UdtLayout.from_datatype(LINE, DATATYPES, self.layouts)
+        self.motor = self.layouts['Motor']
+
+    def test_from_datatype(self):
+        offsets = {name: (x.offset, x.bit) for name, x in self.motor.fields.items()}
+        self.assertEqual(offsets, {
+            'Running': (0, 0),
+            'Faulted': (0, 1),
+            'Speed': (4, -1),
+            'Mode': (8, -1),
+            'Counts': (12, -1),
+            'Flags': (24, -1),
+            'Delay': (32, -1),
+            'Label': (44, -1),
+        })
+        self.assertEqual(self.motor.size, 132)
+        self.assertIs(self.motor.fields['Delay'].layout, BUILTIN_LAYOUTS['TIMER'])
+
+        self.assertEqual(self.line.fields['Motors'].offset, 4)
+        self.assertEqual(self.line.fields['Total'].offset, 272)
+        self.assertEqual((self.line.size, self.line.alignment), (280, 8))
+
+    def test_unknown_member_datatype(self):
+        datatype = RaDatatype(meta_data={'@Name': 'Broken', 'Members': {'Member': [_member('Other', 'Missing')]}})
+
+        with self.assertRaises(ValueError):
+            UdtLayout.from_datatype(datatype, DATATYPES)
+
+    def test_encode_and_decode(self):
+        values = {
+            'Running': True,
+            'Speed': 1.5,
+            'Mode': -2,
+            'Counts': [1, 2, 3],
+            'Flags': [i % 3 == 0 for i in range(40)],
+            'Delay': {'EN': True, 'DN': True, 'PRE': 1000, 'ACC': 250},
+            'Label': 'Conveyor',
+        }
+
+        buffer = self.motor.encode(values)
+
+        self.assertEqual(len(buffer), 132)
+        self.assertEqual(buffer[0], 0b01)
+        self.assertEqual(struct.unpack_from('<Iii', buffer, 32), (0xA0000000, 1000, 250))
+        decoded = self.motor.decode(buffer)
+        self.assertEqual(decoded['Faulted'], False)
+        self.assertEqual(decoded['Delay'], {'EN': True, 'TT': False, 'DN': True, 'PRE': 1000, 'ACC': 250})
+        self.assertEqual(decoded, {**values, 'Faulted': False, 'Delay': decoded['Delay']})
+
+    def test_view_reads_and_writes_in_place(self):
+        buffer = bytearray(self.line.size)
+        view = self.line.view(buffer)
+
+        view['Motors[1].Speed'] = 3.25
+        view['Motors[1].Faulted'] = True
+        view['Motors[1].Flags[33]'] = True
+        view['Motors[1].Delay.DN'] = True
+        view['Motors[0].Label'] = 'M1'
+        view['Total'] = 12.5
+
+        motor = view['Motors[1]']
+        self.assertIsInstance(motor, UdtView)
+        self.assertEqual(motor['Speed'], 3.25)
+        self.assertTrue(motor['Faulted'])
+        self.assertFalse(motor['Running'])
+        self.assertTrue(motor['Flags[33]'])
+        self.assertEqual(struct.unpack_from('<I', buffer, 4 + 132 + 24 + 4)[0], 0b10)
+        self.assertTrue(motor['Delay']['DN'])
+        self.assertEqual(view['Motors[0].Label'], 'M1')
+        self.assertEqual(view.to_dict()['Total'], 12.5)
+
+        view['Motors[1].Faulted'] = False
+        self.assertFalse(motor['Faulted'])
+
+    def test_locate_errors(self):
+        view = self.line.view(bytes(self.line.size))
+
+        with self.assertRaises(KeyError):
+            view['Missing']
+        with self.assertRaises(KeyError):
+            view['Motors.Speed']
+        with self.assertRaises(IndexError):
+            view['Motors[2]']
+        self.assertIn('Motors[1].Counts[2]', view)
+        self.assertNotIn('Id.Speed', view)
+
+
+class TestReadStructure(unittest.TestCase):
+    """Test cases for reading whole structures, against a local stand-in PLC."""
+
+    def setUp(self):
+        self.layout = UdtLayout.from_datatype(MOTOR, DATATYPES)
+        data = self.layout.encode({'Running': True, 'Speed': 2.5, 'Counts': [4, 5, 6], 'Label': 'Pump'})
+        self.server = LogixServer({'Motor1': (STRUCT, (0x0F21, data)), 'Counter': (DINT, 5)})
+        self.server.start()
+        self.session = PlcSession('127.0.0.1', port=self.server.port, timeout=1.0, backoff_initial=0.0)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+
+    def test_read_structure(self):
+        self.assertTrue(self.session.open())
+        requests = self.server.requests
+
+        response = self.session.read_structure('Motor1', self.layout)
+
+        self.assertEqual(response.Status, 'Success')
+        self.assertTrue(response.Value['Running'])
+        self.assertEqual(response.Value['Speed'], 2.5)
+        self.assertEqual(response.Value['Counts'], [4, 5, 6])
+        self.assertEqual(response.Value['Label'], 'Pump')
+        self.assertEqual(self.server.requests - requests, 1)
+
+    def test_read_structure_of_other_type(self):
+        response = self.session.read_structure('Counter', self.layout)
+
+        self.assertIsNone(response.Value)
+        self.assertNotEqual(response.Status, 'Success')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,539 @@
+"""Packed structure (UDT) codec.
+
+A structure tag read as a whole comes back from the PLC as the raw bytes of the structure, in one request. The layout
+of a structure is derived once from its L5X datatype definition, and members are then read and written directly at
+their offsets in the buffer (a memoryview of the reply data, or a bytearray to build a value), so only the members
+accessed are decoded.
+
+Logix lays structure members out in order, each aligned to its size (SINT 1, INT 2, DINT and REAL 4, LINT and LREAL 8),
+arrays and nested structures to at least 4 bytes. BOOL members are bits of hidden SINT host members (the `Target` and
+`BitNumber` of BIT members in the L5X), BOOL arrays are stored in DINTs, and the size of a structure is padded to its
+alignment. Built-in structures (TIMER, COUNTER, CONTROL and STRING) have fixed layouts.
+"""
+from dataclasses import dataclass, field
+from struct import Struct, calcsize
+from typing import Any, Iterable, Optional, Union
+
+from controlrox.interfaces import IDatatype
+
+__all__ = (
+    'BUILTIN_LAYOUTS',
+    'UdtField',
+    'UdtLayout',
+    'UdtView',
+)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# struct formats of the atomic data types
+_ATOMIC_FORMATS = {
+    'SINT': 'b',
+    'INT': 'h',
+    'DINT': 'i',
+    'LINT': 'q',
+    'USINT': 'B',
+    'UINT': 'H',
+    'UDINT': 'I',
+    'ULINT': 'Q',
+    'REAL': 'f',
+    'LREAL': 'd',
+}
+
+_BOOL_WORD = Struct('<I')
+
+# kinds of the members decoded by a layout
+_VALUE, _ARRAY, _BIT, _BOOLS, _STRUCT = range(5)
+
+
+def _align(offset: int, alignment: int) -> int:
+    return offset + -offset % alignment
+
+
+def _get_count(dimension: Any) -> int:
+    """Get the number of elements of a member dimension, 0 for a single value."""
+    try:
+        count = int(str(dimension or '0').split()[0])
+    except ValueError:
+        return 0
+    return count if count > 1 else 0
+
+
+@dataclass
+class UdtField:
+    """A member of a structure layout.
+
+    Attributes:
+        name: The name of the member.
+        data_type: The data type name of the member (of its elements for arrays).
+        offset: The byte offset of the member in the structure.
+        size: The size of one element in bytes (one DINT for BOOL arrays).
+        count: The number of elements of an array member, 0 for a single value.
+        bit: The bit number of a BOOL member in its host at `offset`, -1 for other members.
+        fmt: The struct format of an atomic element (of the host of a BOOL member), empty for structures.
+        layout: The layout of a structure member.
+    """
+    name: str
+    data_type: str
+    offset: int
+    size: int
+    count: int = 0
+    bit: int = -1
+    fmt: str = ''
+    layout: Optional['UdtLayout'] = None
+    struct: Optional[Struct] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.fmt:
+            self.struct = Struct(f'<{self.fmt}')
+
+    @property
+    def is_bool_array(self) -> bool:
+        return self.data_type == 'BOOL' and self.bit < 0 and self.count > 0
+
+    @property
+    def words(self) -> int:
+        """The number of storage elements of the member (DINTs for BOOL arrays)."""
+        if self.is_bool_array:
+            return (self.count + 31) // 32
+        return max(self.count, 1)
+
+    def read(
+        self,
+        buffer: Buffer,
+        offset: int,
+        index: Optional[int] = None
+    ) -> Any:
+        """Read the member (or an element of an array member) at the offset of the member in a buffer.
+
+        Structures are returned as views on the buffer, arrays as lists and strings as text.
+        """
+        if self.bit >= 0:
+            return bool(self.struct.unpack_from(buffer, offset)[0] >> self.bit & 1)
+        if self.is_bool_array:
+            if index is not None:
+                return bool(_BOOL_WORD.unpack_from(buffer, offset + (index >> 5) * 4)[0] >> (index & 31) & 1)
+            words = Struct(f'<{self.words}I').unpack_from(buffer, offset)
+            return [bool(words[i >> 5] >> (i & 31) & 1) for i in range(self.count)]
+        if index is not None or not self.count:
+            return self._read_element(buffer, offset + (index or 0) * self.size)
+        if self.layout is None:
+            return list(Struct(f'<{self.count}{self.fmt}').unpack_from(buffer, offset))
+        return [self._read_element(buffer, offset + i * self.size) for i in range(self.count)]
+
+    def _read_element(
+        self,
+        buffer: Buffer,
+        offset: int
+    ) -> Any:
+        if self.layout is None:
+            return self.struct.unpack_from(buffer, offset)[0]
+        if self.layout.is_string:
+            return self.layout.decode(buffer, offset)
+        return UdtView(self.layout, buffer, offset)
+
+    def write(
+        self,
+        buffer: Union[bytearray, memoryview],
+        offset: int,
+        value: Any,
+        index: Optional[int] = None
+    ) -> None:
+        """Write the member (or an element of an array member) at the offset of the member in a writable buffer."""
+        if self.bit >= 0:
+            self._write_bit(buffer, offset, self.bit, value)
+            return
+        if self.is_bool_array:
+            if index is not None:
+                self._write_bit(buffer, offset + (index >> 5) * 4, index & 31, value, _BOOL_WORD)
+                return
+            words = [0] * self.words
+            for i, x in enumerate(value):
+                if x:
+                    words[i >> 5] |= 1 << (i & 31)
+            Struct(f'<{self.words}I').pack_into(buffer, offset, *words)
+            return
+        if index is not None or not self.count:
+            self._write_element(buffer, offset + (index or 0) * self.size, value)
+            return
+        if self.layout is None:
+            Struct(f'<{self.count}{self.fmt}').pack_into(buffer, offset, *value)
+            return
+        for i, x in enumerate(value):
+            self._write_element(buffer, offset + i * self.size, x)
+
+    def _write_bit(
+        self,
+        buffer: Union[bytearray, memoryview],
+        offset: int,
+        bit: int,
+        value: Any,
+        host: Optional[Struct] = None
+    ) -> None:
+        host = host or self.struct
+        word = host.unpack_from(buffer, offset)[0]
+        word = word | 1 << bit if value else word & ~(1 << bit)
+        host.pack_into(buffer, offset, word)
+
+    def _write_element(
+        self,
+        buffer: Union[bytearray, memoryview],
+        offset: int,
+        value: Any
+    ) -> None:
+        if self.layout is None:
+            self.struct.pack_into(buffer, offset, value)
+        elif isinstance(value, UdtView):
+            buffer[offset:offset + self.size] = value.buffer[value.offset:value.offset + self.size]
+        else:
+            self.layout.encode(value, buffer, offset)
+
+
+class UdtLayout:
+    """Byte layout of a structure data type.
+
+    The atomic members (and BOOL hosts) of a structure are decoded together by one precompiled struct format, nested
+    structures by their own layouts. Use `from_datatype` to derive the layout of an L5X datatype.
+
+    Args:
+        name: The name of the data type.
+        fields: The members of the structure.
+        size: The size of the structure in bytes.
+        alignment: The alignment of the structure when nested.
+        is_string: Whether the structure is a string (LEN and DATA members), decoded as text.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fields: Iterable[UdtField],
+        size: int,
+        alignment: int = 4,
+        is_string: bool = False
+    ) -> None:
+        self.name = name
+        self.fields: dict[str, UdtField] = {x.name: x for x in fields}
+        self.size = size
+        self.alignment = alignment
+        self.is_string = is_string
+        self._paths: dict[str, tuple[int, UdtField, Optional[int]]] = {}
+        self._struct, self._plan = self._compile()
+
+    def __repr__(self) -> str:
+        return f'UdtLayout(name={self.name!r}, fields={len(self.fields)}, size={self.size})'
+
+    def _compile(self) -> tuple[Struct, list[tuple[str, int, int, UdtField]]]:
+        """Compile the struct format decoding the atomic members and the plan mapping its values to members."""
+        slots: dict[int, tuple[str, int]] = {}
+        for x in self.fields.values():
+            if x.layout is None:
+                slots.setdefault(x.offset, ('I' if x.is_bool_array else x.fmt, 1 if x.bit >= 0 else x.words))
+
+        fmt, position, index, indexes = '<', 0, 0, {}
+        for offset in sorted(slots):
+            slot_fmt, count = slots[offset]
+            if offset > position:
+                fmt += f'{offset - position}x'
+            fmt += f'{count}{slot_fmt}' if count > 1 else slot_fmt
+            indexes[offset] = index
+            index += count
+            position = offset + count * calcsize(slot_fmt)
+
+        plan = []
+        for x in self.fields.values():
+            if x.layout is not None:
+                kind = _STRUCT
+            elif x.bit >= 0:
+                kind = _BIT
+            elif x.is_bool_array:
+                kind = _BOOLS
+            else:
+                kind = _ARRAY if x.count else _VALUE
+            plan.append((x.name, kind, indexes.get(x.offset, -1), x))
+        return Struct(fmt), plan
+
+    @classmethod
+    def from_datatype(
+        cls,
+        datatype: IDatatype,
+        datatypes: Optional[Any] = None,
+        layouts: Optional[dict[str, 'UdtLayout']] = None
+    ) -> 'UdtLayout':
+        """Derive the layout of a datatype from its L5X definition.
+
+        Args:
+            datatype: The datatype.
+            datatypes: The datatypes of the controller, by name, to look nested structures up in (by default the
+                datatype of each member is looked up in the current controller).
+            layouts: Layouts already derived, by name, extended with the layouts derived.
+
+        Returns:
+            UdtLayout: The layout.
+
+        Raises:
+            ValueError: If a member data type or BOOL host can not be found.
+        """
+        if datatype.name in BUILTIN_LAYOUTS:
+            return BUILTIN_LAYOUTS[datatype.name]
+        layouts = {} if layouts is None else layouts
+        if datatype.name in layouts:
+            return layouts[datatype.name]
+
+        fields: list[UdtField] = []
+        hosts: dict[str, int] = {}
+        bool_host: Optional[list[int]] = None
+        offset, alignment = 0, 4
+        for member in datatype.members:
+            meta = member.meta_data
+            name, data_type = member.name, meta.get('@DataType') or ''
+            count = _get_count(meta.get('@Dimension'))
+
+            if data_type == 'BIT':
+                target = meta.get('@Target')
+                host = hosts.get(target)
+                if host is None:
+                    raise ValueError(f"Member '{name}' of '{datatype.name}' targets unknown member '{target}'")
+                fields.append(UdtField(name, 'BOOL', host, 1, bit=int(meta.get('@BitNumber') or 0), fmt='B'))
+                continue
+            if data_type == 'BOOL' and not count:
+                if bool_host is None or bool_host[1] == 8:
+                    bool_host = [offset, 0]
+                    offset += 1
+                fields.append(UdtField(name, 'BOOL', bool_host[0], 1, bit=bool_host[1], fmt='B'))
+                bool_host[1] += 1
+                continue
+            bool_host = None
+
+            layout = None
+            if data_type == 'BOOL':
+                fmt, size = 'I', 4
+            elif data_type in _ATOMIC_FORMATS:
+                fmt = _ATOMIC_FORMATS[data_type]
+                size = calcsize(fmt)
+            else:
+                fmt = ''
+                layout = BUILTIN_LAYOUTS.get(data_type) or layouts.get(data_type)
+                if layout is None:
+                    layout = cls.from_datatype(cls._get_member_datatype(member, data_type, datatypes), datatypes, layouts)
+                size = layout.size
+            member_alignment = max(layout.alignment if layout else size, 4 if count else 1)
+
+            offset = _align(offset, member_alignment)
+            member_field = UdtField(name, data_type, offset, size, count, fmt=fmt, layout=layout)
+            if not member.is_hidden():
+                fields.append(member_field)
+            hosts[name] = offset
+            offset += size * member_field.words
+            alignment = max(alignment, member_alignment)
+
+        layout = cls(
+            datatype.name,
+            fields,
+            _align(offset, alignment),
+            alignment,
+            is_string=datatype.get_family() == 'StringFamily',
+        )
+        layouts[datatype.name] = layout
+        return layout
+
+    @staticmethod
+    def _get_member_datatype(
+        member: Any,
+        data_type: str,
+        datatypes: Optional[Any]
+    ) -> IDatatype:
+        if datatypes is None:
+            return member.get_datatype()
+        datatype = datatypes.get(data_type, None)
+        if datatype is None:
+            raise ValueError(f"Datatype '{data_type}' not found")
+        return datatype
+
+    def locate(self, path: str) -> tuple[int, UdtField, Optional[int]]:
+        """Locate a member path (like 'Motor.Speed' or 'Speeds[3]') in the structure.
+
+        Returns:
+            tuple: The offset of the member, the member and the array index (None for the whole member).
+
+        Raises:
+            KeyError: If the path does not name a member.
+            IndexError: If an array index is out of range.
+        """
+        located = self._paths.get(path)
+        if located is not None:
+            return located
+
+        layout, base = self, 0
+        parts = path.split('.')
+        for i, part in enumerate(parts):
+            name, _, index_text = part.partition('[')
+            member = layout.fields.get(name)
+            if member is None:
+                raise KeyError(f"'{layout.name}' has no member '{name}'")
+            index = int(index_text.rstrip(']')) if index_text else None
+            if index is not None and not 0 <= index < member.count:
+                raise IndexError(f"Index {index} out of range for member '{name}' of '{layout.name}'")
+            if i == len(parts) - 1:
+                located = (base + member.offset, member, index)
+                self._paths[path] = located
+                return located
+            if member.layout is None or (member.count and index is None):
+                raise KeyError(f"Member '{name}' of '{layout.name}' is not a structure")
+            base += member.offset + (index or 0) * member.size
+            layout = member.layout
+        raise KeyError(path)
+
+    def read(
+        self,
+        buffer: Buffer,
+        path: str,
+        offset: int = 0
+    ) -> Any:
+        """Read a member of the structure at an offset in a buffer."""
+        member_offset, member, index = self.locate(path)
+        return member.read(buffer, offset + member_offset, index)
+
+    def write(
+        self,
+        buffer: Union[bytearray, memoryview],
+        path: str,
+        value: Any,
+        offset: int = 0
+    ) -> None:
+        """Write a member of the structure at an offset in a writable buffer."""
+        member_offset, member, index = self.locate(path)
+        member.write(buffer, offset + member_offset, value, index)
+
+    def decode(
+        self,
+        buffer: Buffer,
+        offset: int = 0
+    ) -> Any:
+        """Decode the whole structure at an offset in a buffer.
+
+        Returns:
+            Any: The members by name (nested structures as dictionaries, arrays as lists), text for strings.
+        """
+        if self.is_string:
+            length = self.read(buffer, 'LEN', offset)
+            data = self.fields['DATA']
+            start = offset + data.offset
+            return bytes(buffer[start:start + max(0, min(length, data.count))]).decode('utf-8', 'replace')
+
+        values = self._struct.unpack_from(buffer, offset)
+        result: dict[str, Any] = {}
+        for name, kind, index, member in self._plan:
+            if kind == _VALUE:
+                result[name] = values[index]
+            elif kind == _BIT:
+                result[name] = bool(values[index] >> member.bit & 1)
+            elif kind == _ARRAY:
+                result[name] = list(values[index:index + member.count])
+            elif kind == _BOOLS:
+                result[name] = [bool(values[index + (i >> 5)] >> (i & 31) & 1) for i in range(member.count)]
+            elif member.count:
+                start = offset + member.offset
+                result[name] = [member.layout.decode(buffer, start + i * member.size) for i in range(member.count)]
+            else:
+                result[name] = member.layout.decode(buffer, offset + member.offset)
+        return result
+
+    def encode(
+        self,
+        values: Any,
+        buffer: Optional[Union[bytearray, memoryview]] = None,
+        offset: int = 0
+    ) -> Union[bytearray, memoryview]:
+        """Encode member values (text for strings) into a buffer, a new zeroed buffer by default.
+
+        Members not in `values` are left as they are in the buffer.
+        """
+        if buffer is None:
+            buffer = bytearray(offset + self.size)
+        if self.is_string:
+            data = self.fields['DATA']
+            encoded = str(values).encode('utf-8')[:data.count]
+            self.write(buffer, 'LEN', len(encoded), offset)
+            start = offset + data.offset
+            buffer[start:start + data.count] = encoded.ljust(data.count, b'\x00')
+            return buffer
+        for name, value in values.items():
+            self.write(buffer, name, value, offset)
+        return buffer
+
+    def view(
+        self,
+        buffer: Buffer,
+        offset: int = 0
+    ) -> 'UdtView':
+        """Get a view of the structure at an offset in a buffer, without copying it."""
+        return UdtView(self, buffer, offset)
+
+
+class UdtView:
+    """View of a structure on a buffer, reading and writing members in place.
+
+    Members are accessed by path, like `view['Motor.Speed']` or `view['Speeds[3]']`. Writing needs a writable buffer
+    (a bytearray, or a memoryview of one).
+    """
+    __slots__ = ('layout', 'buffer', 'offset')
+
+    def __init__(
+        self,
+        layout: UdtLayout,
+        buffer: Buffer,
+        offset: int = 0
+    ) -> None:
+        self.layout = layout
+        self.buffer = memoryview(buffer)
+        self.offset = offset
+
+    def __repr__(self) -> str:
+        return f'UdtView({self.layout.name}, offset={self.offset})'
+
+    def __getitem__(self, path: str) -> Any:
+        return self.layout.read(self.buffer, path, self.offset)
+
+    def __setitem__(
+        self,
+        path: str,
+        value: Any
+    ) -> None:
+        self.layout.write(self.buffer, path, value, self.offset)
+
+    def __contains__(self, path: str) -> bool:
+        try:
+            self.layout.locate(path)
+        except (KeyError, IndexError, ValueError):
+            return False
+        return True
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.buffer[self.offset:self.offset + self.layout.size])
+
+    def to_dict(self) -> Any:
+        """Decode the whole structure (see `UdtLayout.decode`)."""
+        return self.layout.decode(self.buffer, self.offset)
+
+
+def _builtin_layout(
+    name: str,
+    bits: tuple[str, ...],
+    words: tuple[str, ...]
+) -> UdtLayout:
+    """Layout of a built-in structure: status bits from bit 31 down in a first DINT, then DINT members."""
+    fields = [UdtField(x, 'BOOL', 0, 4, bit=31 - i, fmt='I') for i, x in enumerate(bits)]
+    fields += [UdtField(x, 'DINT', 4 + i * 4, 4, fmt='i') for i, x in enumerate(words)]
+    return UdtLayout(name, fields, 4 + len(words) * 4)
+
+
+BUILTIN_LAYOUTS: dict[str, UdtLayout] = {
+    'TIMER': _builtin_layout('TIMER', ('EN', 'TT', 'DN'), ('PRE', 'ACC')),
+    'COUNTER': _builtin_layout('COUNTER', ('CU', 'CD', 'DN', 'OV', 'UN'), ('PRE', 'ACC')),
+    'CONTROL': _builtin_layout('CONTROL', ('EN', 'EU', 'DN', 'EM', 'ER', 'UL', 'IN', 'FD'), ('LEN', 'POS')),
+    'STRING': UdtLayout(
+        'STRING',
+        [UdtField('LEN', 'DINT', 0, 4, fmt='i'), UdtField('DATA', 'SINT', 4, 1, count=82, fmt='b')],
+        88,
+        is_string=True,
+    ),
+}
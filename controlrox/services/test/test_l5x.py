@@ -10,7 +10,10 @@ import winreg
 
 
 from controlrox.services.l5x import (
+    cached_l5x_dict_from_file,
     cdata,
+    clear_l5x_file_cache,
+    get_l5x_asset_hash,
     l5x_dict_from_file,
     dict_to_l5x_file,
     get_ip_address_from_comm_path,
@@ -120,6 +123,59 @@ class TestL5XDictFromFile(unittest.TestCase):
         self.assertIn('file_location must be a string', str(context.exception))
 
 
+class TestCachedL5XDictFromFile(unittest.TestCase):
+    """Test cases for cached_l5x_dict_from_file function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.l5x_file = os.path.join(self.test_dir, 'test.L5X')
+        with open(self.l5x_file, 'w', encoding='utf-8') as f:
+            f.write('<RSLogix5000Content />')
+        clear_l5x_file_cache()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        clear_l5x_file_cache()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_file_is_parsed_once(self):
+        """Test repeated reads of an unchanged file are served from the cache."""
+        with patch('controlrox.services.l5x.dict_from_xml_file') as mock_dict:
+            mock_dict.return_value = {'RSLogix5000Content': {}}
+            first = cached_l5x_dict_from_file(self.l5x_file)
+            second = cached_l5x_dict_from_file(self.l5x_file)
+
+        self.assertIs(first, second)
+        mock_dict.assert_called_once_with(self.l5x_file)
+
+    def test_changed_file_is_parsed_again(self):
+        """Test a file is parsed again after it changed."""
+        with patch('controlrox.services.l5x.dict_from_xml_file') as mock_dict:
+            mock_dict.return_value = {'RSLogix5000Content': {}}
+            cached_l5x_dict_from_file(self.l5x_file)
+            with open(self.l5x_file, 'w', encoding='utf-8') as f:
+                f.write('<RSLogix5000Content SchemaRevision="1.0" />')
+            cached_l5x_dict_from_file(self.l5x_file)
+
+        self.assertEqual(mock_dict.call_count, 2)
+
+
+class TestGetL5XAssetHash(unittest.TestCase):
+    """Test cases for get_l5x_asset_hash function."""
+
+    def test_hash_ignores_key_order(self):
+        """Test the hash only depends on content."""
+        self.assertEqual(
+            get_l5x_asset_hash({'@Name': 'A', '@Class': 'User'}),
+            get_l5x_asset_hash({'@Class': 'User', '@Name': 'A'})
+        )
+        self.assertNotEqual(
+            get_l5x_asset_hash({'@Name': 'A', '@Class': 'User'}),
+            get_l5x_asset_hash({'@Name': 'A', '@Class': 'ProductDefined'})
+        )
+
+
 class TestDictToXmlFile(unittest.TestCase):
     """Test cases for dict_to_xml_file function."""
 
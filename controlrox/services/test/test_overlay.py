@@ -0,0 +1,314 @@
+"""Unit tests for controlrox.services.overlay module."""
+import copy
+import unittest
+from unittest.mock import MagicMock, Mock
+
+from controlrox.services.overlay import (
+    REMOVED,
+    ControllerOverlay,
+    HashListOverlay,
+    MetaListOverlay,
+    MetaOverlay,
+    create_meta_overlay,
+)
+
+
+class _FakeHashList(list):
+    """List with the name lookup used by HashList."""
+
+    def get(self, key, default=None):
+        return next((x for x in self if x.name == key), default)
+
+
+def _make_asset(name: str) -> Mock:
+    asset = Mock()
+    asset.name = name
+    return asset
+
+
+def _make_meta() -> dict:
+    return {
+        'Controller': {
+            '@Name': 'PLC1',
+            'SafetyInfo': {'SafetyTagMap': 'A=SA'},
+            'Tags': {'Tag': [
+                {'@Name': 'A', '@DataType': 'BOOL'},
+                {'@Name': 'B', '@DataType': 'DINT'},
+            ]},
+            'Programs': {'Program': [{'@Name': 'Main'}]},
+        }
+    }
+
+
+class TestMetaOverlay(unittest.TestCase):
+    """Test cases for MetaOverlay class."""
+
+    def setUp(self):
+        self.base = _make_meta()
+        self.original = copy.deepcopy(self.base)
+        self.overlay = MetaOverlay(self.base)
+
+    def test_reads_share_base(self):
+        tags = self.overlay['Controller']['Tags']['Tag']
+        self.assertIsInstance(self.overlay['Controller'], MetaOverlay)
+        self.assertIsInstance(tags, MetaListOverlay)
+        self.assertEqual(tags, self.base['Controller']['Tags']['Tag'])
+        self.assertIs(tags.base, self.base['Controller']['Tags']['Tag'])
+        self.assertIs(dict.__getitem__(self.overlay['Controller'], 'Programs'), self.base['Controller']['Programs'])
+        self.assertFalse(self.overlay.is_modified)
+
+    def test_changes_do_not_reach_base(self):
+        controller = self.overlay['Controller']
+        controller['@Name'] = 'PLC2'
+        controller['SafetyInfo']['SafetyTagMap'] = 'A=SA,B=SB'
+        controller['Tags']['Tag'][1]['@DataType'] = 'REAL'
+        controller['Tags']['Tag'].append({'@Name': 'C', '@DataType': 'BOOL'})
+        del controller['Programs']
+
+        self.assertEqual(self.base, self.original)
+        self.assertTrue(self.overlay.is_modified)
+        self.assertEqual(controller['@Name'], 'PLC2')
+        self.assertEqual([x['@Name'] for x in controller['Tags']['Tag']], ['A', 'B', 'C'])
+        self.assertNotIn('Programs', controller)
+
+        delta = self.overlay.delta['Controller']
+        self.assertEqual(delta['@Name'], 'PLC2')
+        self.assertEqual(delta['SafetyInfo'], {'SafetyTagMap': 'A=SA,B=SB'})
+        self.assertIs(delta['Programs'], REMOVED)
+        self.assertEqual(len(delta['Tags']['Tag']), 3)
+
+    def test_commit(self):
+        controller = self.overlay['Controller']
+        base_tags = self.base['Controller']['Tags']['Tag']
+        base_tag_a = base_tags[0]
+        controller['SafetyInfo']['SafetyTagMap'] = 'A=SA,B=SB'
+        controller['Tags']['Tag'][1]['@DataType'] = 'REAL'
+        controller['Tags']['Tag'].append({'@Name': 'C', '@DataType': 'BOOL'})
+        controller.pop('Programs')
+
+        self.overlay.commit()
+
+        self.assertFalse(self.overlay.is_modified)
+        self.assertEqual(self.base['Controller']['SafetyInfo']['SafetyTagMap'], 'A=SA,B=SB')
+        self.assertNotIn('Programs', self.base['Controller'])
+        self.assertIs(self.base['Controller']['Tags']['Tag'], base_tags)
+        self.assertIs(base_tags[0], base_tag_a)
+        self.assertEqual(base_tags[1], {'@Name': 'B', '@DataType': 'REAL'})
+        self.assertEqual(base_tags[2], {'@Name': 'C', '@DataType': 'BOOL'})
+        self.assertNotIsInstance(base_tags[1], MetaOverlay)
+
+    def test_commit_only_writes_modified_subtrees(self):
+        self.overlay['Controller']['Tags']['Tag'][0]['@DataType'] = 'SINT'
+        programs = self.base['Controller']['Programs']
+
+        self.overlay.commit()
+
+        self.assertIs(self.base['Controller']['Programs'], programs)
+        self.assertEqual(self.base['Controller']['Tags']['Tag'][0]['@DataType'], 'SINT')
+        self.assertEqual(self.overlay.delta, {})
+
+    def test_discard(self):
+        self.overlay['Controller']['@Name'] = 'PLC2'
+        self.overlay['New'] = {}
+
+        self.overlay.discard()
+
+        self.assertFalse(self.overlay.is_modified)
+        self.assertEqual(self.overlay, self.original)
+        self.assertEqual(self.base, self.original)
+
+    def test_discard_only_restores_changes(self):
+        controller = self.overlay['Controller']
+        programs = controller['Programs']
+        controller['Tags']['Tag'][0]['@DataType'] = 'SINT'
+        controller['@Name'] = 'PLC2'
+        tag_b = controller['Tags']['Tag'][1]
+
+        self.overlay.discard()
+
+        self.assertEqual(self.overlay, self.original)
+        self.assertIs(self.overlay['Controller'], controller)
+        self.assertIs(controller['Programs'], programs)
+        self.assertIs(controller['Tags']['Tag'][1], tag_b)
+        self.assertFalse(controller.is_modified)
+        self.assertEqual(self.overlay.delta, {})
+
+    def test_replaced_subtree_is_not_committed(self):
+        safety_info = self.overlay['Controller']['SafetyInfo']
+        self.overlay['Controller']['SafetyInfo'] = {'SafetyTagMap': ''}
+        safety_info['SafetyTagMap'] = 'X=SX'
+
+        self.overlay.commit()
+
+        self.assertEqual(self.base['Controller']['SafetyInfo'], {'SafetyTagMap': ''})
+        self.assertEqual(self.original['Controller']['SafetyInfo'], {'SafetyTagMap': 'A=SA'})
+
+    def test_deepcopy_and_plain_dict(self):
+        self.overlay['Controller']['@Name'] = 'PLC2'
+
+        copied = copy.deepcopy(self.overlay)
+        self.assertNotIsInstance(copied, MetaOverlay)
+        self.assertNotIsInstance(copied['Controller'], MetaOverlay)
+        self.assertEqual(copied['Controller']['@Name'], 'PLC2')
+        self.assertEqual(dict(self.overlay)['Controller']['@Name'], 'PLC2')
+
+    def test_create_meta_overlay(self):
+        self.assertIsInstance(create_meta_overlay([]), MetaListOverlay)
+        self.assertIsInstance(create_meta_overlay({}), MetaOverlay)
+        with self.assertRaises(ValueError):
+            create_meta_overlay('text')  # type: ignore[arg-type]
+
+
+class TestMetaListOverlay(unittest.TestCase):
+    """Test cases for MetaListOverlay class."""
+
+    def setUp(self):
+        self.base = [{'@Name': 'A'}, {'@Name': 'B'}]
+        self.overlay = MetaListOverlay(self.base)
+
+    def test_element_changes_are_committed_in_place(self):
+        element = self.base[1]
+        for item in self.overlay:
+            if item['@Name'] == 'B':
+                item['Description'] = 'changed'
+
+        self.assertNotIn('Description', self.base[1])
+        self.assertEqual(self.overlay.delta, {1: {'Description': 'changed'}})
+
+        self.overlay.commit()
+        self.assertIs(self.base[1], element)
+        self.assertEqual(element['Description'], 'changed')
+
+    def test_structural_changes(self):
+        self.overlay.insert(0, {'@Name': 'C'})
+        self.overlay.remove({'@Name': 'A'})
+        self.assertEqual(self.base, [{'@Name': 'A'}, {'@Name': 'B'}])
+
+        self.overlay.commit()
+        self.assertEqual(self.base, [{'@Name': 'C'}, {'@Name': 'B'}])
+
+    def test_discard(self):
+        self.overlay[1]['@Name'] = 'X'
+        self.overlay.discard()
+        self.assertEqual(self.overlay, self.base)
+
+        self.overlay.append({'@Name': 'C'})
+        self.overlay.discard()
+        self.assertEqual(self.overlay, [{'@Name': 'A'}, {'@Name': 'B'}])
+        self.assertFalse(self.overlay.is_modified)
+
+
+class TestHashListOverlay(unittest.TestCase):
+    """Test cases for HashListOverlay class."""
+
+    def setUp(self):
+        self.a = _make_asset('A')
+        self.b = _make_asset('B')
+        self.base = _FakeHashList([self.a, self.b])
+        self.overlay = HashListOverlay(self.base)
+
+    def test_reads_share_base(self):
+        self.assertIs(self.overlay.get('A'), self.a)
+        self.assertIn('B', self.overlay)
+        self.assertIsNone(self.overlay.get('C'))
+        self.assertEqual(list(self.overlay), [self.a, self.b])
+        self.assertFalse(self.overlay.is_modified)
+
+    def test_changes_do_not_reach_base(self):
+        c = _make_asset('C')
+        new_a = _make_asset('A')
+        self.overlay.set('C', c)
+        self.overlay.set('A', new_a)
+        self.overlay.remove('B')
+
+        self.assertEqual(list(self.overlay), [new_a, c])
+        self.assertEqual(len(self.overlay), 2)
+        self.assertNotIn('B', self.overlay)
+        self.assertEqual(self.overlay.delta, {'C': c, 'A': new_a, 'B': REMOVED})
+        self.assertEqual(list(self.base), [self.a, self.b])
+
+    def test_commit(self):
+        c = _make_asset('C')
+        self.overlay.set('C', c)
+        self.overlay.remove('B')
+        self.overlay.remove('Missing')
+        add, remove = Mock(), Mock()
+
+        self.overlay.commit(add, remove)
+
+        add.assert_called_once_with(c)
+        remove.assert_called_once_with(self.b)
+        self.assertFalse(self.overlay.is_modified)
+
+    def test_discard(self):
+        self.overlay.remove('A')
+        self.overlay.discard()
+        self.assertIs(self.overlay.get('A'), self.a)
+
+    def test_no_base(self):
+        overlay = HashListOverlay()
+        self.assertEqual(list(overlay), [])
+        overlay.set('A', self.a)
+        self.assertEqual(list(overlay), [self.a])
+
+
+class TestControllerOverlay(unittest.TestCase):
+    """Test cases for ControllerOverlay class."""
+
+    def setUp(self):
+        self.tag = _make_asset('T')
+        self.routine = _make_asset('R')
+        self.program = _make_asset('Main')
+        self.program.tags = _FakeHashList()
+        self.program.routines = _FakeHashList([self.routine])
+        self.controller = MagicMock()
+        self.controller.tags = _FakeHashList([self.tag])
+        self.controller.programs = _FakeHashList([self.program])
+        self.overlay = ControllerOverlay(self.controller)
+
+    def test_containers(self):
+        self.assertIs(self.overlay.get(('tags',), 'T'), self.tag)
+        self.assertIs(self.overlay.get(('routines', 'Main'), 'R'), self.routine)
+        self.assertIsNone(self.overlay.get(('routines', 'Missing'), 'R'))
+        self.assertIs(self.overlay.get_container(('tags',)).base, self.controller.tags)
+        with self.assertRaises(ValueError):
+            self.overlay.get_container(('rungs',))
+        with self.assertRaises(ValueError):
+            self.overlay.get_container(('routines',))
+
+    def test_commit_applies_only_delta(self):
+        new_tag = _make_asset('N')
+        new_routine = _make_asset('R')
+        self.overlay.set(('tags',), 'N', new_tag)
+        self.overlay.remove(('tags',), 'T')
+        self.overlay.set(('routines', 'Main'), 'R', new_routine)
+        self.overlay.get(('datatypes',), 'D')
+        self.assertEqual(self.overlay.delta, {
+            ('tags',): {'N': new_tag, 'T': REMOVED},
+            ('routines', 'Main'): {'R': new_routine},
+        })
+
+        self.overlay.commit()
+
+        self.controller.add_tag.assert_called_once_with(new_tag)
+        self.controller.remove_tag.assert_called_once_with(self.tag)
+        self.program.add_routine.assert_called_once_with(new_routine)
+        self.controller.add_datatype.assert_not_called()
+        self.assertFalse(self.overlay.is_modified)
+
+    def test_commit_missing_program(self):
+        self.overlay.set(('program_tags', 'Missing'), 'T', _make_asset('T'))
+        with self.assertRaises(ValueError):
+            self.overlay.commit()
+
+    def test_discard(self):
+        self.overlay.remove(('tags',), 'T')
+        self.overlay.discard()
+
+        self.assertIs(self.overlay.get(('tags',), 'T'), self.tag)
+        self.assertFalse(self.overlay.is_modified)
+        self.controller.remove_tag.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
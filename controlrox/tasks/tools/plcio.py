@@ -26,6 +26,7 @@ class PlcIoTask(ControllerApplicationTask):
 
         # start connection manager if required
         PlcConnectionManager.load_connection_parameters()
+        self._use_controller_symbols()
         if EnvManager.get('PLC_IO_AUTO_INIT', default=False, cast_type=bool):
             PlcConnectionManager.connect()
 
@@ -39,9 +40,22 @@ class PlcIoTask(ControllerApplicationTask):
             self.application.workspace.raise_frame(self._frame)
         return self._frame
 
+    def _use_controller_symbols(self) -> None:
+        """Use the symbol cache of the loaded controller project for PLC reads and writes.
+        """
+        controller = self.application.controller
+        if not controller:
+            return
+        try:
+            modified_date = controller.modified_date
+        except NotImplementedError:
+            modified_date = ''
+        PlcConnectionManager.use_symbol_cache(controller.name, modified_date, controller.file_location or None)
+
     def show_plc_io_frame(self) -> None:
         """Show the PLC I/O frame.
         """
+        self._use_controller_symbols()
         self._create_frame()
 
     def uninject(self) -> None:
@@ -1,8 +1,13 @@
 """Controller Validate Task
 """
 from datetime import datetime
+from typing import Optional
+from weakref import WeakKeyDictionary
 
 from pyrox.services.logging import log
+from controlrox.interfaces import IController
+from controlrox.models.gui.validation import ValidationFindingsFrame
+from controlrox.models.tasks.findings import ValidationFindingsStore
 from controlrox.models.tasks.task import ControllerApplicationTask
 from controlrox.models.tasks import validator
 
@@ -11,40 +16,105 @@ class ControllerValidatorTask(ControllerApplicationTask):
     """Controller validator task.
     """
 
+    profile_calls: bool = False  # Capture a cProfile of every validation run
+
+    def __init__(self, application) -> None:
+        super().__init__(application)
+        self._findings: WeakKeyDictionary[IController, ValidationFindingsStore] = WeakKeyDictionary()
+        self._findings_frame: Optional[ValidationFindingsFrame] = None
+
+    def _get_findings(self) -> Optional[ValidationFindingsStore]:
+        """Get the findings store of the current controller, if it was validated before."""
+        if not self.application.controller:
+            return None
+        return self._findings.get(self.application.controller, None)
+
+    def revalidate(self) -> None:
+        """Re-evaluate only the findings of the current controller affected by edits since they were recorded."""
+        findings = self._get_findings()
+        if findings is None:
+            self.run('full')
+            return
+        ctrl_validator = validator.ControllerValidatorFactory.get_validator(self.application.controller, findings)
+
+        with self.application.multi_stream.temporary_stream(ctrl_validator.log_file_stream):
+            log().info('--- Starting Incremental Controller Validation ---')
+            log().info(f'Timestamp: {datetime.now().isoformat()}')
+            with ctrl_validator.profile(self.profile_calls):
+                evaluated = ctrl_validator.revalidate()
+            log().info(f'Re-evaluated {len(evaluated)} of {len(findings)} findings.')
+            ctrl_validator.write_profile()
+            log().info('--- Incremental Controller Validation Complete ---')
+
+    def show_findings(self) -> None:
+        """Show the live findings list of the current controller."""
+        if self._get_findings() is None:
+            self.run('full')
+        findings = self._get_findings()
+        if findings is None:
+            return
+
+        if self._findings_frame is None or not self._findings_frame.root.winfo_exists():
+            self._findings_frame = ValidationFindingsFrame(
+                self.application.workspace.workspace_area,
+                findings,
+                on_revalidate=self.revalidate,
+            )
+            self.application.workspace.register_frame(self._findings_frame)
+        else:
+            self._findings_frame.findings = findings
+            self.application.workspace.raise_frame(self._findings_frame)
+
     def run(
         self,
-        validate_type: str = 'full'
+        validate_type: str = 'full',
+        profile_calls: Optional[bool] = None
     ) -> None:
         if not self.application.controller:
             return
-        ctrl_validator = validator.ControllerValidatorFactory.get_validator(self.application.controller)
+        findings = self._get_findings()
+        if validate_type == 'full' and findings is not None:
+            findings.clear()  # Drop the findings of objects deleted or renamed since the last run
+        ctrl_validator = validator.ControllerValidatorFactory.get_validator(self.application.controller, findings)
+        self._findings[self.application.controller] = ctrl_validator.findings
 
         with self.application.multi_stream.temporary_stream(ctrl_validator.log_file_stream):
-            log().info(f'--- Starting Controller Validation: {validate_type} ---')
-            log().info(f'Timestamp: {datetime.now().isoformat()}')
-            log().info(f'Controller: {self.application.controller.name} (ID: {self.application.controller.id})')
-            log().info(f'File: {self.application.controller.file_location}')
-            log().info(f'Log File: {ctrl_validator.log_file_stream.file_path}')
-            log().info('')
-            match validate_type:
-                case 'full':
-                    ctrl_validator.validate_all(self.application.controller)
-                case 'properties':
-                    ctrl_validator.validate_properties(self.application.controller)
-                case 'datatypes':
-                    ctrl_validator.validate_datatypes(self.application.controller)
-                case 'aois':
-                    ctrl_validator.validate_aois(self.application.controller)
-                case 'tags':
-                    ctrl_validator.validate_tags(self.application.controller)
-                case 'modules':
-                    ctrl_validator.validate_modules(self.application.controller)
-                case 'programs':
-                    ctrl_validator.validate_programs(self.application.controller)
-                case _:
-                    raise ValueError(f'Unknown Validate type: {validate_type}')
+            with ctrl_validator.collect_findings(), ctrl_validator.profile(
+                self.profile_calls if profile_calls is None else profile_calls
+            ):
+                self._run_validation(ctrl_validator, validate_type)
+            ctrl_validator.write_profile()
             log().info('--- Controller Validation Complete ---')
 
+    def _run_validation(
+        self,
+        ctrl_validator: validator.ControllerValidator,
+        validate_type: str
+    ) -> None:
+        log().info(f'--- Starting Controller Validation: {validate_type} ---')
+        log().info(f'Timestamp: {datetime.now().isoformat()}')
+        log().info(f'Controller: {self.application.controller.name} (ID: {self.application.controller.id})')
+        log().info(f'File: {self.application.controller.file_location}')
+        log().info(f'Log File: {ctrl_validator.log_file_stream.file_path}')
+        log().info('')
+        match validate_type:
+            case 'full':
+                ctrl_validator.validate_all(self.application.controller)
+            case 'properties':
+                ctrl_validator.validate_properties(self.application.controller)
+            case 'datatypes':
+                ctrl_validator.validate_datatypes(self.application.controller)
+            case 'aois':
+                ctrl_validator.validate_aois(self.application.controller)
+            case 'tags':
+                ctrl_validator.validate_tags(self.application.controller)
+            case 'modules':
+                ctrl_validator.validate_modules(self.application.controller)
+            case 'programs':
+                ctrl_validator.validate_programs(self.application.controller)
+            case _:
+                raise ValueError(f'Unknown Validate type: {validate_type}')
+
     def inject(self) -> None:
 
         dropdown_menu = self.gui.unsafe_get_backend().create_gui_menu(master=self.tools_menu.menu, tearoff=0)
@@ -52,6 +122,18 @@ class ControllerValidatorTask(ControllerApplicationTask):
             label='Validate Controller (All)',
             command=lambda: self.run('full')
         )
+        dropdown_menu.add_item(
+            label='Validate Controller (All, Capture Call Profile)',
+            command=lambda: self.run('full', profile_calls=True)
+        )
+        dropdown_menu.add_item(
+            label='Re-validate Changed',
+            command=self.revalidate
+        )
+        dropdown_menu.add_item(
+            label='Show Findings',
+            command=self.show_findings
+        )
         dropdown_menu.add_separator()
         dropdown_menu.add_item(
             label='Validate Controller (Properties Only)',